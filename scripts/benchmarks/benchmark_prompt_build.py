@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark voor het bouwen van prompts via de PromptOrchestrator.
+
+Bouwt N opeenvolgende prompts (default 1.000, wisselende begrippen en
+contexten) met de echte modules en meet de tijd per prompt per modus:
+
+    fresh-pool   nieuwe ThreadPoolExecutor per parallelle batch (oud gedrag)
+    pooled       persistente thread pool voor elke batch met >1 module
+    inline       alle modules in de aanroepende thread
+    auto         inline of pool op basis van gemeten kosten per module
+    auto+memo    auto met memoization van statische module output
+
+Voorbeelden:
+    python scripts/benchmarks/benchmark_prompt_build.py
+    python scripts/benchmarks/benchmark_prompt_build.py --prompts 200 --json reports/prompt_build.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+logging.disable(logging.CRITICAL)
+
+from services.definition_generator_config import UnifiedGeneratorConfig
+from services.definition_generator_context import EnrichedContext
+from services.prompts.modular_prompt_adapter import ModularPromptAdapter
+
+MODES = ("fresh-pool", "pooled", "inline", "auto", "auto+memo")
+BEGRIPPEN = ("toezicht", "verificatie", "vonnis", "reclassering", "detentie")
+CONTEXTS = (
+    {"organisatorisch": ["DJI"], "juridisch": [], "wettelijk": []},
+    {"organisatorisch": ["OM"], "juridisch": ["Strafrecht"], "wettelijk": ["Sv"]},
+    {"organisatorisch": [], "juridisch": [], "wettelijk": []},
+)
+
+
+def _context(i: int) -> EnrichedContext:
+    return EnrichedContext(
+        base_context=CONTEXTS[i % len(CONTEXTS)],
+        sources=[],
+        expanded_terms={},
+        confidence_scores={},
+        metadata={"ontologische_categorie": ("proces", "type", "resultaat")[i % 3]},
+    )
+
+
+def _configure(orchestrator, mode: str) -> None:
+    orchestrator.shutdown()
+    orchestrator.clear_module_cache()
+    orchestrator._module_costs.clear()
+    orchestrator.__dict__.pop("_execute_batch_parallel", None)
+    orchestrator.execution_mode = {"fresh-pool": "pooled", "auto+memo": "auto"}.get(
+        mode, mode
+    )
+    orchestrator.module_cache_size = 256 if mode == "auto+memo" else 0
+
+    if mode == "fresh-pool":
+        original = orchestrator._execute_batch_parallel
+
+        def per_batch_pool(batch, context):
+            try:
+                return original(batch, context)
+            finally:
+                orchestrator.shutdown()
+
+        orchestrator._execute_batch_parallel = per_batch_pool
+
+
+def run_mode(adapter, mode: str, prompts: int) -> dict[str, float]:
+    orchestrator = adapter._orchestrator
+    _configure(orchestrator, mode)
+    config = UnifiedGeneratorConfig()
+    contexts = [_context(i) for i in range(prompts)]
+
+    durations = []
+    start = time.perf_counter()
+    for i, context in enumerate(contexts):
+        t0 = time.perf_counter()
+        adapter.build_prompt(BEGRIPPEN[i % len(BEGRIPPEN)], context, config)
+        durations.append((time.perf_counter() - t0) * 1000)
+    total = time.perf_counter() - start
+    orchestrator.shutdown()
+
+    durations.sort()
+    return {
+        "total_s": round(total, 3),
+        "mean_ms": round(statistics.fmean(durations), 3),
+        "p50_ms": round(durations[len(durations) // 2], 3),
+        "p95_ms": round(durations[int(len(durations) * 0.95) - 1], 3),
+        "first_ms": round(durations[0], 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--prompts", type=int, default=1000, help="Prompts per modus")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--json", type=Path, help="Schrijf resultaten als JSON")
+    args = parser.parse_args()
+
+    adapter = ModularPromptAdapter()
+    # Opwarmen: regels laden, imports, eerste pool
+    run_mode(adapter, "pooled", 10)
+
+    results = {}
+    print(f"{'mode':<11} {'total s':>8} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7}")
+    for mode in args.modes:
+        summary = run_mode(adapter, mode, args.prompts)
+        results[mode] = summary
+        print(
+            f"{mode:<11} {summary['total_s']:>8.2f} {summary['mean_ms']:>8.2f} "
+            f"{summary['p50_ms']:>7.2f} {summary['p95_ms']:>7.2f}"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
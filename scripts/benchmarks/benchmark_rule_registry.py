@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark voor het laden van de Python toetsregel-validators.
+
+Meet per modus in een vers Python proces (koude imports):
+- startup: importeren + instantiëren van alle validators;
+- first validation: eerste toetsing van een definitie met alle regels;
+- warm validation: dezelfde toetsing nogmaals;
+- second loader: eerste toetsing via een tweede loader-instantie.
+
+Modi:
+    legacy    JSONValidatorLoader met expliciete regels_dir (per regel
+              importlib.spec_from_file_location bij eerste gebruik)
+    scan      RuleRegistry zonder bundle (directory scan + package imports)
+    bundle    RuleRegistry met gegenereerde toetsregels/_validator_bundle.py
+
+Voorbeelden:
+    python scripts/benchmarks/benchmark_rule_registry.py
+    python scripts/benchmarks/benchmark_rule_registry.py --runs 5 --json reports/rule_registry.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent.parent / "src"
+MODES = ("legacy", "scan", "bundle")
+
+_CHILD = r"""
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+sys.path.insert(0, {src!r})
+mode = {mode!r}
+DEFINITIE = "Een vonnis is een schriftelijke uitspraak van de rechter in een strafzaak."
+
+t0 = time.perf_counter()
+if mode == "legacy":
+    from ai_toetser.json_validator_loader import JSONValidatorLoader
+    from toetsregels.rule_registry import DEFAULT_REGELS_DIR
+    loader = JSONValidatorLoader(str(DEFAULT_REGELS_DIR) + "/")
+    loader._use_registry = False
+    ids = loader.get_all_regel_ids()
+else:
+    from ai_toetser.json_validator_loader import JSONValidatorLoader
+    from toetsregels import rule_registry
+    rule_registry._registry = rule_registry.RuleRegistry(use_bundle=(mode == "bundle"))
+    rule_registry.preload_rule_registry()
+    loader = JSONValidatorLoader()
+    ids = loader.get_all_regel_ids()
+t1 = time.perf_counter()
+loader.validate_definitie(DEFINITIE, "vonnis", ids, {{}})
+t2 = time.perf_counter()
+loader.validate_definitie(DEFINITIE, "vonnis", ids, {{}})
+t3 = time.perf_counter()
+# Tweede loader-instantie (bijv. andere service/tab) in hetzelfde proces
+second = JSONValidatorLoader(loader.regels_dir if mode == "legacy" else None)
+second._use_registry = mode != "legacy"
+second.validate_definitie(DEFINITIE, "vonnis", ids, {{}})
+t4 = time.perf_counter()
+print(json.dumps({{"startup_ms": (t1 - t0) * 1000, "first_validation_ms": (t2 - t1) * 1000,
+                  "warm_validation_ms": (t3 - t2) * 1000,
+                  "second_loader_ms": (t4 - t3) * 1000}}))
+"""
+
+
+def _run_once(mode: str) -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(src=str(SRC), mode=mode)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3, help="Processen per modus")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--json", type=Path, help="Schrijf resultaten als JSON")
+    args = parser.parse_args()
+
+    results = {}
+    print(
+        f"{'mode':<8} {'startup ms':>11} {'first val ms':>13} "
+        f"{'warm val ms':>12} {'2nd loader ms':>14}"
+    )
+    for mode in args.modes:
+        runs = [_run_once(mode) for _ in range(args.runs)]
+        summary = {
+            key: round(statistics.median(r[key] for r in runs), 2) for key in runs[0]
+        }
+        results[mode] = summary
+        print(
+            f"{mode:<8} {summary['startup_ms']:>11.1f} "
+            f"{summary['first_validation_ms']:>13.1f} "
+            f"{summary['warm_validation_ms']:>12.1f} "
+            f"{summary['second_loader_ms']:>14.1f}"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark voor de import-tijd van de Streamlit app bij startup.
+
+Draait ``python -X importtime`` over de modules die src/main.py importeert
+(default 5 runs, mediaan), toont de zwaarste packages en modules, schrijft
+de metingen naar de PerformanceTracker en toetst ze aan het import budget:
+
+    - totale import-tijd onder --budget-ms
+    - pandas, openpyxl, PyPDF2, docx en aiohttp niet op het startup pad
+    - geen CRITICAL regressie t.o.v. de baseline in de tracker
+
+Exit code 1 bij een overschrijding, zodat dit in CI kan draaien.
+
+Voorbeelden:
+    python scripts/benchmarks/benchmark_startup_imports.py
+    python scripts/benchmarks/benchmark_startup_imports.py --runs 9 --no-record
+    python scripts/benchmarks/benchmark_startup_imports.py --json reports/startup_imports.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+logging.disable(logging.CRITICAL)
+
+from monitoring.import_profile import (
+    ImportBudget,
+    profile_imports,
+    record_import_profile,
+)
+from monitoring.performance_tracker import get_tracker
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Aantal cold starts")
+    parser.add_argument(
+        "--budget-ms", type=float, default=ImportBudget.total_ms, help="Max import-tijd"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Aantal regels in overzicht"
+    )
+    parser.add_argument(
+        "--no-record",
+        action="store_true",
+        help="Niet naar PerformanceTracker schrijven",
+    )
+    parser.add_argument("--json", type=Path, help="Schrijf resultaten als JSON")
+    args = parser.parse_args()
+
+    profiles = sorted(
+        (profile_imports() for _ in range(max(args.runs, 1))),
+        key=lambda p: p.total_ms,
+    )
+    profile = profiles[len(profiles) // 2]
+    totals = [p.total_ms for p in profiles]
+
+    print(
+        f"startup imports: mediaan {profile.total_ms:.0f}ms "
+        f"(min {totals[0]:.0f}, max {totals[-1]:.0f}, "
+        f"stdev {statistics.pstdev(totals):.0f}) over {len(profiles)} runs"
+    )
+    print(f"\n{'package':<28} {'ms':>8}")
+    for package, ms in list(profile.by_package().items())[: args.top]:
+        print(f"{package:<28} {ms:>8.1f}")
+    print(f"\n{'module (cumulatief)':<48} {'ms':>8}")
+    for timing in profile.slowest(args.top):
+        print(f"{timing.module:<48} {timing.cumulative_us / 1000:>8.1f}")
+
+    violations = ImportBudget(total_ms=args.budget_ms).check(profile)
+    regressions = {}
+    if not args.no_record:
+        regressions = record_import_profile(
+            profile, get_tracker(), top_packages=args.top
+        )
+        violations.extend(
+            f"regressie {name}"
+            for name, status in regressions.items()
+            if status == "CRITICAL"
+        )
+        warnings = [name for name, status in regressions.items() if status == "WARNING"]
+        if warnings:
+            print(f"\nWAARSCHUWING: trager dan baseline: {', '.join(warnings)}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(
+            json.dumps(
+                {
+                    "total_ms": round(profile.total_ms, 2),
+                    "wall_ms": round(profile.wall_ms, 2),
+                    "runs_total_ms": [round(t, 2) for t in totals],
+                    "by_package_ms": {
+                        k: round(v, 2) for k, v in profile.by_package().items()
+                    },
+                    "regressions": regressions,
+                    "violations": violations,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    if violations:
+        print("\nBUDGET OVERSCHREDEN:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    print("\nBinnen import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark voor de web lookup pipeline.
+
+Draait ModernWebLookupService.lookup voor 1 tot 500 termen tegen een lokale
+stand-in server (record/replay harness) en rapporteert end-to-end latency,
+ranking/dedup CPU tijd en piek geheugengebruik. Er is geen internet nodig.
+
+Voorbeelden:
+    # Standaard suite (synthetische responses, 20ms latency)
+    python scripts/benchmarks/benchmark_web_lookup.py
+
+    # Met vastgelegde cassette, failure injectie en JSON output
+    python scripts/benchmarks/benchmark_web_lookup.py \\
+        --cassette tests/fixtures/cassettes/web_lookup_basic.json \\
+        --failure-rate 0.1 --json reports/web_lookup_benchmark.json
+
+    # Cassette opnemen tegen de echte providers (vereist internet)
+    python scripts/benchmarks/benchmark_web_lookup.py --record \\
+        --cassette tests/fixtures/cassettes/web_lookup_recorded.json --terms 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Voeg src toe aan path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from monitoring.web_lookup_benchmark import run_lookup_benchmark
+
+COLUMNS = [
+    ("terms", "terms", "{:d}"),
+    ("wall_seconds", "wall s", "{:.2f}"),
+    ("throughput_per_s", "terms/s", "{:.1f}"),
+    ("latency_p50_ms", "p50 ms", "{:.1f}"),
+    ("latency_p95_ms", "p95 ms", "{:.1f}"),
+    ("ranking_cpu_ms", "rank cpu ms", "{:.1f}"),
+    ("peak_memory_mb", "peak MB", "{:.1f}"),
+    ("http_requests", "requests", "{:d}"),
+    ("injected_failures", "failures", "{:d}"),
+]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--terms", type=int, nargs="+", default=[1, 10, 100, 500], help="Suite sizes"
+    )
+    parser.add_argument("--cassette", type=Path, help="Cassette bestand (JSON)")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Neem responses op van de echte providers in --cassette",
+    )
+    parser.add_argument(
+        "--no-synthetic",
+        action="store_true",
+        help="Geen synthetische responses voor requests buiten de cassette",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall-seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, help="Schrijf resultaten als JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+async def _main(args: argparse.Namespace) -> list[dict]:
+    if args.record and not args.cassette:
+        msg = "--record vereist --cassette"
+        raise SystemExit(msg)
+
+    results = []
+    for n in args.terms:
+        result = await run_lookup_benchmark(
+            n,
+            cassette=args.cassette,
+            concurrency=args.concurrency,
+            synthetic=not (args.no_synthetic or args.record),
+            mode="record" if args.record else "replay",
+            latency_ms=0.0 if args.record else args.latency_ms,
+            jitter_ms=0.0 if args.record else args.jitter_ms,
+            failure_rate=args.failure_rate,
+            stall_rate=args.stall_rate,
+            stall_seconds=args.stall_seconds,
+            seed=args.seed,
+        )
+        results.append(result)
+        print(" | ".join(fmt.format(result[key]) for key, _, fmt in COLUMNS))
+    return results
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    print("🏁 Web lookup offline benchmark")
+    print(" | ".join(label for _, label, _ in COLUMNS))
+    results = asyncio.run(_main(args))
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n📄 Resultaten geschreven naar {args.json}")
+
+
+if __name__ == "__main__":
+    main()
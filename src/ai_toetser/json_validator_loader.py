@@ -5,14 +5,19 @@ Deze module laadt validators dynamisch uit de config/toetsregels/regels director
 waar elke toetsregel bestaat uit een JSON configuratie en bijbehorende Python implementatie.
 """
 
-import importlib.util
 import json
 import logging
-import sys
 from pathlib import Path
-from types import ModuleType
 from typing import Any, cast
 
+from toetsregels.rule_registry import (
+    DEFAULT_REGELS_DIR,
+    get_rule_registry,
+    import_validator_module,
+    validator_class_name,
+    validator_module_candidates,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +45,8 @@ class JSONValidatorLoader:
 
         self._validators_cache: dict[str, Any] = {}
         self._json_cache: dict[str, dict[str, Any]] = {}
+        # Standaard regels: validators komen uit de (éénmalig geladen) registry
+        self._use_registry = self.regels_dir.resolve() == DEFAULT_REGELS_DIR.resolve()
 
         logger.info(
             f"JSONValidatorLoader geïnitialiseerd met directory: {self.regels_dir}"
@@ -59,6 +66,14 @@ class JSONValidatorLoader:
         if regel_id in self._validators_cache:
             return self._validators_cache[regel_id]
 
+        if self._use_registry:
+            validator = get_rule_registry().get_validator(regel_id)
+            if validator is None:
+                logger.warning(f"Geen validator in registry voor {regel_id}")
+                return None
+            self._validators_cache[regel_id] = validator
+            return validator
+
         # Laad JSON config
         json_config = self.load_json_config(regel_id)
         if not json_config:
@@ -67,9 +82,8 @@ class JSONValidatorLoader:
 
         # Bepaal mogelijke Python bestandsnamen
         # Primair: CON-01 -> CON_01.py
-        candidates = [regel_id.replace("-", "_") + ".py"]
         # Alternatief (ARAI-01 → ARAI01.py, ARAI-02SUB1 → ARAI02SUB1.py)
-        candidates.append(regel_id.replace("-", "") + ".py")
+        candidates = [f"{name}.py" for name in validator_module_candidates(regel_id)]
 
         validators_dir = self.regels_dir.parent / "validators"
         py_path = None
@@ -86,19 +100,11 @@ class JSONValidatorLoader:
             return None
 
         try:
-            # Dynamisch laden van Python module
-            spec = importlib.util.spec_from_file_location(
-                f"toetsregel_{regel_id}", py_path
-            )
-            if spec is None or spec.loader is None:
-                logger.error(f"Kon geen module spec laden voor {py_path}")
-                return None
-            module: ModuleType = importlib.util.module_from_spec(spec)
-            sys.modules[f"toetsregel_{regel_id}"] = module
-            spec.loader.exec_module(module)
+            # Python module éénmaal per proces importeren
+            module = import_validator_module(py_path, f"toetsregel_{regel_id}")
 
             # Zoek validator class (conventie: {ID}Validator)
-            class_name = f"{regel_id.replace('-', '')}Validator"
+            class_name = validator_class_name(regel_id)
             validator_class = getattr(module, class_name, None)
 
             if validator_class is None:
@@ -0,0 +1,161 @@
+"""CLI voor batchgeneratie van definities (bv. een begrippenlijst van een ketenpartner).
+
+Invoer is een CSV met minimaal een kolom ``begrip``; optionele kolommen:
+``ontologische_categorie``, ``organisatorische_context``, ``juridische_context``,
+``wettelijke_basis`` (meerdere waarden gescheiden door ``;``) en
+``extra_instructies``. Een tekstbestand met één begrip per regel mag ook.
+
+Usage:
+    python -m src.cli.batch_generation_cli run begrippen.csv --org DJI
+    python -m src.cli.batch_generation_cli run begrippen.csv --concurrency 8
+    python -m src.cli.batch_generation_cli run begrippen.csv --checkpoint runs/ketenpartner.jsonl
+"""
+
+import asyncio
+import csv
+import json
+import sys
+import uuid
+from pathlib import Path
+
+# Add src to path for proper imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import click
+
+from services.interfaces import GenerationRequest
+
+_LIST_COLUMNS = ("organisatorische_context", "juridische_context", "wettelijke_basis")
+
+
+def _split(value: str | None) -> list[str]:
+    return [part.strip() for part in (value or "").split(";") if part.strip()]
+
+
+def load_requests(
+    path: Path, default_org: tuple[str, ...], actor: str
+) -> list[GenerationRequest]:
+    """Lees een CSV (kolom ``begrip``) of tekstbestand (één begrip per regel)."""
+    if path.suffix.lower() != ".csv":
+        rows = [
+            {"begrip": line.strip()}
+            for line in path.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+    else:
+        with path.open(encoding="utf-8-sig", newline="") as fh:
+            rows = [
+                row for row in csv.DictReader(fh) if (row.get("begrip") or "").strip()
+            ]
+
+    requests = []
+    for row in rows:
+        lists = {column: _split(row.get(column)) for column in _LIST_COLUMNS}
+        if not lists["organisatorische_context"]:
+            lists["organisatorische_context"] = list(default_org)
+        requests.append(
+            GenerationRequest(
+                id=str(uuid.uuid4()),
+                begrip=row["begrip"].strip(),
+                ontologische_categorie=(row.get("ontologische_categorie") or None),
+                extra_instructies=(row.get("extra_instructies") or None),
+                actor=actor,
+                **lists,
+            )
+        )
+    return requests
+
+
+@click.group()
+def batch():
+    """Batchgeneratie commands."""
+
+
+@batch.command()
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--org",
+    "default_org",
+    multiple=True,
+    help="Organisatorische context voor rijen zonder eigen context (herhaalbaar)",
+)
+@click.option("--concurrency", default=4, show_default=True, type=int)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    default=None,
+    help="JSONL checkpoint; default: <input>.checkpoint.jsonl",
+)
+@click.option("--actor", default="batch_cli", show_default=True)
+@click.option("--json", "as_json", is_flag=True, help="Resultaten als JSON-regels")
+def run(
+    input_path: str,
+    default_org: tuple[str, ...],
+    concurrency: int,
+    checkpoint_path: str | None,
+    actor: str,
+    as_json: bool,
+):
+    """Genereer definities voor alle begrippen in INPUT_PATH.
+
+    Een afgebroken run hervat bij dezelfde checkpoint waar hij gebleven was.
+
+    \b
+    Examples:
+        batch_generation_cli.py run begrippen.csv --org DJI
+        batch_generation_cli.py run begrippen.txt --concurrency 8 --json
+    """
+    path = Path(input_path)
+    requests = load_requests(path, default_org, actor)
+    if not requests:
+        click.echo("Geen begrippen gevonden.")
+        return
+    checkpoint = checkpoint_path or str(path.with_suffix(".checkpoint.jsonl"))
+
+    from services.container import get_container
+
+    orchestrator = get_container().orchestrator()
+
+    async def _run() -> dict[str, int]:
+        counts = {"ok": 0, "failed": 0, "resumed": 0, "duplicates": 0}
+        done = 0
+        async for result in orchestrator.create_definitions_batch(
+            requests, concurrency=concurrency, checkpoint=checkpoint
+        ):
+            done += 1
+            if result.resumed:
+                counts["resumed"] += 1
+            elif result.duplicate_of is not None:
+                counts["duplicates"] += 1
+            counts["ok" if result.success else "failed"] += 1
+            if as_json:
+                click.echo(json.dumps(result.to_dict(), ensure_ascii=False))
+                continue
+            status = "✓" if result.success else "✗"
+            detail = (
+                f"#{result.definition_id}"
+                if result.success
+                else (result.error or "onbekende fout")
+            )
+            suffix = " (checkpoint)" if result.resumed else ""
+            if result.duplicate_of is not None:
+                suffix += f" (dubbel van rij {result.duplicate_of + 1})"
+            click.echo(
+                f"[{done}/{len(requests)}] {status} {result.begrip}: "
+                f"{detail} {result.duration:.1f}s{suffix}"
+            )
+        return counts
+
+    counts = asyncio.run(_run())
+    if not as_json:
+        click.echo(
+            f"\nKlaar: {counts['ok']} gelukt, {counts['failed']} mislukt, "
+            f"{counts['resumed']} uit checkpoint, {counts['duplicates']} dubbel"
+        )
+        click.echo(f"Checkpoint: {checkpoint}")
+
+
+if __name__ == "__main__":
+    batch()
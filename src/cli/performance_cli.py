@@ -4,8 +4,11 @@ Usage:
     python -m src.cli.performance_cli status
     python -m src.cli.performance_cli baselines
     python -m src.cli.performance_cli history app_startup_ms
+    python -m src.cli.performance_cli rule-timings --top 15
 """
 
+import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -315,5 +318,84 @@ def migrate_startup_metric():
         click.echo("Migratie geannuleerd.")
 
 
+@performance.command()
+@click.option("--db", "db_path", default=None, help="Pad naar definities database")
+@click.option("--limit", default=0, type=int, help="Max. aantal definities (0 = alle)")
+@click.option("--repeat", default=1, show_default=True, type=int)
+@click.option("--top", default=20, show_default=True, type=int)
+@click.option("--json", "as_json", is_flag=True, help="Rapport als JSON")
+def rule_timings(db_path: str | None, limit: int, repeat: int, top: int, as_json: bool):
+    """Meet de tijd per toetsregel over het definitie-corpus (hot rules).
+
+    Valideert alle definities (zonder resultaatcache) met tijdmeting per regel
+    en toont p50/p95/totaal per regel, duurste regels eerst.
+
+    \b
+    Examples:
+        performance_cli.py rule-timings
+        performance_cli.py rule-timings --repeat 3 --top 10 --json
+    """
+    from database.definitie_repository import get_definitie_repository
+    from services.validation.config import ValidationConfig
+    from services.validation.modular_validation_service import (
+        ModularValidationService,
+    )
+    from services.validation.result_cache import ValidationResultCache
+    from services.validation.rule_timing import RuleTimingCollector
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    records = get_definitie_repository(db_path).get_all()
+    if limit > 0:
+        records = records[:limit]
+    if not records:
+        click.echo("Geen definities gevonden.")
+        return
+
+    timing = RuleTimingCollector(enabled=True)
+    service = ModularValidationService(
+        get_cached_toetsregel_manager(),
+        None,
+        ValidationConfig.from_yaml_with_fallback(
+            str(src_path / "config" / "validation_rules.yaml")
+        ),
+        result_cache=ValidationResultCache(max_entries=0),
+        rule_timing=timing,
+    )
+
+    async def _run() -> None:
+        for _ in range(repeat):
+            for record in records:
+                await service.validate_definition(
+                    record.begrip,
+                    record.definitie,
+                    ontologische_categorie=record.categorie or None,
+                )
+
+    asyncio.run(_run())
+    stats = timing.get_stats()
+    rows = timing.report(top=top)
+
+    if as_json:
+        click.echo(json.dumps({**stats, "top": rows}, indent=2))
+        return
+
+    click.echo(
+        f"\n=== Tijd per toetsregel ({stats['runs']} validaties, "
+        f"{stats['total_ms']:.1f}ms totaal) ===\n"
+    )
+    click.echo(
+        f"{'Regel':<14} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'totaal ms':>11} {'aandeel':>8}"
+    )
+    click.echo("-" * 62)
+    for row in rows:
+        click.echo(
+            f"{row['rule']:<14} {row['count']:>6} {row['p50_ms']:>9.3f} "
+            f"{row['p95_ms']:>9.3f} {row['total_ms']:>11.1f} "
+            f"{row['share_pct']:>7.1f}%"
+        )
+    click.echo()
+
+
 if __name__ == "__main__":
     performance()
@@ -0,0 +1,178 @@
+"""CLI voor incrementele corpus-revalidatie na wijzigingen in toetsregels.
+
+Usage:
+    python -m src.cli.revalidation_cli run
+    python -m src.cli.revalidation_cli run --dry-run
+    python -m src.cli.revalidation_cli run --full --db data/definities.db
+    python -m src.cli.revalidation_cli stats --top 5
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for proper imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import click
+
+from services.validation.revalidation import (
+    DEFAULT_STORE_PATH,
+    IncrementalRevalidationService,
+    RevalidationProgress,
+    RuleResultStore,
+)
+
+
+def _build_service(
+    db_path: str | None, store_path: str
+) -> IncrementalRevalidationService:
+    from database.definitie_repository import get_definitie_repository
+    from services.validation.config import ValidationConfig
+    from services.validation.modular_validation_service import (
+        ModularValidationService,
+    )
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    config = ValidationConfig.from_yaml_with_fallback(
+        str(src_path / "config" / "validation_rules.yaml")
+    )
+    validation_service = ModularValidationService(
+        get_cached_toetsregel_manager(), None, config
+    )
+    return IncrementalRevalidationService(
+        repository=get_definitie_repository(db_path),
+        validation_service=validation_service,
+        store=RuleResultStore(store_path),
+    )
+
+
+@click.group()
+def revalidation():
+    """Corpus revalidatie commands."""
+
+
+@revalidation.command()
+@click.option("--db", "db_path", default=None, help="Pad naar definities database")
+@click.option(
+    "--store",
+    "store_path",
+    default=DEFAULT_STORE_PATH,
+    show_default=True,
+    help="Pad naar de store met uitkomsten per regel",
+)
+@click.option("--full", is_flag=True, help="Voer alle regels opnieuw uit")
+@click.option("--dry-run", is_flag=True, help="Niets wegschrijven")
+@click.option("--batch-size", default=200, show_default=True, type=int)
+@click.option("--json", "as_json", is_flag=True, help="Rapport als JSON")
+def run(
+    db_path: str | None,
+    store_path: str,
+    full: bool,
+    dry_run: bool,
+    batch_size: int,
+    as_json: bool,
+):
+    """Revalideer alle definities; alleen gewijzigde regels worden uitgevoerd.
+
+    \b
+    Examples:
+        revalidation_cli.py run
+        revalidation_cli.py run --dry-run --json
+    """
+    service = _build_service(db_path, store_path)
+
+    def _progress(p: RevalidationProgress) -> None:
+        if not as_json:
+            click.echo(
+                f"  {p.processed}/{p.total} definities "
+                f"({p.definitions_per_second:.1f}/s, {p.rules_evaluated} regels uitgevoerd)"
+            )
+
+    report = service.run(
+        full=full, dry_run=dry_run, batch_size=batch_size, progress=_progress
+    )
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    click.echo("\n=== Corpus Revalidatie ===\n")
+    click.echo(f"Definities:          {report.definitions}")
+    click.echo(f"Volledig opnieuw:    {report.full_revalidations}")
+    click.echo(f"Regels uitgevoerd:   {report.rules_evaluated}")
+    click.echo(f"Regels hergebruikt:  {report.rules_reused}")
+    if report.changed_rules:
+        click.echo(f"Gewijzigde regels:   {', '.join(report.changed_rules)}")
+    click.echo(
+        f"Doorlooptijd:        {report.elapsed_seconds:.2f}s "
+        f"({report.definitions_per_second:.1f} def/s, "
+        f"{report.rules_per_second:.0f} regels/s)"
+    )
+    if dry_run:
+        click.echo("\nDry-run: niets weggeschreven.")
+    else:
+        click.echo(f"Bijgewerkt:          {report.updated}")
+
+
+@revalidation.command()
+@click.option("--db", "db_path", default=None, help="Pad naar definities database")
+@click.option(
+    "--store",
+    "store_path",
+    default=DEFAULT_STORE_PATH,
+    show_default=True,
+    help="Pad naar de store met uitkomsten per regel",
+)
+@click.option("--top", default=10, show_default=True, type=int)
+@click.option("--json", "as_json", is_flag=True, help="Rapport als JSON")
+def stats(db_path: str | None, store_path: str, top: int, as_json: bool):
+    """Corpusstatistieken uit de store: scoreverdeling, faalpercentages, categorieën.
+
+    \b
+    Examples:
+        revalidation_cli.py stats
+        revalidation_cli.py stats --top 5 --json
+    """
+    from database.definitie_repository import get_definitie_repository
+    from services.validation.corpus_stats import get_corpus_matrix
+
+    matrix = get_corpus_matrix(RuleResultStore(store_path)).with_overall(
+        get_definitie_repository(db_path).get_validation_scores()
+    )
+    summary = matrix.summary(top=top)
+
+    if as_json:
+        click.echo(json.dumps(summary, indent=2))
+        return
+
+    click.echo("\n=== Corpus Statistieken ===\n")
+    click.echo(f"Definities:  {summary['definitions']}")
+    click.echo(f"Regels:      {summary['rules']}")
+    click.echo(f"Gem. score:  {summary['mean_score']}")
+
+    click.echo("\nScoreverdeling:")
+    histogram = summary["score_histogram"]
+    for low, count in zip(histogram["edges"], histogram["counts"], strict=False):
+        click.echo(f"  {low:>4.1f}+ {count:>7}")
+
+    click.echo("\nCategoriegemiddelden:")
+    for category, mean in summary["category_means"].items():
+        click.echo(f"  {category:<10} {mean if mean is not None else '-'}")
+
+    click.echo("\nMeest falende regels:")
+    for row in summary["top_failing_rules"]:
+        click.echo(f"  {row['rule']:<12} {row['fail_rate']:>7.1%} ({row['failed']})")
+
+    click.echo("\nDefinities met de meeste overtredingen:")
+    for row in summary["top_offenders"]:
+        click.echo(
+            f"  #{row['definitie_id']:<8} {row['failed_rules']:>3} regels, "
+            f"score {row['score']}"
+        )
+
+
+if __name__ == "__main__":
+    revalidation()
@@ -0,0 +1,90 @@
+"""CLI voor bulk UFO herclassificatie van het definitie-corpus.
+
+Usage:
+    python -m src.cli.ufo_cli reclassify
+    python -m src.cli.ufo_cli reclassify --dry-run --json
+    python -m src.cli.ufo_cli reclassify --only-missing --min-confidence 0.5
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for proper imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import click
+
+
+@click.group()
+def ufo():
+    """UFO classificatie commands."""
+
+
+@ufo.command()
+@click.option("--db", "db_path", default=None, help="Pad naar definities database")
+@click.option(
+    "--only-missing", is_flag=True, help="Alleen definities zonder UFO categorie"
+)
+@click.option(
+    "--min-confidence",
+    default=0.0,
+    show_default=True,
+    type=float,
+    help="Minimale confidence om weg te schrijven",
+)
+@click.option("--dry-run", is_flag=True, help="Niets wegschrijven")
+@click.option("--json", "as_json", is_flag=True, help="Rapport als JSON")
+def reclassify(
+    db_path: str | None,
+    only_missing: bool,
+    min_confidence: float,
+    dry_run: bool,
+    as_json: bool,
+):
+    """Classificeer alle definities in bulk en werk ufo_categorie bij.
+
+    \b
+    Examples:
+        ufo_cli.py reclassify
+        ufo_cli.py reclassify --dry-run --json
+    """
+    from database.definitie_repository import get_definitie_repository
+    from services.ufo_bulk_classifier import BulkUFOClassifier
+    from services.ufo_classifier_service import get_ufo_classifier
+
+    report = BulkUFOClassifier(get_ufo_classifier()).reclassify_repository(
+        get_definitie_repository(db_path),
+        only_missing=only_missing,
+        min_confidence=min_confidence,
+        dry_run=dry_run,
+    )
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    click.echo("\n=== UFO Herclassificatie ===\n")
+    click.echo(f"Definities:          {report.definitions}")
+    click.echo(f"Geclassificeerd:     {report.classified}")
+    click.echo(f"Gedisambigueerd:     {report.disambiguated}")
+    click.echo(f"Ongewijzigd:         {report.unchanged}")
+    click.echo(f"Unknown:             {report.skipped_unknown}")
+    click.echo(f"Te lage confidence:  {report.skipped_low_confidence}")
+    click.echo(f"Niet opslaanbaar:    {report.skipped_unstorable}")
+    click.echo(f"Doorlooptijd:        {report.elapsed_seconds:.2f}s")
+    click.echo("\nVerdeling:")
+    for category, count in sorted(
+        report.distribution.items(), key=lambda item: item[1], reverse=True
+    ):
+        click.echo(f"  {category:<12} {count:>6}")
+    if dry_run:
+        click.echo(f"\nDry-run: {report.updated} wijzigingen niet weggeschreven.")
+    else:
+        click.echo(f"\nBijgewerkt:          {report.updated}")
+
+
+if __name__ == "__main__":
+    ufo()
@@ -9,6 +9,7 @@ inclusief opslaan, ophalen, zoeken en duplicaat detectie.
 import json  # JSON encoding en decoding voor metadata opslag
 import logging  # Logging functionaliteit voor debug en monitoring
 import sqlite3  # SQLite database interface voor lokale database opslag
+import unicodedata  # Unicode normalisatie voor begrip_norm
 from dataclasses import (  # Dataclass decorators voor gestructureerde data
     asdict,
     dataclass,
@@ -57,6 +58,26 @@ class SourceType(Enum):
     MANUAL = "manual"  # Handmatig ingevoerde definitie
 
 
+def normalize_begrip(begrip: str | None) -> str:
+    """Genormaliseerd begrip voor de kolom ``begrip_norm`` (NFC, gestript, lowercase).
+
+    In Python i.p.v. SQL ``LOWER()``: die verlaagt alleen ASCII-letters.
+    """
+    return unicodedata.normalize("NFC", begrip or "").strip().lower()
+
+
+def _normalized_context(value: Any) -> tuple[str, ...]:
+    """Contextlijst (lijst of JSON string) → gesorteerde, unieke lowercase waarden."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value) if value.strip() else []
+        except json.JSONDecodeError:
+            value = [value]
+    if not isinstance(value, list | tuple | set):
+        value = [value] if value else []
+    return tuple(sorted({str(x or "").strip().lower() for x in value} - {""}))
+
+
 @dataclass
 class DefinitieRecord:
     """Representatie van een definitie record in de database.
@@ -469,6 +490,7 @@ class DefinitieRepository:
                     logger.debug(
                         f"Database tables already exist ({table_count} found), skipping schema creation"
                     )
+                self._ensure_begrip_norm(conn)
         else:
             # Fallback schema creation if schema.sql not found
             logger.warning("schema.sql not found, creating basic schema")
@@ -495,8 +517,51 @@ class DefinitieRepository:
                     )
                 """
                 )
+                self._ensure_begrip_norm(conn)
                 conn.commit()
 
+    def _ensure_begrip_norm(self, conn: sqlite3.Connection) -> None:
+        """Kolom en index voor ``begrip_norm`` (CON-01 duplicate lookup).
+
+        Bestaande databases krijgen de kolom erbij; rijen zonder waarde worden
+        eenmalig aangevuld. Via de index is de ``IS NULL`` check bij volgende
+        starts goedkoop. Rijen die buiten deze repository zonder waarde zijn
+        geschreven vindt ``find_by_context_key`` ook zonder backfill.
+        """
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(definities)")}
+            if not columns:
+                return
+            if "begrip_norm" not in columns:
+                conn.execute("ALTER TABLE definities ADD COLUMN begrip_norm TEXT")
+            # Voorganger: expressie-index op LOWER(TRIM(begrip)) (alleen ASCII)
+            old = conn.execute(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type = 'index' AND name = 'idx_definities_begrip_norm'"
+            ).fetchone()
+            if old and "LOWER" in str(old[0]).upper():
+                conn.execute("DROP INDEX idx_definities_begrip_norm")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_definities_begrip_norm "
+                "ON definities(begrip_norm)"
+            )
+            missing = [
+                (normalize_begrip(row[1]), row[0])
+                for row in conn.execute(
+                    "SELECT id, begrip FROM definities WHERE begrip_norm IS NULL"
+                )
+            ]
+            if not missing:
+                return
+            conn.execute("BEGIN")
+            conn.executemany(
+                "UPDATE definities SET begrip_norm = ? WHERE id = ?", missing
+            )
+            conn.execute("COMMIT")
+            logger.info(f"begrip_norm aangevuld voor {len(missing)} definities")
+        except sqlite3.Error as e:
+            logger.warning(f"begrip_norm kolom/index niet bijgewerkt: {e}")
+
     def _split_sql_statements(self, sql: str) -> list[str]:
         """Split SQL bestand in individuele statements."""
         statements = []
@@ -591,6 +656,8 @@ class DefinitieRepository:
             columns, values = self._build_insert_columns(
                 record, wb_value, include_legacy
             )
+            columns.append("begrip_norm")
+            values.append(normalize_begrip(record.begrip))
             column_sql = ", ".join(columns)
             placeholders = ", ".join("?" for _ in columns)
 
@@ -914,6 +981,67 @@ class DefinitieRepository:
             row = cur.fetchone()
             return int(row[0]) if row else 0
 
+    def find_by_context_key(
+        self,
+        begrip: str,
+        organisatorische_context: Any,
+        juridische_context: Any = None,
+        wettelijke_basis: Any = None,
+        categorie: str | None = None,
+        exclude_id: int | None = None,
+    ) -> DefinitieRecord | None:
+        """
+        Zoek een definitie met hetzelfde begrip en dezelfde genormaliseerde context.
+
+        Kandidaten komen via de index op ``begrip_norm`` (plus rijen waarvan
+        die nog niet is ingevuld); de drie contextlijsten worden orde- en
+        hoofdletterongevoelig vergeleken.
+        Gebruikt door CON-01 voor het duplicate-context signaal.
+
+        Args:
+            begrip: Het begrip
+            organisatorische_context: Lijst (of JSON string) met organisaties
+            juridische_context: Lijst (of JSON string) met juridische context
+            wettelijke_basis: Lijst (of JSON string) met wettelijke basis
+            categorie: Optionele categorie (genegeerd als kandidaat er geen heeft)
+            exclude_id: Definitie die niet als duplicaat telt (de gevalideerde zelf)
+
+        Returns:
+            Meest recente versie van een gevonden DefinitieRecord, of None
+        """
+        begrip_norm = normalize_begrip(begrip)
+        if not begrip_norm:
+            return None
+        key = (
+            _normalized_context(organisatorische_context),
+            _normalized_context(juridische_context),
+            _normalized_context(wettelijke_basis),
+        )
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM definities "
+                "WHERE (begrip_norm = ? OR begrip_norm IS NULL) AND id != ? "
+                "ORDER BY version_number DESC, id DESC",
+                (begrip_norm, exclude_id if exclude_id is not None else -1),
+            )
+            for row in cursor:
+                record = self._row_to_record(row)
+                if normalize_begrip(record.begrip) != begrip_norm:
+                    continue
+                if (
+                    categorie
+                    and record.categorie
+                    and str(record.categorie).lower() != str(categorie).lower()
+                ):
+                    continue
+                if (
+                    _normalized_context(record.organisatorische_context),
+                    _normalized_context(record.juridische_context),
+                    _normalized_context(record.wettelijke_basis),
+                ) == key:
+                    return record
+        return None
+
     def update_definitie(
         self, definitie_id: int, updates: dict[str, Any], updated_by: str | None = None
     ) -> bool:
@@ -971,6 +1099,9 @@ class DefinitieRepository:
 
             if not set_clauses:
                 return False
+            if "begrip" in updates:
+                set_clauses.append("begrip_norm = ?")
+                params.append(normalize_begrip(updates["begrip"]))
 
             # Add metadata
             set_clauses.append("updated_at = ?")
@@ -1090,6 +1221,65 @@ class DefinitieRepository:
 
         return self.search_definities(status=status_enum, limit=None)
 
+    def update_validation_results(
+        self, results: list[tuple[int, float, list[dict[str, Any]]]]
+    ) -> int:
+        """
+        Schrijf (her)berekende validatieresultaten weg in één transactie.
+
+        Validatiescore en -issues zijn afgeleide data: er wordt geen versie
+        verhoogd en geen geschiedenis gelogd (bijv. corpus-revalidatie na een
+        regelwijziging).
+
+        Args:
+            results: Lijst van (definitie_id, validation_score, violations)
+
+        Returns:
+            Aantal bijgewerkte definities
+        """
+        if not results:
+            return 0
+        now = datetime.now(UTC)
+        rows = [
+            (score, now, json.dumps(issues, ensure_ascii=False), definitie_id)
+            for definitie_id, score, issues in results
+        ]
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
+            cursor = conn.executemany(
+                """
+                UPDATE definities
+                   SET validation_score = ?, validation_date = ?, validation_issues = ?
+                 WHERE id = ?
+                """,
+                rows,
+            )
+            conn.execute("COMMIT")
+            return cursor.rowcount
+
+    def update_ufo_categories(self, updates: list[tuple[int, str]]) -> int:
+        """
+        Schrijf (her)berekende UFO categorieën weg in één transactie.
+
+        Bedoeld voor corpus-herclassificatie; er wordt geen versie verhoogd.
+
+        Args:
+            updates: Lijst van (definitie_id, ufo_categorie)
+
+        Returns:
+            Aantal bijgewerkte definities
+        """
+        if not updates:
+            return 0
+        rows = [(categorie, definitie_id) for definitie_id, categorie in updates]
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
+            cursor = conn.executemany(
+                "UPDATE definities SET ufo_categorie = ? WHERE id = ?", rows
+            )
+            conn.execute("COMMIT")
+            return cursor.rowcount
+
     def search_definities(
         self,
         query: str | None = None,
@@ -1188,6 +1378,16 @@ class DefinitieRepository:
 
             return stats
 
+    def get_validation_scores(self) -> dict[int, float]:
+        """Validatiescore per definitie-ID (alleen definities mét score)."""
+        with self._get_connection() as conn:
+            return dict(
+                conn.execute(
+                    "SELECT id, validation_score FROM definities "
+                    "WHERE validation_score IS NOT NULL"
+                ).fetchall()
+            )
+
     def export_to_json(
         self, file_path: str, filters: dict[str, Any] | None = None
     ) -> int:
@@ -0,0 +1,20 @@
+-- Migration: geïndexeerde duplicate-context lookup voor CON-01
+-- Date: 2026-10-18
+-- Description: Opgeslagen genormaliseerd begrip (begrip_norm) met index zodat
+--              find_by_context_key() alleen kandidaten met hetzelfde begrip leest
+--              i.p.v. alle definities (O(1) per validatie i.p.v. O(n)).
+--              De normalisatie (NFC, strip, lowercase) gebeurt in Python: SQL
+--              LOWER() verlaagt alleen ASCII-letters.
+--
+-- De kolom zelf voegt DefinitieRepository toe bij het openen van een bestaande
+-- database (en vult ontbrekende waarden eenmalig aan). SQLite kent geen
+-- "ADD COLUMN IF NOT EXISTS", dus dit script doet alleen wat herhaalbaar is:
+-- de voorganger (expressie-index op LOWER(TRIM(begrip))) vervangen. Open de
+-- database eerst één keer via de applicatie.
+
+DROP INDEX IF EXISTS idx_definities_begrip_norm;
+CREATE INDEX IF NOT EXISTS idx_definities_begrip_norm ON definities(begrip_norm);
+
+-- Related Files:
+-- - src/database/definitie_repository.py (normalize_begrip, find_by_context_key)
+-- - src/services/validation/modular_validation_service.py (_find_duplicate_definition)
@@ -11,6 +11,7 @@ CREATE TABLE definities (
 
     -- Kern informatie
     begrip VARCHAR(255) NOT NULL,
+    begrip_norm TEXT, -- NFC + strip + lowercase (in Python), voor duplicate lookup
     definitie TEXT NOT NULL,
     categorie VARCHAR(50) NOT NULL CHECK (categorie IN (
         -- Basis categorieën (legacy support)
@@ -86,6 +87,7 @@ CREATE TABLE definities (
 
 -- Index voor snelle lookups
 CREATE INDEX idx_definities_begrip ON definities(begrip);
+CREATE INDEX idx_definities_begrip_norm ON definities(begrip_norm);
 CREATE INDEX idx_definities_context ON definities(organisatorische_context, juridische_context);
 CREATE INDEX idx_definities_status ON definities(status);
 CREATE INDEX idx_definities_categorie ON definities(categorie);
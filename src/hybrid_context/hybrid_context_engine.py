@@ -3,7 +3,6 @@ Hybrid Context Engine - Hoofdcomponent voor hybride context verrijking.
 Combineert web lookup met document processing voor optimale definitie generatie.
 """
 
-import asyncio  # Async support voor web lookup
 import logging  # Logging faciliteiten voor debug en monitoring
 from dataclasses import dataclass  # Dataklassen voor gestructureerde context data
 from datetime import (  # Datum en tijd functionaliteit voor timestamps, timezone
@@ -19,6 +18,7 @@ from document_processing.document_processor import (
 # Legacy web_lookup import replaced with modern service
 # from web_lookup.lookup import zoek_definitie_combinatie  # DEPRECATED
 from services.modern_web_lookup_service import ModernWebLookupService
+from utils.background_loop import run_sync
 
 from .context_fusion import ContextFusion  # Context fusie en samenvoeging
 from .smart_source_selector import SmartSourceSelector  # Intelligente bron selectie
@@ -36,18 +36,9 @@ def zoek_definitie_combinatie(term: str, *args: Any, **kwargs: Any) -> dict[str,
         request = LookupRequest(term=term, max_results=5)
         return await _web_lookup_service.lookup(request)
 
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop, create one
-        return cast(dict[str, Any], asyncio.run(_async_lookup()))
-
-    # If there's a running loop, run in thread to avoid nested loop issues
-    import concurrent.futures
-
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(asyncio.run, _async_lookup())
-        return cast(dict[str, Any], future.result())
+    # Persistente background loop: de aiohttp sessies van de lookup service
+    # blijven herbruikbaar tussen aanroepen (geen nieuwe loop per lookup)
+    return cast(dict[str, Any], run_sync(_async_lookup()))
 
 
 # Imports zijn al bovenaan toegevoegd
@@ -25,6 +25,7 @@ if str(src_path) not in sys.path:
 
 import streamlit as st
 
+from ui.helpers.async_bridge import begin_script_run
 from ui.session_state import SessionStateManager
 from ui.tabbed_interface import TabbedInterface
 from utils.exceptions import log_and_display_error
@@ -108,6 +109,8 @@ def main():
         # Measure Streamlit initialization overhead only
         init_start = time.perf_counter()
         SessionStateManager.initialize_session_state()
+        # Nieuwe script run: annuleer async werk van de vorige run van deze sessie
+        begin_script_run()
         init_ms = (time.perf_counter() - init_start) * 1000
 
         # Create interface (CACHED via @st.cache_resource)
@@ -0,0 +1,178 @@
+"""Import-time profiel van de app startup.
+
+Draait ``python -X importtime`` in een vers proces over de modules die
+``src/main.py`` bij het starten importeert, en vat de output samen per
+module en per top-level package. Resultaten gaan naar de PerformanceTracker
+(baseline + regressie detectie) en worden getoetst aan een budget: een
+maximum totale import-tijd en een lijst zware dependencies die pas bij de
+eerste render van een tab geladen mogen worden.
+"""
+
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from monitoring.performance_tracker import PerformanceTracker
+
+SRC_DIR = Path(__file__).parent.parent
+
+# Modules die src/main.py op module-niveau importeert
+STARTUP_MODULES = (
+    "ui.tabbed_interface",
+    "ui.session_state",
+    "ui.helpers.async_bridge",
+    "utils.exceptions",
+    "utils.progress_callback",
+    "utils.structured_logging",
+    "utils.logging_filters",
+)
+
+# Zware dependencies die niet bij startup geladen mogen worden
+DEFERRED_MODULES = ("pandas", "openpyxl", "PyPDF2", "docx", "aiohttp")
+
+METRIC_PREFIX = "startup_import"
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Eén regel uit ``-X importtime`` (tijden in microseconden)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".", 1)[0]
+
+
+@dataclass
+class ImportProfile:
+    """Samenvatting van één import-run."""
+
+    timings: list[ImportTiming]
+    wall_ms: float
+    modules: tuple[str, ...] = field(default=STARTUP_MODULES)
+
+    @property
+    def total_ms(self) -> float:
+        """Som van alle self-tijden: totale import-tijd van het proces."""
+        return sum(t.self_us for t in self.timings) / 1000
+
+    def imported(self, module: str) -> bool:
+        """True als ``module`` (of een submodule ervan) geïmporteerd is."""
+        prefix = module + "."
+        return any(
+            t.module == module or t.module.startswith(prefix) for t in self.timings
+        )
+
+    def by_package(self) -> dict[str, float]:
+        """Import-tijd per top-level package in ms, aflopend gesorteerd."""
+        totals: dict[str, int] = defaultdict(int)
+        for timing in self.timings:
+            totals[timing.package] += timing.self_us
+        return {
+            package: us / 1000
+            for package, us in sorted(totals.items(), key=lambda kv: -kv[1])
+        }
+
+    def slowest(self, limit: int = 15) -> list[ImportTiming]:
+        """Modules met de hoogste cumulatieve import-tijd."""
+        return sorted(self.timings, key=lambda t: -t.cumulative_us)[:limit]
+
+
+@dataclass
+class ImportBudget:
+    """Grenzen voor de startup imports."""
+
+    total_ms: float = 1200.0
+    deferred_modules: tuple[str, ...] = DEFERRED_MODULES
+
+    def check(self, profile: ImportProfile) -> list[str]:
+        """Geef een lijst overschrijdingen (leeg = binnen budget)."""
+        violations = []
+        if profile.total_ms > self.total_ms:
+            violations.append(
+                f"import-tijd {profile.total_ms:.0f}ms > budget {self.total_ms:.0f}ms"
+            )
+        violations.extend(
+            f"'{module}' wordt bij startup geïmporteerd (hoort lazy te zijn)"
+            for module in self.deferred_modules
+            if profile.imported(module)
+        )
+        return violations
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse de stderr van ``python -X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(
+                    module=module,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=max(len(indent) - 1, 0) // 2,
+                )
+            )
+    return timings
+
+
+def profile_imports(
+    modules: tuple[str, ...] = STARTUP_MODULES,
+    *,
+    python: str = sys.executable,
+    src_dir: Path = SRC_DIR,
+) -> ImportProfile:
+    """Meet de imports van ``modules`` in een vers Python proces (cold start)."""
+    statement = "import " + ", ".join(modules)
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=src_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if completed.returncode != 0:
+        tail = completed.stderr.strip().splitlines()[-1:] or ["onbekende fout"]
+        msg = f"Import van startup modules faalde: {tail[0]}"
+        raise RuntimeError(msg)
+    return ImportProfile(
+        timings=parse_importtime(completed.stderr), wall_ms=wall_ms, modules=modules
+    )
+
+
+def record_import_profile(
+    profile: ImportProfile, tracker: "PerformanceTracker", *, top_packages: int = 10
+) -> dict[str, str | None]:
+    """Sla het profiel op in de tracker en geef regressie-status per metric.
+
+    De regressie wordt getoetst tegen de baseline van vóór deze meting.
+    """
+    metrics = {
+        f"{METRIC_PREFIX}_total_ms": profile.total_ms,
+        f"{METRIC_PREFIX}_wall_ms": profile.wall_ms,
+    }
+    for package, ms in list(profile.by_package().items())[:top_packages]:
+        metrics[f"{METRIC_PREFIX}.{package}_ms"] = ms
+
+    metadata = {"platform": sys.platform, "modules": list(profile.modules)}
+    statuses = {}
+    for name, value in metrics.items():
+        statuses[name] = tracker.check_regression(name, value)
+        tracker.track_metric(name, round(value, 2), metadata=metadata)
+    return statuses
@@ -0,0 +1,167 @@
+"""
+Offline benchmark voor ``ModernWebLookupService.lookup``.
+
+Draait de volledige lookup pipeline tegen de replay harness
+(``monitoring.web_lookup_replay``) en meet:
+
+- end-to-end latency per term (P50/P95/max) en totale doorlooptijd
+- CPU tijd van ranking/dedup (``rank_and_dedup``)
+- piek geheugengebruik (tracemalloc)
+
+Wordt gebruikt door ``scripts/benchmarks/benchmark_web_lookup.py`` en door de
+offline performance regressietests (``tests/performance``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from services.interfaces import LookupRequest
+
+from .web_lookup_replay import Cassette, replay_http
+
+BASE_TERMS = [
+    "vonnis",
+    "voorlopige hechtenis",
+    "dagvaarding",
+    "hoger beroep",
+    "cassatie",
+    "onherroepelijk",
+    "verdachte",
+    "bestuursorgaan",
+    "beschikking",
+    "proces-verbaal",
+    "strafbeschikking",
+    "reclassering",
+    "tenuitvoerlegging",
+    "vreemdeling",
+    "bewaring",
+]
+
+CONTEXTS = [None, "OM | Sv", "DJI | strafrecht", "bestuursrecht | Awb"]
+
+
+def generate_terms(n: int) -> list[tuple[str, str | None]]:
+    """Genereer ``n`` (term, context) paren; elke tiende term is een ECLI."""
+    terms: list[tuple[str, str | None]] = []
+    for i in range(n):
+        if i % 10 == 9:
+            terms.append((f"ECLI:NL:HR:2023:{1000 + i}", None))
+            continue
+        base = BASE_TERMS[i % len(BASE_TERMS)]
+        cycle = i // len(BASE_TERMS)
+        term = base if cycle == 0 else f"{base} {cycle}"
+        terms.append((term, CONTEXTS[i % len(CONTEXTS)]))
+    return terms
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def run_lookup_benchmark(
+    n_terms: int,
+    cassette: Cassette | str | Path | None = None,
+    concurrency: int = 8,
+    synthetic: bool = True,
+    **server_options: Any,
+) -> dict[str, Any]:
+    """
+    Benchmark de lookup pipeline offline voor ``n_terms`` termen.
+
+    Args:
+        n_terms: Aantal termen (1-500 in de standaard suite)
+        cassette: Cassette (of pad) met vastgelegde provider responses
+        concurrency: Aantal gelijktijdige lookups
+        synthetic: Synthetische responses voor requests buiten de cassette
+        **server_options: Opties voor de ReplayServer (latency_ms,
+            failure_rate, seed, ...)
+
+    Returns:
+        Dict met latency, ranking CPU, geheugen en replay statistieken
+    """
+    from services.modern_web_lookup_service import ModernWebLookupService
+    from services.web_lookup import ranking
+
+    terms = generate_terms(n_terms)
+    latencies: list[float] = []
+    result_counts: list[int] = []
+    ranking_cpu = 0.0
+    ranking_calls = 0
+    original_rank = ranking.rank_and_dedup
+
+    def _timed_rank(*args: Any, **kwargs: Any) -> Any:
+        nonlocal ranking_cpu, ranking_calls
+        start = time.process_time()
+        try:
+            return original_rank(*args, **kwargs)
+        finally:
+            ranking_cpu += time.process_time() - start
+            ranking_calls += 1
+
+    # Geïnjecteerde failures mogen de echte provider health niet vervuilen
+    health_dir = tempfile.TemporaryDirectory()
+    previous_health_db = os.environ.get("PROVIDER_HEALTH_DB")
+    os.environ["PROVIDER_HEALTH_DB"] = str(Path(health_dir.name) / "health.db")
+    ranking.rank_and_dedup = _timed_rank  # type: ignore[assignment]
+    tracemalloc.start()
+    try:
+        async with replay_http(
+            cassette, synthetic=synthetic, **server_options
+        ) as server:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def _one(term: str, context: str | None) -> None:
+                async with semaphore:
+                    start = time.perf_counter()
+                    # Eigen instance per lookup: debug attempts zijn per-call state
+                    service = ModernWebLookupService()
+                    results = await service.lookup(
+                        LookupRequest(term=term, context=context, max_results=5)
+                    )
+                    latencies.append(time.perf_counter() - start)
+                    result_counts.append(len(results))
+
+            wall_start = time.perf_counter()
+            await asyncio.gather(*(_one(t, c) for t, c in terms))
+            wall = time.perf_counter() - wall_start
+            stats = server.stats
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        ranking.rank_and_dedup = original_rank  # type: ignore[assignment]
+        if previous_health_db is None:
+            os.environ.pop("PROVIDER_HEALTH_DB", None)
+        else:
+            os.environ["PROVIDER_HEALTH_DB"] = previous_health_db
+        health_dir.cleanup()
+
+    return {
+        "terms": n_terms,
+        "concurrency": concurrency,
+        "wall_seconds": wall,
+        "throughput_per_s": n_terms / wall if wall else 0.0,
+        "latency_p50_ms": _percentile(latencies, 0.5) * 1000,
+        "latency_p95_ms": _percentile(latencies, 0.95) * 1000,
+        "latency_max_ms": max(latencies, default=0.0) * 1000,
+        "latency_mean_ms": (statistics.fmean(latencies) * 1000) if latencies else 0.0,
+        "ranking_cpu_ms": ranking_cpu * 1000,
+        "ranking_calls": ranking_calls,
+        "peak_memory_mb": peak / (1024 * 1024),
+        "avg_results": statistics.fmean(result_counts) if result_counts else 0.0,
+        "http_requests": stats.requests,
+        "cassette_hits": stats.hits,
+        "synthetic_responses": stats.synthetic,
+        "misses": stats.misses,
+        "injected_failures": stats.injected_failures,
+    }
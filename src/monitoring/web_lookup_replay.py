@@ -0,0 +1,486 @@
+"""
+Offline record/replay harness voor de web lookup pipeline.
+
+Alle providers maken hun HTTP sessie via
+``services.web_lookup.http_session.create_session``. Binnen ``replay_http()``
+wordt daar een sessie geïnjecteerd die provider requests naar een lokale
+stand-in HTTP server stuurt. Die server:
+
+- geeft responses uit een cassette (JSON bestand) terug (``mode="replay"``)
+- zet requests door naar de echte provider en legt de responses vast in de
+  cassette (``mode="record"``)
+- genereert voor onbekende requests optioneel synthetische, realistische
+  responses (``synthetic=True``), zodat ook honderden termen offline
+  gebenchmarkt kunnen worden
+- injecteert latency (per host instelbaar, met jitter) en failures (HTTP 5xx
+  of een hangende response)
+
+De services zelf zien een echte aiohttp response, inclusief streaming body;
+aiohttp wordt niet gepatcht. Gebruik::
+
+    async with replay_http("tests/fixtures/cassettes/web_lookup_basic.json",
+                           latency_ms=20, failure_rate=0.1) as server:
+        results = await ModernWebLookupService().lookup(request)
+    print(server.stats)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import socket
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from html import escape
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlencode
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+from services.web_lookup.http_session import use_session_factory
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+REPLAY_PREFIX = "/__replay__"
+
+
+def request_key(method: str, url: str | URL) -> str:
+    """Canonieke sleutel voor een request (query parameters gesorteerd)."""
+    u = URL(str(url))
+    query = urlencode(sorted(u.query.items()))
+    path = unquote(u.raw_path)
+    return f"{method.upper()} {u.scheme}://{u.host}{path}" + (
+        f"?{query}" if query else ""
+    )
+
+
+@dataclass
+class Interaction:
+    """Eén vastgelegde request/response."""
+
+    method: str
+    url: str
+    status: int
+    content_type: str
+    body: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "content_type": self.content_type,
+            "body": self.body,
+        }
+
+
+@dataclass
+class Cassette:
+    """Verzameling vastgelegde interacties, opgeslagen als JSON."""
+
+    path: Path | None = None
+    interactions: dict[str, Interaction] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Laad een cassette; een niet-bestaand bestand geeft een lege cassette."""
+        cassette = cls(path=Path(path))
+        if cassette.path and cassette.path.exists():
+            data = json.loads(cassette.path.read_text(encoding="utf-8"))
+            for item in data.get("interactions", []):
+                cassette.add(Interaction(**item))
+        return cassette
+
+    def add(self, interaction: Interaction) -> None:
+        self.interactions[request_key(interaction.method, interaction.url)] = (
+            interaction
+        )
+
+    def get(self, method: str, url: str | URL) -> Interaction | None:
+        return self.interactions.get(request_key(method, url))
+
+    def save(self, path: str | Path | None = None) -> None:
+        target = Path(path) if path else self.path
+        if target is None:
+            msg = "Geen pad opgegeven om de cassette op te slaan"
+            raise ValueError(msg)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CASSETTE_VERSION,
+            "interactions": [i.to_dict() for i in self.interactions.values()],
+        }
+        target.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+
+@dataclass
+class ReplayStats:
+    """Tellers van de stand-in server."""
+
+    requests: int = 0
+    hits: int = 0
+    synthetic: int = 0
+    recorded: int = 0
+    misses: int = 0
+    injected_failures: int = 0
+    injected_stalls: int = 0
+    per_host: dict[str, int] = field(default_factory=dict)
+
+
+class ReplayServer:
+    """Lokale stand-in HTTP server voor provider requests."""
+
+    def __init__(
+        self,
+        cassette: Cassette | None = None,
+        mode: str = "replay",
+        synthetic: bool = False,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        host_latency_ms: dict[str, float] | None = None,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        stall_rate: float = 0.0,
+        stall_seconds: float = 60.0,
+        seed: int | None = None,
+    ):
+        """Initialize replay server.
+
+        Args:
+            cassette: Cassette met vastgelegde interacties
+            mode: "replay" (alleen cassette) of "record" (doorzetten + vastleggen)
+            synthetic: Genereer responses voor requests die niet in de cassette staan
+            latency_ms: Basis latency per response
+            jitter_ms: Uniforme extra latency (0..jitter_ms)
+            host_latency_ms: Latency per host (overschrijft latency_ms)
+            failure_rate: Kans (0..1) op een geïnjecteerde HTTP failure
+            failure_status: HTTP status voor geïnjecteerde failures
+            stall_rate: Kans (0..1) dat een response ``stall_seconds`` hangt
+                (simuleert timeouts)
+            stall_seconds: Duur van een hangende response
+            seed: Seed voor reproduceerbare latency/failure injectie
+        """
+        if mode not in ("replay", "record"):
+            msg = f"Onbekende replay mode: {mode}"
+            raise ValueError(msg)
+        self.cassette = cassette or Cassette()
+        self.mode = mode
+        self.synthetic = synthetic
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.host_latency_ms = host_latency_ms or {}
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.stats = ReplayStats()
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self._upstream: aiohttp.ClientSession | None = None
+        self.base_url = ""
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", REPLAY_PREFIX + "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        # Vooraf gebonden socket: de vrije poort is bekend zonder aiohttp internals
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        site = web.SockSite(self._runner, sock)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{port}"
+        if self.mode == "record":
+            self._upstream = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+
+    async def stop(self) -> None:
+        if self._upstream:
+            await self._upstream.close()
+        if self._runner:
+            await self._runner.cleanup()
+
+    def rewrite(self, url: URL) -> URL:
+        """Vertaal een provider URL naar de stand-in server."""
+        target = (
+            f"{self.base_url}{REPLAY_PREFIX}/{url.scheme}/{url.raw_host}"
+            f"{url.raw_path_qs}"
+        )
+        return URL(target, encoded=True)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        scheme, _, rest = request.match_info["tail"].partition("/")
+        host, _, _ = rest.partition("/")
+        raw = request.raw_path[len(REPLAY_PREFIX) + len(scheme) + 2 :]
+        original = f"{scheme}://{raw}"
+        self.stats.requests += 1
+        self.stats.per_host[host] = self.stats.per_host.get(host, 0) + 1
+
+        delay = self.host_latency_ms.get(host, self.latency_ms)
+        if self.jitter_ms:
+            delay += self._rng.uniform(0, self.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+        if self.stall_rate and self._rng.random() < self.stall_rate:
+            self.stats.injected_stalls += 1
+            await asyncio.sleep(self.stall_seconds)
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            self.stats.injected_failures += 1
+            return web.Response(
+                status=self.failure_status, text="Injected failure (replay harness)"
+            )
+
+        interaction = self.cassette.get(request.method, original)
+        if interaction is None and self.mode == "record":
+            interaction = await self._record(request.method, original)
+        elif interaction is not None:
+            self.stats.hits += 1
+        if interaction is None and self.synthetic:
+            interaction = synthesize_response(request.method, original)
+            if interaction is not None:
+                self.stats.synthetic += 1
+        if interaction is None:
+            self.stats.misses += 1
+            logger.debug(f"Replay miss: {request_key(request.method, original)}")
+            return web.Response(status=404, text="Not in cassette")
+
+        return web.Response(
+            status=interaction.status,
+            body=interaction.body.encode("utf-8"),
+            content_type=interaction.content_type,
+            charset="utf-8",
+        )
+
+    async def _record(self, method: str, url: str) -> Interaction | None:
+        assert self._upstream is not None
+        try:
+            async with self._upstream.request(method, URL(url, encoded=True)) as resp:
+                body = await resp.text(errors="replace")
+                interaction = Interaction(
+                    method=method,
+                    url=url,
+                    status=resp.status,
+                    content_type=resp.content_type or "text/plain",
+                    body=body,
+                )
+        except Exception as e:
+            logger.warning(f"Opnemen van {url} gefaald: {e}")
+            return None
+        self.cassette.add(interaction)
+        self.stats.recorded += 1
+        return interaction
+
+
+class StandInSession:
+    """Provider sessie die alle requests naar de stand-in server stuurt.
+
+    Biedt het deel van de ``aiohttp.ClientSession`` API dat de providers
+    gebruiken (``get``/``request``/``close``) en delegeert naar een echte
+    sessie; ``params`` worden vooraf in de URL opgenomen.
+    """
+
+    def __init__(self, server: ReplayServer, **session_kwargs: Any):
+        # Loopback verkeer mag niet via een geconfigureerde proxy lopen
+        session_kwargs.pop("trust_env", None)
+        self._server = server
+        self._session = aiohttp.ClientSession(**session_kwargs)
+
+    def request(
+        self, method: str, url: str | URL, *, params: Any = None, **kwargs: Any
+    ) -> Any:
+        target = URL(str(url)) if not isinstance(url, URL) else url
+        if params:
+            target = target.extend_query(params)
+        return self._session.request(method, self._server.rewrite(target), **kwargs)
+
+    def get(self, url: str | URL, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self) -> StandInSession:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+@asynccontextmanager
+async def replay_http(
+    cassette: Cassette | str | Path | None = None, **server_options: Any
+) -> AsyncIterator[ReplayServer]:
+    """
+    Leid provider requests binnen deze context om naar een ReplayServer.
+
+    Alleen sessies die via ``create_session`` worden gemaakt (in deze context
+    of daaruit gestarte tasks) worden omgeleid. In record mode wordt de
+    cassette bij het verlaten van de context opgeslagen.
+
+    Args:
+        cassette: Cassette of pad naar een cassette bestand
+        **server_options: Opties voor ``ReplayServer`` (mode, synthetic,
+            latency_ms, failure_rate, ...)
+    """
+    if not isinstance(cassette, Cassette):
+        cassette = Cassette.load(cassette) if cassette else Cassette()
+    server = ReplayServer(cassette, **server_options)
+    await server.start()
+    try:
+        with use_session_factory(lambda **kwargs: StandInSession(server, **kwargs)):
+            yield server
+    finally:
+        await server.stop()
+        if server.mode == "record" and cassette.path:
+            cassette.save()
+
+
+# --------------------
+# Synthetische responses
+# --------------------
+
+
+def _text_for(term: str, source: str) -> str:
+    # Tekst verschilt per bron zodat ranking/dedup realistisch werk krijgt
+    return (
+        f"{term.capitalize()} is een juridisch begrip dat in het Nederlandse "
+        f"recht wordt gebruikt. Het begrip {term} wordt volgens {source} nader "
+        "omschreven in wet- en regelgeving en in de rechtspraak."
+    )
+
+
+def _json(url: str, method: str, payload: Any) -> Interaction:
+    return Interaction(
+        method=method,
+        url=url,
+        status=200,
+        content_type="application/json",
+        body=json.dumps(payload, ensure_ascii=False),
+    )
+
+
+def _synthesize_mediawiki(method: str, url: str, u: URL) -> Interaction | None:
+    q = dict(parse_qsl(u.query_string))
+    site = u.host or ""
+    if "/api/rest_v1/page/summary/" in u.path:
+        title = unquote(u.path.rsplit("/", 1)[-1]).replace("_", " ")
+        return _json(
+            url,
+            method,
+            {
+                "type": "standard",
+                "title": title,
+                "pageid": zlib.crc32(title.encode("utf-8")),
+                "extract": _text_for(title, site),
+                "timestamp": "2025-01-01T00:00:00Z",
+                "content_urls": {
+                    "desktop": {
+                        "page": f"https://{site}/wiki/{title.replace(' ', '_')}"
+                    }
+                },
+            },
+        )
+    if q.get("list") == "search":
+        term = q.get("srsearch", "")
+        return _json(
+            url,
+            method,
+            {"query": {"search": [{"title": term, "snippet": _text_for(term, site)}]}},
+        )
+    if q.get("prop") == "extracts":
+        title = q.get("titles", "")
+        return _json(
+            url,
+            method,
+            {
+                "query": {
+                    "pages": {"1": {"title": title, "extract": _text_for(title, site)}}
+                }
+            },
+        )
+    if q.get("action") == "parse":
+        page = q.get("page", "")
+        wikitext = f"== Nederlands ==\n# [[{page}]]: {_text_for(page, site)}"
+        return _json(url, method, {"parse": {"wikitext": {"*": wikitext}}})
+    return None
+
+
+def _synthesize_sru(method: str, url: str, u: URL) -> Interaction:
+    q = dict(parse_qsl(u.query_string))
+    query = q.get("query", "")
+    # Ruwe term uit de CQL query (eerste quoted waarde)
+    term = query.split('"')[1] if '"' in query else query
+    n = max(1, min(int(q.get("maximumRecords", 3) or 3), 10))
+    records = "".join(
+        f"""
+    <srw:record>
+      <srw:recordSchema>{escape(q.get("recordSchema", "dc"))}</srw:recordSchema>
+      <srw:recordData>
+        <dc:dc xmlns:dc="http://purl.org/dc/elements/1.1/">
+          <dc:title>{escape(term)} ({i + 1})</dc:title>
+          <dc:description>{escape(_text_for(term, str(u.host)))}</dc:description>
+          <dc:identifier>https://{u.host}/{escape(term.replace(" ", "-"))}/{i + 1}</dc:identifier>
+          <dc:date>2024-01-0{i % 9 + 1}</dc:date>
+        </dc:dc>
+      </srw:recordData>
+      <srw:recordPosition>{i + 1}</srw:recordPosition>
+    </srw:record>"""
+        for i in range(n)
+    )
+    body = f"""<?xml version="1.0" encoding="UTF-8"?>
+<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/">
+  <srw:version>1.2</srw:version>
+  <srw:numberOfRecords>{n}</srw:numberOfRecords>
+  <srw:records>{records}
+  </srw:records>
+</srw:searchRetrieveResponse>"""
+    return Interaction(method, url, 200, "application/xml", body)
+
+
+def _synthesize_rechtspraak(method: str, url: str, u: URL) -> Interaction:
+    ecli = dict(parse_qsl(u.query_string)).get("id", "")
+    body = f"""<?xml version="1.0" encoding="UTF-8"?>
+<open-rechtspraak>
+  <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+           xmlns:dcterms="http://purl.org/dc/terms/">
+    <rdf:Description>
+      <dcterms:identifier>{escape(ecli)}</dcterms:identifier>
+      <dcterms:title>Uitspraak {escape(ecli)}</dcterms:title>
+      <dcterms:abstract>{escape(_text_for("uitspraak", str(u.host)))}</dcterms:abstract>
+      <dcterms:date>2023-05-01</dcterms:date>
+    </rdf:Description>
+  </rdf:RDF>
+</open-rechtspraak>"""
+    return Interaction(method, url, 200, "application/xml", body)
+
+
+def synthesize_response(method: str, url: str) -> Interaction | None:
+    """Genereer een realistische provider response voor een onbekend request."""
+    u = URL(url, encoded=True)
+    host = u.host or ""
+    if host.endswith(("wikipedia.org", "wiktionary.org")):
+        return _synthesize_mediawiki(method, url, u)
+    if u.query.get("operation") == "searchRetrieve":
+        return _synthesize_sru(method, url, u)
+    if host == "data.rechtspraak.nl" and "/uitspraken/content" in u.path:
+        return _synthesize_rechtspraak(method, url, u)
+    return None
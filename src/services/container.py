@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     from services.data_aggregation_service import DataAggregationService
     from services.export_service import ExportService
     from services.gpt4_synonym_suggester import GPT4SynonymSuggester
+    from services.jobs import JobQueue
     from services.synonym_orchestrator import SynonymOrchestrator
     from services.web_lookup.synonym_service import JuridischeSynoniemService
 
@@ -651,12 +652,38 @@ class ServiceContainer:
             logger.info("⚡ DefinitionImportService lazy-loaded (CSV helper)")
         return self._lazy_instances["import_service"]
 
+    def job_queue(self) -> "JobQueue":
+        """
+        Get or create JobQueue voor achtergrondjobs (LAZY-LOADED).
+
+        Generatie, CSV import en bulk export worden als job uitgevoerd op de
+        background event loop; de workers starten bij de eerste ``enqueue``.
+
+        Returns:
+            Singleton instance van JobQueue met de standaard handlers
+        """
+        if "job_queue" not in self._lazy_instances:
+            from services.jobs import JobQueue, register_default_handlers
+
+            queue = JobQueue(max_workers=self.config.get("job_max_workers", 2))
+            register_default_handlers(
+                queue,
+                self,
+                generation_concurrency=self.config.get("job_generation_concurrency", 1),
+            )
+            self._lazy_instances["job_queue"] = queue
+            logger.info("⚡ JobQueue lazy-loaded")
+        return self._lazy_instances["job_queue"]
+
     # UI-services worden niet in de servicescontainer opgebouwd. Gebruik UI-container.
 
     # Utility methods
 
     def reset(self):
         """Reset alle service instances (eager and lazy)."""
+        if "job_queue" in self._lazy_instances:
+            # Lopende jobs gaan terug naar de wachtrij voor de nieuwe queue
+            self._lazy_instances["job_queue"].stop()
         self._instances.clear()
         self._lazy_instances.clear()
         logger.debug("Alle service instances gereset (eager + lazy)")
@@ -683,6 +710,7 @@ class ServiceContainer:
             "gate_policy": self.gate_policy,
             "definition_workflow_service": self.definition_workflow_service,
             "import_service": self.import_service,
+            "job_queue": self.job_queue,
             "synonym_registry": self.synonym_registry,
             "gpt4_synonym_suggester": self.gpt4_synonym_suggester,
             "synonym_orchestrator": self.synonym_orchestrator,
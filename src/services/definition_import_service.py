@@ -58,14 +58,21 @@ class DefinitionImportService:
         # Thread pool voor sync database operaties
         self._executor = ThreadPoolExecutor(max_workers=2)
 
-    async def validate_single(self, payload: dict[str, Any]) -> SingleImportPreview:
+    async def validate_single(
+        self, payload: dict[str, Any], *, gate_only: bool = False
+    ) -> SingleImportPreview:
         """Valideer één definitie en geef duplicates terug.
 
         Vereist velden in payload: begrip, definitie, categorie, organisatorische_context(list),
         optioneel: juridische_context(list), wettelijke_basis(list).
+
+        Met ``gate_only=True`` bepaalt de validatie alleen ``ok`` (bulkimport);
+        de preview bevat dan geen volledige violations/scores.
         """
         definition = self._payload_to_definition(payload)
-        validation = await self._validator.validate_definition(definition)
+        validation = await self._validator.validate_definition(
+            definition, gate_only=gate_only
+        )
 
         # Duplicaatcontrole op begrip + context (repository logica)
         # Run sync database operation in thread pool to prevent blocking
@@ -96,14 +103,20 @@ class DefinitionImportService:
         allow_duplicate: bool = False,
         duplicate_strategy: str | None = None,
         created_by: str | None = None,
+        gate_only: bool = False,
     ) -> SingleImportResult:
-        """Voer de daadwerkelijke import uit na validatie."""
+        """Voer de daadwerkelijke import uit na validatie.
+
+        ``gate_only`` wordt doorgegeven aan ``validate_single``.
+        """
         # Run validation in async context
         import asyncio
 
         # Voor kleine timeout safety, gebruik asyncio.wait_for
         try:
-            preview = await asyncio.wait_for(self.validate_single(payload), timeout=2.0)
+            preview = await asyncio.wait_for(
+                self.validate_single(payload, gate_only=gate_only), timeout=2.0
+            )
         except TimeoutError:
             return SingleImportResult(
                 success=False,
@@ -9,6 +9,7 @@ import json
 import logging
 import sqlite3
 from contextlib import contextmanager, suppress
+from dataclasses import fields
 from datetime import datetime
 from typing import Any, cast
 
@@ -18,6 +19,7 @@ from database.definitie_repository import (
     DefinitieRepository as LegacyRepository,
     DefinitieStatus,
     SourceType,
+    normalize_begrip,
 )
 from services.exceptions import (
     DatabaseConnectionError,
@@ -29,6 +31,8 @@ from services.interfaces import Definition, DefinitionRepositoryInterface
 
 logger = logging.getLogger(__name__)
 
+_RECORD_FIELDS = frozenset(f.name for f in fields(DefinitieRecord))
+
 
 class DefinitionRepository(DefinitionRepositoryInterface):
     """
@@ -456,6 +460,7 @@ class DefinitionRepository(DefinitionRepositoryInterface):
                     """
                     INSERT INTO definities (
                         begrip,
+                        begrip_norm,
                         definitie,
                         organisatorische_context,
                         juridische_context,
@@ -464,10 +469,11 @@ class DefinitionRepository(DefinitionRepositoryInterface):
                         created_at,
                         updated_at,
                         created_by
-                    ) VALUES (?, ?, ?, ?, ?, 'draft', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, 'draft', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, ?)
                     """,
                     (
                         begrip,
+                        normalize_begrip(begrip),
                         "",  # Empty definition for new draft
                         org_context,
                         jur_context,
@@ -793,6 +799,8 @@ class DefinitionRepository(DefinitionRepositoryInterface):
         record_data = {}
         for idx, col in enumerate(description):
             col_name = col[0]
+            if col_name not in _RECORD_FIELDS:
+                continue  # afgeleide kolommen zoals begrip_norm
             value = row[idx]
 
             # Converteer datetime strings
@@ -857,6 +865,25 @@ class DefinitionRepository(DefinitionRepositoryInterface):
             logger.warning(f"get_definitie failed for ID {definitie_id}: {e}")
             return None
 
+    def find_by_context_key(
+        self,
+        begrip: str,
+        organisatorische_context: Any,
+        juridische_context: Any = None,
+        wettelijke_basis: Any = None,
+        categorie: str | None = None,
+        exclude_id: int | None = None,
+    ) -> DefinitieRecord | None:
+        """Pass-through naar de geïndexeerde context-lookup (CON-01)."""
+        return self.legacy_repo.find_by_context_key(
+            begrip,
+            organisatorische_context,
+            juridische_context,
+            wettelijke_basis,
+            categorie=categorie,
+            exclude_id=exclude_id,
+        )
+
     def update_definitie(
         self, definitie_id: int, updates: dict[str, Any], updated_by: str | None = None
     ) -> bool:
@@ -261,11 +261,13 @@ class ExportService:
                 or export_data.definitie_origineel
             )
             try:
+                # Alleen pass/fail nodig: gate-only (stopt bij eerste blocker)
                 result = await self.validation_orchestrator.validate_text(
                     begrip=export_data.begrip,
                     text=text_for_validation,
                     ontologische_categorie=None,
                     context=None,
+                    gate_only=True,
                 )
             except Exception as e:  # pragma: no cover - defensive
                 msg = f"Validatie mislukt vóór export: {e!s}"
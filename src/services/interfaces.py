@@ -1200,6 +1200,10 @@ class OrchestratorConfig:
     timeout_seconds: int = 30
     # DEF-90: Enable JSON validation rules (tests can disable for golden-accept)
     use_json_rules: bool = True
+    # Onafhankelijke stages (feedback, synoniemen, voorbeelden, ...) gelijktijdig
+    enable_concurrent_stages: bool = True
+    # Optionele deadline (seconden) per stage-naam, bv. {"synonyms": 5.0}
+    stage_deadlines: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
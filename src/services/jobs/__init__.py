@@ -0,0 +1,30 @@
+"""
+Achtergrondjobs: SQLite-backed wachtrij met een worker pool.
+
+Generatie, CSV import en bulk export draaien als job buiten de Streamlit
+script run; status, voortgang en resultaten blijven bewaard.
+"""
+
+from .handlers import (
+    JOB_EXPORT,
+    JOB_GENERATION,
+    JOB_IMPORT,
+    generation_payload,
+    register_default_handlers,
+)
+from .job_queue import JobContext, JobQueue, job_operation_name
+from .job_store import JobRecord, JobStore, get_job_store
+
+__all__ = [
+    "JOB_EXPORT",
+    "JOB_GENERATION",
+    "JOB_IMPORT",
+    "JobContext",
+    "JobQueue",
+    "JobRecord",
+    "JobStore",
+    "generation_payload",
+    "get_job_store",
+    "job_operation_name",
+    "register_default_handlers",
+]
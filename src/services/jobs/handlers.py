@@ -0,0 +1,209 @@
+"""
+Standaard job handlers: definitie generatie, CSV import en bulk export.
+
+Payloads zijn JSON-serialiseerbaar zodat een job ook door een ander proces
+opgepakt kan worden; handlers halen hun services lazy uit de container.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from services.jobs.job_queue import JobContext, JobQueue
+
+if TYPE_CHECKING:
+    from services.container import ServiceContainer
+    from services.interfaces import GenerationRequest
+
+logger = logging.getLogger(__name__)
+
+JOB_GENERATION = "generation"
+JOB_IMPORT = "import"
+JOB_EXPORT = "export"
+
+
+def generation_payload(
+    request: GenerationRequest,
+    context: dict[str, Any] | None = None,
+    *,
+    ui_response: bool = False,
+) -> dict[str, Any]:
+    """Payload voor een ``generation`` job op basis van een GenerationRequest.
+
+    Met ``ui_response=True`` bevat het resultaat het volledige UI antwoord van
+    ``ServiceAdapter.legacy_ui_response`` (voorbeelden, validatie, metadata).
+    """
+    return {"request": asdict(request), "context": context, "ui_response": ui_response}
+
+
+def register_default_handlers(
+    queue: JobQueue,
+    container: ServiceContainer,
+    *,
+    generation_concurrency: int = 1,
+    generation_timeout: float | None = 300.0,
+) -> None:
+    """Registreer de generatie-, import- en export handlers op ``queue``."""
+
+    async def generate(payload: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        from services.interfaces import GenerationRequest
+
+        request = GenerationRequest(**payload["request"])
+        ctx.report(0.05, f"Definitie genereren voor '{request.begrip}'")
+        response = await container.orchestrator().create_definition(
+            request, payload.get("context")
+        )
+        if payload.get("ui_response"):
+            from services.service_factory import ServiceAdapter
+
+            return ServiceAdapter(container).legacy_ui_response(response)
+        definition = response.definition
+        return {
+            "success": response.success,
+            "error": response.error,
+            "definition_id": getattr(definition, "id", None),
+            "begrip": getattr(definition, "begrip", request.begrip),
+            "definitie": getattr(definition, "definitie", None),
+            "metadata": response.metadata,
+        }
+
+    async def import_rows(payload: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        """CSV import: elke rij direct als draft opslaan (zoals de import tab).
+
+        Met ``skip_duplicates`` worden rijen met een bestaand begrip in dezelfde
+        organisatorische context overgeslagen, anders komt er een nieuwe rij bij.
+        Validatie via de import service is opt-in met ``validated=True``.
+        """
+        rows = payload.get("rows") or []
+        if payload.get("validated"):
+            import_row = _validated_importer(container, payload)
+        else:
+            import_row = _draft_importer(container, payload)
+        results: list[dict[str, Any]] = []
+        for index, row in enumerate(rows):
+            try:
+                outcome = await import_row(row)
+            except Exception as e:
+                # Eén foute rij mag de rest van de import niet tegenhouden
+                logger.warning(f"Import van rij {index} mislukt: {e}")
+                outcome = {"success": False, "definition_id": None, "error": str(e)}
+            results.append(
+                {
+                    "row": index,
+                    "begrip": row.get("begrip"),
+                    "skipped": False,
+                    **outcome,
+                }
+            )
+            ctx.report((index + 1) / len(rows), f"{index + 1}/{len(rows)} rijen")
+        succeeded = sum(1 for r in results if r["success"])
+        skipped = sum(1 for r in results if r["skipped"])
+        return {
+            "total": len(rows),
+            "succeeded": succeeded,
+            "skipped": skipped,
+            "failed": len(rows) - succeeded - skipped,
+            "rows": results,
+        }
+
+    async def export_definitions(
+        payload: dict[str, Any], ctx: JobContext
+    ) -> dict[str, Any]:
+        from services.export_service import ExportFormat, ExportLevel
+
+        service = container.export_service()
+        repository = container.repository()
+        ids = payload.get("definition_ids") or []
+        ctx.report(0.1, f"{len(ids)} definities ophalen")
+        # Repository en bestandsexport zijn sync: buiten de event loop uitvoeren
+        records = await asyncio.to_thread(
+            lambda: [r for r in map(repository.get_definitie, ids) if r is not None]
+        )
+        ctx.report(0.5, "Exportbestand schrijven")
+        path = await asyncio.to_thread(
+            service.export_multiple_definitions,
+            records,
+            ExportFormat(payload.get("format", ExportFormat.CSV.value)),
+            ExportLevel(payload.get("level", ExportLevel.BASIS.value)),
+        )
+        return {
+            "path": str(path),
+            "count": len(records),
+            "missing": len(ids) - len(records),
+        }
+
+    queue.register(
+        JOB_GENERATION,
+        generate,
+        concurrency=generation_concurrency,
+        timeout=generation_timeout,
+    )
+    queue.register(JOB_IMPORT, import_rows)
+    queue.register(JOB_EXPORT, export_definitions)
+
+
+def _draft_importer(container: ServiceContainer, payload: dict[str, Any]):
+    """Sla een CSV rij zonder validatie op als draft via de repository."""
+    from services.interfaces import Definition
+
+    repository = container.repository()
+    skip_duplicates = payload.get("skip_duplicates", True)
+    created_by = payload.get("created_by")
+
+    def save(row: dict[str, Any]) -> dict[str, Any]:
+        begrip = row.get("begrip", "")
+        context = row.get("organisatorische_context") or ""
+        if skip_duplicates:
+            existing = repository.find_by_begrip(begrip)
+            if existing and context in (existing.organisatorische_context or []):
+                return {
+                    "success": False,
+                    "skipped": True,
+                    "definition_id": None,
+                    "error": None,
+                }
+        definition_id = repository.save(
+            Definition(
+                begrip=begrip,
+                definitie=row.get("definitie", ""),
+                categorie=row.get("categorie") or "Type",
+                organisatorische_context=[context] if context else [],
+                metadata={
+                    "status": "draft",
+                    "validation_score": 0.0,
+                    "created_by": created_by,
+                    # Zonder skip: altijd een nieuwe rij, ook naast een bestaande
+                    "force_duplicate": not skip_duplicates,
+                },
+            )
+        )
+        return {"success": True, "definition_id": definition_id, "error": None}
+
+    async def import_row(row: dict[str, Any]) -> dict[str, Any]:
+        # Repository is sync: buiten de event loop uitvoeren
+        return await asyncio.to_thread(save, row)
+
+    return import_row
+
+
+def _validated_importer(container: ServiceContainer, payload: dict[str, Any]):
+    """Importeer een rij via de import service (validatie en duplicate strategie)."""
+    service = container.import_service()
+
+    async def import_row(row: dict[str, Any]) -> dict[str, Any]:
+        outcome = await service.import_single(
+            row,
+            duplicate_strategy=payload.get("duplicate_strategy"),
+            created_by=payload.get("created_by"),
+            gate_only=payload.get("gate_only", True),
+        )
+        return {
+            "success": outcome.success,
+            "definition_id": outcome.definition_id,
+            "error": outcome.error,
+        }
+
+    return import_row
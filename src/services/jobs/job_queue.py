@@ -0,0 +1,344 @@
+"""
+Worker pool voor achtergrondjobs (generatie, import, export).
+
+De ``JobQueue`` draait op de persistente background event loop
+(``utils.background_loop``), los van de Streamlit script run. UI code dient
+jobs in met ``enqueue`` en krijgt direct een job id terug; status, voortgang,
+resultaat en timing staan in de ``JobStore`` en kunnen bij elke rerun
+opgevraagd worden. Start en einde van een job worden bovendien gemeld via
+``utils.progress_callback`` onder de naam ``job_<id>``.
+
+Concurrency wordt begrensd door ``max_workers`` (totaal) en een limiet per
+soort job. Mislukte pogingen gaan naar de bestaande ``DeadLetterQueue``; de
+exponentiële backoff daarvan bepaalt wanneer een job opnieuw in de wachtrij
+komt, tot ``max_attempts`` bereikt is.
+
+Omdat de store SQLite gebruikt kan ook een apart proces (sidecar) dezelfde
+wachtrij verwerken via ``JobQueue.serve()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from services.jobs.job_store import JobRecord, JobStore, get_job_store
+from utils.background_loop import BackgroundLoop, get_background_loop
+from utils.progress_callback import notify_progress
+from utils.resilience import DeadLetterQueue, FailedRequest
+from utils.smart_rate_limiter import RequestPriority
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict[str, Any], "JobContext"], Awaitable[Any]]
+
+_DLQ_PREFIX = "job:"
+
+
+def job_operation_name(job_id: str) -> str:
+    """Naam waaronder een job via ``notify_progress`` gemeld wordt."""
+    return f"job_{job_id}"
+
+
+@dataclass(frozen=True)
+class _Registration:
+    handler: JobHandler
+    concurrency: int
+    timeout: float | None
+
+
+class JobContext:
+    """Wordt aan een handler meegegeven om voortgang te rapporteren."""
+
+    def __init__(self, store: JobStore, job: JobRecord):
+        self._store = store
+        self.job_id = job.id
+        self.attempt = job.attempts
+
+    def report(self, progress: float, message: str | None = None) -> None:
+        """Sla voortgang (0..1) en een korte statusregel op."""
+        self._store.report_progress(self.job_id, progress, message)
+
+
+class JobQueue:
+    """SQLite-backed job queue met een begrensde async worker pool."""
+
+    def __init__(
+        self,
+        store: JobStore | None = None,
+        *,
+        max_workers: int = 2,
+        poll_interval: float = 0.5,
+        dead_letter_queue: DeadLetterQueue | None = None,
+        background_loop: BackgroundLoop | None = None,
+    ):
+        """
+        Args:
+            store: Job store (default: gedeelde store, zie ``get_job_store``)
+            max_workers: Maximaal aantal gelijktijdig lopende jobs
+            poll_interval: Seconden tussen controles op nieuwe jobs en retries
+                (jobs uit dit proces wekken de worker direct)
+            dead_letter_queue: Queue voor mislukte pogingen
+            background_loop: Event loop waarop de workers draaien
+        """
+        self.store = store or get_job_store()
+        self.max_workers = max(1, int(max_workers))
+        self.poll_interval = poll_interval
+        self.dead_letter_queue = dead_letter_queue or DeadLetterQueue()
+        self._background_loop = background_loop or get_background_loop()
+        self._registrations: dict[str, _Registration] = {}
+        self._running: dict[str, int] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._lock = threading.Lock()
+        self._runner: Future[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_event: asyncio.Event | None = None
+
+    # ===== Registratie en publieke API =====
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        *,
+        concurrency: int = 1,
+        timeout: float | None = None,
+    ) -> None:
+        """Koppel een async handler aan een soort job.
+
+        Args:
+            kind: Soort job (bv. ``"generation"``)
+            handler: ``async handler(payload, context)``; de return value moet
+                JSON-serialiseerbaar zijn en wordt als resultaat bewaard
+            concurrency: Maximaal aantal gelijktijdige jobs van deze soort
+            timeout: Maximale duur van één poging in seconden
+        """
+        self._registrations[kind] = _Registration(
+            handler=handler, concurrency=max(1, int(concurrency)), timeout=timeout
+        )
+        self._running.setdefault(kind, 0)
+
+    @property
+    def kinds(self) -> list[str]:
+        return list(self._registrations)
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        *,
+        owner: str | None = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        max_attempts: int = 3,
+    ) -> str:
+        """Dien een job in en start de workers zo nodig; geeft het job id."""
+        if kind not in self._registrations:
+            msg = f"Geen handler geregistreerd voor job soort '{kind}'"
+            raise ValueError(msg)
+        job_id = self.store.enqueue(
+            kind,
+            payload,
+            priority=priority.value,
+            max_attempts=max_attempts,
+            owner=owner,
+        )
+        self.start()
+        self._wake()
+        logger.info(f"Job {job_id} ({kind}) in wachtrij geplaatst")
+        return job_id
+
+    def get(self, job_id: str) -> JobRecord | None:
+        """Actuele status van een job."""
+        return self.store.get(job_id)
+
+    def list_jobs(self, **filters: Any) -> list[JobRecord]:
+        """Zie ``JobStore.list_jobs``."""
+        return self.store.list_jobs(**filters)
+
+    def cancel(self, job_id: str) -> bool:
+        """Annuleer een wachtende of lopende job.
+
+        Een lopende job in dit proces wordt direct afgebroken; in een ander
+        proces wordt het resultaat bij afronding genegeerd.
+        """
+        previous = self.store.cancel(job_id)
+        if previous is None:
+            return False
+        loop, task = self._loop, self._tasks.get(job_id)
+        if loop is not None and not loop.is_closed():
+            if task is not None:
+                loop.call_soon_threadsafe(task.cancel)
+            asyncio.run_coroutine_threadsafe(
+                self.dead_letter_queue.remove(job_id, processed=False), loop
+            )
+        logger.info(f"Job {job_id} geannuleerd (was {previous})")
+        return True
+
+    # ===== Worker lifecycle =====
+
+    @property
+    def is_running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    def start(self) -> None:
+        """Start de workers op de background loop (idempotent)."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._runner = self._background_loop.submit(self._run())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop de workers; lopende jobs gaan terug naar de wachtrij."""
+        with self._lock:
+            runner, self._runner = self._runner, None
+        if runner is None:
+            return
+        runner.cancel()
+        deadline = time.monotonic() + timeout
+        while self._tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def serve(self) -> None:
+        """Blokkerend verwerken in het huidige proces (sidecar worker)."""
+        try:
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            logger.info("Job worker gestopt")
+
+    def _wake(self) -> None:
+        loop, event = self._loop, self._wake_event
+        if loop is not None and event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+
+    # ===== Worker loop =====
+
+    async def _run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake_event = wake_event = asyncio.Event()
+        for job in self.store.recover(_other_process_alive):
+            await self.dead_letter_queue.add(
+                self._failed_request(job, job.error or "onderbroken")
+            )
+        try:
+            while True:
+                await self._requeue_retryable()
+                self._dispatch()
+                # asyncio.timeout i.p.v. wait_for: die kan een gelijktijdige
+                # annulering (stop) inslikken als de poll-timeout net afloopt
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.poll_interval):
+                        await wake_event.wait()
+                wake_event.clear()
+        finally:
+            tasks = list(self._tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._wake_event is wake_event:
+                self._loop = self._wake_event = None
+
+    def _dispatch(self) -> None:
+        """Claim jobs zolang er worker slots (totaal en per soort) vrij zijn."""
+        while len(self._tasks) < self.max_workers:
+            kinds = [
+                kind
+                for kind, registration in self._registrations.items()
+                if self._running[kind] < registration.concurrency
+            ]
+            job = self.store.claim_next(kinds)
+            if job is None:
+                return
+            self._running[job.kind] += 1
+            self._tasks[job.id] = asyncio.create_task(
+                self._execute(job), name=f"job:{job.kind}:{job.id}"
+            )
+
+    async def _execute(self, job: JobRecord) -> None:
+        registration = self._registrations[job.kind]
+        operation = job_operation_name(job.id)
+        notify_progress(operation, True)
+        started = time.perf_counter()
+        try:
+            work = registration.handler(job.payload, JobContext(self.store, job))
+            if registration.timeout is not None:
+                result = await asyncio.wait_for(work, registration.timeout)
+            else:
+                result = await work
+        except asyncio.CancelledError:
+            # Annulering door gebruiker: status is al 'cancelled'.
+            # Stoppende worker: job blijft 'running' en gaat terug in de wachtrij.
+            self.store.release(job.id)
+            raise
+        except Exception as e:
+            elapsed = time.perf_counter() - started
+            error = f"{type(e).__name__}: {e}"
+            retry = job.attempts < job.max_attempts
+            logger.warning(
+                f"Job {job.id} ({job.kind}) poging {job.attempts}/"
+                f"{job.max_attempts} mislukt: {error}"
+            )
+            if self.store.fail(job.id, error, elapsed, retry=retry) and retry:
+                await self.dead_letter_queue.add(self._failed_request(job, error))
+        else:
+            elapsed = time.perf_counter() - started
+            if self.store.complete(job.id, result, elapsed):
+                logger.info(f"Job {job.id} ({job.kind}) klaar in {elapsed:.2f}s")
+        finally:
+            self._tasks.pop(job.id, None)
+            self._running[job.kind] -= 1
+            notify_progress(operation, False)
+            if self._wake_event is not None:
+                self._wake_event.set()
+
+    async def _requeue_retryable(self) -> None:
+        """Zet jobs waarvan de DLQ backoff verstreken is terug in de wachtrij."""
+        for request in await self.dead_letter_queue.get_retryable_requests():
+            if not request.function_name.startswith(_DLQ_PREFIX):
+                continue
+            if self.store.requeue(request.request_id):
+                logger.info(f"Job {request.request_id} opnieuw in wachtrij")
+            await self.dead_letter_queue.remove(request.request_id)
+
+    @staticmethod
+    def _failed_request(job: JobRecord, error: str) -> FailedRequest:
+        try:
+            priority = RequestPriority(job.priority)
+        except ValueError:
+            priority = RequestPriority.NORMAL
+        return FailedRequest(
+            request_id=job.id,
+            function_name=f"{_DLQ_PREFIX}{job.kind}",
+            args=(),
+            kwargs=job.payload,
+            priority=priority,
+            timestamp=datetime.now(UTC),
+            # retry_count = reeds uitgevoerde herhalingen; bepaalt de backoff
+            retry_count=max(0, job.attempts - 1),
+            max_retries=job.max_attempts - 1,
+            last_error=error,
+        )
+
+
+def _other_process_alive(pid: int) -> bool:
+    """True als ``pid`` een ander, nog levend proces is."""
+    if pid == os.getpid():
+        # Eigen jobs van een vorige worker loop in dit proces
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
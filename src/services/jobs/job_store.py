@@ -0,0 +1,527 @@
+"""
+Persistente job store (SQLite) voor achtergrondtaken.
+
+Generatie, bulk export en CSV import draaiden binnen de Streamlit script run:
+de sessie bleef geblokkeerd en een rerun startte het werk opnieuw. Jobs worden
+nu in SQLite vastgelegd; een ``JobQueue`` worker claimt ze, en status,
+voortgang, resultaat en timing blijven bewaard zodat gebruikers de pagina
+kunnen verlaten en later terugkomen.
+
+Levenscyclus van een job:
+    queued     → wacht op een vrije worker
+    running    → geclaimd door een worker (``worker_pid``)
+    retrying   → mislukt, wacht in de DeadLetterQueue op een nieuwe poging
+    succeeded / failed / cancelled  → eindstatus
+
+Claimen gebeurt in één SQLite transactie (``BEGIN IMMEDIATE``), zodat meerdere
+processen (UI en eventuele sidecar worker) dezelfde database kunnen gebruiken.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_RETRYING = "retrying"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+FINAL_STATUSES = frozenset({STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED})
+
+# Verankerd aan de project root: UI en sidecar delen dezelfde wachtrij
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_DB_PATH = str(PROJECT_ROOT / "cache" / "jobs.db")
+
+
+def resolve_db_path(db_path: str | Path) -> str:
+    """Maak een relatief database pad absoluut t.o.v. de project root."""
+    path = Path(db_path)
+    return str(path if path.is_absolute() else PROJECT_ROOT / path)
+
+
+_COLUMNS = (
+    "id, kind, status, payload, result, error, priority, attempts, max_attempts, "
+    "progress, progress_message, owner, worker_pid, created_at, started_at, "
+    "finished_at, run_seconds, updated_at"
+)
+
+
+@dataclass
+class JobRecord:
+    """Momentopname van één job uit de store."""
+
+    id: str
+    kind: str
+    status: str
+    payload: dict[str, Any]
+    result: Any = None
+    error: str | None = None
+    priority: int = 2
+    attempts: int = 0
+    max_attempts: int = 3
+    progress: float = 0.0
+    progress_message: str | None = None
+    owner: str | None = None
+    worker_pid: int | None = None
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    run_seconds: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    @property
+    def queue_seconds(self) -> float | None:
+        """Wachttijd tussen aanmaken en (laatste) start."""
+        if self.started_at is None:
+            return None
+        return max(0.0, self.started_at - self.created_at)
+
+    def timing(self) -> dict[str, Any]:
+        """Per-job timing voor UI en monitoring."""
+        total = None
+        if self.finished_at is not None:
+            total = round(self.finished_at - self.created_at, 4)
+        queue = self.queue_seconds
+        return {
+            "queue_seconds": round(queue, 4) if queue is not None else None,
+            "run_seconds": round(self.run_seconds, 4),
+            "total_seconds": total,
+            "attempts": self.attempts,
+        }
+
+    @classmethod
+    def from_row(cls, row: tuple) -> JobRecord:
+        (
+            job_id,
+            kind,
+            status,
+            payload,
+            result,
+            error,
+            priority,
+            attempts,
+            max_attempts,
+            progress,
+            progress_message,
+            owner,
+            worker_pid,
+            created_at,
+            started_at,
+            finished_at,
+            run_seconds,
+            updated_at,
+        ) = row
+        return cls(
+            id=job_id,
+            kind=kind,
+            status=status,
+            payload=json.loads(payload) if payload else {},
+            result=json.loads(result) if result is not None else None,
+            error=error,
+            priority=priority,
+            attempts=attempts,
+            max_attempts=max_attempts,
+            progress=progress,
+            progress_message=progress_message,
+            owner=owner,
+            worker_pid=worker_pid,
+            created_at=created_at,
+            started_at=started_at,
+            finished_at=finished_at,
+            run_seconds=run_seconds,
+            updated_at=updated_at,
+        )
+
+
+class JobStore:
+    """SQLite-backed job queue, gedeeld tussen processen."""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        """Initialize job store.
+
+        Args:
+            db_path: Pad naar SQLite database (relatief t.o.v. de project root)
+        """
+        self.db_path = resolve_db_path(db_path)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit; transacties worden expliciet gestart met BEGIN IMMEDIATE
+        return sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+
+    def _ensure_schema(self) -> None:
+        """Create jobs table als deze niet bestaat."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    priority INTEGER NOT NULL DEFAULT 2,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    progress REAL NOT NULL DEFAULT 0,
+                    progress_message TEXT,
+                    owner TEXT,
+                    worker_pid INTEGER,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    run_seconds REAL NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_priority "
+                "ON jobs (status, priority, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_owner ON jobs (owner, created_at)"
+            )
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = 2,
+        max_attempts: int = 3,
+        owner: str | None = None,
+    ) -> str:
+        """Leg een nieuwe job vast; geeft het job id terug.
+
+        ``payload`` moet JSON-serialiseerbaar zijn (een job kan in een ander
+        proces uitgevoerd worden).
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                """
+                INSERT INTO jobs (id, kind, status, payload, priority, max_attempts,
+                                  owner, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    job_id,
+                    kind,
+                    STATUS_QUEUED,
+                    json.dumps(payload, ensure_ascii=False),
+                    int(priority),
+                    max(1, int(max_attempts)),
+                    owner,
+                    now,
+                    now,
+                ),
+            )
+        return job_id
+
+    def claim_next(self, kinds: Iterable[str] | None = None) -> JobRecord | None:
+        """Claim atomisch de volgende wachtende job (laagste prioriteit eerst).
+
+        Args:
+            kinds: Alleen jobs van deze soorten claimen (None = alle soorten)
+        """
+        kinds = list(kinds) if kinds is not None else None
+        if kinds is not None and not kinds:
+            return None
+        query = f"SELECT {_COLUMNS} FROM jobs WHERE status = ?"
+        params: list[Any] = [STATUS_QUEUED]
+        if kinds is not None:
+            query += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        query += " ORDER BY priority, created_at LIMIT 1"
+
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(query, params).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+                    conn.execute(
+                        """
+                        UPDATE jobs
+                           SET status = ?, attempts = attempts + 1, worker_pid = ?,
+                               started_at = ?, updated_at = ?
+                         WHERE id = ?
+                    """,
+                        (STATUS_RUNNING, os.getpid(), now, now, row[0]),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning(f"Job store: claimen mislukt: {e}")
+            return None
+        return self.get(row[0])
+
+    def report_progress(
+        self, job_id: str, progress: float, message: str | None = None
+    ) -> None:
+        """Werk voortgang (0..1) en optionele statusregel van een lopende job bij."""
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    UPDATE jobs SET progress = ?, progress_message = ?, updated_at = ?
+                     WHERE id = ? AND status = ?
+                """,
+                    (
+                        min(1.0, max(0.0, float(progress))),
+                        message,
+                        time.time(),
+                        job_id,
+                        STATUS_RUNNING,
+                    ),
+                )
+        except sqlite3.Error as e:
+            # Voortgang mag de job nooit laten falen
+            logger.debug(f"Job store: voortgang niet opgeslagen: {e}")
+
+    def complete(self, job_id: str, result: Any, run_seconds: float) -> bool:
+        """Markeer een lopende job als geslaagd en bewaar het resultaat.
+
+        Returns:
+            False als de job intussen niet meer ``running`` is (bv. geannuleerd)
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs
+                   SET status = ?, result = ?, error = NULL, progress = 1.0,
+                       finished_at = ?, run_seconds = run_seconds + ?, updated_at = ?
+                 WHERE id = ? AND status = ?
+            """,
+                (
+                    STATUS_SUCCEEDED,
+                    json.dumps(result, ensure_ascii=False, default=str),
+                    now,
+                    float(run_seconds),
+                    now,
+                    job_id,
+                    STATUS_RUNNING,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, error: str, run_seconds: float, *, retry: bool) -> bool:
+        """Registreer een mislukte poging.
+
+        Met ``retry=True`` gaat de job naar ``retrying`` (nieuwe poging volgt),
+        anders naar de eindstatus ``failed``.
+        """
+        now = time.time()
+        status = STATUS_RETRYING if retry else STATUS_FAILED
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs
+                   SET status = ?, error = ?, run_seconds = run_seconds + ?,
+                       finished_at = CASE WHEN ? THEN NULL ELSE ? END,
+                       updated_at = ?
+                 WHERE id = ? AND status = ?
+            """,
+                (
+                    status,
+                    error,
+                    float(run_seconds),
+                    retry,
+                    now,
+                    now,
+                    job_id,
+                    STATUS_RUNNING,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def requeue(self, job_id: str) -> bool:
+        """Zet een job in ``retrying`` terug in de wachtrij."""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (STATUS_QUEUED, time.time(), job_id, STATUS_RETRYING),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, job_id: str) -> bool:
+        """Geef een lopende job terug aan de wachtrij (worker stopt).
+
+        De onderbroken poging telt niet mee voor ``max_attempts``.
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs
+                   SET status = ?, attempts = MAX(0, attempts - 1), updated_at = ?
+                 WHERE id = ? AND status = ?
+            """,
+                (STATUS_QUEUED, time.time(), job_id, STATUS_RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def cancel(self, job_id: str) -> str | None:
+        """Annuleer een job die nog niet afgerond is.
+
+        Returns:
+            De status vóór annulering, of None als er niets te annuleren viel
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT status FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                if row is None or row[0] in FINAL_STATUSES:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    """
+                    UPDATE jobs SET status = ?, finished_at = ?, updated_at = ?
+                     WHERE id = ?
+                """,
+                    (STATUS_CANCELLED, now, now, job_id),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return row[0]
+
+    def recover(self, is_alive: Callable[[int], bool]) -> list[JobRecord]:
+        """Herstel jobs van een proces dat niet meer bestaat.
+
+        ``running`` jobs van een gestopt proces gaan terug naar de wachtrij.
+        ``retrying`` jobs van zo'n proces worden overgenomen door dit proces
+        en teruggegeven, zodat de aanroeper ze opnieuw kan inplannen.
+        """
+        now = time.time()
+        adopted: list[str] = []
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT id, status, worker_pid FROM jobs WHERE status IN (?, ?)",
+                    (STATUS_RUNNING, STATUS_RETRYING),
+                ).fetchall()
+                for job_id, status, pid in rows:
+                    if pid is not None and is_alive(pid):
+                        continue
+                    if status == STATUS_RUNNING:
+                        conn.execute(
+                            "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
+                            (STATUS_QUEUED, now, job_id),
+                        )
+                    else:
+                        conn.execute(
+                            "UPDATE jobs SET worker_pid = ?, updated_at = ? "
+                            "WHERE id = ?",
+                            (os.getpid(), now, job_id),
+                        )
+                        adopted.append(job_id)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if rows:
+            logger.info(
+                f"Job store: {len(rows)} onderbroken job(s) gevonden, "
+                f"{len(adopted)} retry(s) overgenomen"
+            )
+        return [job for job in (self.get(job_id) for job_id in adopted) if job]
+
+    def get(self, job_id: str) -> JobRecord | None:
+        """Haal één job op."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return JobRecord.from_row(row) if row else None
+
+    def list_jobs(
+        self,
+        *,
+        owner: str | None = None,
+        status: str | Iterable[str] | None = None,
+        kind: str | None = None,
+        limit: int = 50,
+    ) -> list[JobRecord]:
+        """Recentste jobs eerst, optioneel gefilterd."""
+        query = f"SELECT {_COLUMNS} FROM jobs WHERE 1 = 1"
+        params: list[Any] = []
+        if owner is not None:
+            query += " AND owner = ?"
+            params.append(owner)
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(int(limit))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [JobRecord.from_row(row) for row in rows]
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Verwijder afgeronde jobs ouder dan de opgegeven leeftijd."""
+        cutoff = time.time() - older_than_seconds
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"DELETE FROM jobs WHERE finished_at < ? "
+                f"AND status IN ({', '.join('?' for _ in FINAL_STATUSES)})",
+                (cutoff, *sorted(FINAL_STATUSES)),
+            )
+            return cursor.rowcount
+
+
+_stores: dict[str, JobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_job_store(db_path: str | None = None) -> JobStore:
+    """
+    Haal de gedeelde job store op (één instance per database pad).
+
+    Het pad kan overschreven worden met env var JOB_QUEUE_DB.
+    """
+    path = resolve_db_path(db_path or os.getenv("JOB_QUEUE_DB") or DEFAULT_DB_PATH)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = JobStore(path)
+            _stores[path] = store
+        return store
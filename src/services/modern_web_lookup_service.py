@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -40,6 +42,11 @@ except ImportError:
 
     BronType = _FallbackBronType  # type: ignore[misc,assignment]
 
+# Attempts van de lopende ``_lookup_source`` call (per asyncio task)
+_CALL_ATTEMPTS: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "web_lookup_call_attempts", default=None
+)
+
 
 @dataclass
 class SourceConfig:
@@ -79,6 +86,8 @@ class ModernWebLookupService(WebLookupServiceInterface):
         # In productie geen legacy fallback meer gebruiken
         self._legacy_fallback_enabled = False
         self._setup_sources()
+        self._health_store = self._setup_health_store()
+        self._latency_tracker = self._setup_latency_tracker()
 
     def _setup_sources(self) -> None:
         """Configureer alle beschikbare lookup bronnen."""
@@ -190,6 +199,136 @@ class ModernWebLookupService(WebLookupServiceInterface):
             ),
         }
 
+    def _setup_health_store(self):
+        """Koppel de gedeelde (cross-process) provider health store."""
+        try:
+            from .web_lookup.provider_health import get_provider_health_store
+
+            health_cfg = (self._config or {}).get("web_lookup", {})
+            return get_provider_health_store(health_cfg.get("provider_health"))
+        except Exception as e:
+            logger.warning(f"Provider health store niet geladen: {e}")
+            return None
+
+    def _setup_latency_tracker(self):
+        """Koppel de gedeelde latency tracker voor adaptieve timeouts."""
+        try:
+            from .web_lookup.latency_tracker import get_latency_tracker
+
+            wl = (self._config or {}).get("web_lookup", {})
+            return get_latency_tracker(wl.get("adaptive_timeouts"))
+        except Exception as e:
+            logger.warning(f"Latency tracker niet geladen: {e}")
+            return None
+
+    def _source_key(self, source: SourceConfig) -> str:
+        """Geef de key in ``self.sources`` voor een SourceConfig."""
+        for key, cfg in self.sources.items():
+            if cfg is source:
+                return key
+        return source.name.lower()
+
+    def _call_timeout(
+        self, provider: str, endpoint: str, request: LookupRequest
+    ) -> float:
+        """Timeout voor één provider call, afgeleid uit geobserveerde latency.
+
+        De request-timeout is zowel de cold-start waarde als de bovengrens.
+        """
+        default = float(getattr(request, "timeout", 30) or 30)
+        if self._latency_tracker is None:
+            return default
+        return self._latency_tracker.timeout_for(provider, endpoint, default)
+
+    async def _timed_call(
+        self,
+        provider: str,
+        endpoint: str,
+        awaitable: Any,
+        request: LookupRequest,
+    ) -> Any:
+        """Voer een provider call uit met adaptieve timeout en meet de latency.
+
+        Afgeronde calls en timeouts worden geregistreerd; snelle transportfouten
+        niet, omdat die de latency verdeling onterecht omlaag zouden trekken.
+        """
+        timeout = self._call_timeout(provider, endpoint, request)
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=timeout)
+        except TimeoutError:
+            if self._latency_tracker is not None:
+                self._latency_tracker.record(provider, endpoint, timeout)
+            raise
+        if self._latency_tracker is not None:
+            self._latency_tracker.record(
+                provider, endpoint, time.perf_counter() - start
+            )
+        return result
+
+    def _log_attempt(self, attempt: dict[str, Any]) -> None:
+        """Registreer een attempt voor de debug weergave én de lopende call."""
+        self._debug_attempts.append(attempt)
+        call_attempts = _CALL_ATTEMPTS.get()
+        if call_attempts is not None:
+            call_attempts.append(attempt)
+
+    def _filter_healthy_sources(self, sources: list[str]) -> list[str]:
+        """Sla providers met een open circuit over (gedeeld tussen processen)."""
+        if self._health_store is None:
+            return sources
+        healthy = []
+        for name in sources:
+            if self._health_store.allow_request(name):
+                healthy.append(name)
+            else:
+                logger.info(f"Provider {name} overgeslagen: circuit open")
+                self._debug_attempts.append(
+                    {"provider": name, "skipped": True, "reason": "circuit_open"}
+                )
+        return healthy
+
+    def _record_provider_health(
+        self,
+        source_name: str,
+        result: LookupResult | None,
+        attempts: list[dict[str, Any]],
+        error: str | None = None,
+    ) -> None:
+        """Leid provider health af uit resultaat en attempts van één lookup.
+
+        Een lege maar bereikbare provider is gezond; alleen transportfouten
+        (exceptions, timeouts, HTTP 5xx) zonder enig geslaagd contact tellen
+        als failure. Zonder uitkomst wordt een eventuele half-open probe
+        vrijgegeven, zodat die niet tot ``probe_timeout_seconds`` geclaimd blijft.
+        """
+        if self._health_store is None:
+            return
+        if result is not None and getattr(result, "success", True):
+            self._health_store.record_success(source_name)
+            return
+
+        reached = False
+        errors: list[str] = []
+        if error:
+            errors.append(error)
+        for att in attempts:
+            status = att.get("status")
+            if att.get("error"):
+                errors.append(str(att["error"]))
+            elif isinstance(status, int) and status >= 500:
+                errors.append(f"HTTP {status}")
+            elif att.get("success") is not None or isinstance(status, int):
+                reached = True
+
+        if reached:
+            self._health_store.record_success(source_name)
+        elif errors:
+            self._health_store.record_failure(source_name, errors[-1])
+        else:
+            # Geen uitkomst (bijv. geannuleerd): een geclaimde probe vrijgeven
+            self._health_store.release_probe(source_name)
+
     # === Context token parsing helpers ===
     def _classify_context_tokens(
         self, context: str | None
@@ -267,7 +406,8 @@ class ModernWebLookupService(WebLookupServiceInterface):
         self._debug_attempts = []
 
         # Bepaal welke bronnen te gebruiken
-        sources_to_search = self._determine_sources(request)
+        # Health store is sync SQLite: niet op de event loop uitvoeren
+        sources_to_search = await asyncio.to_thread(self._determine_sources, request)
 
         # Concurrent lookups uitvoeren
         tasks = [
@@ -411,7 +551,15 @@ class ModernWebLookupService(WebLookupServiceInterface):
             return filtered_results[: request.max_results]
 
     def _determine_sources(self, request: LookupRequest) -> list[str]:
-        """Bepaal welke bronnen te gebruiken op basis van request en context."""
+        """Bepaal welke bronnen te gebruiken op basis van request en context.
+
+        Providers waarvan het circuit in de gedeelde health store open staat
+        worden vooraf overgeslagen in plaats van een timeout te kosten.
+        """
+        return self._filter_healthy_sources(self._select_sources(request))
+
+    def _select_sources(self, request: LookupRequest) -> list[str]:
+        """Selecteer bronnen op basis van request en context (zonder health)."""
         if request.sources:
             return [s for s in request.sources if s in self.sources]
 
@@ -464,6 +612,11 @@ class ModernWebLookupService(WebLookupServiceInterface):
             "term": term,
             "api_type": source_config.api_type,
         }
+        # Per call verzamelen: de gedeelde debug lijst wordt door concurrent
+        # lookups gereset en aangevuld, en is alleen voor weergave
+        call_attempts: list[dict[str, Any]] = []
+        token = _CALL_ATTEMPTS.set(call_attempts)
+        result: LookupResult | None = None
         try:
             if source_config.api_type == "mediawiki":
                 result = await self._lookup_mediawiki(term, source_config, request)
@@ -488,10 +641,25 @@ class ModernWebLookupService(WebLookupServiceInterface):
             logger.error(f"Error in {source_name} lookup: {e}")
             # Geen legacy fallback in modern-only modus
             attempt["success"] = False
-            attempt["error"] = str(e)
+            attempt["error"] = str(e) or type(e).__name__
             attempt["duration_ms"] = int((_t.time() - start) * 1000)
             return None
         finally:
+            _CALL_ATTEMPTS.reset(token)
+            # Alleen attempts van deze provider (geen doorverwijzingen)
+            provider_attempts = [
+                a
+                for a in call_attempts
+                if a.get("provider") in (source_name, source_config.name)
+            ]
+            # Health store is sync SQLite: niet op de event loop uitvoeren
+            await asyncio.to_thread(
+                self._record_provider_health,
+                source_name,
+                result,
+                provider_attempts,
+                attempt.get("error"),
+            )
             self._debug_attempts.append(attempt)
 
     async def _lookup_mediawiki(
@@ -499,6 +667,7 @@ class ModernWebLookupService(WebLookupServiceInterface):
     ) -> LookupResult | None:
         """Lookup in MediaWiki API (Wikipedia, Wiktionary)."""
         logger.info(f"MediaWiki lookup for {term} in {source.name}")
+        provider = self._source_key(source)
 
         try:
             if source.name == "Wikipedia":
@@ -524,24 +693,34 @@ class ModernWebLookupService(WebLookupServiceInterface):
                 for stage_name, toks in stages:
                     query_term = t if not toks else f"{t} " + " ".join(toks)
                     try:
-                        res = await asyncio.wait_for(
-                            wikipedia_lookup(query_term),
-                            timeout=float(getattr(request, "timeout", 30) or 30),
+                        res = await self._timed_call(
+                            provider, "lookup", wikipedia_lookup(query_term), request
                         )
                         # Log attempt
-                        self._debug_attempts.append(
+                        self._log_attempt(
                             {
                                 "provider": source.name,
                                 "api_type": "mediawiki",
                                 "term": query_term,
                                 "stage": stage_name,
                                 "success": bool(res and res.success),
+                                "error": getattr(res, "error_message", None),
                             }
                         )
                         if res and res.success:
                             result = res
                             break
-                    except Exception:
+                    except Exception as e:
+                        self._log_attempt(
+                            {
+                                "provider": source.name,
+                                "api_type": "mediawiki",
+                                "term": query_term,
+                                "stage": stage_name,
+                                "success": False,
+                                "error": str(e) or type(e).__name__,
+                            }
+                        )
                         continue
 
                 # Heuristische fallbacks indien nog niets gevonden (hyphen/titlecase/suffix-strip)
@@ -593,11 +772,10 @@ class ModernWebLookupService(WebLookupServiceInterface):
                             continue
                         seen.add(fbq.lower())
                         try:
-                            fb_res = await asyncio.wait_for(
-                                wikipedia_lookup(fbq),
-                                timeout=float(getattr(request, "timeout", 30) or 30),
+                            fb_res = await self._timed_call(
+                                provider, "lookup", wikipedia_lookup(fbq), request
                             )
-                            self._debug_attempts.append(
+                            self._log_attempt(
                                 {
                                     "provider": source.name,
                                     "api_type": "mediawiki",
@@ -605,12 +783,24 @@ class ModernWebLookupService(WebLookupServiceInterface):
                                     "fallback": True,
                                     "synonym_of": t,
                                     "success": bool(fb_res and fb_res.success),
+                                    "error": getattr(fb_res, "error_message", None),
                                 }
                             )
                             if fb_res and fb_res.success:
                                 result = fb_res
                                 break
-                        except Exception:
+                        except Exception as e:
+                            self._log_attempt(
+                                {
+                                    "provider": source.name,
+                                    "api_type": "mediawiki",
+                                    "term": fbq,
+                                    "fallback": True,
+                                    "synonym_of": t,
+                                    "success": False,
+                                    "error": str(e) or type(e).__name__,
+                                }
+                            )
                             continue
 
                 if result and result.success:
@@ -644,23 +834,33 @@ class ModernWebLookupService(WebLookupServiceInterface):
                         else f"{wikt_base} " + " ".join(wikt_toks)
                     )
                     try:
-                        wikt_res = await asyncio.wait_for(
-                            wiktionary_lookup(wikt_q),
-                            timeout=float(getattr(request, "timeout", 30) or 30),
+                        wikt_res = await self._timed_call(
+                            provider, "lookup", wiktionary_lookup(wikt_q), request
                         )
-                        self._debug_attempts.append(
+                        self._log_attempt(
                             {
                                 "provider": source.name,
                                 "api_type": "mediawiki",
                                 "term": wikt_q,
                                 "stage": wikt_stage_name,
                                 "success": bool(wikt_res and wikt_res.success),
+                                "error": getattr(wikt_res, "error_message", None),
                             }
                         )
                         if wikt_res and wikt_res.success:
                             wikt_result = wikt_res
                             break
-                    except Exception:
+                    except Exception as e:
+                        self._log_attempt(
+                            {
+                                "provider": source.name,
+                                "api_type": "mediawiki",
+                                "term": wikt_q,
+                                "stage": wikt_stage_name,
+                                "success": False,
+                                "error": str(e) or type(e).__name__,
+                            }
+                        )
                         continue
 
                 if not (wikt_result and wikt_result.success):
@@ -677,11 +877,10 @@ class ModernWebLookupService(WebLookupServiceInterface):
                             continue
                         wikt_seen.add(wikt_fbq.lower())
                         try:
-                            wikt_fb_res = await asyncio.wait_for(
-                                wiktionary_lookup(wikt_fbq),
-                                timeout=float(getattr(request, "timeout", 30) or 30),
+                            wikt_fb_res = await self._timed_call(
+                                provider, "lookup", wiktionary_lookup(wikt_fbq), request
                             )
-                            self._debug_attempts.append(
+                            self._log_attempt(
                                 {
                                     "provider": source.name,
                                     "api_type": "mediawiki",
@@ -690,12 +889,25 @@ class ModernWebLookupService(WebLookupServiceInterface):
                                     "success": bool(
                                         wikt_fb_res and wikt_fb_res.success
                                     ),
+                                    "error": getattr(
+                                        wikt_fb_res, "error_message", None
+                                    ),
                                 }
                             )
                             if wikt_fb_res and wikt_fb_res.success:
                                 wikt_result = wikt_fb_res
                                 break
-                        except Exception:
+                        except Exception as e:
+                            self._log_attempt(
+                                {
+                                    "provider": source.name,
+                                    "api_type": "mediawiki",
+                                    "term": wikt_fbq,
+                                    "fallback": True,
+                                    "success": False,
+                                    "error": str(e) or type(e).__name__,
+                                }
+                            )
                             continue
 
                 if wikt_result and wikt_result.success:
@@ -715,6 +927,7 @@ class ModernWebLookupService(WebLookupServiceInterface):
     ) -> LookupResult | None:
         """Lookup in SRU API (overheid.nl, rechtspraak.nl)."""
         logger.info(f"SRU lookup for {term} in {source.name}")
+        provider = self._source_key(source)
 
         try:
             # Import SRU service
@@ -750,11 +963,13 @@ class ModernWebLookupService(WebLookupServiceInterface):
                 for stage_name, toks in stages:
                     combo_term = base if not toks else f"{base} " + " ".join(toks)
                     # Respecteer per-request timeout budget
-                    results = await asyncio.wait_for(
+                    results = await self._timed_call(
+                        provider,
+                        endpoint,
                         sru_service.search(
                             term=combo_term, endpoint=endpoint, max_records=3
                         ),
-                        timeout=float(getattr(request, "timeout", 30) or 30),
+                        request,
                     )
                     # collect attempts for this stage
                     try:
@@ -766,7 +981,7 @@ class ModernWebLookupService(WebLookupServiceInterface):
                                 "stage": stage_name,
                             }
                             rec.update(att)
-                            self._debug_attempts.append(rec)
+                            self._log_attempt(rec)
                     except Exception as exc:  # pragma: no cover - diagnostic only
                         logger.debug(
                             "SRU attempt logging failed for %s (%s stage): %s",
@@ -787,11 +1002,13 @@ class ModernWebLookupService(WebLookupServiceInterface):
                 if " " in base and "-" not in base:
                     extra_terms.append(base.replace(" ", "-"))
                 for et in extra_terms:
-                    results = await asyncio.wait_for(
+                    results = await self._timed_call(
+                        provider,
+                        endpoint,
                         sru_service.search(term=et, endpoint=endpoint, max_records=3),
-                        timeout=float(getattr(request, "timeout", 30) or 30),
+                        request,
                     )
-                    self._debug_attempts.append(
+                    self._log_attempt(
                         {
                             "provider": source.name,
                             "api_type": "sru",
@@ -815,6 +1032,16 @@ class ModernWebLookupService(WebLookupServiceInterface):
             logger.warning(f"SRU service niet beschikbaar: {e}")
         except Exception as e:
             logger.error(f"SRU lookup error: {e}")
+            # Registreer o.a. timeouts zodat provider health ze meeweegt
+            self._log_attempt(
+                {
+                    "provider": source.name,
+                    "api_type": "sru",
+                    "term": term,
+                    "success": False,
+                    "error": str(e) or type(e).__name__,
+                }
+            )
 
         return None
 
@@ -844,9 +1071,8 @@ class ModernWebLookupService(WebLookupServiceInterface):
             if "rechtspraak" in source.name.lower():
                 from .web_lookup.rechtspraak_rest_service import rechtspraak_lookup
 
-                res = await asyncio.wait_for(
-                    rechtspraak_lookup(term),
-                    timeout=float(getattr(request, "timeout", 30) or 30),
+                res = await self._timed_call(
+                    self._source_key(source), "rest", rechtspraak_lookup(term), request
                 )
                 if res and res.success:
                     # NOTE: Provider weight applied in ranking, not here
@@ -864,7 +1090,7 @@ class ModernWebLookupService(WebLookupServiceInterface):
             return None
         finally:
             attempt["duration_ms"] = int((_t.time() - start) * 1000)
-            self._debug_attempts.append(attempt)
+            self._log_attempt(attempt)
 
     async def _lookup_brave(
         self, term: str, source: SourceConfig, request: LookupRequest
@@ -922,9 +1148,11 @@ class ModernWebLookupService(WebLookupServiceInterface):
                 enable_synonyms=True,
                 mcp_search_function=mcp_search_wrapper,
             ) as brave_service:
-                result = await asyncio.wait_for(
+                result = await self._timed_call(
+                    self._source_key(source),
+                    "search",
                     brave_service.lookup(term),
-                    timeout=float(getattr(request, "timeout", 30) or 30),
+                    request,
                 )
 
                 if result and result.success:
@@ -1204,12 +1432,16 @@ class ModernWebLookupService(WebLookupServiceInterface):
 
     def get_source_status(self) -> dict[str, dict[str, Any]]:
         """Krijg status van alle bronnen voor monitoring."""
+        health = self._health_store.get_status() if self._health_store else {}
+        latency = self._latency_tracker.get_status() if self._latency_tracker else {}
         return {
             name: {
                 "enabled": config.enabled,
                 "api_type": config.api_type,
                 "confidence_weight": config.confidence_weight,
                 "is_juridical": config.is_juridical,
+                "health": health.get(name, {"state": "closed"}),
+                "latency": latency.get(name, {}),
             }
             for name, config in self.sources.items()
         }
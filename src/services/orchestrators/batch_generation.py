@@ -0,0 +1,168 @@
+"""
+Batch generation helpers for DefinitionOrchestratorV2.
+
+``create_definitions_batch`` generates definitions for a whole list of
+begrippen. This module holds the pieces it needs that are not orchestration
+itself:
+
+- ``batch_key``: identity of a request; identical requests are generated once
+- ``BatchCheckpoint``: append-only JSONL file with finished items, so an
+  interrupted run resumes where it stopped
+- ``SharedLookups`` / ``shared_lookup`` / ``lookup_key``: batch-scoped memo
+  for expensive per-term lookups (web lookup, synonym enrichment); concurrent
+  requests for the same term and context share one in-flight call
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from services.interfaces import DefinitionResponseV2, GenerationRequest
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_shared_lookups: ContextVar[dict[tuple[str, str], asyncio.Task[Any]] | None] = (
+    ContextVar("batch_shared_lookups", default=None)
+)
+
+
+def _norm(value: Any) -> str:
+    if isinstance(value, list | tuple):
+        return ";".join(sorted(_norm(v) for v in value if v))
+    return " ".join(str(value or "").lower().split())
+
+
+def batch_key(request: GenerationRequest) -> str:
+    """Stable identity of a request: begrip, category, contexts and instructions."""
+    parts = [
+        _norm(request.begrip),
+        _norm(request.ontologische_categorie),
+        _norm(request.organisatorische_context),
+        _norm(request.juridische_context),
+        _norm(request.wettelijke_basis),
+        _norm(request.extra_instructies),
+    ]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def lookup_key(*parts: Any) -> str:
+    """Normalized ``shared_lookup`` key, e.g. a term plus its context lists."""
+    return "|".join(_norm(part) for part in parts)
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome for one request of a batch, streamed as soon as it is known."""
+
+    index: int
+    request_id: str
+    begrip: str
+    key: str
+    success: bool
+    definition_id: int | None = None
+    error: str | None = None
+    duration: float = 0.0
+    duplicate_of: int | None = None  # index of the request that was generated
+    resumed: bool = False  # taken from the checkpoint of an earlier run
+    response: DefinitionResponseV2 | None = field(default=None, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("response")
+        return data
+
+
+class BatchCheckpoint:
+    """Append-only JSONL checkpoint of finished batch items (by ``batch_key``).
+
+    Only successful items are skipped on resume; failed terms are retried.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._done: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with self.path.open(encoding="utf-8") as fh:
+            for line_no, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Afgebroken laatste regel van een gecrashte run
+                    logger.warning(f"Checkpoint {self.path}: regel {line_no} ongeldig")
+                    continue
+                if entry.get("success"):
+                    self._done[entry["key"]] = entry
+        logger.info(f"Checkpoint {self.path}: {len(self._done)} termen al klaar")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._done.get(key)
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def record(self, result: BatchItemResult) -> None:
+        entry = result.to_dict()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fh.flush()
+        if result.success:
+            self._done[result.key] = entry
+
+
+class SharedLookups:
+    """Batch-scoped memo used by ``shared_lookup``.
+
+    Every batch item task calls ``bind()`` first; tasks it spawns (the stage
+    graph) inherit the binding through their copied context.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[tuple[str, str], asyncio.Task[Any]] = {}
+
+    def bind(self) -> None:
+        _shared_lookups.set(self._tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def aclose(self) -> None:
+        """Cancel lookups nobody is waiting for any more."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks.clear()
+
+
+async def shared_lookup(kind: str, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+    """Run ``factory()`` once per (kind, key) within a bound ``SharedLookups``.
+
+    Outside a batch this is a plain call. The shared task is shielded:
+    a caller that is cancelled (e.g. a stage deadline) does not cancel the
+    lookup for the other batch items waiting on it.
+    """
+    memo = _shared_lookups.get()
+    if memo is None:
+        return await factory()
+    task = memo.get((kind, key))
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        memo[(kind, key)] = task
+    return await asyncio.shield(task)
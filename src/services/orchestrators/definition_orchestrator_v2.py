@@ -14,10 +14,15 @@ Key improvements:
 - Story 2.4: Uses ValidationOrchestratorInterface for clean separation of concerns
 """
 
+import asyncio
+import dataclasses
 import logging
+import os
 import time
 import uuid
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from services.exceptions import (
@@ -42,8 +47,18 @@ from services.interfaces import (
     SecurityServiceInterface as SecurityService,
     ValidationResult,
 )
+from services.orchestrators.batch_generation import (
+    BatchCheckpoint,
+    BatchItemResult,
+    SharedLookups,
+    batch_key,
+    lookup_key,
+    shared_lookup,
+)
+from services.orchestrators.stage_graph import Stage, StageGraph, StageRunner
 from services.validation.interfaces import ValidationOrchestratorInterface
 from utils.dict_helpers import safe_dict_get
+from utils.smart_rate_limiter import RequestPriority, get_smart_limiter
 from utils.type_helpers import ensure_dict, ensure_list, ensure_string
 
 UTC = UTC  # Python 3.10 compatibility - must be after all imports
@@ -305,9 +320,14 @@ class DefinitionOrchestratorV2(DefinitionOrchestratorInterface):
         9. Storage (Conditional on Quality Gate)
         10. Feedback Loop Update (GVI Rode Kabel)
         11. Monitoring & Metrics
+
+        Phases 1-7 run as a stage graph (see ``_build_stage_graph``): stages
+        without mutual dependencies run concurrently, each stage can have a
+        deadline and per-stage timings end up in the response metadata.
         """
         start_time = time.time()
         generation_id = request.id if request.id else str(uuid.uuid4())
+        graph: StageGraph | None = None
 
         try:
             # Track generation start
@@ -320,630 +340,33 @@ class DefinitionOrchestratorV2(DefinitionOrchestratorInterface):
             )
 
             # =====================================
-            # PHASE 1: Security & Privacy (DPIA/AVG Compliance)
-            # =====================================
-            sanitized_request = request
-            if self.security_service:
-                sanitized_request = await self.security_service.sanitize_request(
-                    request
-                )
-                logger.info(
-                    f"Generation {generation_id}: Request sanitized for privacy compliance"
-                )
-            else:
-                logger.debug(
-                    f"Generation {generation_id}: Security service not available, using original request"
-                )
-
-            # =====================================
-            # PHASE 2: Feedback Integration (GVI Rode Kabel)
-            # =====================================
-            feedback_history = None
-            if self.config.enable_feedback_loop and self.feedback_engine:
-                feedback_history = await self.feedback_engine.get_feedback_for_request(
-                    sanitized_request.begrip, sanitized_request.ontologische_categorie
-                )
-                logger.info(
-                    f"Generation {generation_id}: Feedback loaded ({len(feedback_history or [])} entries)"
-                )
-            else:
-                logger.debug(
-                    f"Generation {generation_id}: Feedback system disabled or unavailable"
-                )
-
-            # =====================================
-            # PHASE 2.4: Synonym Enrichment (Architecture v3.1)
-            # =====================================
-            enriched_synonyms: list[Any] = []
-            ai_pending_count = 0
-            synonym_enrichment_status = "not_available"
-
-            if self.synonym_orchestrator:
-                logger.info(
-                    f"Generation {generation_id}: Starting synonym enrichment for term: {sanitized_request.begrip}"
-                )
-                try:
-                    # Build context for synonym enrichment
-                    synonym_context = {
-                        "organisatorisch": sanitized_request.organisatorische_context
-                        or [],
-                        "juridisch": sanitized_request.juridische_context or [],
-                        "wettelijk": sanitized_request.wettelijke_basis or [],
-                    }
-
-                    # Ensure synonyms (GPT-4 enrichment if needed)
-                    # min_count=5 matches architecture specification (line 613)
-                    enriched_synonyms, ai_pending_count = (
-                        await self.synonym_orchestrator.ensure_synonyms(
-                            term=sanitized_request.begrip,
-                            min_count=5,
-                            context=synonym_context,
-                        )
-                    )
-
-                    logger.info(
-                        f"Generation {generation_id}: Synonym enrichment complete - "
-                        f"found {len(enriched_synonyms)} synonyms "
-                        f"({ai_pending_count} AI-pending for review)"
-                    )
-                    synonym_enrichment_status = (
-                        "success" if enriched_synonyms else "no_synonyms"
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"Generation {generation_id}: Synonym enrichment failed: {type(e).__name__}: {e!s} - "
-                        f"proceeding without synonym expansion"
-                    )
-                    synonym_enrichment_status = "error"
-                    # Continue without synonyms - definition generation proceeds
-            else:
-                logger.debug(
-                    f"Generation {generation_id}: Synonym orchestrator not available - "
-                    f"proceeding without synonym enrichment"
-                )
-
-            # =====================================
-            # PHASE 2.5: Web Lookup Context Enrichment (Epic 3)
-            # =====================================
-            provenance_sources = []
-            web_lookup_status = "not_available"  # Track status for metadata
-            debug_info = None  # Ensure defined even when web lookup is unavailable
-            # Allow timeout override via env for environments with slower network
-            import os
-
-            try:
-                web_lookup_timeout = float(
-                    os.getenv("WEB_LOOKUP_TIMEOUT_SECONDS", "10.0")
-                )
-            except ValueError as e:
-                # DEF-229: Log invalid env var configuration
-                logger.warning(
-                    f"Invalid WEB_LOOKUP_TIMEOUT_SECONDS value, using default 10.0: {e}",
-                    exc_info=True,
-                )
-                web_lookup_timeout = 10.0
-
-            # Web lookup runs ALWAYS when service is available (no feature flag)
-            if self.web_lookup_service:
-                logger.info(
-                    f"Generation {generation_id}: Starting web lookup for term: {sanitized_request.begrip}"
-                )
-                try:
-                    from services.interfaces import LookupRequest
-                    from services.web_lookup.provenance import build_provenance
-
-                    # Build a compact context string to guide provider selection
-                    ctx_parts = []
-                    if sanitized_request.organisatorische_context:
-                        ctx_parts.extend(sanitized_request.organisatorische_context)
-                    if sanitized_request.juridische_context:
-                        ctx_parts.extend(sanitized_request.juridische_context)
-                    if sanitized_request.wettelijke_basis:
-                        ctx_parts.extend(sanitized_request.wettelijke_basis)
-                    context_str = " | ".join([str(x) for x in ctx_parts if x]) or None
-
-                    # Allow broader result set so UI can show all hits
-                    import os as _os
-
-                    try:
-                        _max_res = int(_os.getenv("WEB_LOOKUP_MAX_RESULTS", "20"))
-                    except ValueError as e:
-                        # DEF-229: Log invalid env var configuration
-                        logger.warning(
-                            f"Invalid WEB_LOOKUP_MAX_RESULTS value, using default 20: {e}",
-                            exc_info=True,
-                        )
-                        _max_res = 20
-                    lookup_request = LookupRequest(
-                        term=sanitized_request.begrip,
-                        sources=None,
-                        context=context_str,
-                        max_results=_max_res,
-                        include_examples=False,
-                        timeout=web_lookup_timeout,  # Configurable via env var
-                    )
-
-                    # Add timeout protection for web lookup
-                    import asyncio
-
-                    web_results = await asyncio.wait_for(
-                        self.web_lookup_service.lookup(lookup_request),
-                        timeout=web_lookup_timeout,
-                    )
-                    logger.info(
-                        f"Generation {generation_id}: Web lookup returned {len(web_results) if web_results else 0} results"
-                    )
-                    # Capture debug info from service if available
-                    # Note: getattr with default never raises AttributeError
-                    debug_info = getattr(self.web_lookup_service, "_last_debug", None)
-
-                    # Build provenance records
-                    # Convert LookupResults to minimal dicts expected by build_provenance
-                    prepared = []
-                    for r in web_results or []:
-                        prepared.append(
-                            {
-                                "provider": r.source.name.lower(),
-                                "title": (
-                                    safe_dict_get(r.metadata, "dc_title")
-                                    if isinstance(r.metadata, dict)
-                                    else None
-                                )
-                                or r.source.name,
-                                "url": r.source.url,
-                                "snippet": r.definition or r.context or "",
-                                "score": float(r.source.confidence or 0.0),
-                                "used_in_prompt": False,
-                                "retrieved_at": (
-                                    safe_dict_get(r.metadata, "retrieved_at")
-                                    if isinstance(r.metadata, dict)
-                                    else None
-                                ),
-                            }
-                        )
-
-                    # STORY 3.1: Extract legal metadata for juridical sources
-                    provenance_sources = build_provenance(prepared, extract_legal=True)
-
-                    # Mark top-K as used_in_prompt (we'll include these first in any context pack)
-                    top_k = max(0, int(getattr(self.config, "web_lookup_top_k", 3)))
-                    for i, src in enumerate(provenance_sources):
-                        if i < top_k:
-                            src["used_in_prompt"] = True
-
-                    # Attach to context so prompt service can optionally use it
-                    context = context or {}
-                    context["web_lookup"] = {
-                        "sources": provenance_sources,
-                        "top_k": top_k,
-                        "debug": debug_info,
-                    }
-                    logger.info(
-                        f"Generation {generation_id}: Web lookup enriched context with {len(provenance_sources)} sources"
-                    )
-                    web_lookup_status = (
-                        "success" if provenance_sources else "no_results"
-                    )
-
-                except TimeoutError:
-                    logger.warning(
-                        f"Generation {generation_id}: Web lookup timeout after {web_lookup_timeout} seconds - "
-                        f"prompt service will use cached lookup results or proceed without"
-                    )
-                    web_lookup_status = "timeout"
-                    # Continue without web context - definition generation proceeds
-
-                except Exception as e:
-                    logger.error(
-                        f"Generation {generation_id}: Web lookup failed: {type(e).__name__}: {e!s} - "
-                        f"proceeding WITHOUT external context"
-                    )
-                    web_lookup_status = "error"
-                    # Continue without web context - definition generation proceeds
-            else:
-                # Log that web lookup service is NOT available
-                logger.warning(
-                    f"Generation {generation_id}: Web lookup service not available - "
-                    f"proceeding WITHOUT external context enrichment"
-                )
-
-            # =====================================
-            # PHASE 2.9: Merge document snippets into provenance sources (EPIC-018)
-            # =====================================
-            try:
-                docs_ctx = (
-                    ensure_dict(safe_dict_get(context, "documents", {}))
-                    if context
-                    else {}
-                )
-                doc_snippets = ensure_list(safe_dict_get(docs_ctx, "snippets", []))
-                if doc_snippets:
-                    normalized_docs = []
-                    for s in doc_snippets:
-                        try:
-                            normalized_docs.append(
-                                {
-                                    "provider": "documents",
-                                    "title": ensure_string(
-                                        safe_dict_get(s, "title")
-                                        or safe_dict_get(s, "filename")
-                                        or "document"
-                                    ),
-                                    "url": safe_dict_get(s, "url"),
-                                    "snippet": ensure_string(
-                                        safe_dict_get(s, "snippet", "")
-                                    ),
-                                    "score": float(
-                                        safe_dict_get(s, "score", 0.0) or 0.0
-                                    ),
-                                    "used_in_prompt": True,
-                                    "doc_id": safe_dict_get(s, "doc_id"),
-                                    "source_label": "Geüpload document",
-                                }
-                            )
-                        except (TypeError, ValueError) as e:
-                            # DEF-229: Log individual snippet normalization failures
-                            # Note: KeyError/AttributeError removed - safe_dict_get never raises
-                            snippet_keys = (
-                                list(s.keys())
-                                if isinstance(s, dict)
-                                else type(s).__name__
-                            )
-                            logger.debug(
-                                f"Skipping malformed document snippet: {type(e).__name__}: {e} [keys={snippet_keys}]"
-                            )
-                            continue
-                    if normalized_docs:
-                        provenance_sources = normalized_docs + (
-                            provenance_sources or []
-                        )
-                        context = context or {}
-                        context["documents"] = {"snippets": normalized_docs}
-            except TypeError as e:
-                # DEF-229: Log document snippet merge failures
-                # Note: Only TypeError possible in outer block (list concatenation)
-                logger.warning(
-                    f"Generation {generation_id}: Failed to merge document snippets: {type(e).__name__}: {e}",
-                    exc_info=True,
-                )
-
-            # =====================================
-            # PHASE 3: Intelligent Prompt Generation (with ontological category fix)
-            # =====================================
-            prompt_result = await self.prompt_service.build_generation_prompt(
-                sanitized_request,
-                feedback_history=feedback_history,
-                context=context,
-            )
-            logger.info(
-                f"Generation {generation_id}: V2 Prompt built ({prompt_result.token_count} tokens, "
-                f"ontological_category={sanitized_request.ontologische_categorie})"
-            )
-
-            # Debug summary: how many sources vs injected snippets in prompt
-            try:
-                text = prompt_result.text or ""
-                header = "### Contextinformatie uit bronnen:"
-                injected_snippets = 0
-                if header in text:
-                    # Count list items following the header (lines starting with "- ")
-                    tail = text.split(header, 1)[1]
-                    injected_snippets = tail.count("\n- ")
-                logger.info(
-                    "Web lookup summary: sources=%s, injected_snippets=%s",
-                    len(provenance_sources or []),
-                    injected_snippets,
-                )
-            except (AttributeError, ValueError) as e:
-                # DEF-229: Non-fatal debug summary failure
-                logger.debug(f"Could not generate web lookup summary: {e}")
-
-            # =====================================
-            # PHASE 4: AI Generation with Retry Logic
-            # =====================================
-            # Get temperature from config (0.1 for consistent legal definitions)
-            from config.config_manager import get_prompt_temperature
-
-            temperature = (
-                safe_dict_get(sanitized_request.options, "temperature")
-                if sanitized_request.options
-                else None
-            )
-            if temperature is None:
-                temperature = get_prompt_temperature("definition")
-
-            generation_result = await self.ai_service.generate_definition(
-                prompt=prompt_result.text,
-                temperature=temperature,
-                max_tokens=(
-                    safe_dict_get(sanitized_request.options, "max_tokens", 500)
-                    if sanitized_request.options
-                    else 500
-                ),
-                model=(
-                    safe_dict_get(sanitized_request.options, "model")
-                    if sanitized_request.options
-                    else None
-                ),
-            )
-            logger.info(f"Generation {generation_id}: AI generation complete")
-
-            # =====================================
-            # PHASE 5: Generate Voorbeelden (Examples)
-            # =====================================
-            voorbeelden = {}
-            try:
-                from utils.voorbeelden_debug import DEBUG_ENABLED, debugger
-                from voorbeelden.unified_voorbeelden import (
-                    genereer_alle_voorbeelden_async,
-                )
-
-                # Build context_dict for voorbeelden generation (V2-only fields)
-                voorbeelden_context = {
-                    "organisatorisch": sanitized_request.organisatorische_context or [],
-                    "juridisch": sanitized_request.juridische_context or [],
-                    "wettelijk": sanitized_request.wettelijke_basis or [],
-                }
-
-                # Debug logging point C - Before voorbeelden generation
-                if DEBUG_ENABLED:
-                    debug_gen_id = debugger.start_generation(
-                        begrip=sanitized_request.begrip,
-                        definitie=(
-                            generation_result.text
-                            if hasattr(generation_result, "text")
-                            else str(generation_result)
-                        ),
-                    )
-                    debugger.log_point(
-                        "C",
-                        debug_gen_id,
-                        context_keys=list(voorbeelden_context.keys()),
-                        orchestrator="V2",
-                    )
-                    debugger.log_session_state(debug_gen_id, "C")
-
-                # Generate voorbeelden using async for better performance (US-052)
-                voorbeelden = await genereer_alle_voorbeelden_async(
-                    begrip=sanitized_request.begrip,
-                    definitie=(
-                        generation_result.text
-                        if hasattr(generation_result, "text")
-                        else str(generation_result)
-                    ),
-                    context_dict=voorbeelden_context,
-                )
-
-                # Debug: Log antoniemen count
-                if "antoniemen" in voorbeelden:
-                    logger.info(
-                        f"Orchestrator generated {len(voorbeelden['antoniemen'])} antoniemen for {sanitized_request.begrip}"
-                    )
-
-                # Debug logging point C2 - After voorbeelden generation
-                if DEBUG_ENABLED:
-                    debugger.log_point(
-                        "C2",
-                        debug_gen_id,
-                        voorbeelden_types=list(voorbeelden.keys()),
-                        voorbeelden_counts={
-                            k: len(v) if isinstance(v, list) else 1
-                            for k, v in voorbeelden.items()
-                        },
-                    )
-                    debugger.log_session_state(debug_gen_id, "C2")
-
-                # Debug logging point A - After voorbeelden generation in V2
-                if os.getenv("DEBUG_EXAMPLES"):
-                    logger.info(
-                        "[EXAMPLES-A] V2 generated | gen_id=%s | begrip=%s | keys=%s | counts=%s",
-                        generation_id,
-                        sanitized_request.begrip,
-                        (
-                            list(voorbeelden.keys())
-                            if isinstance(voorbeelden, dict)
-                            else "NOT_DICT"
-                        ),
-                        {
-                            k: len(v) if isinstance(v, list | str) else "INVALID"
-                            for k, v in (voorbeelden or {}).items()
-                        },
-                    )
-
-                logger.info(
-                    f"Generation {generation_id}: Voorbeelden generated ({len(voorbeelden)} types)"
-                )
-            except Exception as e:
-                # DEF-229: Add stack trace for debugging voorbeelden failures
-                logger.warning(
-                    f"Generation {generation_id}: Voorbeelden generation failed: {type(e).__name__}: {e}",
-                    exc_info=True,
-                )
-                if DEBUG_ENABLED and "debug_gen_id" in locals():
-                    debugger.log_error(debug_gen_id, "C", e)
-                # Continue without voorbeelden
-
-            # =====================================
-            # PHASE 6: Text Cleaning & Normalization
-            # =====================================
-            # V2 cleaning service (always available through adapter)
-            raw_gpt_output = (
-                generation_result.text
-                if hasattr(generation_result, "text")
-                else str(generation_result)
-            )
-            cleaning_result = await self.cleaning_service.clean_text(
-                raw_gpt_output,
-                sanitized_request.begrip,
-            )
-            cleaned_text = cleaning_result.cleaned_text
-
-            # Extract clean definition for "origineel" display
-            # Uses full cleaning to remove ALL unwanted patterns:
-            # - "Ontologische categorie:" metadata header
-            # - "[term]:" prefix (e.g., "Vervoersverbod:")
-            # - Forbidden words, circular definitions, etc.
-            from opschoning.opschoning_enhanced import opschonen_enhanced
-
-            definitie_zonder_header = opschonen_enhanced(
-                raw_gpt_output, sanitized_request.begrip, handle_gpt_format=True
-            )
-
-            logger.info(f"Generation {generation_id}: Text cleaned with V2 service")
-
-            # =====================================
-            # PHASE 6: Validation
+            # PHASES 1-7: Stage graph (security t/m re-validation)
             # =====================================
-            # Use ValidationOrchestratorInterface.validate_text
-            from services.validation.interfaces import ValidationContext
-
-            # Tolerant correlation_id: als generation_id geen geldige UUID is, genereer er één
-            try:
-                corr = uuid.UUID(generation_id)
-            except ValueError:
-                # DEF-229: UUID.parse only raises ValueError for invalid strings
-                corr = uuid.uuid4()
-            # Voeg opties toe aan metadata zodat validator context flags kan lezen
-            meta: dict[str, Any] = {"generation_id": generation_id}
-            try:
-                if sanitized_request.options:
-                    # Expliciet doorgeven van force_duplicate voor duplicate-escalatie
-                    if bool(
-                        safe_dict_get(
-                            sanitized_request.options, "force_duplicate", False
-                        )
-                    ):
-                        meta["force_duplicate"] = True
-                    # Bewaar volledige options voor toekomstig gebruik (niet verplicht)
-                    meta["options"] = dict(sanitized_request.options)
-            except (TypeError, AttributeError) as e:
-                # DEF-229: Log options extraction failures
-                logger.debug(f"Could not extract generation options for metadata: {e}")
-            validation_context = ValidationContext(
-                correlation_id=corr,
-                metadata=meta,
-            )
-            # Validate using Definition object per interface contract
-            temp_definition = Definition(
-                begrip=sanitized_request.begrip,
-                definitie=cleaned_text,
-                organisatorische_context=sanitized_request.organisatorische_context
-                or [],
-                juridische_context=sanitized_request.juridische_context or [],
-                wettelijke_basis=sanitized_request.wettelijke_basis or [],
-                ontologische_categorie=sanitized_request.ontologische_categorie,
-                created_by=sanitized_request.actor,
+            web_lookup_timeout = self._web_lookup_timeout()
+            graph = self._build_stage_graph(
+                request, context, generation_id, web_lookup_timeout
             )
-            raw_validation = await self.validation_service.validate_definition(
-                definition=temp_definition,
-                context=validation_context,
-            )
-            # Normalize to schema-conform dict for internal decisions
-            try:
-                from services.validation.mappers import ensure_schema_compliance
-
-                validation_result = ensure_schema_compliance(raw_validation)
-            except (ImportError, TypeError, ValueError, AttributeError) as e:
-                # DEF-229: Log schema compliance failures with context
-                logger.warning(
-                    f"Generation {generation_id}: Validation schema mapping failed, using fallback: {e}",
-                    extra={
-                        "error_type": type(e).__name__,
-                        "generation_id": generation_id,
-                    },
-                    exc_info=True,
-                )
-                # Defensive fallback to simple mapping
-                is_ok = getattr(raw_validation, "is_valid", False)
-                vio_list = getattr(raw_validation, "violations", None)
-                if vio_list is None:
-                    vio_list = getattr(raw_validation, "errors", []) or []
-                validation_result = {
-                    "is_acceptable": bool(is_ok),
-                    "violations": vio_list,
-                    "passed_rules": [],
-                    "detailed_scores": {},
-                    "version": "v2",
-                    "system": {},
-                }
-
+            results = await graph.run()
             logger.info(
-                f"Generation {generation_id}: Validation complete (valid: {safe_dict_get(validation_result, 'is_acceptable', False)})"
+                f"Generation {generation_id}: Stages complete, critical path: "
+                f"{' -> '.join(graph.critical_path())}"
             )
 
-            # =====================================
-            # PHASE 7: Enhancement (if validation failed and enabled)
-            # =====================================
-            was_enhanced = False
-            if (
-                not safe_dict_get(validation_result, "is_acceptable", False)
-                and self.config.enable_enhancement
-                and self.enhancement_service
-            ):
-                enhanced_text = await self.enhancement_service.enhance_definition(
-                    cleaned_text,
-                    ensure_list(safe_dict_get(validation_result, "violations", [])),
-                    context=sanitized_request,
-                )
-
-                # Re-validate enhanced text with new context
-                try:
-                    corr2 = uuid.UUID(generation_id)
-                except ValueError:
-                    # DEF-229: UUID.parse only raises ValueError for invalid strings
-                    corr2 = uuid.uuid4()
-                enhanced_context = ValidationContext(
-                    correlation_id=corr2,
-                    metadata={"generation_id": generation_id, "enhanced": True},
-                )
-                # Re-validate enhanced text using Definition object
-                enhanced_definition = Definition(
-                    begrip=sanitized_request.begrip,
-                    definitie=enhanced_text,
-                    organisatorische_context=sanitized_request.organisatorische_context
-                    or [],
-                    juridische_context=sanitized_request.juridische_context or [],
-                    wettelijke_basis=sanitized_request.wettelijke_basis or [],
-                    ontologische_categorie=sanitized_request.ontologische_categorie,
-                    created_by=sanitized_request.actor,
-                )
-                raw_validation = await self.validation_service.validate_definition(
-                    definition=enhanced_definition,
-                    context=enhanced_context,
-                )
-                try:
-                    from services.validation.mappers import ensure_schema_compliance
-
-                    validation_result = ensure_schema_compliance(raw_validation)
-                except (ImportError, TypeError, ValueError, AttributeError) as e:
-                    # DEF-229: Log enhancement validation mapping failures
-                    logger.warning(
-                        f"Generation {generation_id}: Enhanced validation schema mapping failed: {e}",
-                        extra={
-                            "error_type": type(e).__name__,
-                            "generation_id": generation_id,
-                        },
-                        exc_info=True,
-                    )
-                    is_ok = getattr(raw_validation, "is_valid", False)
-                    vio_list = getattr(raw_validation, "violations", None)
-                    if vio_list is None:
-                        vio_list = getattr(raw_validation, "errors", []) or []
-                    validation_result = {
-                        "is_acceptable": bool(is_ok),
-                        "violations": vio_list,
-                        "passed_rules": [],
-                        "detailed_scores": {},
-                        "version": "v2",
-                        "system": {},
-                    }
-
-                cleaned_text = enhanced_text
-                was_enhanced = True
-                logger.info(
-                    f"Generation {generation_id}: Enhancement applied, re-validated"
-                )
+            sanitized_request = results["security"]
+            feedback_history = results["feedback"]
+            enriched_synonyms, ai_pending_count, synonym_enrichment_status = results[
+                "synonyms"
+            ]
+            web_lookup = results["web_lookup"]
+            web_lookup_status = web_lookup["status"]
+            debug_info = web_lookup["debug"]
+            prompt_result, provenance_sources = results["prompt"]
+            generation_result, temperature = results["generation"]
+            voorbeelden = results["voorbeelden"]
+            _, definitie_zonder_header = results["cleaning"]
+            raw_validation, validation_result, cleaned_text, was_enhanced = results[
+                "revalidation"
+            ]
 
             # =====================================
             # PHASE 8: Definition Object Creation
@@ -1017,7 +440,6 @@ class DefinitionOrchestratorV2(DefinitionOrchestratorInterface):
                     ),
                 },
             )
-
             # =====================================
             # PHASE 9: Storage (Conditional on Quality Gate)
             # =====================================
@@ -1109,6 +531,8 @@ class DefinitionOrchestratorV2(DefinitionOrchestratorInterface):
                     "synonym_enrichment_status": synonym_enrichment_status,
                     "enriched_synonyms_count": len(enriched_synonyms),
                     "ai_pending_synonyms_count": ai_pending_count,
+                    # Per-stage timings en kritiek pad van de stage graph
+                    **graph.timing_metadata(),
                 },
             )
 
@@ -1127,9 +551,959 @@ class DefinitionOrchestratorV2(DefinitionOrchestratorInterface):
                     "duration": time.time() - start_time,
                     "error_type": type(e).__name__,
                     "orchestrator_version": "v2.0",
+                    **(graph.timing_metadata() if graph else {}),
                 },
             )
 
+    async def create_definitions_batch(
+        self,
+        requests: Iterable[GenerationRequest],
+        *,
+        concurrency: int = 4,
+        context: dict[str, Any] | None = None,
+        checkpoint: str | Path | BatchCheckpoint | None = None,
+        rate_limit_endpoint: str | None = "definition_generation",
+        priority: RequestPriority = RequestPriority.LOW,
+    ) -> AsyncIterator[BatchItemResult]:
+        """
+        Generate definitions for a list of requests, streaming per-term results.
+
+        - Identical requests (see ``batch_key``) are generated once; the
+          duplicates are reported with ``duplicate_of``.
+        - Web lookups and synonym enrichment are shared across the batch.
+        - Every generation first acquires the shared smart rate limiter of
+          ``rate_limit_endpoint`` at ``priority`` (LOW by default, so
+          interactive generations go first). ``None`` disables this.
+        - With a ``checkpoint`` (JSONL path) finished terms are recorded as
+          they complete; a rerun with the same checkpoint skips them and
+          reports them with ``resumed=True``.
+
+        Results are yielded in completion order; ``BatchItemResult.index`` is
+        the position in ``requests``.
+        """
+        requests = list(requests)
+        if checkpoint is not None and not isinstance(checkpoint, BatchCheckpoint):
+            checkpoint = BatchCheckpoint(checkpoint)
+
+        groups: dict[str, list[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault(batch_key(request), []).append(index)
+
+        def with_duplicates(result: BatchItemResult) -> list[BatchItemResult]:
+            return [result] + [
+                dataclasses.replace(
+                    result,
+                    index=dup,
+                    request_id=requests[dup].id,
+                    duplicate_of=result.index,
+                )
+                for dup in groups[result.key][1:]
+            ]
+
+        pending: list[str] = []
+        for key, indices in groups.items():
+            done = checkpoint.get(key) if checkpoint is not None else None
+            if done is None:
+                pending.append(key)
+                continue
+            first = requests[indices[0]]
+            for result in with_duplicates(
+                BatchItemResult(
+                    index=indices[0],
+                    request_id=first.id,
+                    begrip=first.begrip,
+                    key=key,
+                    success=True,
+                    definition_id=done.get("definition_id"),
+                    resumed=True,
+                )
+            ):
+                yield result
+
+        logger.info(
+            f"Batch: {len(requests)} requests, {len(groups)} unique, "
+            f"{len(groups) - len(pending)} from checkpoint, concurrency={concurrency}"
+        )
+        limiter = (
+            await get_smart_limiter(rate_limit_endpoint)
+            if rate_limit_endpoint and pending
+            else None
+        )
+        semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+        shared = SharedLookups()
+
+        async def generate(key: str) -> BatchItemResult:
+            shared.bind()
+            index = groups[key][0]
+            request = requests[index]
+            result = BatchItemResult(
+                index=index,
+                request_id=request.id,
+                begrip=request.begrip,
+                key=key,
+                success=False,
+            )
+            async with semaphore:
+                if limiter is not None and not await limiter.acquire(
+                    priority, request_id=f"batch_{request.id}"
+                ):
+                    result.error = "Rate limit timeout"
+                    return result
+                started = time.perf_counter()
+                try:
+                    # Own copy per item: the prompt stage adds keys to it
+                    response = await self.create_definition(
+                        request, dict(context) if context is not None else None
+                    )
+                except Exception as e:  # create_definition normally never raises
+                    response = DefinitionResponseV2(success=False, error=str(e))
+                result.duration = time.perf_counter() - started
+                if limiter is not None:
+                    await limiter.record_response(
+                        result.duration, response.success, priority
+                    )
+            result.success = response.success
+            result.error = response.error
+            result.definition_id = (
+                response.definition.id if response.definition else None
+            )
+            result.response = response
+            return result
+
+        tasks = [
+            asyncio.create_task(generate(key), name=f"batch:{key}") for key in pending
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if checkpoint is not None:
+                    checkpoint.record(result)
+                for item in with_duplicates(result):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await shared.aclose()
+
+    # =====================================
+    # STAGE GRAPH (PHASES 1-7)
+    # =====================================
+
+    def _build_stage_graph(
+        self,
+        request: GenerationRequest,
+        context: dict[str, Any] | None,
+        generation_id: str,
+        web_lookup_timeout: float,
+    ) -> StageGraph:
+        """Express phases 1-7 as a dependency graph.
+
+        Feedback, synonym enrichment and document-context prep only need the
+        sanitized request. Web lookup waits for synonyms (providers read the
+        synonym registry). Voorbeelden overlap with cleaning/validation.
+        """
+        deadlines = dict(self.config.stage_deadlines or {})
+        deadlines.setdefault("web_lookup", web_lookup_timeout)
+
+        def stage(
+            name: str,
+            run: StageRunner,
+            after: tuple[str, ...] = (),
+            on_timeout: Callable[[], Any] | None = None,
+        ) -> Stage:
+            return Stage(
+                name=name,
+                run=run,
+                after=after,
+                deadline=deadlines.get(name),
+                on_timeout=on_timeout,
+            )
+
+        def web_lookup_timed_out() -> dict[str, Any]:
+            logger.warning(
+                f"Generation {generation_id}: Web lookup timeout after {deadlines['web_lookup']} seconds - "
+                f"prompt service will use cached lookup results or proceed without"
+            )
+            # Continue without web context - definition generation proceeds
+            return {"sources": [], "status": "timeout", "debug": None, "context": None}
+
+        stages = [
+            stage("security", lambda d: self._stage_security(request, generation_id)),
+            stage(
+                "feedback",
+                lambda d: self._stage_feedback(d["security"], generation_id),
+                ("security",),
+            ),
+            stage(
+                "synonyms",
+                lambda d: self._stage_synonyms(d["security"], generation_id),
+                ("security",),
+            ),
+            stage(
+                "web_lookup",
+                lambda d: self._stage_web_lookup(
+                    d["security"], generation_id, web_lookup_timeout
+                ),
+                ("security", "synonyms"),
+                on_timeout=web_lookup_timed_out,
+            ),
+            stage("documents", lambda d: self._stage_documents(context, generation_id)),
+            stage(
+                "prompt",
+                lambda d: self._stage_prompt(
+                    d["security"],
+                    d["feedback"],
+                    d["web_lookup"],
+                    d["documents"],
+                    context,
+                    generation_id,
+                ),
+                ("security", "feedback", "web_lookup", "documents"),
+            ),
+            stage(
+                "generation",
+                lambda d: self._stage_generation(
+                    d["security"], d["prompt"][0], generation_id
+                ),
+                ("security", "prompt"),
+            ),
+            stage(
+                "voorbeelden",
+                lambda d: self._stage_voorbeelden(
+                    d["security"], d["generation"][0], generation_id
+                ),
+                ("security", "generation"),
+            ),
+            stage(
+                "cleaning",
+                lambda d: self._stage_cleaning(
+                    d["security"], d["generation"][0], generation_id
+                ),
+                ("security", "generation"),
+            ),
+            stage(
+                "validation",
+                lambda d: self._stage_validation(
+                    d["security"], d["cleaning"][0], generation_id
+                ),
+                ("security", "cleaning"),
+            ),
+            stage(
+                "enhancement",
+                lambda d: self._stage_enhancement(
+                    d["security"], d["cleaning"][0], d["validation"][1]
+                ),
+                ("security", "cleaning", "validation"),
+            ),
+            stage(
+                "revalidation",
+                lambda d: self._stage_revalidation(
+                    d["security"],
+                    d["cleaning"][0],
+                    d["validation"],
+                    d["enhancement"],
+                    generation_id,
+                ),
+                ("security", "cleaning", "validation", "enhancement"),
+            ),
+        ]
+        return StageGraph(stages, concurrent=self.config.enable_concurrent_stages)
+
+    def _web_lookup_timeout(self) -> float:
+        """Web lookup deadline; override via env for slower networks."""
+        try:
+            return float(os.getenv("WEB_LOOKUP_TIMEOUT_SECONDS", "10.0"))
+        except ValueError as e:
+            # DEF-229: Log invalid env var configuration
+            logger.warning(
+                f"Invalid WEB_LOOKUP_TIMEOUT_SECONDS value, using default 10.0: {e}",
+                exc_info=True,
+            )
+            return 10.0
+
+    async def _stage_security(
+        self, request: GenerationRequest, generation_id: str
+    ) -> GenerationRequest:
+        """PHASE 1: Security & Privacy (DPIA/AVG Compliance)."""
+        if self.security_service:
+            sanitized_request = await self.security_service.sanitize_request(request)
+            logger.info(
+                f"Generation {generation_id}: Request sanitized for privacy compliance"
+            )
+            return sanitized_request
+        logger.debug(
+            f"Generation {generation_id}: Security service not available, using original request"
+        )
+        return request
+
+    async def _stage_feedback(
+        self, sanitized_request: GenerationRequest, generation_id: str
+    ) -> list | None:
+        """PHASE 2: Feedback Integration (GVI Rode Kabel)."""
+        if self.config.enable_feedback_loop and self.feedback_engine:
+            feedback_history = await self.feedback_engine.get_feedback_for_request(
+                sanitized_request.begrip, sanitized_request.ontologische_categorie
+            )
+            logger.info(
+                f"Generation {generation_id}: Feedback loaded ({len(feedback_history or [])} entries)"
+            )
+            return feedback_history
+        logger.debug(
+            f"Generation {generation_id}: Feedback system disabled or unavailable"
+        )
+        return None
+
+    async def _stage_synonyms(
+        self, sanitized_request: GenerationRequest, generation_id: str
+    ) -> tuple[list[Any], int, str]:
+        """PHASE 2.4: Synonym Enrichment (Architecture v3.1).
+
+        Returns:
+            (enriched_synonyms, ai_pending_count, synonym_enrichment_status)
+        """
+        if not self.synonym_orchestrator:
+            logger.debug(
+                f"Generation {generation_id}: Synonym orchestrator not available - "
+                f"proceeding without synonym enrichment"
+            )
+            return [], 0, "not_available"
+
+        logger.info(
+            f"Generation {generation_id}: Starting synonym enrichment for term: {sanitized_request.begrip}"
+        )
+        try:
+            # Build context for synonym enrichment
+            synonym_context = {
+                "organisatorisch": sanitized_request.organisatorische_context or [],
+                "juridisch": sanitized_request.juridische_context or [],
+                "wettelijk": sanitized_request.wettelijke_basis or [],
+            }
+
+            # Ensure synonyms (GPT-4 enrichment if needed)
+            # min_count=5 matches architecture specification (line 613)
+            # Within a batch the enrichment per term + context is shared
+            enriched_synonyms, ai_pending_count = await shared_lookup(
+                "synonyms",
+                lookup_key(
+                    sanitized_request.begrip,
+                    synonym_context["organisatorisch"],
+                    synonym_context["juridisch"],
+                    synonym_context["wettelijk"],
+                ),
+                lambda: self.synonym_orchestrator.ensure_synonyms(
+                    term=sanitized_request.begrip,
+                    min_count=5,
+                    context=synonym_context,
+                ),
+            )
+
+            logger.info(
+                f"Generation {generation_id}: Synonym enrichment complete - "
+                f"found {len(enriched_synonyms)} synonyms "
+                f"({ai_pending_count} AI-pending for review)"
+            )
+            return (
+                enriched_synonyms,
+                ai_pending_count,
+                "success" if enriched_synonyms else "no_synonyms",
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Generation {generation_id}: Synonym enrichment failed: {type(e).__name__}: {e!s} - "
+                f"proceeding without synonym expansion"
+            )
+            # Continue without synonyms - definition generation proceeds
+            return [], 0, "error"
+
+    async def _stage_web_lookup(
+        self,
+        sanitized_request: GenerationRequest,
+        generation_id: str,
+        web_lookup_timeout: float,
+    ) -> dict[str, Any]:
+        """PHASE 2.5: Web Lookup Context Enrichment (Epic 3).
+
+        The deadline is enforced by the stage graph. Returns a dict with
+        ``sources``, ``status``, ``debug`` and ``context`` (the ``web_lookup``
+        entry for the prompt context, or None).
+        """
+        outcome: dict[str, Any] = {
+            "sources": [],
+            "status": "not_available",
+            "debug": None,
+            "context": None,
+        }
+        # Web lookup runs ALWAYS when service is available (no feature flag)
+        if not self.web_lookup_service:
+            # Log that web lookup service is NOT available
+            logger.warning(
+                f"Generation {generation_id}: Web lookup service not available - "
+                f"proceeding WITHOUT external context enrichment"
+            )
+            return outcome
+
+        logger.info(
+            f"Generation {generation_id}: Starting web lookup for term: {sanitized_request.begrip}"
+        )
+        try:
+            from services.interfaces import LookupRequest
+            from services.web_lookup.provenance import build_provenance
+
+            # Build a compact context string to guide provider selection
+            ctx_parts = []
+            if sanitized_request.organisatorische_context:
+                ctx_parts.extend(sanitized_request.organisatorische_context)
+            if sanitized_request.juridische_context:
+                ctx_parts.extend(sanitized_request.juridische_context)
+            if sanitized_request.wettelijke_basis:
+                ctx_parts.extend(sanitized_request.wettelijke_basis)
+            context_str = " | ".join([str(x) for x in ctx_parts if x]) or None
+
+            # Allow broader result set so UI can show all hits
+            try:
+                _max_res = int(os.getenv("WEB_LOOKUP_MAX_RESULTS", "20"))
+            except ValueError as e:
+                # DEF-229: Log invalid env var configuration
+                logger.warning(
+                    f"Invalid WEB_LOOKUP_MAX_RESULTS value, using default 20: {e}",
+                    exc_info=True,
+                )
+                _max_res = 20
+            lookup_request = LookupRequest(
+                term=sanitized_request.begrip,
+                sources=None,
+                context=context_str,
+                max_results=_max_res,
+                include_examples=False,
+                timeout=web_lookup_timeout,  # Configurable via env var
+            )
+
+            async def lookup() -> tuple[Any, Any]:
+                results = await self.web_lookup_service.lookup(lookup_request)
+                # Capture debug info from service if available
+                # Note: getattr with default never raises AttributeError
+                return results, getattr(self.web_lookup_service, "_last_debug", None)
+
+            # Within a batch identical lookups (term + context) are shared
+            web_results, debug_info = await shared_lookup(
+                "web_lookup",
+                f"{' '.join(sanitized_request.begrip.lower().split())}|{context_str}",
+                lookup,
+            )
+            logger.info(
+                f"Generation {generation_id}: Web lookup returned {len(web_results) if web_results else 0} results"
+            )
+            outcome["debug"] = debug_info
+
+            # Build provenance records
+            # Convert LookupResults to minimal dicts expected by build_provenance
+            prepared = []
+            for r in web_results or []:
+                prepared.append(
+                    {
+                        "provider": r.source.name.lower(),
+                        "title": (
+                            safe_dict_get(r.metadata, "dc_title")
+                            if isinstance(r.metadata, dict)
+                            else None
+                        )
+                        or r.source.name,
+                        "url": r.source.url,
+                        "snippet": r.definition or r.context or "",
+                        "score": float(r.source.confidence or 0.0),
+                        "used_in_prompt": False,
+                        "retrieved_at": (
+                            safe_dict_get(r.metadata, "retrieved_at")
+                            if isinstance(r.metadata, dict)
+                            else None
+                        ),
+                    }
+                )
+
+            # STORY 3.1: Extract legal metadata for juridical sources
+            provenance_sources = build_provenance(prepared, extract_legal=True)
+
+            # Mark top-K as used_in_prompt (we'll include these first in any context pack)
+            top_k = max(0, int(getattr(self.config, "web_lookup_top_k", 3)))
+            for i, src in enumerate(provenance_sources):
+                if i < top_k:
+                    src["used_in_prompt"] = True
+
+            # Attached to the context by the prompt stage so prompt service can use it
+            outcome["sources"] = provenance_sources
+            outcome["context"] = {
+                "sources": provenance_sources,
+                "top_k": top_k,
+                "debug": debug_info,
+            }
+            logger.info(
+                f"Generation {generation_id}: Web lookup enriched context with {len(provenance_sources)} sources"
+            )
+            outcome["status"] = "success" if provenance_sources else "no_results"
+
+        except Exception as e:
+            logger.error(
+                f"Generation {generation_id}: Web lookup failed: {type(e).__name__}: {e!s} - "
+                f"proceeding WITHOUT external context"
+            )
+            outcome["status"] = "error"
+            # Continue without web context - definition generation proceeds
+        return outcome
+
+    async def _stage_documents(
+        self, context: dict[str, Any] | None, generation_id: str
+    ) -> list[dict[str, Any]]:
+        """PHASE 2.9: Normalize document snippets into provenance sources (EPIC-018)."""
+        normalized_docs: list[dict[str, Any]] = []
+        try:
+            docs_ctx = (
+                ensure_dict(safe_dict_get(context, "documents", {})) if context else {}
+            )
+            doc_snippets = ensure_list(safe_dict_get(docs_ctx, "snippets", []))
+            for s in doc_snippets:
+                try:
+                    normalized_docs.append(
+                        {
+                            "provider": "documents",
+                            "title": ensure_string(
+                                safe_dict_get(s, "title")
+                                or safe_dict_get(s, "filename")
+                                or "document"
+                            ),
+                            "url": safe_dict_get(s, "url"),
+                            "snippet": ensure_string(safe_dict_get(s, "snippet", "")),
+                            "score": float(safe_dict_get(s, "score", 0.0) or 0.0),
+                            "used_in_prompt": True,
+                            "doc_id": safe_dict_get(s, "doc_id"),
+                            "source_label": "Geüpload document",
+                        }
+                    )
+                except (TypeError, ValueError) as e:
+                    # DEF-229: Log individual snippet normalization failures
+                    # Note: KeyError/AttributeError removed - safe_dict_get never raises
+                    snippet_keys = (
+                        list(s.keys()) if isinstance(s, dict) else type(s).__name__
+                    )
+                    logger.debug(
+                        f"Skipping malformed document snippet: {type(e).__name__}: {e} [keys={snippet_keys}]"
+                    )
+                    continue
+        except TypeError as e:
+            # DEF-229: Log document snippet merge failures
+            logger.warning(
+                f"Generation {generation_id}: Failed to merge document snippets: {type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            return []
+        return normalized_docs
+
+    async def _stage_prompt(
+        self,
+        sanitized_request: GenerationRequest,
+        feedback_history: list | None,
+        web_lookup: dict[str, Any],
+        normalized_docs: list[dict[str, Any]],
+        context: dict[str, Any] | None,
+        generation_id: str,
+    ) -> tuple["PromptResult", list[dict[str, Any]]]:
+        """PHASE 3: Intelligent Prompt Generation (with ontological category fix).
+
+        Merges web lookup and document context first. Returns the prompt
+        result and the combined provenance sources (documents first).
+        """
+        provenance_sources = web_lookup["sources"]
+        if web_lookup["context"] is not None or normalized_docs:
+            # Extend a copy: the caller's dict is left untouched
+            context = dict(context or {})
+        if web_lookup["context"] is not None:
+            context["web_lookup"] = web_lookup["context"]
+        if normalized_docs:
+            provenance_sources = normalized_docs + (provenance_sources or [])
+            context["documents"] = {"snippets": normalized_docs}
+
+        prompt_result = await self.prompt_service.build_generation_prompt(
+            sanitized_request,
+            feedback_history=feedback_history,
+            context=context,
+        )
+        logger.info(
+            f"Generation {generation_id}: V2 Prompt built ({prompt_result.token_count} tokens, "
+            f"ontological_category={sanitized_request.ontologische_categorie})"
+        )
+
+        # Debug summary: how many sources vs injected snippets in prompt
+        try:
+            text = prompt_result.text or ""
+            header = "### Contextinformatie uit bronnen:"
+            injected_snippets = 0
+            if header in text:
+                # Count list items following the header (lines starting with "- ")
+                tail = text.split(header, 1)[1]
+                injected_snippets = tail.count("\n- ")
+            logger.info(
+                "Web lookup summary: sources=%s, injected_snippets=%s",
+                len(provenance_sources or []),
+                injected_snippets,
+            )
+        except (AttributeError, ValueError) as e:
+            # DEF-229: Non-fatal debug summary failure
+            logger.debug(f"Could not generate web lookup summary: {e}")
+
+        return prompt_result, provenance_sources
+
+    async def _stage_generation(
+        self,
+        sanitized_request: GenerationRequest,
+        prompt_result: "PromptResult",
+        generation_id: str,
+    ) -> tuple[Any, float]:
+        """PHASE 4: AI Generation with Retry Logic.
+
+        Returns:
+            (generation_result, temperature)
+        """
+        # Get temperature from config (0.1 for consistent legal definitions)
+        from config.config_manager import get_prompt_temperature
+
+        temperature = (
+            safe_dict_get(sanitized_request.options, "temperature")
+            if sanitized_request.options
+            else None
+        )
+        if temperature is None:
+            temperature = get_prompt_temperature("definition")
+
+        generation_result = await self.ai_service.generate_definition(
+            prompt=prompt_result.text,
+            temperature=temperature,
+            max_tokens=(
+                safe_dict_get(sanitized_request.options, "max_tokens", 500)
+                if sanitized_request.options
+                else 500
+            ),
+            model=(
+                safe_dict_get(sanitized_request.options, "model")
+                if sanitized_request.options
+                else None
+            ),
+        )
+        logger.info(f"Generation {generation_id}: AI generation complete")
+        return generation_result, temperature
+
+    async def _stage_voorbeelden(
+        self,
+        sanitized_request: GenerationRequest,
+        generation_result: Any,
+        generation_id: str,
+    ) -> dict[str, Any]:
+        """PHASE 5: Generate Voorbeelden (Examples), parallel to cleaning/validation."""
+        voorbeelden: dict[str, Any] = {}
+        try:
+            from utils.voorbeelden_debug import DEBUG_ENABLED, debugger
+            from voorbeelden.unified_voorbeelden import (
+                genereer_alle_voorbeelden_async,
+            )
+
+            # Build context_dict for voorbeelden generation (V2-only fields)
+            voorbeelden_context = {
+                "organisatorisch": sanitized_request.organisatorische_context or [],
+                "juridisch": sanitized_request.juridische_context or [],
+                "wettelijk": sanitized_request.wettelijke_basis or [],
+            }
+
+            # Debug logging point C - Before voorbeelden generation
+            if DEBUG_ENABLED:
+                debug_gen_id = debugger.start_generation(
+                    begrip=sanitized_request.begrip,
+                    definitie=(
+                        generation_result.text
+                        if hasattr(generation_result, "text")
+                        else str(generation_result)
+                    ),
+                )
+                debugger.log_point(
+                    "C",
+                    debug_gen_id,
+                    context_keys=list(voorbeelden_context.keys()),
+                    orchestrator="V2",
+                )
+                debugger.log_session_state(debug_gen_id, "C")
+
+            # Generate voorbeelden using async for better performance (US-052)
+            voorbeelden = await genereer_alle_voorbeelden_async(
+                begrip=sanitized_request.begrip,
+                definitie=(
+                    generation_result.text
+                    if hasattr(generation_result, "text")
+                    else str(generation_result)
+                ),
+                context_dict=voorbeelden_context,
+            )
+
+            # Debug: Log antoniemen count
+            if "antoniemen" in voorbeelden:
+                logger.info(
+                    f"Orchestrator generated {len(voorbeelden['antoniemen'])} antoniemen for {sanitized_request.begrip}"
+                )
+
+            # Debug logging point C2 - After voorbeelden generation
+            if DEBUG_ENABLED:
+                debugger.log_point(
+                    "C2",
+                    debug_gen_id,
+                    voorbeelden_types=list(voorbeelden.keys()),
+                    voorbeelden_counts={
+                        k: len(v) if isinstance(v, list) else 1
+                        for k, v in voorbeelden.items()
+                    },
+                )
+                debugger.log_session_state(debug_gen_id, "C2")
+
+            # Debug logging point A - After voorbeelden generation in V2
+            if os.getenv("DEBUG_EXAMPLES"):
+                logger.info(
+                    "[EXAMPLES-A] V2 generated | gen_id=%s | begrip=%s | keys=%s | counts=%s",
+                    generation_id,
+                    sanitized_request.begrip,
+                    (
+                        list(voorbeelden.keys())
+                        if isinstance(voorbeelden, dict)
+                        else "NOT_DICT"
+                    ),
+                    {
+                        k: len(v) if isinstance(v, list | str) else "INVALID"
+                        for k, v in (voorbeelden or {}).items()
+                    },
+                )
+
+            logger.info(
+                f"Generation {generation_id}: Voorbeelden generated ({len(voorbeelden)} types)"
+            )
+        except Exception as e:
+            # DEF-229: Add stack trace for debugging voorbeelden failures
+            logger.warning(
+                f"Generation {generation_id}: Voorbeelden generation failed: {type(e).__name__}: {e}",
+                exc_info=True,
+            )
+            if DEBUG_ENABLED and "debug_gen_id" in locals():
+                debugger.log_error(debug_gen_id, "C", e)
+            # Continue without voorbeelden
+        return voorbeelden
+
+    async def _stage_cleaning(
+        self,
+        sanitized_request: GenerationRequest,
+        generation_result: Any,
+        generation_id: str,
+    ) -> tuple[str, str]:
+        """PHASE 6: Text Cleaning & Normalization.
+
+        Returns:
+            (cleaned_text, definitie_zonder_header)
+        """
+        # V2 cleaning service (always available through adapter)
+        raw_gpt_output = (
+            generation_result.text
+            if hasattr(generation_result, "text")
+            else str(generation_result)
+        )
+        cleaning_result = await self.cleaning_service.clean_text(
+            raw_gpt_output,
+            sanitized_request.begrip,
+        )
+        cleaned_text = cleaning_result.cleaned_text
+
+        # Extract clean definition for "origineel" display
+        # Uses full cleaning to remove ALL unwanted patterns:
+        # - "Ontologische categorie:" metadata header
+        # - "[term]:" prefix (e.g., "Vervoersverbod:")
+        # - Forbidden words, circular definitions, etc.
+        from opschoning.opschoning_enhanced import opschonen_enhanced
+
+        definitie_zonder_header = opschonen_enhanced(
+            raw_gpt_output, sanitized_request.begrip, handle_gpt_format=True
+        )
+
+        logger.info(f"Generation {generation_id}: Text cleaned with V2 service")
+        return cleaned_text, definitie_zonder_header
+
+    async def _stage_validation(
+        self,
+        sanitized_request: GenerationRequest,
+        cleaned_text: str,
+        generation_id: str,
+    ) -> tuple[Any, ValidationResult]:
+        """PHASE 6: Validation.
+
+        Returns:
+            (raw_validation, schema-conform validation_result)
+        """
+        # Use ValidationOrchestratorInterface.validate_text
+        from services.validation.interfaces import ValidationContext
+
+        # Tolerant correlation_id: als generation_id geen geldige UUID is, genereer er één
+        try:
+            corr = uuid.UUID(generation_id)
+        except ValueError:
+            # DEF-229: UUID.parse only raises ValueError for invalid strings
+            corr = uuid.uuid4()
+        # Voeg opties toe aan metadata zodat validator context flags kan lezen
+        meta: dict[str, Any] = {"generation_id": generation_id}
+        try:
+            if sanitized_request.options:
+                # Expliciet doorgeven van force_duplicate voor duplicate-escalatie
+                if bool(
+                    safe_dict_get(sanitized_request.options, "force_duplicate", False)
+                ):
+                    meta["force_duplicate"] = True
+                # Bewaar volledige options voor toekomstig gebruik (niet verplicht)
+                meta["options"] = dict(sanitized_request.options)
+        except (TypeError, AttributeError) as e:
+            # DEF-229: Log options extraction failures
+            logger.debug(f"Could not extract generation options for metadata: {e}")
+        validation_context = ValidationContext(
+            correlation_id=corr,
+            metadata=meta,
+        )
+        # Validate using Definition object per interface contract
+        temp_definition = Definition(
+            begrip=sanitized_request.begrip,
+            definitie=cleaned_text,
+            organisatorische_context=sanitized_request.organisatorische_context or [],
+            juridische_context=sanitized_request.juridische_context or [],
+            wettelijke_basis=sanitized_request.wettelijke_basis or [],
+            ontologische_categorie=sanitized_request.ontologische_categorie,
+            created_by=sanitized_request.actor,
+        )
+        raw_validation = await self.validation_service.validate_definition(
+            definition=temp_definition,
+            context=validation_context,
+        )
+        # Normalize to schema-conform dict for internal decisions
+        try:
+            from services.validation.mappers import ensure_schema_compliance
+
+            validation_result = ensure_schema_compliance(raw_validation)
+        except (ImportError, TypeError, ValueError, AttributeError) as e:
+            # DEF-229: Log schema compliance failures with context
+            logger.warning(
+                f"Generation {generation_id}: Validation schema mapping failed, using fallback: {e}",
+                extra={
+                    "error_type": type(e).__name__,
+                    "generation_id": generation_id,
+                },
+                exc_info=True,
+            )
+            # Defensive fallback to simple mapping
+            validation_result = self._fallback_validation_result(raw_validation)
+
+        logger.info(
+            f"Generation {generation_id}: Validation complete (valid: {safe_dict_get(validation_result, 'is_acceptable', False)})"
+        )
+        return raw_validation, validation_result
+
+    async def _stage_enhancement(
+        self,
+        sanitized_request: GenerationRequest,
+        cleaned_text: str,
+        validation_result: ValidationResult,
+    ) -> str | None:
+        """PHASE 7: Enhancement (if validation failed and enabled).
+
+        Returns the enhanced text, or None when no enhancement was applied.
+        """
+        if (
+            not safe_dict_get(validation_result, "is_acceptable", False)
+            and self.config.enable_enhancement
+            and self.enhancement_service
+        ):
+            return await self.enhancement_service.enhance_definition(
+                cleaned_text,
+                ensure_list(safe_dict_get(validation_result, "violations", [])),
+                context=sanitized_request,
+            )
+        return None
+
+    async def _stage_revalidation(
+        self,
+        sanitized_request: GenerationRequest,
+        cleaned_text: str,
+        validation: tuple[Any, ValidationResult],
+        enhanced_text: str | None,
+        generation_id: str,
+    ) -> tuple[Any, ValidationResult, str, bool]:
+        """PHASE 7b: Re-validate enhanced text (pass-through without enhancement).
+
+        Returns:
+            (raw_validation, validation_result, final_text, was_enhanced)
+        """
+        raw_validation, validation_result = validation
+        if enhanced_text is None:
+            return raw_validation, validation_result, cleaned_text, False
+
+        from services.validation.interfaces import ValidationContext
+
+        # Re-validate enhanced text with new context
+        try:
+            corr2 = uuid.UUID(generation_id)
+        except ValueError:
+            # DEF-229: UUID.parse only raises ValueError for invalid strings
+            corr2 = uuid.uuid4()
+        enhanced_context = ValidationContext(
+            correlation_id=corr2,
+            metadata={"generation_id": generation_id, "enhanced": True},
+        )
+        # Re-validate enhanced text using Definition object
+        enhanced_definition = Definition(
+            begrip=sanitized_request.begrip,
+            definitie=enhanced_text,
+            organisatorische_context=sanitized_request.organisatorische_context or [],
+            juridische_context=sanitized_request.juridische_context or [],
+            wettelijke_basis=sanitized_request.wettelijke_basis or [],
+            ontologische_categorie=sanitized_request.ontologische_categorie,
+            created_by=sanitized_request.actor,
+        )
+        raw_validation = await self.validation_service.validate_definition(
+            definition=enhanced_definition,
+            context=enhanced_context,
+        )
+        try:
+            from services.validation.mappers import ensure_schema_compliance
+
+            validation_result = ensure_schema_compliance(raw_validation)
+        except (ImportError, TypeError, ValueError, AttributeError) as e:
+            # DEF-229: Log enhancement validation mapping failures
+            logger.warning(
+                f"Generation {generation_id}: Enhanced validation schema mapping failed: {e}",
+                extra={
+                    "error_type": type(e).__name__,
+                    "generation_id": generation_id,
+                },
+                exc_info=True,
+            )
+            validation_result = self._fallback_validation_result(raw_validation)
+
+        logger.info(f"Generation {generation_id}: Enhancement applied, re-validated")
+        return raw_validation, validation_result, enhanced_text, True
+
+    @staticmethod
+    def _fallback_validation_result(raw_validation: Any) -> dict[str, Any]:
+        """Minimal schema-like result when schema mapping fails."""
+        is_ok = getattr(raw_validation, "is_valid", False)
+        vio_list = getattr(raw_validation, "violations", None)
+        if vio_list is None:
+            vio_list = getattr(raw_validation, "errors", []) or []
+        return {
+            "is_acceptable": bool(is_ok),
+            "violations": vio_list,
+            "passed_rules": [],
+            "detailed_scores": {},
+            "version": "v2",
+            "system": {},
+        }
+
     # =====================================
     # LEGACY INTERFACE COMPATIBILITY
     # =====================================
@@ -0,0 +1,197 @@
+"""
+Stage graph runner for DefinitionOrchestratorV2.
+
+The orchestration pipeline is expressed as named stages with explicit
+dependencies. Every stage starts as soon as all of its dependencies are done,
+so independent stages (feedback, synonyms, document context, voorbeelden)
+overlap and end-to-end latency approaches the critical path.
+
+Each stage may carry a deadline. Optional stages provide an ``on_timeout``
+fallback whose value is used when the deadline passes; stages without a
+fallback raise ``TimeoutError`` like ``asyncio.wait_for`` would. Start offset,
+duration and status are recorded per stage for the response metadata.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+StageRunner = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of the pipeline.
+
+    ``run`` receives the results of the stages listed in ``after`` (by name).
+    """
+
+    name: str
+    run: StageRunner
+    after: tuple[str, ...] = ()
+    deadline: float | None = None
+    on_timeout: Callable[[], Any] | None = None
+
+
+@dataclass
+class StageTiming:
+    """Timing of a single stage, relative to the start of the graph run."""
+
+    start: float = 0.0
+    duration: float = 0.0
+    status: str = "pending"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": round(self.start, 4),
+            "duration": round(self.duration, 4),
+            "status": self.status,
+        }
+
+
+class StageGraph:
+    """Dependency graph of stages, executed concurrently where possible."""
+
+    def __init__(self, stages: Iterable[Stage], *, concurrent: bool = True):
+        self._stages = self._topological_order(list(stages))
+        self._concurrent = concurrent
+        self.timings: dict[str, StageTiming] = {
+            stage.name: StageTiming() for stage in self._stages
+        }
+        self._t0 = 0.0
+
+    @staticmethod
+    def _topological_order(stages: list[Stage]) -> list[Stage]:
+        by_name: dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in by_name:
+                msg = f"Duplicate stage name: {stage.name}"
+                raise ValueError(msg)
+            by_name[stage.name] = stage
+        for stage in stages:
+            missing = [dep for dep in stage.after if dep not in by_name]
+            if missing:
+                msg = f"Stage {stage.name} depends on unknown stage(s): {missing}"
+                raise ValueError(msg)
+
+        ordered: list[Stage] = []
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(stage: Stage) -> None:
+            mark = state.get(stage.name)
+            if mark == 2:
+                return
+            if mark == 1:
+                msg = f"Cycle in stage graph at: {stage.name}"
+                raise ValueError(msg)
+            state[stage.name] = 1
+            for dep in stage.after:
+                visit(by_name[dep])
+            state[stage.name] = 2
+            ordered.append(stage)
+
+        for stage in stages:
+            visit(stage)
+        return ordered
+
+    async def run(self) -> dict[str, Any]:
+        """Run all stages; return their results by name.
+
+        The first failing stage cancels the remaining stages and its exception
+        is re-raised.
+        """
+        self._t0 = time.perf_counter()
+        if not self._concurrent:
+            results: dict[str, Any] = {}
+            for stage in self._stages:
+                deps = {dep: results[dep] for dep in stage.after}
+                results[stage.name] = await self._run_stage(stage, deps)
+            return results
+
+        tasks: dict[str, asyncio.Task[Any]] = {}
+        for stage in self._stages:
+            tasks[stage.name] = asyncio.create_task(
+                self._await_deps_and_run(stage, tasks), name=f"stage:{stage.name}"
+            )
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _await_deps_and_run(
+        self, stage: Stage, tasks: dict[str, asyncio.Task[Any]]
+    ) -> Any:
+        deps = {dep: await tasks[dep] for dep in stage.after}
+        return await self._run_stage(stage, deps)
+
+    async def _run_stage(self, stage: Stage, deps: dict[str, Any]) -> Any:
+        timing = self.timings[stage.name]
+        started = time.perf_counter()
+        timing.start = started - self._t0
+        timing.status = "running"
+        try:
+            if stage.deadline is None:
+                result = await stage.run(deps)
+            else:
+                result = await asyncio.wait_for(stage.run(deps), stage.deadline)
+        except TimeoutError:
+            timing.status = "timeout"
+            if stage.on_timeout is None:
+                raise
+            logger.warning(
+                f"Stage {stage.name} exceeded deadline of {stage.deadline}s, "
+                "using fallback"
+            )
+            return stage.on_timeout()
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            raise
+        except Exception:
+            timing.status = "error"
+            raise
+        else:
+            timing.status = "ok"
+            return result
+        finally:
+            timing.duration = time.perf_counter() - started
+
+    def critical_path(self) -> list[str]:
+        """Stages on the longest dependency chain of the last run."""
+        by_name = {stage.name: stage for stage in self._stages}
+
+        def finish(name: str) -> float:
+            timing = self.timings[name]
+            return timing.start + timing.duration
+
+        ran = [name for name, t in self.timings.items() if t.status != "pending"]
+        if not ran:
+            return []
+        path = [max(ran, key=finish)]
+        while True:
+            deps = [d for d in by_name[path[-1]].after if d in ran]
+            if not deps:
+                break
+            path.append(max(deps, key=finish))
+        return list(reversed(path))
+
+    def timing_metadata(self) -> dict[str, Any]:
+        """Per-stage timings plus critical path, for response metadata."""
+        return {
+            "stage_timings": {
+                name: timing.to_dict()
+                for name, timing in self.timings.items()
+                if timing.status != "pending"
+            },
+            "critical_path": self.critical_path(),
+        }
@@ -2,11 +2,13 @@
 
 Deze orchestrator levert een dunne, async-first laag bovenop de
 `ValidationServiceInterface`, met optionele pre-cleaning. Batchverwerking
-gebeurt sequentieel; parallelisme volgt in een latere iteratie.
+gebeurt sequentieel, of optioneel in een procespool van de onderliggende
+service (``workers``).
 """
 
 from __future__ import annotations
 
+import inspect
 import logging
 import uuid
 from collections.abc import Iterable
@@ -57,6 +59,8 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
         text: str,
         ontologische_categorie: str | None = None,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         """Valideer losse tekst met optionele pre-cleaning.
 
@@ -65,6 +69,7 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
             text: Te valideren tekst (mag leeg zijn)
             ontologische_categorie: Optionele categorie voor contextuele regels
             context: Optionele validatiecontext
+            gate_only: Alleen acceptatie bepalen (indien de service dat kent)
 
         Returns:
             ValidationResult: Schema-conform resultaat
@@ -81,23 +86,10 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
 
         with operation_progress("validating_definition"):
             try:
-                cleaned_text = text
-                if self.cleaning_service is not None:
-                    cleaning = await self.cleaning_service.clean_text(text, begrip)
-                    cleaned_text = cleaning.cleaned_text if cleaning else text
+                cleaned_text = await self._clean_text(text, begrip)
 
                 # Build context dict with all relevant fields
-                context_dict = None
-                if context:
-                    context_dict = {}
-                    if context.profile:
-                        context_dict["profile"] = context.profile
-                    if context.correlation_id:
-                        context_dict["correlation_id"] = str(context.correlation_id)
-                    if context.locale:
-                        context_dict["locale"] = context.locale
-                    if context.feature_flags:
-                        context_dict["feature_flags"] = dict(context.feature_flags)
+                context_dict = self._context_to_dict(context)
 
                 # No enrichment with 'definition' here: not available in validate_text
                 # Context info should be supplied via ValidationContext only.
@@ -108,6 +100,7 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
                     text=cleaned_text,
                     ontologische_categorie=ontologische_categorie,
                     context=context_dict,
+                    **self._gate_kwargs(gate_only),
                 )
 
                 # Ensure result is schema-compliant
@@ -125,12 +118,15 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
         self,
         definition: Definition,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         """Valideer een volledig Definition-object met optionele pre-cleaning.
 
         Args:
             definition: Te valideren Definition object
             context: Optionele validatiecontext
+            gate_only: Alleen acceptatie bepalen (indien de service dat kent)
 
         Returns:
             ValidationResult: Schema-conform resultaat met detailed_scores
@@ -153,17 +149,7 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
                     text = cleaned.cleaned_text if cleaned else definition.definitie
 
                 # Build context dict with all relevant fields
-                context_dict = None
-                if context:
-                    context_dict = {}
-                    if context.profile:
-                        context_dict["profile"] = context.profile
-                    if context.correlation_id:
-                        context_dict["correlation_id"] = str(context.correlation_id)
-                    if context.locale:
-                        context_dict["locale"] = context.locale
-                    if context.feature_flags:
-                        context_dict["feature_flags"] = dict(context.feature_flags)
+                context_dict = self._context_to_dict(context)
 
                 # Call underlying service (geen automatische enrich met 'definition')
                 result = await self.validation_service.validate_definition(
@@ -171,6 +157,7 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
                     text=text,
                     ontologische_categorie=definition.ontologische_categorie,
                     context=context_dict,
+                    **self._gate_kwargs(gate_only),
                 )
 
                 # Ensure result is schema-compliant
@@ -187,22 +174,41 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
                 )
 
     async def batch_validate(
-        self, items: Iterable[ValidationRequest], max_concurrency: int = 1
+        self,
+        items: Iterable[ValidationRequest],
+        max_concurrency: int = 1,
+        *,
+        workers: int | None = None,
+        chunk_size: int | None = None,
     ) -> list[ValidationResult]:
-        """Valideer meerdere items sequentieel.
+        """Valideer meerdere items sequentieel of in een procespool.
 
         Args:
             items: Itereerbare van ValidationRequest objects
             max_concurrency: Maximum parallelle validaties (genegeerd in v2.2)
+            workers: Indien gezet en ondersteund door de validation service:
+                valideer in een procespool met zoveel workers (0 = alle cores)
+            chunk_size: Items per procespool-taak
 
         Returns:
             List[ValidationResult]: Resultaten in zelfde volgorde als input
 
         Note:
             - max_concurrency wordt genegeerd in deze versie (Story 2.2)
-            - Parallelisme wordt toegevoegd in Story 2.3
-            - Individuele failures resulteren in degraded results, niet batch failure
+            - Individuele failures resulteren in degraded results, niet batch failure;
+              faalt de procespool als geheel, dan volgt sequentiële verwerking
         """
+        items = list(items)
+        if workers is not None and items and self._supports_process_pool():
+            try:
+                return await self._batch_validate_in_processes(
+                    items, workers=workers, chunk_size=chunk_size
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Procespool batchvalidatie gefaald, sequentieel verder: {type(e).__name__}: {e}"
+                )
+
         results: list[ValidationResult] = []
         for item in items:
             results.append(
@@ -216,6 +222,90 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
         return results
 
     # Internal helpers
+    def _gate_kwargs(self, gate_only: bool) -> dict[str, bool]:
+        """``gate_only`` alleen doorgeven als de service die modus kent.
+
+        Services zonder gate-modus valideren volledig; het resultaat bevat dan
+        evengoed ``is_acceptable``.
+        """
+        if not gate_only:
+            return {}
+        try:
+            parameters = inspect.signature(
+                self.validation_service.validate_definition
+            ).parameters
+        except (TypeError, ValueError):
+            return {}
+        return {"gate_only": True} if "gate_only" in parameters else {}
+
+    def _supports_process_pool(self) -> bool:
+        """True als de validation service batch_validate(workers=...) kent."""
+        batch = getattr(self.validation_service, "batch_validate", None)
+        if batch is None:
+            return False
+        try:
+            return "workers" in inspect.signature(batch).parameters
+        except (TypeError, ValueError):
+            return False
+
+    async def _batch_validate_in_processes(
+        self,
+        items: list[ValidationRequest],
+        *,
+        workers: int,
+        chunk_size: int | None,
+    ) -> list[ValidationResult]:
+        """Clean hier (async), valideer in de procespool van de service."""
+        from utils.progress_callback import operation_progress
+
+        with operation_progress("validating_definition"):
+            correlation_ids: list[str] = []
+            prepared: list[dict] = []
+            for item in items:
+                context = item.context
+                correlation_ids.append(
+                    str(context.correlation_id)
+                    if context and context.correlation_id
+                    else str(uuid.uuid4())
+                )
+                prepared.append(
+                    {
+                        "begrip": item.begrip,
+                        "text": await self._clean_text(item.text, item.begrip),
+                        "ontologische_categorie": item.ontologische_categorie,
+                        "context": self._context_to_dict(context),
+                    }
+                )
+            raw_results = await self.validation_service.batch_validate(
+                prepared, workers=workers, chunk_size=chunk_size
+            )
+        return [
+            ensure_schema_compliance(result, correlation_id)
+            for result, correlation_id in zip(raw_results, correlation_ids, strict=True)
+        ]
+
+    async def _clean_text(self, text: str, begrip: str) -> str:
+        if self.cleaning_service is None:
+            return text
+        cleaning = await self.cleaning_service.clean_text(text, begrip)
+        return cleaning.cleaned_text if cleaning else text
+
+    @staticmethod
+    def _context_to_dict(context: ValidationContext | None) -> dict | None:
+        """Zet een ValidationContext om naar de context dict van de service."""
+        if not context:
+            return None
+        context_dict: dict = {}
+        if context.profile:
+            context_dict["profile"] = context.profile
+        if context.correlation_id:
+            context_dict["correlation_id"] = str(context.correlation_id)
+        if context.locale:
+            context_dict["locale"] = context.locale
+        if context.feature_flags:
+            context_dict["feature_flags"] = dict(context.feature_flags)
+        return context_dict
+
     def _enrich_context_with_definition_fields(
         self, ctx: dict | None, definition: Definition
     ) -> dict:
@@ -238,6 +328,9 @@ class ValidationOrchestratorV2(ValidationOrchestratorInterface):
                 enriched["wettelijke_basis"] = list(definition.wettelijke_basis)
             if definition.categorie:
                 enriched["categorie"] = definition.categorie
+            if definition.id is not None:
+                # Opgeslagen definitie: niet als duplicaat van zichzelf (CON-01)
+                enriched["definition_id"] = definition.id
         except (TypeError, AttributeError) as e:
             # DEF-248: Log context enrichment failures - may indicate malformed definition
             logger.warning(
@@ -193,6 +193,36 @@ class BasePromptModule(ABC):
             Lijst van module IDs
         """
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """
+        Declareer de inputs waar de output van deze module volledig van afhangt.
+
+        Modules waarvan de output alleen afhangt van configuratie, regelset
+        en een paar context-waarden (niet van het begrip zelf) overriden dit.
+        De PromptOrchestrator memoiseert de output dan per unieke set inputs.
+
+        Args:
+            context: Module context
+
+        Returns:
+            JSON-serialiseerbare dict met cache-key inputs, of None als de
+            module niet cachebaar is (default)
+        """
+        return None
+
+    def restore_from_cache(self, context: ModuleContext, output: ModuleOutput) -> None:
+        """
+        Herhaal side-effects op shared state wanneer output uit de cache komt.
+
+        Default: geen. Modules die in execute() set_shared() aanroepen en
+        cachebaar zijn, moeten die state hier opnieuw zetten.
+
+        Args:
+            context: Module context
+            output: De gecachte output
+        """
+        return
+
     def get_info(self) -> dict[str, Any]:
         """
         Retourneer module informatie voor debugging/monitoring.
@@ -9,6 +9,7 @@ Deze module is verantwoordelijk voor:
 """
 
 import logging
+import re
 from datetime import UTC, datetime
 from typing import Any
 
@@ -16,6 +17,31 @@ from .base_module import BasePromptModule, ModuleContext, ModuleOutput
 
 logger = logging.getLogger(__name__)
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_TIMESTAMP_LINE = re.compile(r"^(- Timestamp: ).*$", re.MULTILINE)
+# Waarde van de Timestamp regel in gecachte prompts (zie with_timestamp)
+TIMESTAMP_PLACEHOLDER = "{timestamp}"
+
+
+def with_timestamp(prompt: str, timestamp: str | None = None) -> str:
+    """
+    Vervang de waarde van de Timestamp regel in de METADATA sectie.
+
+    Een gecachte prompt wordt bewaard met ``TIMESTAMP_PLACEHOLDER`` en bij
+    elk gebruik opnieuw gestempeld, zodat het tijdstip klopt met het moment
+    van de aanvraag. Prompts zonder metadata sectie blijven ongewijzigd.
+
+    Args:
+        prompt: Volledige prompt tekst
+        timestamp: Nieuwe waarde (default: huidig tijdstip in UTC)
+
+    Returns:
+        Prompt met de nieuwe timestamp
+    """
+    if timestamp is None:
+        timestamp = datetime.now(UTC).strftime(_TIMESTAMP_FORMAT)
+    return _TIMESTAMP_LINE.sub(lambda m: m.group(1) + timestamp, prompt, count=1)
+
 
 class DefinitionTaskModule(BasePromptModule):
     """
@@ -224,7 +250,7 @@ Stel jezelf deze vragen:
         Returns:
             Metadata sectie
         """
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now(UTC).strftime(_TIMESTAMP_FORMAT)
 
         return f"""#### 📊 METADATA voor traceerbaarheid:
 - Begrip: {begrip}
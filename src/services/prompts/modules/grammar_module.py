@@ -127,6 +127,13 @@ class GrammarModule(BasePromptModule):
         """
         return []  # Soft dependency op expertise module via shared state
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """Output hangt af van configuratie en de woordsoort van ExpertiseModule."""
+        return {
+            "config": self._config,
+            "word_type": context.get_shared("word_type", "overig"),
+        }
+
     def _build_basic_grammar_rules(self) -> list[str]:
         """Bouw basis grammaticaregels."""
         rules = []
@@ -123,6 +123,10 @@ class IntegrityRulesModule(BasePromptModule):
         """
         return []
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """Output hangt alleen af van de module configuratie."""
+        return {"config": self._config}
+
     def _build_int01_rule(self) -> list[str]:
         """Bouw INT-01 regel."""
         rules = []
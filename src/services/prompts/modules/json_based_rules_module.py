@@ -180,6 +180,21 @@ class JSONBasedRulesModule(BasePromptModule):
         """
         return []
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """Output hangt af van configuratie, prefix en de geladen regelset."""
+        from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+        # Eén fingerprint per prompt build, gedeeld door alle regel-modules
+        ruleset_version = context.get_or_set_shared(
+            "ruleset_version",
+            get_cached_toetsregel_manager().get_ruleset_version,
+        )
+        return {
+            "config": self._config,
+            "rule_prefix": self.rule_prefix,
+            "ruleset_version": ruleset_version,
+        }
+
     def _format_rule(self, regel_key: str, regel_data: dict) -> list[str]:
         """
         Formateer een regel uit JSON data naar markdown lines.
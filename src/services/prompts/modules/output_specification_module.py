@@ -136,6 +136,26 @@ class OutputSpecificationModule(BasePromptModule):
         """
         return []
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """Output hangt af van configuratie en de gevraagde karakterlimieten."""
+        metadata = context.enriched_context.metadata
+        return {
+            "config": self._config,
+            "min_chars": metadata.get("min_karakters", self.default_min_chars),
+            "max_chars": metadata.get("max_karakters", self.default_max_chars),
+        }
+
+    def restore_from_cache(self, context: ModuleContext, output: ModuleOutput) -> None:
+        """Zet de karakterlimiet waarschuwing opnieuw voor andere modules."""
+        if output.metadata.get("has_limit_warning"):
+            context.set_shared(
+                "character_limit_warning",
+                {
+                    "min": output.metadata["min_chars"],
+                    "max": output.metadata["max_chars"],
+                },
+            )
+
     def _build_basic_format_requirements(self) -> str:
         """Bouw basis format vereisten."""
         return """### 📏 OUTPUT FORMAT VEREISTEN:
@@ -8,9 +8,12 @@ Deze orchestrator is verantwoordelijk voor:
 4. Output combinatie en validatie
 """
 
+import hashlib
+import json
 import logging
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
@@ -38,14 +41,35 @@ class PromptOrchestrator:
     en output combinatie voor het genereren van de complete prompt.
     """
 
-    def __init__(self, max_workers: int = 4, module_order: list[str] | None = None):
+    EXECUTION_MODES = ("auto", "inline", "pooled")
+    # Gewicht van de laatste meting in het lopende gemiddelde per module
+    COST_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        module_order: list[str] | None = None,
+        module_cache_size: int = 256,
+        execution_mode: str = "auto",
+        inline_threshold_ms: float = 5.0,
+    ):
         """
         Initialize de orchestrator.
 
         Args:
             max_workers: Maximum aantal parallel workers voor module execution
             module_order: Optionele lijst met module IDs voor output volgorde
+            module_cache_size: Maximum aantal gememoiseerde module outputs
+                (0 = uit); alleen modules met cache_key_inputs() worden gecached
+            execution_mode: "auto", "inline" of "pooled" voor batches met
+                meerdere modules. "auto" voert een batch inline uit als de
+                gemeten kosten van alle modules samen onder
+                inline_threshold_ms blijven, anders in de thread pool
+            inline_threshold_ms: Grens voor inline uitvoering in "auto" modus
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            msg = f"Onbekende execution_mode '{execution_mode}'"
+            raise ValueError(msg)
         self.modules: dict[str, BasePromptModule] = {}
         self.module_order: list[str] = module_order or []
         self.dependency_graph: dict[str, set[str]] = defaultdict(set)
@@ -53,6 +77,20 @@ class PromptOrchestrator:
         self._execution_metadata: dict[str, Any] = {}
         self._custom_module_order = module_order or self._get_default_module_order()
 
+        # Memo van module outputs per (module_id, hash van cache-key inputs), LRU
+        self.module_cache_size = module_cache_size
+        self._module_cache: OrderedDict[tuple[str, str], ModuleOutput] = OrderedDict()
+        self._module_cache_lock = threading.Lock()
+        self._module_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        # Persistente thread pool (lazy) en gemeten kosten per module (ms)
+        self.execution_mode = execution_mode
+        self.inline_threshold_ms = inline_threshold_ms
+        self._module_costs: dict[str, float] = {}
+        self._costs_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
         # Log after modules are registered instead
         logger.debug(f"PromptOrchestrator created with {max_workers} workers")
 
@@ -176,6 +214,7 @@ class PromptOrchestrator:
 
         # Execute modules batch voor batch (DEF-123: alleen actieve modules)
         all_outputs: dict[str, ModuleOutput] = {}
+        batch_modes: list[str] = []
 
         for batch_idx, batch in enumerate(execution_batches):
             # DEF-123: Filter batch to only include active modules
@@ -187,17 +226,21 @@ class PromptOrchestrator:
 
             logger.debug(f"Executing batch {batch_idx + 1}: {active_batch}")
 
-            if len(active_batch) == 1:
-                # Single module - execute sequentially
-                module_id = active_batch[0]
-                output = self._execute_module(module_id, module_context)
-                all_outputs[module_id] = output
+            if self._run_inline(active_batch):
+                # Goedkope modules: thread overhead kost meer dan het oplevert
+                batch_modes.append("inline")
+                batch_outputs = {
+                    module_id: self._execute_module(module_id, module_context)
+                    for module_id in active_batch
+                }
             else:
                 # Multiple modules - execute parallel
+                batch_modes.append("pooled")
                 batch_outputs = self._execute_batch_parallel(
                     active_batch, module_context
                 )
-                all_outputs.update(batch_outputs)
+            all_outputs.update(batch_outputs)
+            self._record_module_costs(batch_outputs)
 
         # Combineer alle outputs in de juiste volgorde
         combined_prompt = self._combine_outputs(all_outputs)
@@ -211,8 +254,19 @@ class PromptOrchestrator:
             "active_modules": len(active_modules),
             "skipped_modules": sorted(skipped_modules),
             "execution_batches": len(execution_batches),
+            "batch_modes": batch_modes,
+            "module_costs_ms": {
+                module_id: cost
+                for module_id, cost in self.get_module_costs().items()
+                if module_id in all_outputs
+            },
             "execution_time_ms": round(execution_time * 1000, 2),
             "prompt_length": len(combined_prompt),
+            "cached_modules": sorted(
+                module_id
+                for module_id, output in all_outputs.items()
+                if output.metadata.get("cache_hit")
+            ),
             "module_metadata": {
                 module_id: output.metadata for module_id, output in all_outputs.items()
             },
@@ -244,21 +298,46 @@ class PromptOrchestrator:
 
         try:
             # Valideer input
+            start_time = time.time()
             is_valid, error_msg = module.validate_input(context)
             if not is_valid:
                 logger.warning(f"Module '{module_id}' validation failed: {error_msg}")
                 return ModuleOutput(
                     content="",
-                    metadata={"skipped_reason": error_msg},
+                    metadata={
+                        "skipped_reason": error_msg,
+                        "execution_time_ms": round(
+                            (time.time() - start_time) * 1000, 2
+                        ),
+                    },
                     success=False,
                     error_message=error_msg,
                 )
 
+            # Memo hit: output hangt alleen af van de gedeclareerde inputs
+            cache_key = self._module_cache_key(module, context)
+            cached = self._get_cached_output(cache_key)
+            if cached is not None:
+                module.restore_from_cache(context, cached)
+                cached.metadata["execution_time_ms"] = round(
+                    (time.time() - start_time) * 1000, 2
+                )
+                logger.debug(f"Module '{module_id}' uit cache")
+                return cached
+
             # Execute module
-            start_time = time.time()
             output = module.execute(context)
             execution_time = time.time() - start_time
 
+            # Alleen cachen als de inputs tijdens executie niet veranderd zijn
+            # (bv. shared state die een parallelle module net heeft gezet)
+            if (
+                cache_key is not None
+                and output.success
+                and self._module_cache_key(module, context) == cache_key
+            ):
+                self._store_cached_output(cache_key, output)
+
             # Voeg execution time toe aan metadata
             output.metadata["execution_time_ms"] = round(execution_time * 1000, 2)
 
@@ -281,6 +360,96 @@ class PromptOrchestrator:
                 error_message=f"Module execution failed: {e!s}",
             )
 
+    def _module_cache_key(
+        self, module: BasePromptModule, context: ModuleContext
+    ) -> tuple[str, str] | None:
+        """
+        Bepaal de memo key van een module, of None als deze niet cachebaar is.
+
+        Args:
+            module: De module
+            context: Module context
+
+        Returns:
+            Tuple (module_id, hash van de gedeclareerde inputs) of None
+        """
+        if self.module_cache_size <= 0:
+            return None
+        try:
+            inputs = module.cache_key_inputs(context)
+            if inputs is None:
+                return None
+            payload = json.dumps(
+                {"module": type(module).__qualname__, "inputs": inputs},
+                sort_keys=True,
+                default=str,
+            )
+        except Exception as e:
+            logger.debug(f"Geen cache key voor module '{module.module_id}': {e}")
+            return None
+        digest = hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False)
+        return module.module_id, digest.hexdigest()
+
+    def _get_cached_output(
+        self, cache_key: tuple[str, str] | None
+    ) -> ModuleOutput | None:
+        """Haal een kopie van een gememoiseerde output op (LRU bijwerken)."""
+        if cache_key is None:
+            return None
+        with self._module_cache_lock:
+            output = self._module_cache.get(cache_key)
+            if output is None:
+                self._module_cache_stats["misses"] += 1
+                return None
+            self._module_cache.move_to_end(cache_key)
+            self._module_cache_stats["hits"] += 1
+        return ModuleOutput(
+            content=output.content,
+            metadata={**output.metadata, "cache_hit": True},
+            success=output.success,
+            error_message=output.error_message,
+        )
+
+    def _store_cached_output(
+        self, cache_key: tuple[str, str], output: ModuleOutput
+    ) -> None:
+        """Memoiseer een kopie van de output; oudste entries vallen eruit."""
+        entry = ModuleOutput(
+            content=output.content,
+            metadata=dict(output.metadata),
+            success=output.success,
+            error_message=output.error_message,
+        )
+        with self._module_cache_lock:
+            self._module_cache[cache_key] = entry
+            self._module_cache.move_to_end(cache_key)
+            while len(self._module_cache) > self.module_cache_size:
+                self._module_cache.popitem(last=False)
+                self._module_cache_stats["evictions"] += 1
+
+    def clear_module_cache(self) -> None:
+        """Leeg de memo van module outputs (bv. na wijziging van regels)."""
+        with self._module_cache_lock:
+            self._module_cache.clear()
+
+    def get_module_cache_stats(self) -> dict[str, Any]:
+        """
+        Verkrijg statistieken van de module output memo.
+
+        Returns:
+            Dictionary met size, max_size, hits, misses, evictions en hit_rate
+        """
+        with self._module_cache_lock:
+            stats = dict(self._module_cache_stats)
+            size = len(self._module_cache)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "size": size,
+            "max_size": self.module_cache_size,
+            **stats,
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
     def _execute_batch_parallel(
         self, batch: list[str], context: ModuleContext
     ) -> dict[str, ModuleOutput]:
@@ -296,30 +465,93 @@ class PromptOrchestrator:
         """
         outputs = {}
 
-        with ThreadPoolExecutor(
-            max_workers=min(len(batch), self.max_workers)
-        ) as executor:
-            future_to_module = {
-                executor.submit(self._execute_module, module_id, context): module_id
-                for module_id in batch
-            }
+        executor = self._get_executor()
+        future_to_module = {
+            executor.submit(self._execute_module, module_id, context): module_id
+            for module_id in batch
+        }
 
-            for future in as_completed(future_to_module):
-                module_id = future_to_module[future]
-                try:
-                    output = future.result()
-                    outputs[module_id] = output
-                except Exception as e:
-                    logger.error(f"Parallel execution error voor '{module_id}': {e}")
-                    outputs[module_id] = ModuleOutput(
-                        content="",
-                        metadata={"parallel_error": str(e)},
-                        success=False,
-                        error_message=f"Parallel execution failed: {e!s}",
-                    )
+        for future in as_completed(future_to_module):
+            module_id = future_to_module[future]
+            try:
+                output = future.result()
+                outputs[module_id] = output
+            except Exception as e:
+                logger.error(f"Parallel execution error voor '{module_id}': {e}")
+                outputs[module_id] = ModuleOutput(
+                    content="",
+                    metadata={"parallel_error": str(e)},
+                    success=False,
+                    error_message=f"Parallel execution failed: {e!s}",
+                )
 
         return outputs
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Persistente thread pool, aangemaakt bij de eerste pooled batch."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="prompt-module",
+                    )
+        return self._executor
+
+    def _run_inline(self, batch: list[str]) -> bool:
+        """
+        Bepaal of een batch inline (in de aanroepende thread) kan draaien.
+
+        Args:
+            batch: Module IDs van de batch
+
+        Returns:
+            True voor inline uitvoering, False voor de thread pool
+        """
+        if len(batch) == 1 or self.execution_mode == "inline":
+            return True
+        if self.execution_mode == "pooled":
+            return False
+        # Auto: zonder meting voor elke module eerst via de pool (veilige default)
+        if any(module_id not in self._module_costs for module_id in batch):
+            return False
+        estimated = sum(self._module_costs[module_id] for module_id in batch)
+        return estimated < self.inline_threshold_ms
+
+    def _record_module_costs(self, outputs: dict[str, ModuleOutput]) -> None:
+        """Werk het lopende gemiddelde van de execution time per module bij."""
+        with self._costs_lock:
+            for module_id, output in outputs.items():
+                measured = output.metadata.get("execution_time_ms")
+                if measured is None:
+                    continue
+                previous = self._module_costs.get(module_id)
+                self._module_costs[module_id] = (
+                    measured
+                    if previous is None
+                    else previous + self.COST_SMOOTHING * (measured - previous)
+                )
+
+    def get_module_costs(self) -> dict[str, float]:
+        """
+        Verkrijg de gemeten (gemiddelde) execution time per module.
+
+        Returns:
+            Dictionary van module_id -> execution time in ms
+        """
+        with self._costs_lock:
+            return {
+                module_id: round(cost, 3)
+                for module_id, cost in self._module_costs.items()
+            }
+
+    def shutdown(self) -> None:
+        """Stop de thread pool; een volgende pooled batch maakt een nieuwe aan."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def _combine_outputs(self, outputs: dict[str, ModuleOutput]) -> str:
         """
         Combineer module outputs in de juiste volgorde.
@@ -129,6 +129,10 @@ class StructureRulesModule(BasePromptModule):
         """
         return []
 
+    def cache_key_inputs(self, context: ModuleContext) -> dict[str, Any] | None:
+        """Output hangt alleen af van de module configuratie."""
+        return {"config": self._config}
+
     def _build_str01_rule(self) -> list[str]:
         """Bouw STR-01 regel."""
         rules = []
@@ -6,10 +6,15 @@ Fixes ontological category template selection bug.
 REFACTORED: Now uses centralized ContextManager (US-043).
 """
 
+import copy
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
 from typing import Any
 
 from services.definition_generator_config import ContextConfig, UnifiedGeneratorConfig
@@ -19,6 +24,10 @@ from services.definition_generator_context import (
 )
 from services.definition_generator_prompts import UnifiedPromptBuilder
 from services.interfaces import GenerationRequest
+from services.prompts.modules.definition_task_module import (
+    TIMESTAMP_PLACEHOLDER,
+    with_timestamp,
+)
 from services.web_lookup.config_loader import load_web_lookup_config
 from services.web_lookup.sanitization import sanitize_snippet
 from utils.type_helpers import ensure_string
@@ -30,6 +39,23 @@ CONTEXT_V2_ENABLED = os.getenv("CONTEXT_V2_ENABLED", "false").lower() == "true"
 # US-043: Use centralized context manager
 USE_CONTEXT_MANAGER = os.getenv("USE_CONTEXT_MANAGER", "true").lower() == "true"
 
+# Context velden die per aanroep verschillen maar de prompt niet bepalen
+# (web lookup debug info en timings, ophaaltijdstip van bronnen)
+_VOLATILE_CONTEXT_KEYS = frozenset({"debug", "duration_ms", "retrieved_at"})
+
+
+def _stable_context(value: Any) -> Any:
+    """Kopie van ``value`` zonder vluchtige velden, voor de prompt cache key."""
+    if isinstance(value, dict):
+        return {
+            k: _stable_context(v)
+            for k, v in value.items()
+            if k not in _VOLATILE_CONTEXT_KEYS
+        }
+    if isinstance(value, list | tuple):
+        return [_stable_context(v) for v in value]
+    return value
+
 
 @dataclass
 class PromptResult:
@@ -50,6 +76,7 @@ class PromptServiceConfig:
     max_token_limit: int = 10000  # Hard limit
     cache_enabled: bool = True
     cache_ttl_seconds: int = 3600
+    cache_max_entries: int = 256
     feedback_integration: bool = True
     token_optimization: bool = True
 
@@ -76,6 +103,11 @@ class PromptServiceV2:
         )
         self.context_manager = HybridContextManager(context_config)
 
+        # Prompt result cache: identieke requests geven een identieke prompt
+        self._prompt_cache: OrderedDict[str, tuple[float, PromptResult]] = OrderedDict()
+        self._prompt_cache_lock = threading.Lock()
+        self._prompt_cache_stats = {"hits": 0, "misses": 0}
+
         # Load prompt augmentation config (Epic 3)
         try:
             wl_cfg = load_web_lookup_config().get("web_lookup", {})
@@ -96,6 +128,22 @@ class PromptServiceV2:
         """
         start_time = time.time()
 
+        cache_key = self._prompt_cache_key(request, feedback_history, context)
+        cached = self._get_cached_prompt(cache_key)
+        if cached is not None:
+            logger.debug(f"V2 Prompt voor '{request.begrip}' uit cache")
+            # Eigen kopie per aanroep, met het tijdstip van deze aanvraag
+            return replace(
+                cached,
+                text=with_timestamp(cached.text),
+                components_used=tuple(cached.components_used),
+                metadata={
+                    **copy.deepcopy(cached.metadata),
+                    "generation_time": time.time() - start_time,
+                    "cache_hit": True,
+                },
+            )
+
         try:
             # US-043: Use HybridContextManager as single context entry point
             # Build enriched context through the unified manager
@@ -186,6 +234,16 @@ class PromptServiceV2:
                 f"components={result.components_used}"
             )
 
+            # De cache bewaart een kopie zonder tijdstip (zie with_timestamp)
+            self._store_cached_prompt(
+                cache_key,
+                replace(
+                    result,
+                    text=with_timestamp(result.text, TIMESTAMP_PLACEHOLDER),
+                    components_used=tuple(result.components_used),
+                    metadata=copy.deepcopy(result.metadata),
+                ),
+            )
             return result
 
         except Exception as e:
@@ -195,6 +253,79 @@ class PromptServiceV2:
             )
             raise
 
+    def _prompt_cache_key(
+        self,
+        request: GenerationRequest,
+        feedback_history: list[dict] | None,
+        context: dict[str, Any] | None,
+    ) -> str | None:
+        """Cache key over alle prompt-bepalende inputs, of None.
+
+        Niet in de key: request id/actor en vluchtige context velden
+        (``_VOLATILE_CONTEXT_KEYS``), anders mist elke generatie met web lookup.
+        """
+        if not self.config.cache_enabled or self.config.cache_max_entries <= 0:
+            return None
+        try:
+            from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+            request_fields = asdict(request)
+            request_fields.pop("id", None)
+            request_fields.pop("actor", None)
+            payload = json.dumps(
+                {
+                    "request": request_fields,
+                    "feedback": feedback_history or [],
+                    "context": _stable_context(context or {}),
+                    "ruleset": get_cached_toetsregel_manager().get_ruleset_version(),
+                },
+                sort_keys=True,
+                default=str,
+            )
+        except Exception as e:
+            logger.debug(f"Prompt cache key niet te bepalen: {e}")
+            return None
+        return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def _get_cached_prompt(self, cache_key: str | None) -> PromptResult | None:
+        if cache_key is None:
+            return None
+        with self._prompt_cache_lock:
+            entry = self._prompt_cache.get(cache_key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._prompt_cache[cache_key]
+                entry = None
+            if entry is None:
+                self._prompt_cache_stats["misses"] += 1
+                return None
+            self._prompt_cache.move_to_end(cache_key)
+            self._prompt_cache_stats["hits"] += 1
+            return entry[1]
+
+    def _store_cached_prompt(self, cache_key: str | None, result: PromptResult) -> None:
+        if cache_key is None:
+            return
+        expires_at = time.monotonic() + self.config.cache_ttl_seconds
+        with self._prompt_cache_lock:
+            self._prompt_cache[cache_key] = (expires_at, result)
+            self._prompt_cache.move_to_end(cache_key)
+            while len(self._prompt_cache) > self.config.cache_max_entries:
+                self._prompt_cache.popitem(last=False)
+
+    def clear_prompt_cache(self) -> None:
+        """Leeg de prompt result cache."""
+        with self._prompt_cache_lock:
+            self._prompt_cache.clear()
+
+    def get_prompt_cache_stats(self) -> dict[str, Any]:
+        """Statistieken van de prompt result cache en de module output memo."""
+        with self._prompt_cache_lock:
+            stats = {"size": len(self._prompt_cache), **self._prompt_cache_stats}
+        from services.prompts.modular_prompt_adapter import get_cached_orchestrator
+
+        stats["modules"] = get_cached_orchestrator().get_module_cache_stats()
+        return stats
+
     def _maybe_augment_with_document_snippets(
         self, prompt_text: str, enriched_context: EnrichedContext
     ) -> str:
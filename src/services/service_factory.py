@@ -471,116 +471,148 @@ class ServiceAdapter:
         Vertaalt de legacy interface naar de nieuwe service calls.
         Deze methode is sync om legacy UI compatibility te behouden.
         """
-        from services.interfaces import GenerationRequest
         from utils.progress_callback import operation_progress
 
         # DEF-198: Clean architecture - import from utils/, callback registered by UI
         with operation_progress("generating_definition"):
-            # Handle regeneration context
-            extra_instructions = self._handle_regeneration_context(begrip, kwargs)
-
-            # Converteer legacy context_dict naar GenerationRequest
-            # Extract ontologische categorie uit kwargs
-            categorie = safe_dict_get(kwargs, "categorie")
-            ontologische_categorie = None
-            if categorie:
-                # Converteer OntologischeCategorie enum naar string
-                if hasattr(categorie, "value"):
-                    ontologische_categorie = categorie.value
-                else:
-                    ontologische_categorie = str(categorie)
-
-            import uuid
-
-            # Map legacy dictionary to V2 fields and keep legacy string fields populated for compatibility
-            org_list = ensure_list(safe_dict_get(context_dict, "organisatorisch", []))
-            context_text = (
-                ", ".join(org_list)
-                if isinstance(org_list, list)
-                else str(org_list or "")
-            )
-            # EPIC-010: domein field verwijderd - gebruik juridische_context
-
-            # Collect options (feature flags etc.)
-            opts = ensure_dict(safe_dict_get(kwargs, "options", {}))
-
-            # Document context (EPIC-018): compacte samenvatting door UI aangeleverd
-            doc_context = ensure_string(
-                safe_dict_get(kwargs, "document_context", "")
-            ).strip()
-
-            request = GenerationRequest(
-                id=str(uuid.uuid4()),  # Generate unique ID for tracking
-                begrip=begrip,
-                # CRITICAL FIX: Use the new list fields for V2 context mapping
-                organisatorische_context=org_list,
-                juridische_context=ensure_list(
-                    safe_dict_get(context_dict, "juridisch", [])
-                ),
-                wettelijke_basis=ensure_list(
-                    safe_dict_get(context_dict, "wettelijk", [])
-                ),
-                # Standard fields
-                organisatie=ensure_string(safe_dict_get(kwargs, "organisatie", "")),
-                extra_instructies=extra_instructions,
-                ontologische_categorie=ontologische_categorie,  # Categorie uit 6-stappen protocol
-                ufo_categorie=ensure_string(safe_dict_get(kwargs, "ufo_categorie", ""))
-                or None,
-                actor="legacy_ui",  # Track that this comes from legacy UI
-                legal_basis="legitimate_interest",  # Default legal basis for DPIA compliance
-                # Populate legacy string context for compatibility with tests/UI
-                context=context_text,
-                options=opts or None,
-                document_context=(doc_context or None),
+            request, extra_context = self.build_generation_request(
+                begrip, context_dict, **kwargs
             )
 
-            # Compose additional context (documents/web lookup augmentation, etc.)
-            extra_context: dict[str, Any] = {}
-            # EPIC-018: document snippets meegeven aan orchestrator context
-            doc_snippets_kw = safe_dict_get(kwargs, "document_snippets", None)
-            if doc_snippets_kw:
-                try:
-                    # Ensure list of dicts (gebruik module-level helpers)
-                    snippets_list = [
-                        ensure_dict(x) for x in ensure_list(doc_snippets_kw)
-                    ]
-                    if snippets_list:
-                        extra_context["documents"] = {"snippets": snippets_list}
-                except (TypeError, ValueError, KeyError) as e:
-                    # DEF-229: Log snippet normalization failures
-                    logger.warning(f"Failed to normalize document snippets: {e}")
-
             # Handle V2 orchestrator async call properly
             response = await self.orchestrator.create_definition(
-                request, context=extra_context or None
+                request, context=extra_context
             )
+            return self.legacy_ui_response(response)
 
-            # Early return for failure case
-            if not response.success or not response.definition:
-                return self._create_failure_response(response)
+    def submit_generation(
+        self, begrip: str, context_dict: dict, *, owner: str | None = None, **kwargs
+    ) -> str:
+        """
+        Dien een generatie in als achtergrondjob (zie ``services.jobs``).
 
-            # Convert to canonical UI format using normalization
-            ui_response = self.to_ui_response(response, {})
+        Neemt dezelfde argumenten als ``generate_definition``; het resultaat
+        van de job is het legacy UI antwoord. Geen automatische retries: de
+        gebruiker wacht op het resultaat en een herhaalde poging zou een
+        tweede definitie opslaan.
 
-            # Add minimal legacy compatibility fields
-            return {
-                **ui_response,
-                "success": True,
-                "final_definitie": ui_response[
-                    "definitie_gecorrigeerd"
-                ],  # Legacy alias
-                "marker": ensure_string(
-                    safe_dict_get(response.definition.metadata, "marker", "")
-                ),
-                "validation_score": ui_response["final_score"],  # Legacy alias
-                # Ensure prompt fields are available for debug
-                "prompt_text": ensure_string(
-                    safe_dict_get(ui_response["metadata"], "prompt_text", "")
-                ),
-                "prompt_template": safe_dict_get(
-                    ui_response["metadata"], "prompt_template", ""
-                ),
-            }
+        Returns:
+            Job id om de status mee op te vragen
+        """
+        from services.jobs import JOB_GENERATION, generation_payload
+
+        request, extra_context = self.build_generation_request(
+            begrip, context_dict, **kwargs
+        )
+        return self.container.job_queue().enqueue(
+            JOB_GENERATION,
+            generation_payload(request, extra_context, ui_response=True),
+            owner=owner,
+            max_attempts=1,
+        )
+
+    def build_generation_request(
+        self, begrip: str, context_dict: dict, **kwargs
+    ) -> tuple[Any, dict[str, Any] | None]:
+        """Vertaal legacy UI argumenten naar een GenerationRequest + extra context."""
+        from services.interfaces import GenerationRequest
+
+        # Handle regeneration context
+        extra_instructions = self._handle_regeneration_context(begrip, kwargs)
+
+        # Converteer legacy context_dict naar GenerationRequest
+        # Extract ontologische categorie uit kwargs
+        categorie = safe_dict_get(kwargs, "categorie")
+        ontologische_categorie = None
+        if categorie:
+            # Converteer OntologischeCategorie enum naar string
+            if hasattr(categorie, "value"):
+                ontologische_categorie = categorie.value
+            else:
+                ontologische_categorie = str(categorie)
+
+        import uuid
+
+        # Map legacy dictionary to V2 fields and keep legacy string fields populated for compatibility
+        org_list = ensure_list(safe_dict_get(context_dict, "organisatorisch", []))
+        context_text = (
+            ", ".join(org_list) if isinstance(org_list, list) else str(org_list or "")
+        )
+        # EPIC-010: domein field verwijderd - gebruik juridische_context
+
+        # Collect options (feature flags etc.)
+        opts = ensure_dict(safe_dict_get(kwargs, "options", {}))
+
+        # Document context (EPIC-018): compacte samenvatting door UI aangeleverd
+        doc_context = ensure_string(
+            safe_dict_get(kwargs, "document_context", "")
+        ).strip()
+
+        request = GenerationRequest(
+            id=str(uuid.uuid4()),  # Generate unique ID for tracking
+            begrip=begrip,
+            # CRITICAL FIX: Use the new list fields for V2 context mapping
+            organisatorische_context=org_list,
+            juridische_context=ensure_list(
+                safe_dict_get(context_dict, "juridisch", [])
+            ),
+            wettelijke_basis=ensure_list(safe_dict_get(context_dict, "wettelijk", [])),
+            # Standard fields
+            organisatie=ensure_string(safe_dict_get(kwargs, "organisatie", "")),
+            extra_instructies=extra_instructions,
+            ontologische_categorie=ontologische_categorie,  # Categorie uit 6-stappen protocol
+            ufo_categorie=ensure_string(safe_dict_get(kwargs, "ufo_categorie", ""))
+            or None,
+            actor="legacy_ui",  # Track that this comes from legacy UI
+            legal_basis="legitimate_interest",  # Default legal basis for DPIA compliance
+            # Populate legacy string context for compatibility with tests/UI
+            context=context_text,
+            options=opts or None,
+            document_context=(doc_context or None),
+        )
+
+        # Compose additional context (documents/web lookup augmentation, etc.)
+        extra_context: dict[str, Any] = {}
+        # EPIC-018: document snippets meegeven aan orchestrator context
+        doc_snippets_kw = safe_dict_get(kwargs, "document_snippets", None)
+        if doc_snippets_kw:
+            try:
+                # Ensure list of dicts (gebruik module-level helpers)
+                snippets_list = [ensure_dict(x) for x in ensure_list(doc_snippets_kw)]
+                if snippets_list:
+                    extra_context["documents"] = {"snippets": snippets_list}
+            except (TypeError, ValueError, KeyError) as e:
+                # DEF-229: Log snippet normalization failures
+                logger.warning(f"Failed to normalize document snippets: {e}")
+
+        return request, extra_context or None
+
+    def legacy_ui_response(self, response: Any) -> dict:
+        """Zet een orchestrator response om naar het legacy UI antwoord."""
+        # Early return for failure case
+        if not response.success or not response.definition:
+            return self._create_failure_response(response)
+
+        # Convert to canonical UI format using normalization
+        ui_response = self.to_ui_response(response, {})
+
+        # Add minimal legacy compatibility fields
+        return {
+            **ui_response,
+            "success": True,
+            "final_definitie": ui_response["definitie_gecorrigeerd"],  # Legacy alias
+            "marker": ensure_string(
+                safe_dict_get(response.definition.metadata, "marker", "")
+            ),
+            "validation_score": ui_response["final_score"],  # Legacy alias
+            # Ensure prompt fields are available for debug
+            "prompt_text": ensure_string(
+                safe_dict_get(ui_response["metadata"], "prompt_text", "")
+            ),
+            "prompt_template": safe_dict_get(
+                ui_response["metadata"], "prompt_template", ""
+            ),
+        }
 
     def _create_failure_response(self, response: Any) -> dict:
         """Create a standardized failure response."""
@@ -0,0 +1,428 @@
+"""Corpus-brede UFO classificatie met gevectoriseerde scoring.
+
+``UFOClassifierService.classify`` doet per definitie normalisatie, een regex
+search per patroon en disambiguatie. Voor het herclassificeren van het hele
+corpus (bijv. na een wijziging van de patronen) doet ``BulkUFOClassifier``
+hetzelfde in bulk:
+
+1. alle definities worden één keer getokeniseerd (``\\w+`` op lowercase tekst);
+2. een sparse term-feature matrix (CSR: ``indptr``/``indices``) koppelt
+   definities aan de woorden uit de patronen;
+3. één matrixproduct met de gewichtsvectoren per categorie geeft de scores
+   voor alle categorieën tegelijk;
+4. alleen definities waarvan het begrip een disambiguatieregel heeft
+   (het ambigue residu) gaan door het scalaire pad van de service.
+
+De uitkomst is identiek aan ``classify`` per definitie: een patroon
+``\\b(a|b|c)\\b`` matcht precies als één van de alternatieven als heel woord
+voorkomt. Alternatieven die geen enkel woord zijn (``proces-verbaal``,
+``strafbaar feit``) en patronen in een andere vorm (``\\b\\d+\\b``) worden
+per definitie met hun regex gecontroleerd.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from services.ufo_classifier_service import (
+    DEFAULT_CONFIDENCE,
+    MAX_CONFIDENCE,
+    MIN_CONFIDENCE,
+    PATTERN_WEIGHT,
+    UFOCategory,
+    UFOClassificationResult,
+    UFOClassifierService,
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+_WORD = re.compile(r"\w+")
+_ALTERNATION = re.compile(r"^\\b\(([^()\\]+)\)\\b$")
+
+# Waarden toegestaan door de CHECK constraint op definities.ufo_categorie
+STORABLE_CATEGORIES = frozenset(
+    {"Kind", "Event", "Role", "Phase", "Relator", "Mode", "Quantity", "Quality"}
+)
+
+
+class UFOFeatureIndex:
+    """
+    Woord → patroon index en gewichtsmatrix afgeleid uit de service patronen.
+
+    Kolommen van de scorematrix volgen de volgorde van ``patterns`` (dezelfde
+    volgorde als de score-dict in ``classify``, relevant bij gelijke scores).
+    """
+
+    def __init__(self, patterns: Mapping[UFOCategory, Sequence[str]]):
+        self.categories: list[UFOCategory] = list(patterns)
+        self.word_ids: dict[str, int] = {}
+        word_patterns: list[list[int]] = []
+        # (patroon index, regex) voor wat niet als heel woord te matchen is
+        self.regex_checks: list[tuple[int, re.Pattern[str]]] = []
+        pattern_categories: list[int] = []
+
+        for column, category in enumerate(self.categories):
+            for pattern in patterns[category]:
+                pattern_index = len(pattern_categories)
+                pattern_categories.append(column)
+
+                match = _ALTERNATION.match(pattern)
+                if match is None:
+                    self.regex_checks.append(
+                        (pattern_index, re.compile(pattern, re.IGNORECASE))
+                    )
+                    continue
+
+                others = []
+                for alternative in match.group(1).split("|"):
+                    word = alternative.lower()
+                    if not _WORD.fullmatch(word):
+                        others.append(alternative)
+                        continue
+                    word_id = self.word_ids.setdefault(word, len(self.word_ids))
+                    if word_id == len(word_patterns):
+                        word_patterns.append([])
+                    word_patterns[word_id].append(pattern_index)
+                if others:
+                    self.regex_checks.append(
+                        (
+                            pattern_index,
+                            re.compile(rf"\b({'|'.join(others)})\b", re.IGNORECASE),
+                        )
+                    )
+
+        self.n_patterns = len(pattern_categories)
+        # Woord × patroon incidentie (dense, klein: ~200 × ~40)
+        self.word_pattern = np.zeros((len(self.word_ids), self.n_patterns), np.int32)
+        for word_id, pattern_indices in enumerate(word_patterns):
+            self.word_pattern[word_id, pattern_indices] = 1
+        # Gewichtsvector per categorie: PATTERN_WEIGHT per eigen patroon
+        self.category_weights = np.zeros((self.n_patterns, len(self.categories)))
+        self.category_weights[np.arange(self.n_patterns), pattern_categories] = (
+            PATTERN_WEIGHT
+        )
+
+    def term_feature_matrix(
+        self, texts: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Tokeniseer alle teksten één keer tot een sparse binaire CSR matrix.
+
+        Args:
+            texts: Lowercase teksten
+
+        Returns:
+            (indptr, indices): woord-ids van rij ``i`` staan in
+            ``indices[indptr[i]:indptr[i + 1]]``
+        """
+        word_ids = self.word_ids
+        indptr = np.zeros(len(texts) + 1, np.int64)
+        indices: list[int] = []
+        for row, text in enumerate(texts):
+            found = {word_ids[t] for t in _TOKEN.findall(text) if t in word_ids}
+            indices.extend(found)
+            indptr[row + 1] = len(indices)
+        return indptr, np.asarray(indices, np.int64)
+
+    def pattern_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """Binaire matrix (definitie × patroon): True als het patroon matcht."""
+        indptr, indices = self.term_feature_matrix(texts)
+        counts = np.zeros((len(texts), self.n_patterns), np.int32)
+        if indices.size:
+            rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+            np.add.at(counts, rows, self.word_pattern[indices])
+        matched = counts > 0
+
+        for pattern_index, regex in self.regex_checks:
+            column = matched[:, pattern_index]
+            for row, text in enumerate(texts):
+                if not column[row] and regex.search(text):
+                    column[row] = True
+        return matched
+
+    def scores(self, texts: Sequence[str]) -> np.ndarray:
+        """Scores (definitie × categorie) via één matrixproduct."""
+        matched = self.pattern_matrix(texts).astype(np.float64)
+        return np.minimum(matched @ self.category_weights, MAX_CONFIDENCE)
+
+
+@dataclass
+class BulkClassification:
+    """Uitkomst van een bulk classificatie (één rij per invoer)."""
+
+    terms: list[str]
+    definitions: list[str]
+    categories: list[UFOCategory]
+    confidences: np.ndarray
+    secondary: list[list[UFOCategory]]
+    scores: list[dict[UFOCategory, float]]
+    invalid: np.ndarray
+    disambiguated: np.ndarray
+    elapsed_ms: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+
+@dataclass
+class UFOReclassificationReport:
+    """Samenvatting van een corpus herclassificatie."""
+
+    definitions: int = 0
+    classified: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped_unknown: int = 0
+    skipped_low_confidence: int = 0
+    skipped_unstorable: int = 0
+    disambiguated: int = 0
+    dry_run: bool = False
+    elapsed_seconds: float = 0.0
+    distribution: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "definitions": self.definitions,
+            "classified": self.classified,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "skipped_unknown": self.skipped_unknown,
+            "skipped_low_confidence": self.skipped_low_confidence,
+            "skipped_unstorable": self.skipped_unstorable,
+            "disambiguated": self.disambiguated,
+            "dry_run": self.dry_run,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "distribution": self.distribution,
+        }
+
+
+class BulkUFOClassifier:
+    """Gevectoriseerde classificatie van veel definities tegelijk.
+
+    Args:
+        service: De UFOClassifierService waarvan patronen, disambiguatie en
+            beslisregels worden gevolgd
+    """
+
+    def __init__(self, service: UFOClassifierService | None = None):
+        self.service = service or UFOClassifierService()
+        self.index = UFOFeatureIndex(self.service.PATTERNS)
+        # Enum en resultaat-type uit de module van de service zelf, zodat
+        # ``src.services...`` en ``services...`` imports niet door elkaar lopen
+        module = sys.modules[type(self.service).__module__]
+        self.unknown: UFOCategory = module.UFOCategory.UNKNOWN
+        self.result_type: type[UFOClassificationResult] = module.UFOClassificationResult
+
+    def classify(self, items: Iterable[tuple[Any, Any]]) -> BulkClassification:
+        """
+        Classificeer (begrip, definitie) paren in bulk.
+
+        Args:
+            items: Iterable van (term, definitie)
+
+        Returns:
+            BulkClassification met per rij categorie, confidence en scores
+        """
+        start = time.perf_counter()
+        service = self.service
+        terms: list[str] = []
+        definitions: list[str] = []
+        for term, definition in items:
+            terms.append(service._normalize_text(term))
+            definitions.append(service._normalize_text(definition))
+
+        n = len(terms)
+        invalid = np.array(
+            [not t or not d for t, d in zip(terms, definitions, strict=True)], bool
+        )
+        texts = [f"{t} {d}".lower() for t, d in zip(terms, definitions, strict=True)]
+        scores = self.index.scores(texts) if n else np.zeros((0, 0))
+        categories, confidences, secondary, row_scores = self._decide(scores)
+
+        # Ambigu residu: begrippen met een disambiguatieregel
+        rules = service.DISAMBIGUATION_RULES
+        disambiguated = np.zeros(n, bool)
+        for i in range(n):
+            if invalid[i] or terms[i].lower() not in rules:
+                continue
+            disambiguated[i] = True
+            adjusted = service._apply_disambiguation(
+                terms[i], definitions[i], dict(row_scores[i])
+            )
+            categories[i], confidences[i] = service._determine_primary_category(
+                adjusted
+            )
+            secondary[i] = service._get_secondary_categories(adjusted, categories[i])
+            row_scores[i] = adjusted
+
+        for i in np.flatnonzero(invalid):
+            categories[i] = self.unknown
+            confidences[i] = MIN_CONFIDENCE
+            secondary[i] = []
+            row_scores[i] = {}
+
+        return BulkClassification(
+            terms=terms,
+            definitions=definitions,
+            categories=categories,
+            confidences=confidences,
+            secondary=secondary,
+            scores=row_scores,
+            invalid=invalid,
+            disambiguated=disambiguated,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    def results(self, bulk: BulkClassification) -> list[UFOClassificationResult]:
+        """Zet een bulk uitkomst om naar resultaten zoals ``classify`` ze geeft."""
+        service = self.service
+        per_item_ms = bulk.elapsed_ms / len(bulk) if len(bulk) else 0.0
+        results = []
+        for i, category in enumerate(bulk.categories):
+            if bulk.invalid[i]:
+                results.append(
+                    self.result_type(
+                        term=bulk.terms[i],
+                        definition=bulk.definitions[i],
+                        primary_category=category,
+                        confidence=MIN_CONFIDENCE,
+                        explanation=["Empty or invalid input"],
+                    )
+                )
+                continue
+            result = self.result_type(
+                term=bulk.terms[i],
+                definition=bulk.definitions[i],
+                primary_category=category,
+                confidence=float(bulk.confidences[i]),
+                secondary_categories=bulk.secondary[i],
+                matched_patterns=[],
+                classification_time_ms=per_item_ms,
+                version=service.version,
+            )
+            result.explanation = service._generate_explanation(result, bulk.scores[i])
+            results.append(result)
+        return results
+
+    def _decide(self, scores: np.ndarray) -> tuple[
+        list[UFOCategory],
+        np.ndarray,
+        list[list[UFOCategory]],
+        list[dict[UFOCategory, float]],
+    ]:
+        """Gevectoriseerde versie van de beslisregels van de service."""
+        n = scores.shape[0]
+        cats = self.index.categories
+        if n == 0:
+            return [], np.zeros(0), [], []
+
+        rows = np.arange(n)
+        nonzero = scores > 0
+        has_scores = nonzero.any(axis=1)
+        # argmax: eerste maximum = eerste in dict-volgorde bij gelijke scores
+        primary_col = scores.argmax(axis=1)
+        primary = scores[rows, primary_col]
+        others = np.where(nonzero, scores, -np.inf)
+        others[rows, primary_col] = -np.inf
+        second = others.max(axis=1)
+        close = (nonzero.sum(axis=1) > 1) & (primary - second < 0.1)
+        primary = np.where(close, primary * 0.8, primary)
+        confidences = np.where(
+            has_scores,
+            np.maximum(MIN_CONFIDENCE, np.minimum(primary, MAX_CONFIDENCE)),
+            DEFAULT_CONFIDENCE,
+        )
+
+        # Stabiele sortering op aflopende score (zoals sorted(..., reverse=True))
+        order = np.argsort(-scores, axis=1, kind="stable")
+        eligible = scores >= 0.2
+        categories: list[UFOCategory] = []
+        secondary: list[list[UFOCategory]] = []
+        row_scores: list[dict[UFOCategory, float]] = []
+        for i in range(n):
+            if not has_scores[i]:
+                categories.append(self.unknown)
+                secondary.append([])
+                row_scores.append({})
+                continue
+            p = int(primary_col[i])
+            categories.append(cats[p])
+            secondary.append(
+                [cats[c] for c in order[i] if c != p and eligible[i, c]][:3]
+            )
+            row_scores.append(
+                {cats[c]: float(scores[i, c]) for c in np.flatnonzero(nonzero[i])}
+            )
+        return categories, confidences, secondary, row_scores
+
+    def reclassify_repository(
+        self,
+        repository: Any,
+        *,
+        only_missing: bool = False,
+        min_confidence: float = 0.0,
+        dry_run: bool = False,
+    ) -> UFOReclassificationReport:
+        """
+        Herclassificeer alle definities en schrijf ``ufo_categorie`` in bulk weg.
+
+        Alleen gewijzigde waarden worden geschreven. Unknown, te lage
+        confidence en categorieën die de database niet toestaat (Collective)
+        laten de bestaande waarde staan.
+
+        Args:
+            repository: DefinitieRepository (get_all/update_ufo_categories)
+            only_missing: Alleen definities zonder ufo_categorie
+            min_confidence: Minimale confidence om weg te schrijven
+            dry_run: Bereken alles, maar schrijf niets weg
+        """
+        start = time.perf_counter()
+        records = [r for r in repository.get_all() if r.id is not None]
+        if only_missing:
+            records = [r for r in records if not r.ufo_categorie]
+        report = UFOReclassificationReport(definitions=len(records), dry_run=dry_run)
+
+        bulk = self.classify((r.begrip, r.definitie) for r in records)
+        report.disambiguated = int(bulk.disambiguated.sum())
+        updates: list[tuple[int, str]] = []
+        for record, category, confidence in zip(
+            records, bulk.categories, bulk.confidences, strict=True
+        ):
+            if category is self.unknown:
+                report.skipped_unknown += 1
+                continue
+            report.classified += 1
+            report.distribution[category.value] = (
+                report.distribution.get(category.value, 0) + 1
+            )
+            if confidence < min_confidence:
+                report.skipped_low_confidence += 1
+            elif category.value not in STORABLE_CATEGORIES:
+                report.skipped_unstorable += 1
+            elif record.ufo_categorie == category.value:
+                report.unchanged += 1
+            else:
+                updates.append((record.id, category.value))
+
+        if dry_run:
+            report.updated = len(updates)
+        else:
+            report.updated = repository.update_ufo_categories(updates)
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "UFO herclassificatie: %d definities, %d bijgewerkt (%.2fs)",
+            report.definitions,
+            report.updated,
+            report.elapsed_seconds,
+            extra={"component": "ufo_bulk_classifier", **report.to_dict()},
+        )
+        return report
@@ -31,6 +31,7 @@ MAX_TEXT_LENGTH = 10000
 MIN_CONFIDENCE = 0.1
 MAX_CONFIDENCE = 1.0
 DEFAULT_CONFIDENCE = 0.3
+PATTERN_WEIGHT = 0.4  # Score per matchend patroon
 
 
 class UFOCategory(Enum):
@@ -226,7 +227,7 @@ class UFOClassifierService:
 
             for pattern in patterns:
                 if pattern.search(combined_text):
-                    score += 0.4  # Simple scoring: 0.4 per match
+                    score += PATTERN_WEIGHT  # Simple scoring: 0.4 per match
                     matches.append(pattern.pattern)
 
             if score > 0:
@@ -384,7 +385,23 @@ class UFOClassifierService:
     def batch_classify(
         self, definitions: list[tuple[str, str]], context: dict | None = None
     ) -> list[UFOClassificationResult]:
-        """Batch classify multiple terms efficiently."""
+        """Batch classify multiple terms efficiently.
+
+        Scoort alle definities in één keer via de gevectoriseerde
+        ``BulkUFOClassifier``; valt terug op ``classify`` per item als dat
+        pad faalt.
+        """
+        if not definitions:
+            return []
+
+        try:
+            from services.ufo_bulk_classifier import BulkUFOClassifier
+
+            bulk = BulkUFOClassifier(self)
+            return bulk.results(bulk.classify(definitions))
+        except Exception as e:
+            logger.error(f"Bulk classification failed, falling back per item: {e}")
+
         results = []
 
         for term, definition in definitions:
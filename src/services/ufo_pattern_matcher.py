@@ -13,12 +13,16 @@ from __future__ import annotations
 
 import logging
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import lru_cache
+from re import _parser as re_parser  # type: ignore[attr-defined]
 from typing import Any, cast
 
+from utils.warm_start import get_warm_start
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,16 +58,298 @@ class PatternMatch:
     context: dict[str, Any] = field(default_factory=dict)
 
 
+# Ankers korter dan dit filteren nauwelijks; zo'n patroon draait altijd
+_MIN_ANCHOR_LENGTH = 2
+_REPEAT_OPS = {"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"}
+
+
+def _sequence_literals(items: list[tuple[Any, Any]]) -> set[str] | None:
+    """Beste set letterlijke fragmenten voor een geparste regex sequentie."""
+    candidates: list[set[str]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            candidates.append({"".join(run)})
+            run.clear()
+
+    for op, arg in items:
+        name = str(op)
+        if name == "LITERAL":
+            char = chr(arg).lower()
+            if len(char) == 1:
+                run.append(char)
+            else:
+                flush()
+            continue
+        if name == "AT":  # \b, ^, $: zero-width, onderbreekt geen fragment
+            continue
+
+        flush()
+        sub: set[str] | None = None
+        if name == "BRANCH":
+            branches = [_sequence_literals(list(branch)) for branch in arg[1]]
+            if all(branches):
+                sub = set().union(*branches)
+        elif name == "SUBPATTERN":
+            _group, add_flags, del_flags, pattern = arg
+            if not add_flags and not del_flags:
+                sub = _sequence_literals(list(pattern))
+        elif name in _REPEAT_OPS:
+            minimum, _maximum, pattern = arg
+            if minimum >= 1:
+                sub = _sequence_literals(list(pattern))
+        elif name == "IN":
+            chars = [chr(a).lower() for o, a in arg if str(o) == "LITERAL"]
+            if len(chars) == len(arg):
+                sub = set(chars)
+        if sub:
+            candidates.append(sub)
+
+    flush()
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def required_literals(pattern: str) -> frozenset[str] | None:
+    """
+    Bepaal letterlijke fragmenten waarvan er minstens één in elke match zit.
+
+    Fragmenten zijn lowercase; de matcher werkt op lowercase tekst. Geeft None
+    als dat niet (bruikbaar) vast te stellen is, het patroon draait dan altijd.
+    """
+    try:
+        parsed = re_parser.parse(pattern, re.IGNORECASE | re.UNICODE)
+    except Exception:
+        return None
+    anchors = _sequence_literals(list(parsed))
+    if not anchors or min(map(len, anchors)) < _MIN_ANCHOR_LENGTH:
+        return None
+    return frozenset(anchors)
+
+
+class TermAutomaton:
+    """
+    Aho-Corasick automaat over een vaste set termen.
+
+    Eén pass over de tekst vindt alle (ook overlappende) voorkomens van alle
+    termen; de kosten hangen af van de tekstlengte, niet van het aantal termen.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: list[str] = [t for t in dict.fromkeys(terms) if t]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for index, term in enumerate(self.terms):
+            self._add(term, index)
+        self._link()
+
+    def _add(self, term: str, index: int) -> None:
+        state = 0
+        for char in term:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = nxt
+            state = nxt
+        self._out[state] += (index,)
+
+    def _link(self) -> None:
+        """Zet failure links (BFS) en voeg outputs van suffixen samen."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[int]:
+        """Indices (in ``terms``) van alle termen die in ``text`` voorkomen."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+@dataclass
+class MatchIndex:
+    """
+    Gecombineerde index over vocabulaire en patroon-ankers.
+
+    Per literal (index in ``automaton.terms``) staan de vocabulaire hits
+    (domein positie, domein, categorie) en de patronen (positie in
+    ``pattern_keys``) waarvan het een anker is. Patronen zonder anker staan
+    in ``always_run``.
+    """
+
+    automaton: TermAutomaton
+    term_hits: list[tuple[tuple[int, str, UFOCategory], ...]]
+    pattern_hits: list[tuple[int, ...]]
+    pattern_keys: list[tuple[UFOCategory, str]]
+    always_run: tuple[int, ...]
+
+
+# Mapping van domeintermen naar categorieën (exact of als deel van de term)
+_TERM_CATEGORIES = {
+    # Personen/entiteiten -> KIND
+    "persoon": UFOCategory.KIND,
+    "organisatie": UFOCategory.KIND,
+    "document": UFOCategory.KIND,
+    # Processen -> EVENT
+    "procedure": UFOCategory.EVENT,
+    "onderzoek": UFOCategory.EVENT,
+    "zitting": UFOCategory.EVENT,
+    # Rollen -> ROLE
+    "verdachte": UFOCategory.ROLE,
+    "rechter": UFOCategory.ROLE,
+    "advocaat": UFOCategory.ROLE,
+    # Relaties -> RELATOR
+    "overeenkomst": UFOCategory.RELATOR,
+    "huwelijk": UFOCategory.RELATOR,
+    "contract": UFOCategory.RELATOR,
+    # Status -> PHASE
+    "status": UFOCategory.PHASE,
+    "fase": UFOCategory.PHASE,
+}
+
+# Disambiguatie regels per term: (patroon, categorie, confidence)
+_DISAMBIGUATION_RULES: dict[str, list[tuple[re.Pattern[str], UFOCategory, float]]] = {
+    term: [
+        (re.compile(pattern, re.IGNORECASE), category, confidence)
+        for pattern, category, confidence in rules
+    ]
+    for term, rules in {
+        "zaak": [
+            (r"rechts?zaak|strafzaak|civiele zaak", UFOCategory.EVENT, 0.9),
+            (
+                r"roerende zaak|onroerende zaak|zaak als object",
+                UFOCategory.KIND,
+                0.9,
+            ),
+            (r"zaak van", UFOCategory.MODE, 0.7),
+        ],
+        "huwelijk": [
+            (
+                r"huwelijks(?:voltrekking|sluiting|ceremonie)",
+                UFOCategory.EVENT,
+                0.9,
+            ),
+            (
+                r"huwelijk tussen|huwelijks(?:band|relatie)",
+                UFOCategory.RELATOR,
+                0.9,
+            ),
+            (r"gehuwd|huwelijkse staat", UFOCategory.PHASE, 0.8),
+        ],
+        "overeenkomst": [
+            (r"sluiten van een overeenkomst", UFOCategory.EVENT, 0.8),
+            (r"overeenkomst tussen", UFOCategory.RELATOR, 0.9),
+            (r"overeenkomst als document", UFOCategory.KIND, 0.8),
+        ],
+        "procedure": [
+            (r"procedure(?:document|handleiding)", UFOCategory.KIND, 0.8),
+            (r"procedure\s+(?:wordt|is|vindt)", UFOCategory.EVENT, 0.9),
+        ],
+        "vergunning": [
+            (r"vergunning(?:document|bewijs)", UFOCategory.KIND, 0.8),
+            (r"vergunning tussen|vergunning voor", UFOCategory.RELATOR, 0.9),
+            (r"vergunningverlening|vergunningprocedure", UFOCategory.EVENT, 0.8),
+        ],
+    }.items()
+}
+
+
 class PatternMatcher:
     """
     Uitgebreide pattern matching met 100+ patronen voor Nederlandse juridische tekst.
-    Performance is geen concern - focus op volledigheid en correctheid.
+
+    Matching loopt via één Aho-Corasick automaat over de vocabulaire en de
+    letterlijke ankers van alle patronen: per tekst draaien alleen de patronen
+    waarvan een anker voorkomt. Resultaten staan in een begrensde LRU cache.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024):
+        # De tabellen staan in deze module; het snapshot wordt herbouwd zodra
+        # dit bestand wijzigt.
+        tables = get_warm_start().get_or_build(
+            "ufo_pattern_tables", [__file__], self._build_tables
+        )
+        self.patterns = tables["patterns"]
+        self.legal_vocabulary = tables["legal_vocabulary"]
+        self.compiled_patterns = self._compile_all_patterns(tables["pattern_sources"])
+        self._match_index: MatchIndex = tables["match_index"]
+        self._indexed_patterns = [
+            (category, pattern_id, self.compiled_patterns[category].get(pattern_id))
+            for category, pattern_id in self._match_index.pattern_keys
+        ]
+
+        # Begrensde result cache (lowercase tekst -> matches)
+        self.cache_size = cache_size
+        self._match_cache: OrderedDict[str, tuple[PatternMatch, ...]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _build_tables(self) -> dict[str, Any]:
+        """Bouw patroontabellen, vocabulaire, regex bronnen en match index."""
         self.patterns = self._initialize_comprehensive_patterns()
-        self.compiled_patterns = self._compile_all_patterns()
-        self.legal_vocabulary = self._initialize_legal_vocabulary()
+        legal_vocabulary = self._initialize_legal_vocabulary()
+        pattern_sources = self._expand_pattern_sources()
+        return {
+            "patterns": self.patterns,
+            "legal_vocabulary": legal_vocabulary,
+            "pattern_sources": pattern_sources,
+            "match_index": self._build_match_index(legal_vocabulary, pattern_sources),
+        }
+
+    def _build_match_index(
+        self,
+        legal_vocabulary: dict[str, set[str]],
+        pattern_sources: dict[UFOCategory, dict[str, str]],
+    ) -> MatchIndex:
+        """Bouw de gecombineerde automaat over vocabulaire en patroon-ankers."""
+        term_hits: dict[str, list[tuple[int, str, UFOCategory]]] = defaultdict(list)
+        for position, (domain, terms) in enumerate(legal_vocabulary.items()):
+            for term in sorted(terms):
+                category = self._determine_category_for_term(term, domain)
+                term_hits[term].append((position, domain, category))
+
+        pattern_keys: list[tuple[UFOCategory, str]] = []
+        pattern_hits: dict[str, list[int]] = defaultdict(list)
+        always_run: list[int] = []
+        for category, sources in pattern_sources.items():
+            for pattern_id, pattern in sources.items():
+                position = len(pattern_keys)
+                pattern_keys.append((category, pattern_id))
+                anchors = required_literals(pattern)
+                if anchors is None:
+                    always_run.append(position)
+                    continue
+                for anchor in anchors:
+                    pattern_hits[anchor].append(position)
+
+        automaton = TermAutomaton([*term_hits, *pattern_hits])
+        return MatchIndex(
+            automaton=automaton,
+            term_hits=[tuple(term_hits.get(t, ())) for t in automaton.terms],
+            pattern_hits=[tuple(pattern_hits.get(t, ())) for t in automaton.terms],
+            pattern_keys=pattern_keys,
+            always_run=tuple(always_run),
+        )
 
     def _initialize_legal_vocabulary(self) -> dict[str, set[str]]:
         """Initialiseer complete Nederlandse juridische vocabulaire - 500+ termen."""
@@ -1333,23 +1619,16 @@ class PatternMatcher:
             },
         }
 
-    def _compile_all_patterns(self) -> dict[UFOCategory, dict[str, re.Pattern[str]]]:
-        """Compileer alle regex patronen voor snelle matching."""
-        compiled: dict[UFOCategory, dict[str, re.Pattern[str]]] = {}
+    def _expand_pattern_sources(self) -> dict[UFOCategory, dict[str, str]]:
+        """Schrijf alle patronen en woord sets uit als regex bronnen."""
+        sources: dict[UFOCategory, dict[str, str]] = {}
 
         for category, data in self.patterns.items():
-            compiled[category] = {}
+            sources[category] = {}
 
             if "patterns" in data:
                 for i, pattern in enumerate(data["patterns"]):
-                    try:
-                        compiled[category][f"pattern_{i}"] = re.compile(
-                            pattern, re.IGNORECASE | re.UNICODE
-                        )
-                    except re.error as e:
-                        logger.warning(
-                            f"Could not compile pattern {i} for {category}: {e}"
-                        )
+                    sources[category][f"pattern_{i}"] = pattern
 
             # Compileer ook woord sets als patterns
             for key in [
@@ -1363,59 +1642,97 @@ class PatternMatcher:
                 if key in data and isinstance(data[key], set):
                     terms = data[key]
                     if terms:
-                        pattern = (
+                        # Gesorteerd zodat de bron stabiel is tussen processen
+                        sources[category][key] = (
                             r"\b("
-                            + "|".join(re.escape(term) for term in terms)
+                            + "|".join(re.escape(term) for term in sorted(terms))
                             + r")\b"
                         )
-                        try:
-                            compiled[category][key] = re.compile(
-                                pattern, re.IGNORECASE | re.UNICODE
-                            )
-                        except re.error as e:
-                            logger.warning(
-                                f"Could not compile {key} for {category}: {e}"
-                            )
+
+        return sources
+
+    def _compile_all_patterns(
+        self, sources: dict[UFOCategory, dict[str, str]] | None = None
+    ) -> dict[UFOCategory, dict[str, re.Pattern[str]]]:
+        """Compileer alle regex patronen voor snelle matching."""
+        if sources is None:
+            sources = self._expand_pattern_sources()
+        compiled: dict[UFOCategory, dict[str, re.Pattern[str]]] = {}
+
+        for category, category_sources in sources.items():
+            compiled[category] = {}
+            for pattern_id, pattern in category_sources.items():
+                try:
+                    compiled[category][pattern_id] = re.compile(
+                        pattern, re.IGNORECASE | re.UNICODE
+                    )
+                except re.error as e:
+                    logger.warning(
+                        f"Could not compile {pattern_id} for {category}: {e}"
+                    )
 
         return compiled
 
-    @lru_cache(maxsize=2048)
-    def find_all_matches(self, text: str) -> list[PatternMatch]:
+    def find_all_matches(self, text: str, use_cache: bool = True) -> list[PatternMatch]:
         """
-        Vind ALLE matches in de tekst - geen shortcuts, volledige analyse.
-        Performance is geen issue voor single-user applicatie.
+        Vind ALLE matches in de tekst - patronen, vocabulaire en disambiguatie.
+
+        Het resultaat is gelijk aan het draaien van elk patroon: patronen
+        waarvan geen enkel anker in de tekst staat kunnen niet matchen.
+
+        Args:
+            text: Te analyseren tekst
+            use_cache: Resultaat uit/naar de LRU cache (uit voor bulk runs
+                over unieke teksten)
+
+        Returns:
+            Lijst met alle gevonden matches
         """
-        matches = []
         text_lower = text.lower()
+        if use_cache:
+            cached = self._get_cached_matches(text_lower)
+            if cached is not None:
+                return cached
 
-        # Loop door ALLE categorieën en ALLE patronen
-        for category, pattern_dict in self.compiled_patterns.items():
-            for pattern_id, pattern in pattern_dict.items():
-                try:
-                    found = pattern.findall(text_lower)
-                    if found:
-                        # Maak match object voor elke gevonden match
-                        for match_text in found:
-                            confidence = self._calculate_match_confidence(
-                                category, pattern_id, match_text, text_lower
-                            )
-                            matches.append(
-                                PatternMatch(
-                                    category=category,
-                                    matched_text=match_text,
-                                    pattern_id=pattern_id,
-                                    confidence=confidence,
-                                    context={"source": "pattern_matcher"},
-                                )
-                            )
-                except Exception as e:
-                    logger.debug(
-                        f"Pattern matching error for {category}.{pattern_id}: {e}"
-                    )
+        matches = self._match(text_lower)
+        if use_cache:
+            self._store_cached_matches(text_lower, matches)
+        return matches
+
+    def _match(self, text_lower: str) -> list[PatternMatch]:
+        """Voer de matching uit op lowercase tekst (zonder cache)."""
+        index = self._match_index
+        found = index.automaton.find(text_lower)
+
+        candidates = set(index.always_run)
+        for literal in found:
+            candidates.update(index.pattern_hits[literal])
+
+        matches = []
+        for position in sorted(candidates):
+            category, pattern_id, pattern = self._indexed_patterns[position]
+            if pattern is None:
+                continue
+            found_texts = pattern.findall(text_lower)
+            if not found_texts:
+                continue
+            # Confidence hangt alleen af van categorie, patroon en volledige tekst
+            confidence = self._calculate_match_confidence(
+                category, pattern_id, found_texts[0], text_lower
+            )
+            matches.extend(
+                PatternMatch(
+                    category=category,
+                    matched_text=match_text,
+                    pattern_id=pattern_id,
+                    confidence=confidence,
+                    context={"source": "pattern_matcher"},
+                )
+                for match_text in found_texts
+            )
 
         # Voeg domeinspecifieke matches toe
-        domain_matches = self._find_domain_matches(text_lower)
-        matches.extend(domain_matches)
+        matches.extend(self._find_domain_matches(text_lower, found))
 
         # Voeg disambiguatie checks toe
         disambiguation_matches = self._apply_disambiguation(text_lower, matches)
@@ -1423,59 +1740,91 @@ class PatternMatcher:
 
         return matches
 
-    def _find_domain_matches(self, text: str) -> list[PatternMatch]:
-        """Vind matches in domeinspecifieke vocabulaire."""
-        matches = []
+    def _get_cached_matches(self, text_lower: str) -> list[PatternMatch] | None:
+        """Haal matches uit de cache (LRU bijwerken)."""
+        with self._cache_lock:
+            cached = self._match_cache.get(text_lower)
+            if cached is None:
+                self._cache_stats["misses"] += 1
+                return None
+            self._match_cache.move_to_end(text_lower)
+            self._cache_stats["hits"] += 1
+        return list(cached)
 
-        for domain, terms in self.legal_vocabulary.items():
-            for term in terms:
-                if term in text:
-                    # Bepaal categorie op basis van term type
-                    category = self._determine_category_for_term(term, domain)
-
-                    matches.append(
-                        PatternMatch(
-                            category=category,
-                            matched_text=term,
-                            pattern_id=f"domain_{domain}",
-                            confidence=0.7,
-                            context={"source": "domain_vocabulary", "domain": domain},
-                        )
-                    )
+    def _store_cached_matches(
+        self, text_lower: str, matches: list[PatternMatch]
+    ) -> None:
+        """Bewaar matches; oudste entries vallen eruit."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._match_cache[text_lower] = tuple(matches)
+            self._match_cache.move_to_end(text_lower)
+            while len(self._match_cache) > self.cache_size:
+                self._match_cache.popitem(last=False)
+                self._cache_stats["evictions"] += 1
 
-        return matches
+    def clear_cache(self) -> None:
+        """Leeg de result cache."""
+        with self._cache_lock:
+            self._match_cache.clear()
 
-    def _determine_category_for_term(self, term: str, domain: str) -> UFOCategory:
-        """Bepaal UFO categorie voor een domeinspecifieke term."""
-        # Mapping van termen naar categorieën
-        term_mappings = {
-            # Personen/entiteiten -> KIND
-            "persoon": UFOCategory.KIND,
-            "organisatie": UFOCategory.KIND,
-            "document": UFOCategory.KIND,
-            # Processen -> EVENT
-            "procedure": UFOCategory.EVENT,
-            "onderzoek": UFOCategory.EVENT,
-            "zitting": UFOCategory.EVENT,
-            # Rollen -> ROLE
-            "verdachte": UFOCategory.ROLE,
-            "rechter": UFOCategory.ROLE,
-            "advocaat": UFOCategory.ROLE,
-            # Relaties -> RELATOR
-            "overeenkomst": UFOCategory.RELATOR,
-            "huwelijk": UFOCategory.RELATOR,
-            "contract": UFOCategory.RELATOR,
-            # Status -> PHASE
-            "status": UFOCategory.PHASE,
-            "fase": UFOCategory.PHASE,
+    def get_cache_stats(self) -> dict[str, Any]:
+        """
+        Verkrijg statistieken van de result cache.
+
+        Returns:
+            Dictionary met size, max_size, hits, misses, evictions en hit_rate
+        """
+        with self._cache_lock:
+            stats = dict(self._cache_stats)
+            size = len(self._match_cache)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "size": size,
+            "max_size": self.cache_size,
+            **stats,
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
         }
 
+    def _find_domain_matches(
+        self, text: str, found: set[int] | None = None
+    ) -> list[PatternMatch]:
+        """
+        Vind matches in domeinspecifieke vocabulaire.
+
+        Args:
+            text: Lowercase tekst
+            found: Literal indices uit de automaat (berekend als niet gegeven)
+        """
+        index = self._match_index
+        if found is None:
+            found = index.automaton.find(text)
+
+        hits = sorted(
+            (position, domain, index.automaton.terms[literal], category)
+            for literal in found
+            for position, domain, category in index.term_hits[literal]
+        )
+        return [
+            PatternMatch(
+                category=category,
+                matched_text=term,
+                pattern_id=f"domain_{domain}",
+                confidence=0.7,
+                context={"source": "domain_vocabulary", "domain": domain},
+            )
+            for _position, domain, term, category in hits
+        ]
+
+    def _determine_category_for_term(self, term: str, domain: str) -> UFOCategory:
+        """Bepaal UFO categorie voor een domeinspecifieke term."""
         # Check exact match
-        if term in term_mappings:
-            return term_mappings[term]
+        if term in _TERM_CATEGORIES:
+            return _TERM_CATEGORIES[term]
 
         # Check partial matches
-        for key, category in term_mappings.items():
+        for key, category in _TERM_CATEGORIES.items():
             if key in term:
                 return category
 
@@ -1491,57 +1840,20 @@ class PatternMatcher:
         """
         disambiguation_matches = []
 
-        # Disambiguatie regels
-        disambiguation_rules = {
-            "zaak": [
-                (r"rechts?zaak|strafzaak|civiele zaak", UFOCategory.EVENT, 0.9),
-                (
-                    r"roerende zaak|onroerende zaak|zaak als object",
-                    UFOCategory.KIND,
-                    0.9,
-                ),
-                (r"zaak van", UFOCategory.MODE, 0.7),
-            ],
-            "huwelijk": [
-                (
-                    r"huwelijks(?:voltrekking|sluiting|ceremonie)",
-                    UFOCategory.EVENT,
-                    0.9,
-                ),
-                (
-                    r"huwelijk tussen|huwelijks(?:band|relatie)",
-                    UFOCategory.RELATOR,
-                    0.9,
-                ),
-                (r"gehuwd|huwelijkse staat", UFOCategory.PHASE, 0.8),
-            ],
-            "overeenkomst": [
-                (r"sluiten van een overeenkomst", UFOCategory.EVENT, 0.8),
-                (r"overeenkomst tussen", UFOCategory.RELATOR, 0.9),
-                (r"overeenkomst als document", UFOCategory.KIND, 0.8),
-            ],
-            "procedure": [
-                (r"procedure(?:document|handleiding)", UFOCategory.KIND, 0.8),
-                (r"procedure\s+(?:wordt|is|vindt)", UFOCategory.EVENT, 0.9),
-            ],
-            "vergunning": [
-                (r"vergunning(?:document|bewijs)", UFOCategory.KIND, 0.8),
-                (r"vergunning tussen|vergunning voor", UFOCategory.RELATOR, 0.9),
-                (r"vergunningverlening|vergunningprocedure", UFOCategory.EVENT, 0.8),
-            ],
-        }
-
-        for term, rules in disambiguation_rules.items():
+        for term, rules in _DISAMBIGUATION_RULES.items():
             if term in text:
                 for pattern, category, confidence in rules:
-                    if re.search(pattern, text, re.IGNORECASE):
+                    if pattern.search(text):
                         disambiguation_matches.append(
                             PatternMatch(
                                 category=category,
                                 matched_text=term,
                                 pattern_id=f"disamb_{term}",
                                 confidence=confidence,
-                                context={"source": "disambiguation", "rule": pattern},
+                                context={
+                                    "source": "disambiguation",
+                                    "rule": pattern.pattern,
+                                },
                             )
                         )
                         break  # Stop bij eerste match
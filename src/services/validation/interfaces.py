@@ -147,6 +147,8 @@ class ValidationOrchestratorInterface(ABC):
         text: str,
         ontologische_categorie: str | None = None,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         """Valideer tekst tegen validatieregels.
 
@@ -155,6 +157,8 @@ class ValidationOrchestratorInterface(ABC):
             text: Te valideren tekst (mag leeg zijn)
             ontologische_categorie: Optionele categorie voor contextuele regels
             context: Optionele validatiecontext
+            gate_only: Alleen is_acceptable is betrouwbaar (violations/scores
+                mogen onvolledig zijn); implementaties mogen volledig valideren
 
         Returns:
             ValidationResult: Schema-conform resultaat
@@ -171,12 +175,15 @@ class ValidationOrchestratorInterface(ABC):
         self,
         definition: Definition,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         """Valideer volledige definitie.
 
         Args:
             definition: Te valideren Definition object
             context: Optionele validatiecontext
+            gate_only: Zie ``validate_text``
 
         Returns:
             ValidationResult: Schema-conform resultaat met detailed_scores
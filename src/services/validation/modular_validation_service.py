@@ -8,9 +8,15 @@ dit uitgebreid worden om ToetsregelManager en Python-regelmodules te gebruiken.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import pickle
 import re
 import uuid
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from types import SimpleNamespace
 from typing import Any
 
 from services.validation.interfaces import CONTRACT_VERSION
@@ -18,8 +24,14 @@ from utils.dict_helpers import safe_dict_get
 from utils.type_helpers import ensure_list, ensure_string
 
 from .aggregation import calculate_weighted_score, determine_acceptability
+from .process_pool import PreparedItem, RuleSetSnapshot, validate_in_process_pool
+from .result_cache import ValidationResultCache, make_cache_key
+from .revalidation import engine_fingerprint, rule_fingerprints
+from .rule_plan import CompiledJsonRule, PlanStep, RuleOutcome, RulePlan
+from .rule_timing import RuleTimingCollector
 from .types_internal import EvaluationContext
 from .violation_builder import (
+    BASELINE_INTERNAL_RULES,
     category_for_rule,
     circular_definition_violation,
     empty_definition_violation,
@@ -35,6 +47,52 @@ from .violation_builder import (
 
 logger = logging.getLogger(__name__)
 
+# STR-01: start ná ':' met hulpwoord/artikel (patroon ongewijzigd overgenomen)
+_STR01_START_RE = re.compile(r"^(is|de|het|een|wordt|betreft)\\b", re.IGNORECASE)
+_AUTH_SOURCE_RE = re.compile(
+    r"\b(volgens|conform|gebaseerd|bepaald|bedoeld|wet|regeling)\b", re.IGNORECASE
+)
+_UNIQUE_ID_RE = re.compile(
+    r"\b(uniek|specifiek|identificeer|registratie|nummer|code|id|vin|isbn|kenteken)\b",
+    re.IGNORECASE,
+)
+_TESTABLE_RE = re.compile(
+    r"\b(\d+|binnen|na|voor|volgens|conform|gebaseerd op)\b", re.IGNORECASE
+)
+_DISTINGUISHING_RE = re.compile(
+    r"\b(onderscheidt|specifiek|bijzonder|kenmerk|eigenschap)\b", re.IGNORECASE
+)
+_STR_ORG_REDUNDANCY_RE = re.compile(
+    r"\bsimpel\b.*\bcomplex\b|\bcomplex\b.*\bsimpel\b", re.IGNORECASE
+)
+
+
+# Regels die naast hun uitkomst ook ctx.metadata aanvullen (CON-01 duplicate
+# signaal); hun uitkomst kan niet los van de context hergebruikt worden
+_CONTEXT_SIDE_EFFECT_RULES = frozenset({"CON-01"})
+
+# Violations (severity error) met deze codes blokkeren acceptatie altijd
+_BLOCKING_CODE_PREFIXES = (
+    "VAL-EMP",
+    "CON-CIRC",
+    "VAL-LEN-002",
+    "LANG-",
+    "STR-FORM-001",
+)
+# Zachte ondergrens: score >= 0.60 zonder blocking errors is acceptabel
+_SOFT_ACCEPT_FLOOR = 0.60
+
+
+def _is_blocking_violation(violation: dict[str, Any]) -> bool:
+    return str(violation.get("severity", "")).lower() == "error" and str(
+        violation.get("code", "")
+    ).startswith(_BLOCKING_CODE_PREFIXES)
+
+
+def _pass_rule(ctx: EvaluationContext) -> RuleOutcome:
+    """Onbekende regelcode → pass."""
+    return 1.0, None
+
 
 class ValidationResultWrapper:
     """Wrapper class om dict result als object properties toegankelijk te maken.
@@ -93,11 +151,18 @@ class ModularValidationService:
         cleaning_service: Any | None = None,
         config: Any | None = None,
         repository: Any | None = None,
+        result_cache: ValidationResultCache | None = None,
+        rule_timing: RuleTimingCollector | None = None,
     ) -> None:
         self.toetsregel_manager = toetsregel_manager
         self.cleaning_service = cleaning_service
         self.config = config
         self._repository = repository
+        # Content-addressed resultaatcache (zie result_cache); versie per plan
+        self._result_cache = result_cache or ValidationResultCache.from_config(config)
+        self._rule_set_version: tuple[RulePlan, str] | None = None
+        # Opt-in tijdmeting per regel (zie rule_timing)
+        self._rule_timing = rule_timing or RuleTimingCollector.from_config(config)
 
         # DEF-215: Degraded mode tracking voor transparantie naar UI
         self._is_degraded_mode: bool = False
@@ -105,16 +170,14 @@ class ModularValidationService:
         self._rules_loaded_count: int = 0
         self._rules_expected_count: int = 45  # Full rule set target
 
+        # Regelset + gecompileerd uitvoeringsplan (lui opgebouwd, zie _get_rule_plan)
+        self._json_rules: dict[str, dict[str, Any]] = {}
+        self._compiled_json_cache: dict[str, CompiledJsonRule] = {}
+        self._compiled_ess02_cache: dict[str, dict[str, list[re.Pattern[str]]]] = {}
+        self._rule_plan: RulePlan | None = None
+
         # Baseline interne regels (altijd beschikbaar voor policies zoals scoring-uitsluiting)
-        self._baseline_internal: list[str] = [
-            "VAL-EMP-001",
-            "VAL-LEN-001",
-            "VAL-LEN-002",
-            "ESS-CONT-001",
-            "CON-CIRC-001",
-            "STR-TERM-001",
-            "STR-ORG-001",
-        ]
+        self._baseline_internal: list[str] = list(BASELINE_INTERNAL_RULES)
 
         # Load rules from ToetsregelManager if available, otherwise use defaults
         if self.toetsregel_manager is not None:
@@ -187,8 +250,9 @@ class ModularValidationService:
             # Evalueren van ALLE beschikbare regels (gebruik weights/thresholds uit config waar beschikbaar)
             self._internal_rules = all_codes
             self._json_rules = all_rules
-            self._compiled_json_cache: dict[str, list[re.Pattern[str]]] = {}
-            self._compiled_ess02_cache: dict[str, dict[str, list[re.Pattern[str]]]] = {}
+            self._compiled_json_cache = {}
+            self._compiled_ess02_cache = {}
+            self._rule_plan = None
             self._default_weights = {}
 
             # Extract weights from rule metadata
@@ -257,6 +321,8 @@ class ModularValidationService:
     def _set_default_rules(self) -> None:
         """Set default rules when ToetsregelManager is not available."""
         self._internal_rules = list(self._baseline_internal)
+        self._compiled_json_cache = {}
+        self._rule_plan = None
         self._default_weights = {
             "VAL-EMP-001": 1.0,
             "VAL-LEN-001": 0.9,
@@ -322,7 +388,124 @@ class ModularValidationService:
     def _get_rule_evaluation_order(
         self,
     ) -> list[str]:  # pragma: no cover - used by optional test
-        return sorted(self._internal_rules)
+        return [step.code for step in self._get_rule_plan().steps]
+
+    # ===== Gecompileerd uitvoeringsplan =====
+    def _rule_plan_sources(self) -> tuple[Any, ...]:
+        """Objecten waarop het plan gebaseerd is (identiteit + grootte bepalen geldigheid)."""
+        return (
+            self._internal_rules,
+            self._json_rules,
+            self._default_weights,
+            getattr(self.config, "weights", None),
+        )
+
+    def _get_rule_plan(self) -> RulePlan:
+        """Geef het uitvoeringsplan; compileer opnieuw als de regelset wijzigde."""
+        sources = self._rule_plan_sources()
+        plan = self._rule_plan
+        if plan is None or not plan.matches(sources):
+            plan = self._compile_rule_plan(sources)
+            self._rule_plan = plan
+        return plan
+
+    def _compile_rule_plan(self, sources: tuple[Any, ...]) -> RulePlan:
+        """Vertaal de geladen toetsregels éénmalig naar een plat, gesorteerd plan."""
+        codes = sorted(self._internal_rules)
+        # Gedeelde literal-index: één scan per tekst voor de patronen van alle regels
+        literals = frozenset().union(
+            *(
+                self._compiled_json_rule(code, self._json_rules[code]).literals
+                for code in codes
+                if code in self._json_rules
+                and code.upper() not in self._JSON_SPECIAL_RULES
+            )
+        )
+        steps = tuple(
+            PlanStep(code=code, evaluate=self._compile_rule_step(code, literals))
+            for code in codes
+        )
+        weights = self._effective_weights()
+        return RulePlan.build(
+            steps=steps,
+            weights=weights,
+            categories={step.code: category_for_rule(step.code) for step in steps},
+            literals=literals,
+            sources=sources,
+            gate_steps=tuple(
+                sorted(
+                    steps,
+                    key=lambda step: (
+                        not step.code.startswith(_BLOCKING_CODE_PREFIXES),
+                        -weights.get(step.code, 0.0),
+                        step.code,
+                    ),
+                )
+            ),
+        )
+
+    def _compile_rule_step(
+        self, code: str, literals: frozenset[str]
+    ) -> Callable[[EvaluationContext], RuleOutcome]:
+        """Bepaal de callable voor één regel (zelfde dispatch als _evaluate_rule).
+
+        Het plan is het enige evaluatiepad; tests en subclasses die regels
+        willen vervangen doen dat hier (of via ``_internal_rules``).
+        """
+        if code in self._json_rules:
+            rule = self._json_rules[code]
+            special = self._JSON_SPECIAL_RULES.get(code.upper())
+            if special is not None:
+                return partial(getattr(self, special), rule)
+            return partial(
+                self._run_json_rule,
+                self._compiled_json_rule(code, rule),
+                literals=literals,
+            )
+        builtin = self._BUILTIN_RULES.get(code)
+        if builtin is not None:
+            return getattr(self, builtin)
+        return _pass_rule
+
+    def _effective_weights(self) -> dict[str, float]:
+        """Scoringsgewichten: defaults + config.weights, baseline/ARAI op 0."""
+        weights = dict(self._default_weights)
+        config_weights = getattr(self.config, "weights", None)
+        if config_weights is not None:
+            weights.update(
+                {
+                    k: float(v) if v is not None else self._default_weights.get(k, 0.5)
+                    for k, v in config_weights.items()
+                }
+            )
+
+        # Exclude certain rules from scoring (weight=0):
+        # - Interne baseline regels (self._baseline_internal) - ALLEEN als er ook JSON regels zijn
+        # - ARAI* taalregels (AR**/ARAI**)
+        # NOTE: In fallback mode (alleen baseline regels), moeten deze WEL meegewogen worden
+        has_non_baseline_rules = any(
+            code not in self._baseline_internal for code in self._internal_rules
+        )
+        try:
+            for code in list(weights.keys()):
+                cu = str(code).upper()
+                # Baseline regels alleen uitsluiten als er ook andere regels zijn
+                if has_non_baseline_rules and code in self._baseline_internal:
+                    weights[code] = 0.0
+                elif cu.startswith(("ARAI", "AR-", "AR")):
+                    # Beperk tot ARAI-familie; AR-prefix meegenomen voor compat
+                    weights[code] = 0.0
+        except (KeyError, TypeError, ValueError) as e:
+            # DEF-231: Log baseline rule filter failures with context
+            logger.warning(
+                f"Baseline rule filtering overgeslagen: {type(e).__name__}: {e}",
+                extra={
+                    "component": "modular_validation_service",
+                    "operation": "filter_baseline_rules",
+                    "weights_count": len(weights) if weights else 0,
+                },
+            )
+        return weights
 
     def get_health_status(self) -> dict[str, Any]:
         """DEF-215: Get validation service health status for monitoring/UI.
@@ -342,6 +525,8 @@ class ModularValidationService:
             "rules_expected": self._rules_expected_count,
             "coverage_pct": round(coverage_pct, 1),
             "degradation_reason": self._degradation_reason,
+            "result_cache": self._result_cache.get_stats(),
+            "rule_timing": self._rule_timing.get_stats(),
         }
 
     async def validate_definition(
@@ -350,15 +535,37 @@ class ModularValidationService:
         text: str,
         ontologische_categorie: str | None = None,
         context: dict[str, Any] | None = None,
+        *,
+        gate_only: bool = False,
     ) -> dict[str, Any]:
+        """Valideer een definitie.
+
+        Met ``gate_only=True`` wordt alleen ``is_acceptable`` bepaald (zie
+        ``_validate_gate``): sneller, maar zonder volledige violations/scores.
+        """
         # 1) Correlation ID
+        correlation_id = self._correlation_id_for(context)
+
+        # 2) Cleaning (optioneel, éénmaal)
+        cleaned = await self._clean_text(text, correlation_id)
+        if gate_only:
+            return self._validate_gate(
+                begrip, text, cleaned, ontologische_categorie, context, correlation_id
+            )
+        return self._validate_prepared(
+            begrip, text, cleaned, ontologische_categorie, context, correlation_id
+        )
+
+    @staticmethod
+    def _correlation_id_for(context: dict[str, Any] | None) -> str:
+        """Correlation ID uit de context, anders een nieuwe UUID."""
         correlation_id = None
         if context and isinstance(context, dict):
             correlation_id = context.get("correlation_id")
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+        return correlation_id or str(uuid.uuid4())
 
-        # 2) Cleaning (optioneel, éénmaal)
+    async def _clean_text(self, text: str, correlation_id: str) -> str:
+        """Pas de optionele cleaning service toe; bij fouten blijft de ruwe tekst."""
         cleaned = text
         if self.cleaning_service is not None and hasattr(
             self.cleaning_service, "clean_text"
@@ -386,20 +593,39 @@ class ModularValidationService:
                     },
                 )
                 cleaned = text
+        return cleaned
+
+    def _validate_prepared(
+        self,
+        begrip: str,
+        text: str,
+        cleaned: str,
+        ontologische_categorie: str | None,
+        context: dict[str, Any] | None,
+        correlation_id: str,
+    ) -> dict[str, Any]:
+        """Synchrone kern van validate_definition (na cleaning).
+
+        Bevat uitsluitend CPU-werk en wordt ook door procespool-workers
+        aangeroepen (zie ``process_pool``).
+        """
+        cache_key, context = self._result_cache_key(
+            begrip, text, cleaned, ontologische_categorie, context
+        )
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                cached["system"]["correlation_id"] = correlation_id
+                logger.debug(
+                    "Validation cache hit: begrip='%s', correlation_id=%s",
+                    (begrip or "")[:50],
+                    correlation_id,
+                )
+                return cached
 
         # 3) Context opbouwen (tokens slechts op aanvraag; hier niet nodig)
-        # DEF-244: begrip now passed via context instead of instance variable
-        eval_ctx = EvaluationContext.from_params(
-            text=text,
-            cleaned=cleaned,
-            begrip=begrip,  # DEF-244: Thread-safe begrip passing
-            locale=(context or {}).get("locale") if isinstance(context, dict) else None,
-            profile=(
-                (context or {}).get("profile") if isinstance(context, dict) else None
-            ),
-            correlation_id=correlation_id,
-            tokens=(),
-            metadata=dict(context or {}),
+        eval_ctx = self._build_evaluation_context(
+            begrip, text, cleaned, context, correlation_id
         )
 
         # DEF-251: Log validation start with begrip for observability
@@ -420,52 +646,347 @@ class ModularValidationService:
             },
         )
 
-        # 4) Regels evalueren in deterministische volgorde
-        weights = dict(self._default_weights)
-        config_weights = getattr(self.config, "weights", None)
-        if config_weights is not None:
-            weights.update(
-                {
-                    k: float(v) if v is not None else self._default_weights.get(k, 0.5)
-                    for k, v in config_weights.items()
-                }
+        # 4) Regels evalueren volgens het gecompileerde plan (deterministische volgorde)
+        plan = self._get_rule_plan()
+
+        # DEF-244: begrip is now in eval_ctx.begrip (thread-safe)
+        calls = ((step.code, step.evaluate) for step in plan.steps)
+        if self._rule_timing.enabled:
+            outcomes = self._rule_timing.run_timed(calls, eval_ctx)
+        else:
+            outcomes = ((code, evaluate(eval_ctx)) for code, evaluate in calls)
+        result = self._aggregate_outcomes(eval_ctx, outcomes, plan.weights)
+        if cache_key is not None:
+            self._result_cache.put(cache_key, result)
+        return result
+
+    # ===== Gate-only validatie =====
+    def _validate_gate(
+        self,
+        begrip: str,
+        text: str,
+        cleaned: str,
+        ontologische_categorie: str | None,
+        context: dict[str, Any] | None,
+        correlation_id: str,
+    ) -> dict[str, Any]:
+        """Bepaal alleen acceptatie; stop zodra de uitkomst vaststaat.
+
+        Zolang de overall-drempel >= de zachte ondergrens ligt, geldt:
+        acceptabel ⇔ geen blocking errors én overall >= 0.60. Eerst de
+        tekstheuristieken en regels die blocking errors kunnen geven, daarna de
+        overige regels op gewicht; na iedere regel begrenzen de nog openstaande
+        gewichten de eindscore. Suggesties en het CON-01 duplicate-signaal
+        worden overgeslagen. ``overall_score`` is de ondergrens op het moment
+        van beslissen (exact als alle regels zijn uitgevoerd).
+        """
+        plan = self._get_rule_plan()
+        total_rules = len(plan.steps)
+        if self._overall_threshold < _SOFT_ACCEPT_FLOOR:
+            # Acceptatie hangt dan (ook) af van categorie-gates: volledig valideren
+            full = self._validate_prepared(
+                begrip, text, cleaned, ontologische_categorie, context, correlation_id
+            )
+            score = full["overall_score"]
+            return self._gate_result(
+                full["is_acceptable"],
+                (score, score),
+                [v for v in full["violations"] if _is_blocking_violation(v)],
+                "full_validation",
+                total_rules,
+                total_rules,
+                correlation_id,
             )
 
-        # Exclude certain rules from scoring (weight=0):
-        # - Interne baseline regels (self._baseline_internal) - ALLEEN als er ook JSON regels zijn
-        # - ARAI* taalregels (AR**/ARAI**)
-        # NOTE: In fallback mode (alleen baseline regels), moeten deze WEL meegewogen worden
-        has_non_baseline_rules = any(
-            code not in self._baseline_internal for code in self._internal_rules
+        eval_ctx = self._build_evaluation_context(
+            begrip, text, cleaned, context, correlation_id, gate_only=True
         )
-        try:
-            for code in list(weights.keys()):
-                cu = str(code).upper()
-                # Baseline regels alleen uitsluiten als er ook andere regels zijn
-                if has_non_baseline_rules and code in self._baseline_internal:
-                    weights[code] = 0.0
-                elif cu.startswith(("ARAI", "AR-", "AR")):
-                    # Beperk tot ARAI-familie; AR-prefix meegenomen voor compat
-                    weights[code] = 0.0
-        except (KeyError, TypeError, ValueError) as e:
-            # DEF-231: Log baseline rule filter failures with context
-            logger.warning(
-                f"Baseline rule filtering overgeslagen: {type(e).__name__}: {e}",
-                extra={
-                    "component": "modular_validation_service",
-                    "operation": "filter_baseline_rules",
-                    "weights_count": len(weights) if weights else 0,
-                    "correlation_id": correlation_id,
-                },
+        bounds = (0.0, 0.0)
+        evaluated = 0
+
+        def decide(
+            acceptable: bool, violations: list[dict[str, Any]], decided_by: str
+        ) -> dict[str, Any]:
+            return self._gate_result(
+                acceptable,
+                bounds,
+                violations,
+                decided_by,
+                evaluated,
+                total_rules,
+                correlation_id,
             )
 
+        # 1) Heuristieken uit _aggregate_outcomes die altijd blokkeren
+        raw_text = eval_ctx.effective_text
+        wcount = len(raw_text.split())
+        heuristics = (
+            (self._has_informal_language(raw_text), informal_language_violation),
+            (self._has_mixed_language(raw_text), mixed_language_violation),
+            (wcount < 6, structure_violation),
+            (
+                bool(eval_ctx.lemma) and eval_ctx.lemma in raw_text.lower(),
+                partial(circular_definition_violation, str(begrip)),
+            ),
+        )
+        blockers = [build() for hit, build in heuristics if hit]
+        if blockers:
+            return decide(False, blockers, "blocking_violation")
+
+        # 2) Regels in gate-volgorde; open gewichten begrenzen de eindscore
+        weights = {
+            step.code: w
+            for step in plan.steps
+            if (w := float(plan.weights.get(step.code, 0.0) or 0.0)) > 0
+        }
+        total_w = sum(weights.values())
+        scale = self._length_scale(wcount)
+        pending_weighted = len(weights)
+        pending_blocking = sum(
+            step.code.startswith(_BLOCKING_CODE_PREFIXES) for step in plan.steps
+        )
+        scores: dict[str, float] = {}
+        weighted = 0.0
+        open_w = total_w
+        for step in plan.gate_steps:
+            score, violation = step.evaluate(eval_ctx)
+            evaluated += 1
+            if violation is not None and _is_blocking_violation(violation):
+                return decide(False, [violation], "blocking_violation")
+            scores[step.code] = float(score or 0.0)
+            if step.code in weights:
+                weighted += weights[step.code] * scores[step.code]
+                open_w -= weights[step.code]
+                pending_weighted -= 1
+            if step.code.startswith(_BLOCKING_CODE_PREFIXES):
+                pending_blocking -= 1
+
+            if pending_weighted == 0:
+                # Exact, in dezelfde volgorde als _aggregate_outcomes
+                exact = calculate_weighted_score(
+                    {s.code: scores[s.code] for s in plan.steps if s.code in scores},
+                    weights,
+                )
+                bounds = (round(exact * scale, 2),) * 2
+            else:
+                bounds = (
+                    round(round(weighted / total_w, 2) * scale, 2),
+                    round(round((weighted + open_w) / total_w, 2) * scale, 2),
+                )
+            if bounds[1] < _SOFT_ACCEPT_FLOOR:
+                return decide(False, [], "score_bound")
+            if pending_blocking == 0 and bounds[0] >= _SOFT_ACCEPT_FLOOR:
+                return decide(True, [], "score_bound")
+        return decide(bounds[0] >= _SOFT_ACCEPT_FLOOR, [], "score_bound")
+
+    def _gate_result(
+        self,
+        acceptable: bool,
+        bounds: tuple[float, float],
+        violations: list[dict[str, Any]],
+        decided_by: str,
+        rules_evaluated: int,
+        rules_total: int,
+        correlation_id: str,
+    ) -> dict[str, Any]:
+        """Schema-achtig resultaat van een gate-only validatie."""
+        return {
+            "version": CONTRACT_VERSION,
+            "overall_score": bounds[0],
+            "is_acceptable": bool(acceptable),
+            "violations": violations,
+            "passed_rules": [],
+            "detailed_scores": {},
+            "gate": {
+                "mode": "gate_only",
+                "decided_by": decided_by,
+                "score_bounds": list(bounds),
+                "rules_evaluated": rules_evaluated,
+                "rules_total": rules_total,
+            },
+            "system": {
+                "correlation_id": correlation_id,
+                "degraded_mode": self._is_degraded_mode,
+                "rules_loaded": self._rules_loaded_count,
+                "rules_expected": self._rules_expected_count,
+                "degradation_reason": self._degradation_reason,
+            },
+        }
+
+    # ===== Resultaatcache =====
+    def _result_cache_key(
+        self,
+        begrip: str,
+        text: str,
+        cleaned: str,
+        ontologische_categorie: str | None,
+        context: dict[str, Any] | None,
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """Cachesleutel (None als het resultaat niet cachebaar is) en context.
+
+        Een voor de sleutel opgezochte CON-01 match staat in de teruggegeven
+        context onder ``__con01_duplicate__``, zodat CON-01 hem hergebruikt.
+        """
+        cache = self._result_cache
+        if not cache.enabled:
+            return None, context
+        version = self._get_rule_set_version()
+        if version is None:
+            cache.record_bypass()
+            return None, context
+        if self._depends_on_repository(begrip, context):
+            # CON-01 duplicate signaal hangt af van de (veranderlijke) repository:
+            # de geïndexeerde lookup is goedkoop, dus neem de match op in de sleutel
+            try:
+                duplicate = self._find_duplicate_definition(
+                    begrip,
+                    context.get("organisatorische_context") or [],
+                    context.get("juridische_context") or [],
+                    context.get("wettelijke_basis") or [],
+                    context,
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Duplicate lookup voor cachesleutel gefaald: {type(e).__name__}: {e}"
+                )
+                cache.record_bypass()
+                return None, context
+            context = {**context, "__con01_duplicate__": duplicate}
+        cache.set_version(version)
+        key = make_cache_key(
+            version, begrip, text, cleaned, ontologische_categorie, context
+        )
+        return key, context
+
+    def _depends_on_repository(
+        self, begrip: str, context: dict[str, Any] | None
+    ) -> bool:
+        """True als CON-01 voor deze invoer de repository raadpleegt."""
+        if (
+            self._repository is None
+            or not begrip
+            or not isinstance(context, dict)
+            or not self._has_duplicate_lookup()
+        ):
+            return False
+        return any(
+            context.get(key)
+            for key in (
+                "organisatorische_context",
+                "juridische_context",
+                "wettelijke_basis",
+            )
+        )
+
+    def _get_rule_set_version(self) -> str | None:
+        """Regelset-versie: fingerprint van plan, evaluatiecode en drempels."""
+        plan = self._get_rule_plan()
+        cached = self._rule_set_version
+        if cached is None or cached[0] is not plan:
+            codes = [step.code for step in plan.steps]
+            try:
+                fingerprints = rule_fingerprints(codes, self._json_rules)
+                engine = engine_fingerprint()
+            except OSError as e:
+                logger.warning(
+                    f"Regelset-fingerprint niet beschikbaar, cache overgeslagen: {e}"
+                )
+                return None
+            plan_version = hashlib.sha256(
+                json.dumps(
+                    [engine, fingerprints, plan.weights], sort_keys=True
+                ).encode()
+            ).hexdigest()
+            cached = (plan, plan_version)
+            self._rule_set_version = cached
+        state = json.dumps(
+            [
+                cached[1],
+                self._overall_threshold,
+                self._category_threshold,
+                self._is_degraded_mode,
+                self._rules_loaded_count,
+                self._rules_expected_count,
+                self._degradation_reason,
+            ],
+            default=str,
+        )
+        return hashlib.sha256(state.encode()).hexdigest()
+
+    def _build_evaluation_context(
+        self,
+        begrip: str,
+        text: str,
+        cleaned: str,
+        context: dict[str, Any] | None,
+        correlation_id: str,
+        *,
+        gate_only: bool = False,
+    ) -> EvaluationContext:
+        # DEF-244: begrip now passed via context instead of instance variable
+        return EvaluationContext.from_params(
+            text=text,
+            cleaned=cleaned,
+            begrip=begrip,  # DEF-244: Thread-safe begrip passing
+            locale=(context or {}).get("locale") if isinstance(context, dict) else None,
+            profile=(
+                (context or {}).get("profile") if isinstance(context, dict) else None
+            ),
+            correlation_id=correlation_id,
+            tokens=(),
+            metadata=dict(context or {}),
+            gate_only=gate_only,
+        )
+
+    def validate_with_cached_outcomes(
+        self,
+        begrip: str,
+        text: str,
+        cached: Mapping[str, RuleOutcome],
+        ontologische_categorie: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, RuleOutcome]]:
+        """Valideer met hergebruik van eerder berekende regeluitkomsten.
+
+        Alleen regels zonder uitkomst in ``cached`` (plus regels met
+        context-bijwerkingen, zie ``_CONTEXT_SIDE_EFFECT_RULES``) worden
+        uitgevoerd; de aggregatie (scores, heuristieken, acceptatie) draait
+        altijd volledig. Geen cleaning: ``text`` wordt als opgeschoond beschouwd.
+        ``ontologische_categorie`` en ``context`` zoals bij ``validate_definition``
+        (de regels lezen de categorie uit ``context["categorie"]``).
+
+        Returns:
+            (resultaat-dict, nieuw berekende uitkomsten per regelcode)
+        """
+        correlation_id = self._correlation_id_for(context)
+        eval_ctx = self._build_evaluation_context(
+            begrip, text, text, context, correlation_id
+        )
+        plan = self._get_rule_plan()
+
+        evaluated: dict[str, RuleOutcome] = {}
+        outcomes: list[tuple[str, Any]] = []
+        for step in plan.steps:
+            out = cached.get(step.code)
+            if out is None or step.code in _CONTEXT_SIDE_EFFECT_RULES:
+                out = step.evaluate(eval_ctx)
+                evaluated[step.code] = out
+            outcomes.append((step.code, out))
+        return self._aggregate_outcomes(eval_ctx, outcomes, plan.weights), evaluated
+
+    def _aggregate_outcomes(
+        self,
+        eval_ctx: EvaluationContext,
+        outcomes: Iterable[tuple[str, Any]],
+        weights: dict[str, float],
+    ) -> dict[str, Any]:
+        """Regeluitkomsten → gewogen score, heuristieken, acceptatie en resultaat."""
+        correlation_id = eval_ctx.correlation_id
         rule_scores: dict[str, float] = {}
         violations: list[dict[str, Any]] = []
         passed_rules: list[str] = []
 
-        # DEF-244: begrip is now in eval_ctx.begrip (thread-safe)
-        for code in sorted(self._internal_rules):
-            out = self._evaluate_rule(code, eval_ctx)
+        for code, out in outcomes:
             # Support both (score, violation) tuple and dict-like outputs (for tests that patch the method)
             if isinstance(out, tuple):
                 score, violation = out
@@ -508,8 +1029,8 @@ class ModularValidationService:
         # to align with golden bands (acceptable minimal ≈ 0.60-0.75,
         # high quality ≥ 0.75, perfect ≥ 0.80).
         try:
-            raw = (eval_ctx.cleaned_text or eval_ctx.raw_text or "").strip()
-            wcount = len(raw.split()) if raw else 0
+            raw_text = eval_ctx.effective_text
+            wcount = len(raw_text.split()) if raw_text else 0
         except (AttributeError, TypeError) as e:
             # DEF-231: Log word count calculation failures
             logger.debug(
@@ -520,34 +1041,12 @@ class ModularValidationService:
                     "correlation_id": correlation_id,
                 },
             )
+            raw_text = ""
             wcount = 0
 
-        scale = 1.0
-        if wcount < 12:
-            scale = 0.75
-        elif wcount < 20:
-            scale = 0.9
-        elif wcount > 100:
-            scale = 0.85
-        elif wcount > 60:
-            scale = 0.9
-
-        overall = round(overall * scale, 2)
+        overall = round(overall * self._length_scale(wcount), 2)
 
         # Extra heuristics (language/structure) to align with golden expectations
-        try:
-            raw_text = (eval_ctx.cleaned_text or eval_ctx.raw_text or "").strip()
-        except (AttributeError, TypeError) as e:
-            # DEF-231: Log raw text extraction failures
-            logger.debug(
-                f"Raw text extractie gefaald, default naar leeg: {type(e).__name__}: {e}",
-                extra={
-                    "component": "modular_validation_service",
-                    "operation": "raw_text_extraction",
-                    "correlation_id": correlation_id,
-                },
-            )
-            raw_text = ""
         # Informal language
         if self._has_informal_language(raw_text):
             violations.append(informal_language_violation())
@@ -668,26 +1167,9 @@ class ModularValidationService:
             }
 
         # Blocking errors check: bepaalde violations blokkeren ALTIJD acceptatie
-        def _has_blocking_errors(vs: list[dict[str, Any]]) -> bool:
-            for v in vs or []:
-                if str(v.get("severity", "")).lower() != "error":
-                    continue
-                code = str(v.get("code", ""))
-                if code.startswith(
-                    (
-                        "VAL-EMP",
-                        "CON-CIRC",
-                        "VAL-LEN-002",
-                        "LANG-",
-                        "STR-FORM-001",
-                    )
-                ):
-                    return True
-            return False
-
-        has_blockers = _has_blocking_errors(violations)
+        has_blockers = any(_is_blocking_violation(v) for v in violations)
         # Soft floor: score >= 0.60 zonder blocking errors (0.60 = acceptabel minimaal)
-        soft_ok = (overall >= 0.60) and (not has_blockers)
+        soft_ok = (overall >= _SOFT_ACCEPT_FLOOR) and (not has_blockers)
         # Blocking errors overrulen de acceptance gate
         gate_ok = bool(acceptance_gate.get("acceptable", False)) and (not has_blockers)
         is_ok = gate_ok or soft_ok
@@ -716,6 +1198,19 @@ class ModularValidationService:
         # De orchestrator verwacht een dict, niet een wrapper
         return result
 
+    @staticmethod
+    def _length_scale(wcount: int) -> float:
+        """Schaalfactor voor de overall score op basis van het aantal woorden."""
+        if wcount < 12:
+            return 0.75
+        if wcount < 20:
+            return 0.9
+        if wcount > 100:
+            return 0.85
+        if wcount > 60:
+            return 0.9
+        return 1.0
+
     def _has_informal_language(self, text: str) -> bool:
         try:
             import re
@@ -765,86 +1260,97 @@ class ModularValidationService:
     def _evaluate_rule(
         self, code: str, ctx: EvaluationContext
     ) -> tuple[float, dict[str, Any] | None]:
+        """Evalueer één regel via losse dispatch (referentie voor het plan)."""
         # JSON rule evaluation path (when ToetsregelManager provided)
-        if hasattr(self, "_json_rules") and code in getattr(self, "_json_rules", {}):
+        if code in self._json_rules:
             return self._evaluate_json_rule(code, self._json_rules[code], ctx)
 
-        text = ctx.cleaned_text or ""
-        # Normalisaties
-        text_norm = text.strip()
-        words = len(text_norm.split()) if text_norm else 0
-        chars = len(text_norm)
+        builtin = self._BUILTIN_RULES.get(code)
+        if builtin is None:
+            # Onbekende regelcode → pass
+            return _pass_rule(ctx)
+        return getattr(self, builtin)(ctx)
 
+    # Ingebouwde baseline regels (gebruikt zonder JSON-definitie)
+    def _rule_empty(self, ctx: EvaluationContext) -> RuleOutcome:
         # Leegte
-        if code == "VAL-EMP-001":
-            if chars == 0:
-                return 0.0, empty_definition_violation()
-            return 0.9, None
+        if ctx.char_count == 0:
+            return 0.0, empty_definition_violation()
+        return 0.9, None
 
+    def _rule_too_short(self, ctx: EvaluationContext) -> RuleOutcome:
         # Te kort
-        if code == "VAL-LEN-001":
-            if words < 5 or chars < 15:
-                return 0.0, too_short_violation()
-            if words < 12 or chars < 40:
-                return 0.7, None
-            if words < 25:
-                return 0.85, None
-            return 0.9, None
-
+        words, chars = ctx.word_count, ctx.char_count
+        if words < 5 or chars < 15:
+            return 0.0, too_short_violation()
+        if words < 12 or chars < 40:
+            return 0.7, None
+        if words < 25:
+            return 0.85, None
+        return 0.9, None
+
+    def _rule_too_long(self, ctx: EvaluationContext) -> RuleOutcome:
         # Te lang
-        if code == "VAL-LEN-002":
-            if words > 80 or chars > 600:
-                return 0.0, too_long_violation()
-            if words > 60 or chars > 450:
-                return 0.85, None
-            return 0.95, None
-
+        words, chars = ctx.word_count, ctx.char_count
+        if words > 80 or chars > 600:
+            return 0.0, too_long_violation()
+        if words > 60 or chars > 450:
+            return 0.85, None
+        return 0.95, None
+
+    def _rule_essential_content(self, ctx: EvaluationContext) -> RuleOutcome:
         # Essentiële inhoud aanwezig (heel grof: voldoende informatiedichtheid)
-        if code == "ESS-CONT-001":
-            if words < 6:
-                return 0.0, essential_content_violation()
-            if words < 12:
-                return 0.65, None
-            return 0.9, None
-
+        words = ctx.word_count
+        if words < 6:
+            return 0.0, essential_content_violation()
+        if words < 12:
+            return 0.65, None
+        return 0.9, None
+
+    def _rule_circular(self, ctx: EvaluationContext) -> RuleOutcome:
         # Circulair (begrip in definitie)
         # DEF-244: Use ctx.begrip instead of instance variable
-        if code == "CON-CIRC-001":
-            begrip = ctx.begrip or None
-            if begrip:
-                pattern = rf"\b{re.escape(str(begrip))}\b"
-                found = bool(re.search(pattern, text_norm, re.IGNORECASE))
-                if not found:
-                    # Fallback: naive contains check in lowercase with added spaces
-                    tn = f" {text_norm.lower()} "
-                    gb = f" {str(begrip).strip().lower()} "
-                    found = gb in tn
-                if found:
-                    return 0.0, circular_definition_violation(str(begrip))
-            return 1.0, None
+        begrip = ctx.begrip or None
+        if begrip:
+            found = bool(ctx.begrip_pattern.search(ctx.text_norm))
+            if not found:
+                # Fallback: naive contains check in lowercase with added spaces
+                found = f" {ctx.lemma} " in f" {ctx.text_lower} "
+            if found:
+                return 0.0, circular_definition_violation(str(begrip))
+        return 1.0, None
 
+    def _rule_terminology(self, ctx: EvaluationContext) -> RuleOutcome:
         # Terminologie/structuur kleine kwestie (bijv. ontbrekende koppelteken)
-        if code == "STR-TERM-001":
-            if "HTTP protocol" in text_norm:
-                return 0.0, terminology_violation("HTTP protocol")
-            return 0.95, None
+        if "HTTP protocol" in ctx.text_norm:
+            return 0.0, terminology_violation("HTTP protocol")
+        return 0.95, None
 
+    def _rule_organization(self, ctx: EvaluationContext) -> RuleOutcome:
         # Organisatie/structuur (lange aaneengeregen zin of herhalingen)
-        if code == "STR-ORG-001":
-            long_sentence = chars > 300 and text_norm.count(",") >= 6
-            redundancy = bool(
-                re.search(
-                    r"\bsimpel\b.*\bcomplex\b|\bcomplex\b.*\bsimpel\b",
-                    text_norm,
-                    re.IGNORECASE,
-                )
-            )
-            if long_sentence or redundancy:
-                return 0.0, organization_violation()
-            return 0.9, None
-
-        # Onbekende regelcode → pass
-        return 1.0, None
+        long_sentence = ctx.char_count > 300 and ctx.comma_count >= 6
+        redundancy = bool(_STR_ORG_REDUNDANCY_RE.search(ctx.text_norm))
+        if long_sentence or redundancy:
+            return 0.0, organization_violation()
+        return 0.9, None
+
+    _BUILTIN_RULES: dict[str, str] = {
+        "VAL-EMP-001": "_rule_empty",
+        "VAL-LEN-001": "_rule_too_short",
+        "VAL-LEN-002": "_rule_too_long",
+        "ESS-CONT-001": "_rule_essential_content",
+        "CON-CIRC-001": "_rule_circular",
+        "STR-TERM-001": "_rule_terminology",
+        "STR-ORG-001": "_rule_organization",
+    }
+
+    # JSON regels met een eigen evaluator (signature: rule, ctx)
+    _JSON_SPECIAL_RULES: dict[str, str] = {
+        "ESS-02": "_eval_ess02",
+        "VER-03": "_eval_ver03",
+        "SAM-02": "_eval_sam02",
+        "SAM-04": "_eval_sam04",
+    }
 
     def _evaluate_json_rule(
         self, code: str, rule: dict[str, Any], ctx: EvaluationContext
@@ -860,159 +1366,162 @@ class ModularValidationService:
         - STR-ORG heuristiek (min_commas + max_chars) en redundancy_patterns
         - En een aantal bekende special-cases (ESS-02, CON-02, ESS-03/04/05, VER-01)
         """
-        text = ctx.cleaned_text or ""
-        text_norm = text.strip()
-        words = len(text_norm.split()) if text_norm else 0
-        chars = len(text_norm)
-        code_up = code.upper()
-        severity = self._severity_for_json_rule(rule)
-        messages: list[str] = []
-        suggestions: list[str] = []
+        special = self._JSON_SPECIAL_RULES.get(code.upper())
+        if special is not None:
+            return getattr(self, special)(rule, ctx)
+        return self._run_json_rule(self._compiled_json_rule(code, rule), ctx)
+
+    def _compiled_json_rule(self, code: str, rule: dict[str, Any]) -> CompiledJsonRule:
+        """Compileer een JSON regel (patronen, drempels, severity) met cache per code."""
+        cached = self._compiled_json_cache.get(code)
+        if cached is not None and cached.rule is rule:
+            return cached
+        compiled = CompiledJsonRule.from_rule(
+            code,
+            rule,
+            severity=self._severity_for_json_rule(rule),
+            severity_level=self._severity_level_for_json_rule(rule),
+            category=category_for_rule(code),
+        )
+        self._compiled_json_cache[code] = compiled
+        return compiled
 
-        # Special: ESS-02 (ontologische categorie eenduidigheid)
-        if code_up == "ESS-02":
-            return self._eval_ess02(rule, text, ctx)
+    def _eval_ver03(self, rule: dict[str, Any], ctx: EvaluationContext) -> RuleOutcome:
+        """VER-03 — werkwoord-term in infinitief (controleer begrip/lemma)."""
+        # DEF-244: Use ctx.begrip instead of instance variable
+        lemma = ctx.lemma
+        if lemma and re.search(r".+[td]$", lemma):
+            msg = "Werkwoord-term niet in infinitief (eindigt op -t/-d)"
+            return 0.0, {
+                "code": "VER-03",
+                "severity": self._severity_for_json_rule(rule),
+                "severity_level": self._severity_level_for_json_rule(rule),
+                "message": msg,
+                "description": msg,
+                "rule_id": "VER-03",
+                "category": category_for_rule("VER-03"),
+                "suggestion": "Gebruik de onbepaalde wijs (infinitief), bijv. 'beoordelen' i.p.v. 'beoordeelt'.",
+            }
+        # Geen issue
+        return 1.0, None
 
-        # Special: VER-03 — werkwoord-term in infinitief (controleer begrip/lemma)
+    def _eval_sam02(self, rule: dict[str, Any], ctx: EvaluationContext) -> RuleOutcome:
+        """SAM-02 — kwalificatie omvat geen herhaling/conflict."""
         # DEF-244: Use ctx.begrip instead of instance variable
-        if code_up == "VER-03":
-            lemma = str(ctx.begrip or "").strip()
-            if lemma and re.search(r".+[td]$", lemma.lower()):
-                msg = "Werkwoord-term niet in infinitief (eindigt op -t/-d)"
+        parts = ctx.lemma.split()
+        head = parts[-1] if len(parts) >= 2 else None
+
+        # Detect: definitietekst lijkt de basisdefinitie te herhalen of definieert het hoofdbegrip i.p.v. het gekwalificeerde begrip
+        text_l = ctx.text_lower
+        if head:
+            # 1) Definieer niet het hoofdbegrip (bv. "delict: ...") maar het gekwalificeerde begrip
+            if text_l.startswith(f"{head}:"):
+                msg = "Kwalificatie definieert het hoofdbegrip in plaats van het gekwalificeerde begrip"
                 return 0.0, {
-                    "code": code_up,
+                    "code": "SAM-02",
                     "severity": self._severity_for_json_rule(rule),
-                    "severity_level": self._severity_level_for_json_rule(rule),
                     "message": msg,
                     "description": msg,
-                    "rule_id": code_up,
-                    "category": category_for_rule(code_up),
-                    "suggestion": "Gebruik de onbepaalde wijs (infinitief), bijv. 'beoordelen' i.p.v. 'beoordeelt'.",
+                    "rule_id": "SAM-02",
+                    "category": category_for_rule("SAM-02"),
+                    "suggestion": "Begin met het gekwalificeerde begrip en gebruik genus+differentia zonder de basisdefinitie te herhalen.",
                 }
-            # Geen issue
-            return 1.0, None
 
-        # Special: SAM-02 — kwalificatie omvat geen herhaling/conflict
+            # 2) Heuristische detectie van herhaling van bekende basisfrase (bv. strafbepaling-zin)
+            if head in text_l and (
+                "binnen de grenzen van" in text_l
+                or "wettelijke strafbepaling" in text_l
+            ):
+                msg = "Kwalificatie bevat (gedeelten van) de basisdefinitie van het hoofdbegrip"
+                return 0.0, {
+                    "code": "SAM-02",
+                    "severity": self._severity_for_json_rule(rule),
+                    "message": msg,
+                    "description": msg,
+                    "rule_id": "SAM-02",
+                    "category": category_for_rule("SAM-02"),
+                    "suggestion": "Gebruik genus+differentia: noem het hoofdbegrip kort (bv. 'delict') en voeg alleen het onderscheidende criterium toe.",
+                }
+
+        # Geen issues gevonden → pass
+        return 1.0, None
+
+    def _eval_sam04(self, rule: dict[str, Any], ctx: EvaluationContext) -> RuleOutcome:
+        """SAM-04 — samenstelling: definitie start met specialiserend component (genus)."""
+        text_l = ctx.text_lower
+        # Extract eerste woord na ':'
+        first_token = None
+        if ":" in text_l:
+            body = text_l.split(":", 1)[1].strip()
+            first_token = (body.split() or [""])[0]
+
         # DEF-244: Use ctx.begrip instead of instance variable
-        if code_up == "SAM-02":
-            head = None
-            try:
-                begrip_full = (ctx.begrip or "").strip().lower()
-                parts = begrip_full.split()
-                if len(parts) >= 2:
-                    head = parts[-1]
-            except (IndexError, AttributeError) as e:
-                # DEF-231: Log SAM-02 head extraction failures
-                logger.debug(
-                    f"SAM-02 head extractie overgeslagen: {type(e).__name__}: {e}",
-                    extra={
-                        "component": "modular_validation_service",
-                        "rule_id": "SAM-02",
-                    },
+        begrip_full = ctx.lemma
+        # Heuristiek: bij samenstellingen zonder spatie moet het eerste woord een substring van het begrip zijn
+        if first_token and begrip_full and " " not in begrip_full:
+            if first_token not in begrip_full:
+                msg = (
+                    "Samenstelling start niet met het specialiserende component (genus)"
                 )
-                head = None
-
-            # Detect: definitietekst lijkt de basisdefinitie te herhalen of definieert het hoofdbegrip i.p.v. het gekwalificeerde begrip
-            text_l = (text or "").strip().lower()
-            if head:
-                # 1) Definieer niet het hoofdbegrip (bv. "delict: ...") maar het gekwalificeerde begrip
-                if text_l.startswith(f"{head}:"):
-                    msg = "Kwalificatie definieert het hoofdbegrip in plaats van het gekwalificeerde begrip"
-                    return 0.0, {
-                        "code": code_up,
-                        "severity": self._severity_for_json_rule(rule),
-                        "message": msg,
-                        "description": msg,
-                        "rule_id": code_up,
-                        "category": category_for_rule(code_up),
-                        "suggestion": "Begin met het gekwalificeerde begrip en gebruik genus+differentia zonder de basisdefinitie te herhalen.",
-                    }
-
-                # 2) Heuristische detectie van herhaling van bekende basisfrase (bv. strafbepaling-zin)
-                if head in text_l and (
-                    "binnen de grenzen van" in text_l
-                    or "wettelijke strafbepaling" in text_l
-                ):
-                    msg = "Kwalificatie bevat (gedeelten van) de basisdefinitie van het hoofdbegrip"
-                    return 0.0, {
-                        "code": code_up,
-                        "severity": self._severity_for_json_rule(rule),
-                        "message": msg,
-                        "description": msg,
-                        "rule_id": code_up,
-                        "category": category_for_rule(code_up),
-                        "suggestion": "Gebruik genus+differentia: noem het hoofdbegrip kort (bv. 'delict') en voeg alleen het onderscheidende criterium toe.",
-                    }
-
-            # Geen issues gevonden → pass
-            return 1.0, None
+                return 0.0, {
+                    "code": "SAM-04",
+                    "severity": self._severity_for_json_rule(rule),
+                    "message": msg,
+                    "description": msg,
+                    "rule_id": "SAM-04",
+                    "category": category_for_rule("SAM-04"),
+                    "suggestion": "Laat de definitie beginnen met het genus uit de samenstelling (bv. 'model …' bij 'procesmodel').",
+                }
 
-        # Special: SAM-04 — samenstelling: definitie start met specialiserend component (genus)
-        if code_up == "SAM-04":
-            text_l = (text or "").strip().lower()
-            # Extract eerste woord na ':'
-            first_token = None
-            if ":" in text_l:
-                try:
-                    body = text_l.split(":", 1)[1].strip()
-                    first_token = (body.split() or [""])[0]
-                except (IndexError, AttributeError) as e:
-                    # DEF-248: Log SAM-04 parsing failures - may indicate malformed definition text
-                    logger.debug(f"SAM-04 first token extraction failed: {e}")
-                    first_token = None
+        return 1.0, None
 
-            # DEF-244: Use ctx.begrip instead of instance variable
-            begrip_full = (ctx.begrip or "").strip().lower()
-            # Heuristiek: bij samenstellingen zonder spatie moet het eerste woord een substring van het begrip zijn
-            if first_token and begrip_full and " " not in begrip_full:
-                if first_token not in begrip_full:
-                    msg = "Samenstelling start niet met het specialiserende component (genus)"
-                    return 0.0, {
-                        "code": code_up,
-                        "severity": self._severity_for_json_rule(rule),
-                        "message": msg,
-                        "description": msg,
-                        "rule_id": code_up,
-                        "category": category_for_rule(code_up),
-                        "suggestion": "Laat de definitie beginnen met het genus uit de samenstelling (bv. 'model …' bij 'procesmodel').",
-                    }
+    def _run_json_rule(
+        self,
+        compiled: CompiledJsonRule,
+        ctx: EvaluationContext,
+        literals: frozenset[str] | None = None,
+    ) -> RuleOutcome:
+        """Generieke evaluatie van een gecompileerde JSON regel.
 
-            return 1.0, None
+        ``literals`` is de literal-index van het uitvoeringsplan; de scan daarvan
+        wordt via ``ctx`` gedeeld door alle regels. Zonder plan volstaan de
+        literals van de regel zelf.
+        """
+        code, code_up, rule = compiled.code, compiled.code_up, compiled.rule
+        present = ctx.present_literals(
+            compiled.literals if literals is None else literals
+        )
+        text = ctx.cleaned_text or ""
+        text_norm = ctx.text_norm
+        words = ctx.word_count
+        chars = ctx.char_count
+        messages: list[str] = []
+        suggestions: list[str] = []
 
-        # Duplicate context signal voor CON-01
-        if code_up == "CON-01":
+        # Duplicate context signal voor CON-01 (niet nodig voor gate-only)
+        if code_up == "CON-01" and not ctx.gate_only:
             self._maybe_add_duplicate_context_signal(ctx)
 
-        # 1) Forbidden regex patterns
-        patterns = rule.get("herkenbaar_patronen", []) or []
-        # Legacy-compatible additional patterns (centralized)
-        from validation.additional_patterns import get_additional_patterns
-
-        extra = get_additional_patterns(code_up)
-        if extra:
-            # Preserve order and de-duplicate
-            patterns = list(dict.fromkeys([*patterns, *extra]))
-        compiled = self._compiled_json_cache.get(code_up)
-        if compiled is None:
-            try:
-                compiled = [re.compile(pat, re.IGNORECASE) for pat in patterns]
-            except re.error:
-                compiled = []
-            self._compiled_json_cache[code_up] = compiled
-
+        # 1) Forbidden regex patterns (vooraf gecompileerd, incl. additional patterns)
         pattern_hits: list[str] = []
         first_hit_pattern: str | None = None
         first_hit_pos: int | None = None
-        for pat in compiled:
-            for m in pat.finditer(text):
-                pattern_hits.append(pat.pattern)
-                if first_hit_pos is None or (m and m.start() < first_hit_pos):
-                    first_hit_pos = m.start()
-                    first_hit_pattern = pat.pattern
+        # Alleen aanwezigheid en eerste positie per patroon tellen: search volstaat
+        for scan in compiled.patterns.matchable(present):
+            m = scan.regex.search(text)
+            if m is None:
+                continue
+            pattern_hits.append(scan.pattern)
+            if first_hit_pos is None or m.start() < first_hit_pos:
+                first_hit_pos = m.start()
+                first_hit_pattern = scan.pattern
+
+        # Regels met alleen herkenbare patronen: zonder hit is er niets meer te toetsen
+        if not pattern_hits and compiled.patterns_only:
+            return 1.0, None
 
         # Sommige regels gebruiken patterns als POSITIEF signaal (presence is goed)
-        positive_pattern_rules = {"CON-02", "ESS-03", "ESS-04", "ESS-05"}
-        if pattern_hits and code_up not in positive_pattern_rules:
+        if pattern_hits and not compiled.positive_patterns:
             pat_list = ", ".join(sorted(set(pattern_hits)))
             messages.append(f"Verboden patroon gedetecteerd: {pat_list}")
             suggestions.append(
@@ -1029,10 +1538,10 @@ class ModularValidationService:
         # 2) STR-01 special-case: check start ná ':'
         if code_up == "STR-01":
             try:
-                body = text.strip()
+                body = text_norm
                 if ":" in body:
                     body = body.split(":", 1)[1].lstrip()
-                if re.match(r"^(is|de|het|een|wordt|betreft)\\b", body, re.IGNORECASE):
+                if _STR01_START_RE.match(body):
                     messages.append(
                         "Start niet met zelfstandig naamwoord (hulpwoord/artikel gedetecteerd)"
                     )
@@ -1051,13 +1560,11 @@ class ModularValidationService:
                 )
 
         # 3) Required patterns
-        req_patterns = rule.get("required_patterns", []) or []
+        req_patterns = compiled.required_sources
         if req_patterns:
-            try:
-                req_compiled = [re.compile(p, re.IGNORECASE) for p in req_patterns]
-            except re.error:
-                req_compiled = []
-            if not any(rc.search(text) for rc in req_compiled):
+            if not any(
+                scan.regex.search(text) for scan in compiled.required.matchable(present)
+            ):
                 messages.append("Vereist patroon niet gevonden")
                 suggestions.append(
                     self._build_suggestion_for_violation(
@@ -1071,7 +1578,7 @@ class ModularValidationService:
                 )
 
         # 4) Forbidden phrases (substring)
-        for phrase in rule.get("forbidden_phrases", []) or []:
+        for phrase in compiled.forbidden_phrases:
             if phrase and phrase in text_norm:
                 messages.append(f"Verboden term: '{phrase}'")
                 suggestions.append(
@@ -1086,8 +1593,8 @@ class ModularValidationService:
                 )
 
         # 5) Numeric constraints
-        min_words = rule.get("min_words")
-        if isinstance(min_words, int) and words < min_words:
+        min_words = compiled.min_words
+        if min_words is not None and words < min_words:
             messages.append(f"Te weinig woorden (min {min_words})")
             suggestions.append(
                 self._build_suggestion_for_violation(
@@ -1095,8 +1602,8 @@ class ModularValidationService:
                 )
             )
 
-        max_words = rule.get("max_words")
-        if isinstance(max_words, int) and words > max_words:
+        max_words = compiled.max_words
+        if max_words is not None and words > max_words:
             messages.append(f"Te veel woorden (max {max_words})")
             suggestions.append(
                 self._build_suggestion_for_violation(
@@ -1104,8 +1611,8 @@ class ModularValidationService:
                 )
             )
 
-        min_chars = rule.get("min_chars")
-        if isinstance(min_chars, int) and chars < min_chars:
+        min_chars = compiled.min_chars
+        if min_chars is not None and chars < min_chars:
             messages.append(f"Te weinig tekens (min {min_chars})")
             suggestions.append(
                 self._build_suggestion_for_violation(
@@ -1113,8 +1620,8 @@ class ModularValidationService:
                 )
             )
 
-        max_chars = rule.get("max_chars")
-        if isinstance(max_chars, int) and chars > max_chars:
+        max_chars = compiled.max_chars
+        if max_chars is not None and chars > max_chars:
             messages.append(f"Te veel tekens (max {max_chars})")
             suggestions.append(
                 self._build_suggestion_for_violation(
@@ -1124,11 +1631,9 @@ class ModularValidationService:
 
         # 6) Circular definition (begrip in definitie)
         # DEF-244: Use ctx.begrip instead of instance variable
-        if rule.get("circular_definition"):
+        if compiled.circular:
             begrip = ctx.begrip or None
-            if begrip and re.search(
-                rf"\b{re.escape(str(begrip))}\b", text_norm, re.IGNORECASE
-            ):
+            if begrip and ctx.begrip_pattern.search(text_norm):
                 messages.append("Circulaire definitie: begrip komt letterlijk voor")
                 suggestions.append(
                     self._build_suggestion_for_violation(
@@ -1137,9 +1642,9 @@ class ModularValidationService:
                 )
 
         # 7) STR-ORG heuristics: min_commas + max_chars als samen-conditie
-        min_commas = rule.get("min_commas")
-        if isinstance(min_commas, int) and isinstance(max_chars, int):
-            if text_norm.count(",") >= min_commas and chars > max_chars:
+        min_commas = compiled.min_commas
+        if min_commas is not None and max_chars is not None:
+            if ctx.comma_count >= min_commas and chars > max_chars:
                 messages.append(
                     f"Zinsstructuur: veel komma's (≥{min_commas}) en te lang (> {max_chars} tekens)"
                 )
@@ -1155,12 +1660,9 @@ class ModularValidationService:
                 )
 
         # 8) Redundancy patterns
-        for rpat in rule.get("redundancy_patterns", []) or []:
-            try:
-                rre = re.compile(rpat, re.IGNORECASE)
-            except re.error:
-                continue
-            if rre.search(text_norm):
+        for scan in compiled.redundancy.matchable(present):
+            rpat = scan.pattern
+            if scan.regex.search(text_norm):
                 messages.append("Redundantie/tegenstrijdigheid gedetecteerd")
                 suggestions.append(
                     self._build_suggestion_for_violation(
@@ -1226,12 +1728,12 @@ class ModularValidationService:
             # Belangrijk: description blijft gelijk aan message (tests verwachten dit)
             vio: dict[str, Any] = {
                 "code": code,
-                "severity": severity,
-                "severity_level": self._severity_level_for_json_rule(rule),
+                "severity": compiled.severity,
+                "severity_level": compiled.severity_level,
                 "message": description,
                 "description": description,
                 "rule_id": code,
-                "category": category_for_rule(code),
+                "category": compiled.category,
                 "suggestion": suggestion_text,
             }
             # Optionele metadata (eerste match en positie)
@@ -1275,6 +1777,8 @@ class ModularValidationService:
         details: str | None = None,
     ) -> str:
         """Genereer concrete NL-suggestie om een violation te herstellen."""
+        if ctx.gate_only:
+            return ""
         c = (code or "").upper()
         d = (details or "").strip()
 
@@ -1327,40 +1831,16 @@ class ModularValidationService:
 
     # ===== Helper checks (JSON required/structure) =====
     def _has_authentic_source_basis(self, text: str) -> bool:
-        return bool(
-            re.search(
-                r"\b(volgens|conform|gebaseerd|bepaald|bedoeld|wet|regeling)\b",
-                text,
-                re.IGNORECASE,
-            )
-        )
+        return bool(_AUTH_SOURCE_RE.search(text))
 
     def _has_unique_identification(self, text: str) -> bool:
-        return bool(
-            re.search(
-                r"\b(uniek|specifiek|identificeer|registratie|nummer|code|id|vin|isbn|kenteken)\b",
-                text,
-                re.IGNORECASE,
-            )
-        )
+        return bool(_UNIQUE_ID_RE.search(text))
 
     def _has_testable_element(self, text: str) -> bool:
-        return bool(
-            re.search(
-                r"\b(\d+|binnen|na|voor|volgens|conform|gebaseerd op)\b",
-                text,
-                re.IGNORECASE,
-            )
-        )
+        return bool(_TESTABLE_RE.search(text))
 
     def _has_distinguishing_feature(self, text: str) -> bool:
-        return bool(
-            re.search(
-                r"\b(onderscheidt|specifiek|bijzonder|kenmerk|eigenschap)\b",
-                text,
-                re.IGNORECASE,
-            )
-        )
+        return bool(_DISTINGUISHING_RE.search(text))
 
     def _lemma_is_singular(self, begrip: str) -> bool:
         # Heuristic: NL plural often ends with 'en'; whitelist of plurale tantum could be extended
@@ -1374,9 +1854,10 @@ class ModularValidationService:
         return not bool(re.search(r"\w+en$", lemma))
 
     def _eval_ess02(
-        self, rule: dict[str, Any], text: str, ctx: EvaluationContext
+        self, rule: dict[str, Any], ctx: EvaluationContext
     ) -> tuple[float, dict[str, Any] | None]:
         """Implement ESS-02: ontological category must be explicit and unambiguous."""
+        text = ctx.cleaned_text or ""
         # Marker override from context
         marker = None
         try:
@@ -1484,11 +1965,14 @@ class ModularValidationService:
                 return
 
             # Check for repository method
-            if not hasattr(self._repository, "_get_all_definitions"):
+            if not self._has_duplicate_lookup():
                 return
 
-            # Find matching definition
-            found_def = self._find_duplicate_definition(begrip, org, jur, wet, md)
+            # Find matching definition (al opgezocht voor de cachesleutel?)
+            if "__con01_duplicate__" in md:
+                found_def = md["__con01_duplicate__"]
+            else:
+                found_def = self._find_duplicate_definition(begrip, org, jur, wet, md)
             if not found_def:
                 return
 
@@ -1526,8 +2010,23 @@ class ModularValidationService:
         # _repository is guaranteed not None by caller (_maybe_add_duplicate_context_signal)
         if self._repository is None:
             return None
-        defs = self._repository._get_all_definitions()
         cat = md.get("categorie") or md.get("ontologische_categorie")
+        # De gevalideerde definitie zelf is geen duplicaat
+        own_id = md.get("definition_id")
+
+        # Geïndexeerde lookup (begrip-index + genormaliseerde contextsleutel)
+        finder = getattr(self._repository, "find_by_context_key", None)
+        if finder is not None:
+            record = finder(begrip, org, jur, wet, categorie=cat, exclude_id=own_id)
+            if record is None:
+                return None
+            return {
+                "id": getattr(record, "id", None),
+                "status": getattr(record, "status", None),
+            }
+
+        # Fallback: repositories zonder lookup leveren alle definities (O(n))
+        defs = self._repository._get_all_definitions()
 
         org_n = self._normalize_context_list(org)
         jur_n = self._normalize_context_list(jur)
@@ -1535,6 +2034,8 @@ class ModularValidationService:
         begrip_norm = str(begrip).strip().lower()
 
         for d in defs:
+            if own_id is not None and getattr(d, "id", None) == own_id:
+                continue
             # Check begrip match
             if (d.begrip or "").strip().lower() != begrip_norm:
                 continue
@@ -1565,6 +2066,12 @@ class ModularValidationService:
 
         return None
 
+    def _has_duplicate_lookup(self) -> bool:
+        """True als de repository een CON-01 duplicate-context lookup biedt."""
+        return hasattr(self._repository, "find_by_context_key") or hasattr(
+            self._repository, "_get_all_definitions"
+        )
+
     def _normalize_context_list(self, lst: list[str]) -> list[str]:
         """Normalize a list of context strings for comparison."""
         try:
@@ -1627,6 +2134,8 @@ class ModularValidationService:
         from collections import defaultdict
 
         buckets: dict[str, list[float]] = defaultdict(list)
+        # Categorieën van geplande regels liggen al vast in het uitvoeringsplan
+        categories = self._rule_plan.categories if self._rule_plan else {}
         for rid, score in (rule_scores or {}).items():
             try:
                 r = str(rid)
@@ -1634,7 +2143,7 @@ class ModularValidationService:
                 # Skip interne regels en ARAI* bij categorie-aggregatie
                 if r in self._baseline_internal or ru.startswith(("ARAI", "AR-", "AR")):
                     continue
-                cat = category_for_rule(r)
+                cat = categories.get(r) or category_for_rule(r)
                 buckets[cat].append(float(score or 0.0))
             except (TypeError, ValueError) as e:
                 # DEF-248: Log score conversion failures - skip rule but don't crash aggregation
@@ -1693,74 +2202,145 @@ class ModularValidationService:
             },
         }
 
+    # ===== Batchvalidatie =====
+    def rule_set_snapshot(self) -> RuleSetSnapshot:
+        """Picklebare momentopname van regelset en instellingen (voor procespool)."""
+        config_weights = getattr(self.config, "weights", None)
+        repository = self._repository
+        if repository is not None and not self._has_duplicate_lookup():
+            repository = None  # CON-01 duplicaatcheck gebruikt hem dan niet
+        return RuleSetSnapshot(
+            internal_rules=tuple(self._internal_rules),
+            json_rules=dict(self._json_rules),
+            default_weights=dict(self._default_weights),
+            config_weights=(
+                dict(config_weights) if config_weights is not None else None
+            ),
+            overall_threshold=self._overall_threshold,
+            category_threshold=self._category_threshold,
+            is_degraded_mode=self._is_degraded_mode,
+            degradation_reason=self._degradation_reason,
+            rules_loaded_count=self._rules_loaded_count,
+            repository=repository,
+        )
+
+    @classmethod
+    def from_rule_set_snapshot(
+        cls, snapshot: RuleSetSnapshot
+    ) -> ModularValidationService:
+        """Bouw een service zonder ToetsregelManager op basis van een snapshot."""
+        service = cls(repository=snapshot.repository)
+        service._internal_rules = list(snapshot.internal_rules)
+        service._json_rules = dict(snapshot.json_rules)
+        service._default_weights = dict(snapshot.default_weights)
+        if snapshot.config_weights is not None:
+            service.config = SimpleNamespace(weights=dict(snapshot.config_weights))
+        service._overall_threshold = snapshot.overall_threshold
+        service._category_threshold = snapshot.category_threshold
+        service._is_degraded_mode = snapshot.is_degraded_mode
+        service._degradation_reason = snapshot.degradation_reason
+        service._rules_loaded_count = snapshot.rules_loaded_count
+        return service
+
+    @staticmethod
+    def _batch_item_args(
+        item: Any,
+    ) -> tuple[str, str, str | None, dict[str, Any] | None]:
+        """Normaliseer een batch-item naar (begrip, text, categorie, context)."""
+        if hasattr(item, "begrip"):
+            # ValidationRequest object
+            return (
+                item.begrip,
+                item.text,
+                item.ontologische_categorie,
+                item.context.__dict__ if item.context else None,
+            )
+        if isinstance(item, tuple):
+            begrip, text, *rest = item
+            return begrip, text, None, (rest[0] if rest else None)
+        return (
+            item.get("begrip", ""),
+            item.get("text", ""),
+            item.get("ontologische_categorie"),
+            item.get("context"),
+        )
+
     async def batch_validate(
         self,
         items: list[Any],
         max_concurrency: int = 1,
+        *,
+        workers: int | None = None,
+        chunk_size: int | None = None,
     ) -> list[dict[str, Any]]:
         """Batch validatie van meerdere items.
 
         Args:
-            items: List van ValidationRequest objects of tuples
+            items: List van ValidationRequest objects, (begrip, text[, context])
+                tuples of dicts
             max_concurrency: Maximum parallelle validaties (default: sequentieel)
+            workers: Indien gezet: valideer in een procespool met zoveel workers
+                (0 = os.cpu_count()); max_concurrency wordt dan genegeerd
+            chunk_size: Items per procespool-taak (default: DEFAULT_CHUNK_SIZE)
 
         Returns:
             List van ValidationResult dicts in zelfde volgorde als input
         """
         import asyncio
-        from typing import TYPE_CHECKING
-
-        if TYPE_CHECKING:
-            pass
 
         # Handle None or empty list
         if not items:
             return []
 
-        results = []
+        if workers is not None:
+            return await self._batch_validate_in_processes(
+                items, workers=workers, chunk_size=chunk_size
+            )
 
         if max_concurrency == 1:
             # Sequentiële verwerking
+            results = []
             for item in items:
-                if hasattr(item, "begrip"):
-                    # ValidationRequest object
-                    result = await self.validate_definition(
-                        begrip=item.begrip,
-                        text=item.text,
-                        ontologische_categorie=item.ontologische_categorie,
-                        context=item.context.__dict__ if item.context else None,
-                    )
-                elif isinstance(item, tuple):
-                    begrip, text = item
-                    result = await self.validate_definition(begrip, text)
-                else:
-                    result = await self.validate_definition(
-                        item.get("begrip", ""), item.get("text", "")
-                    )
-                results.append(result)
-        else:
-            # Parallelle verwerking met semaphore voor concurrency control
-            semaphore = asyncio.Semaphore(max_concurrency)
-
-            async def validate_with_semaphore(item):
-                async with semaphore:
-                    if hasattr(item, "begrip"):
-                        return await self.validate_definition(
-                            begrip=item.begrip,
-                            text=item.text,
-                            ontologische_categorie=item.ontologische_categorie,
-                            context=item.context.__dict__ if item.context else None,
-                        )
-                    if isinstance(item, tuple):
-                        begrip, text = item
-                        return await self.validate_definition(begrip, text)
-                    return await self.validate_definition(
-                        item.get("begrip", ""), item.get("text", "")
-                    )
+                begrip, text, categorie, context = self._batch_item_args(item)
+                results.append(
+                    await self.validate_definition(begrip, text, categorie, context)
+                )
+            return results
 
-            # Voer alle validaties parallel uit
-            results = await asyncio.gather(
-                *[validate_with_semaphore(item) for item in items]
-            )
+        # Parallelle verwerking met semaphore voor concurrency control
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        return results
+        async def validate_with_semaphore(item):
+            async with semaphore:
+                begrip, text, categorie, context = self._batch_item_args(item)
+                return await self.validate_definition(begrip, text, categorie, context)
+
+        # Voer alle validaties parallel uit
+        return await asyncio.gather(*[validate_with_semaphore(item) for item in items])
+
+    async def _batch_validate_in_processes(
+        self, items: list[Any], *, workers: int, chunk_size: int | None
+    ) -> list[dict[str, Any]]:
+        """Procespool-pad van batch_validate (zie ``process_pool``)."""
+        snapshot = self.rule_set_snapshot()
+        try:
+            pickle.dumps(snapshot)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(
+                f"Regelset niet over te dragen naar procespool, sequentieel verder: {type(e).__name__}: {e}",
+                extra={
+                    "component": "modular_validation_service",
+                    "operation": "batch_validate_processes",
+                },
+            )
+            return await self.batch_validate(items)
+
+        prepared: list[PreparedItem] = []
+        for item in items:
+            begrip, text, categorie, context = self._batch_item_args(item)
+            correlation_id = self._correlation_id_for(context)
+            cleaned = await self._clean_text(text, correlation_id)
+            prepared.append((begrip, text, cleaned, categorie, context, correlation_id))
+        return await validate_in_process_pool(
+            snapshot, prepared, workers=workers, chunk_size=chunk_size
+        )
@@ -0,0 +1,124 @@
+"""Procespool-uitvoering voor batchvalidatie van ModularValidationService.
+
+Het toetsen zelf is puur CPU-werk (regexen, tellingen), dus een asyncio
+semaphore levert geen echte parallelliteit op: alles draait op één core. Deze
+module verdeelt een batch in chunks en valideert die in een
+``ProcessPoolExecutor``.
+
+- De regelset wordt als ``RuleSetSnapshot`` éénmaal per worker meegegeven
+  (initializer); iedere worker compileert daaruit zijn eigen uitvoeringsplan
+  en hergebruikt dat voor alle chunks.
+- Cleaning en correlation IDs worden in het hoofdproces bepaald, zodat de
+  resultaten gelijk zijn aan die van ``validate_definition``.
+- Resultaten komen terug in de volgorde van de input.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .modular_validation_service import ModularValidationService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 32
+
+# (begrip, text, cleaned, ontologische_categorie, context, correlation_id)
+PreparedItem = tuple[str, str, str, str | None, dict[str, Any] | None, str]
+
+
+@dataclass(frozen=True)
+class RuleSetSnapshot:
+    """Picklebare momentopname van de regelset en scoringsinstellingen."""
+
+    internal_rules: tuple[str, ...]
+    json_rules: dict[str, dict[str, Any]]
+    default_weights: dict[str, float]
+    config_weights: dict[str, Any] | None
+    overall_threshold: float
+    category_threshold: float
+    is_degraded_mode: bool = False
+    degradation_reason: str | None = None
+    rules_loaded_count: int = 0
+    # Alleen meegestuurd als de CON-01 duplicaatcheck hem daadwerkelijk gebruikt
+    repository: Any | None = None
+
+
+# Per-worker service, opgebouwd door _init_worker
+_worker_service: ModularValidationService | None = None
+
+
+def _init_worker(snapshot: RuleSetSnapshot) -> None:
+    global _worker_service
+    from .modular_validation_service import ModularValidationService
+
+    service = ModularValidationService.from_rule_set_snapshot(snapshot)
+    service._get_rule_plan()  # plan éénmaal per worker compileren
+    _worker_service = service
+
+
+def _validate_chunk(chunk: list[PreparedItem]) -> list[dict[str, Any]]:
+    service = _worker_service
+    if service is None:  # pragma: no cover - initializer draait altijd eerst
+        msg = "Procespool-worker is niet geïnitialiseerd"
+        raise RuntimeError(msg)
+    return [service._validate_prepared(*item) for item in chunk]
+
+
+def chunked(items: list[PreparedItem], size: int) -> list[list[PreparedItem]]:
+    """Verdeel items in opeenvolgende chunks van maximaal ``size``."""
+    size = max(1, int(size))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def resolve_workers(workers: int, n_chunks: int) -> int:
+    """Aantal workers: 0 of negatief betekent os.cpu_count(), nooit meer dan chunks."""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_chunks))
+
+
+async def validate_in_process_pool(
+    snapshot: RuleSetSnapshot,
+    items: list[PreparedItem],
+    *,
+    workers: int,
+    chunk_size: int | None = None,
+) -> list[dict[str, Any]]:
+    """Valideer voorbereide items in een procespool; volgorde gelijk aan input."""
+    if not items:
+        return []
+    chunks = chunked(items, chunk_size or DEFAULT_CHUNK_SIZE)
+    max_workers = resolve_workers(workers, len(chunks))
+    logger.info(
+        "Batchvalidatie in procespool: %d items, %d chunks, %d workers",
+        len(items),
+        len(chunks),
+        max_workers,
+        extra={
+            "component": "validation_process_pool",
+            "items": len(items),
+            "chunks": len(chunks),
+            "workers": max_workers,
+        },
+    )
+
+    loop = asyncio.get_running_loop()
+    # 'spawn': geen fork van een proces met threads (Streamlit, event loops)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(snapshot,),
+    ) as pool:
+        chunk_results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _validate_chunk, chunk) for chunk in chunks)
+        )
+    return [result for chunk in chunk_results for result in chunk]
@@ -0,0 +1,311 @@
+"""Content-addressed cache voor volledige validatieresultaten.
+
+De sleutel is een hash over de (opgeschoonde) tekst, het begrip, de categorie,
+de inhoudelijke contextvelden en de regelset-versie. Die versie is een
+fingerprint over de toetsregels (zie ``revalidation.rule_fingerprints``), de
+evaluatiecode, gewichten en drempels; wijzigt de regelset, dan matchen oude
+entries niet meer.
+
+Twee lagen:
+- LRU in geheugen (per service-instantie, begrensd op ``max_entries``);
+- optioneel een SQLite bestand (``cache_dir``) dat herstarts overleeft. Dat
+  bestand wordt gedeeld door instanties met verschillende configuraties (en
+  processen); entries van andere versies blijven daarom staan en verdwijnen
+  pas via LRU (``max_disk_entries``) of leeftijd (``max_disk_age_days``).
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 10_000
+DEFAULT_MAX_DISK_AGE_DAYS = 30.0
+_DB_NAME = "validation_results.db"
+_PRUNE_EVERY = 256
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Contextvelden zonder directe invloed op het resultaat: tracing, en het id van
+# de gevalideerde definitie (telt alleen via de CON-01 duplicate match mee, die
+# apart in de sleutel zit)
+_IGNORED_CONTEXT_KEYS = frozenset({"correlation_id", "definition_id"})
+
+
+def make_cache_key(
+    version: str,
+    begrip: str,
+    text: str,
+    cleaned: str,
+    categorie: str | None,
+    context: dict[str, Any] | None,
+) -> str:
+    """Hash over alle invoer die het validatieresultaat bepaalt."""
+    relevant = {
+        k: v for k, v in (context or {}).items() if k not in _IGNORED_CONTEXT_KEYS
+    }
+    payload = json.dumps(
+        [
+            version,
+            begrip or "",
+            cleaned or "",
+            # Ruwe tekst alleen als die afwijkt (sommige regels lezen raw_text)
+            text if text != cleaned else None,
+            categorie,
+            relevant,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ValidationResultCache:
+    """LRU (geheugen) + optionele SQLite cache met hit-rate statistieken.
+
+    ``max_entries <= 0`` schakelt de cache uit. Resultaten worden bij ``get``
+    en ``put`` gekopieerd zodat aanroepers het gecachte dict niet muteren.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: str | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        max_disk_age_days: float = DEFAULT_MAX_DISK_AGE_DAYS,
+    ):
+        self.max_entries = int(max_entries)
+        self.max_disk_entries = int(max_disk_entries)
+        self.max_disk_age = float(max_disk_age_days) * 86400
+        self.db_path = None
+        if cache_dir:
+            # Relatieve paden t.o.v. project root, niet de working directory
+            directory = Path(cache_dir)
+            if not directory.is_absolute():
+                directory = PROJECT_ROOT / directory
+            self.db_path = str(directory / _DB_NAME)
+        self._lock = threading.Lock()
+        self._store: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._version: str | None = None
+        self._writes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._evictions = 0
+        self._invalidations = 0
+        if self.db_path and self.enabled:
+            try:
+                self._ensure_schema()
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Validatie-cache op schijf uitgeschakeld: {type(e).__name__}: {e}"
+                )
+                self.db_path = None
+
+    @classmethod
+    def from_config(cls, config: Any | None) -> ValidationResultCache:
+        """Bouw uit ``config.params['result_cache']`` (optioneel)."""
+        params = getattr(config, "params", None) or {}
+        settings = params.get("result_cache") if isinstance(params, dict) else None
+        if not isinstance(settings, dict):
+            return cls()
+        if settings.get("enabled") is False:
+            return cls(max_entries=0)
+        return cls(
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            cache_dir=settings.get("cache_dir"),
+            max_disk_entries=int(
+                settings.get("max_disk_entries", DEFAULT_MAX_DISK_ENTRIES)
+            ),
+            max_disk_age_days=float(
+                settings.get("max_disk_age_days", DEFAULT_MAX_DISK_AGE_DAYS)
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    # ===== Schijflaag =====
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+
+    def _ensure_schema(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS validation_results (
+                    cache_key TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    result BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL DEFAULT 0
+                )
+            """
+            )
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(validation_results)")
+            }
+            if "last_used_at" not in columns:
+                # Bestaande cache (zonder LRU-kolom): created_at als laatst gebruikt
+                conn.execute(
+                    "ALTER TABLE validation_results "
+                    "ADD COLUMN last_used_at REAL NOT NULL DEFAULT 0"
+                )
+                conn.execute("UPDATE validation_results SET last_used_at = created_at")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_validation_results_last_used "
+                "ON validation_results(last_used_at)"
+            )
+
+    def _disk_get(self, key: str) -> dict[str, Any] | None:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT result FROM validation_results "
+                    "WHERE cache_key = ? AND version = ?",
+                    (key, self._version),
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE validation_results SET last_used_at = ? "
+                        "WHERE cache_key = ?",
+                        (time.time(), key),
+                    )
+            return pickle.loads(row[0]) if row else None
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError) as e:
+            logger.debug(f"Validatie-cache lezen gefaald: {type(e).__name__}: {e}")
+            return None
+
+    def _disk_put(self, key: str, result: dict[str, Any]) -> None:
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            now = time.time()
+            with closing(self._connect()) as conn:
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "INSERT OR REPLACE INTO validation_results "
+                    "(cache_key, version, result, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, self._version, blob, now, now),
+                )
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._disk_prune(conn, now)
+        except (sqlite3.Error, pickle.PicklingError, TypeError) as e:
+            logger.debug(f"Validatie-cache schrijven gefaald: {type(e).__name__}: {e}")
+
+    def _disk_prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """Begrens de schijfcache: te oude en minst recent gebruikte entries weg.
+
+        Ongeacht de versie; andere configuraties en processen delen het bestand.
+        """
+        if self.max_disk_age > 0:
+            conn.execute(
+                "DELETE FROM validation_results WHERE last_used_at < ?",
+                (now - self.max_disk_age,),
+            )
+        conn.execute(
+            "DELETE FROM validation_results WHERE cache_key IN ("
+            "SELECT cache_key FROM validation_results "
+            "ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+    # ===== Publieke API =====
+    def set_version(self, version: str) -> None:
+        """Koppel de cache aan een regelset-versie.
+
+        Bij wijziging wordt de geheugenlaag geleegd; op schijf blijven entries
+        van andere versies staan (mogelijk in gebruik door andere instanties).
+        """
+        with self._lock:
+            if version == self._version:
+                return
+            if self._version is not None:
+                self._invalidations += 1
+            self._store.clear()
+            self._version = version
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            result = self._store.get(key)
+            if result is not None:
+                self._store.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(result)
+        if self.db_path:
+            result = self._disk_get(key)
+            if result is not None:
+                with self._lock:
+                    self._hits += 1
+                    self._disk_hits += 1
+                    self._remember(key, result)
+                return copy.deepcopy(result)
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._remember(key, stored)
+        if self.db_path:
+            self._disk_put(key, stored)
+
+    def _remember(self, key: str, result: dict[str, Any]) -> None:
+        self._store[key] = result
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+            self._evictions += 1
+
+    def record_bypass(self) -> None:
+        """Validatie die niet gecachet kon worden (bijv. repository-afhankelijk)."""
+        with self._lock:
+            self._bypassed += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+        if self.db_path:
+            try:
+                with closing(self._connect()) as conn:
+                    conn.execute("DELETE FROM validation_results")
+            except sqlite3.Error as e:
+                logger.debug(f"Validatie-cache legen gefaald: {type(e).__name__}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "persistent": self.db_path is not None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "bypassed": self._bypassed,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._store),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "version": self._version[:12] if self._version else None,
+            }
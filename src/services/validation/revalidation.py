@@ -0,0 +1,460 @@
+"""Incrementele corpus-revalidatie na wijzigingen in toetsregels.
+
+Iedere regel krijgt een fingerprint: een content hash over de geladen JSON
+regel, de Python validator (``toetsregels/regels/<code>.py``) en eventuele
+aanvullende patronen. Per definitie worden de uitkomsten per regel samen met
+die fingerprint bewaard in een SQLite store.
+
+Bij een revalidatie worden per definitie alleen de regels opnieuw uitgevoerd
+waarvan de fingerprint afwijkt (of die nog geen uitkomst hebben); de overige
+uitkomsten komen uit de store. ``validation_score`` en ``validation_issues``
+worden daarna uit alle uitkomsten opnieuw geaggregeerd met de huidige
+gewichten. Een gewijzigde definitietekst of gewijzigde evaluatiecode (engine
+fingerprint) maakt alle uitkomsten van die definitie ongeldig.
+
+Alle regels hebben ``geldigheid`` als beschrijvende tekst, niet als filter;
+een regel geldt dus voor alle definities.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from validation.additional_patterns import get_additional_patterns
+
+from .rule_plan import RuleOutcome
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_STORE_PATH = str(PROJECT_ROOT / "cache" / "rule_results.db")
+DEFAULT_REGELS_DIR = Path(__file__).resolve().parents[2] / "toetsregels" / "regels"
+
+# Modules waarvan de broncode de uitkomst van (alle) regels bepaalt
+_ENGINE_MODULES = (
+    "modular_validation_service.py",
+    "rule_plan.py",
+    "types_internal.py",
+    "violation_builder.py",
+)
+
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def engine_fingerprint() -> str:
+    """Hash over de evaluatiecode; wijzigt die, dan zijn alle uitkomsten ongeldig."""
+    base = Path(__file__).resolve().parent
+    return _sha256(*((base / name).read_bytes() for name in _ENGINE_MODULES))
+
+
+def rule_fingerprints(
+    codes: Iterable[str],
+    json_rules: dict[str, dict[str, Any]],
+    regels_dir: Path = DEFAULT_REGELS_DIR,
+) -> dict[str, str]:
+    """Fingerprint per regel: JSON inhoud + Python validator + extra patronen."""
+    fingerprints: dict[str, str] = {}
+    for code in codes:
+        rule = json_rules.get(code)
+        rule_json = json.dumps(rule, sort_keys=True, ensure_ascii=False, default=str)
+        validator = Path(regels_dir) / f"{code}.py"
+        source = validator.read_bytes() if validator.is_file() else b""
+        extra = json.dumps(get_additional_patterns(code), ensure_ascii=False)
+        fingerprints[code] = _sha256(
+            code.encode(), rule_json.encode(), source, extra.encode()
+        )
+    return fingerprints
+
+
+def text_fingerprint(
+    begrip: str, text: str, context: dict[str, Any] | None = None
+) -> str:
+    """Hash over begrip, tekst en validatiecontext (categorie, org/jur/wet)."""
+    return _sha256(
+        (begrip or "").encode(),
+        (text or "").encode(),
+        json.dumps(context or {}, sort_keys=True, ensure_ascii=False).encode(),
+    )
+
+
+def _context_list(value: Any) -> list[str]:
+    """Contextveld van een DefinitieRecord (JSON array of losse string) → lijst."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(x) for x in value]
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return [str(value)]
+    if isinstance(parsed, list):
+        return [str(x) for x in parsed]
+    return [str(parsed)] if parsed else []
+
+
+def record_context(record: Any) -> dict[str, Any]:
+    """Validatiecontext van een opgeslagen definitie.
+
+    Zelfde sleutels als de ValidationOrchestratorV2 bij het valideren van een
+    Definition, zodat revalidatie dezelfde uitkomst geeft als de UI.
+    """
+    context: dict[str, Any] = {}
+    for key in ("organisatorische_context", "juridische_context", "wettelijke_basis"):
+        values = _context_list(getattr(record, key, None))
+        if values:
+            context[key] = values
+    if getattr(record, "categorie", None):
+        context["categorie"] = record.categorie
+    if getattr(record, "id", None) is not None:
+        context["definition_id"] = record.id
+    return context
+
+
+@dataclass(frozen=True)
+class StoredDefinition:
+    """Opgeslagen uitkomsten van één definitie."""
+
+    text_hash: str
+    engine: str
+    # code → (fingerprint, outcome)
+    outcomes: dict[str, tuple[str, RuleOutcome]]
+
+
+class RuleResultStore:
+    """SQLite store met uitkomsten per definitie per regel (plus fingerprint)."""
+
+    def __init__(self, db_path: str = DEFAULT_STORE_PATH):
+        path = Path(db_path)
+        # Relatieve paden t.o.v. project root, niet de working directory
+        self.db_path = str(path if path.is_absolute() else PROJECT_ROOT / path)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+
+    def _ensure_schema(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS definition_state (
+                    definitie_id INTEGER PRIMARY KEY,
+                    text_hash TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    validated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS rule_results (
+                    definitie_id INTEGER NOT NULL,
+                    rule_code TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    violation TEXT,
+                    PRIMARY KEY (definitie_id, rule_code)
+                );
+            """
+            )
+
+    def load(self, definitie_ids: Iterable[int]) -> dict[int, StoredDefinition]:
+        """Laad opgeslagen state en uitkomsten voor een reeks definities."""
+        ids = list(definitie_ids)
+        stored: dict[int, StoredDefinition] = {}
+        if not ids:
+            return stored
+        with closing(self._connect()) as conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                marks = ",".join("?" * len(chunk))
+                for def_id, text_hash, engine in conn.execute(
+                    "SELECT definitie_id, text_hash, engine FROM definition_state "
+                    f"WHERE definitie_id IN ({marks})",
+                    chunk,
+                ):
+                    stored[def_id] = StoredDefinition(text_hash, engine, {})
+                for def_id, code, fingerprint, score, violation in conn.execute(
+                    "SELECT definitie_id, rule_code, fingerprint, score, violation "
+                    f"FROM rule_results WHERE definitie_id IN ({marks})",
+                    chunk,
+                ):
+                    entry = stored.get(def_id)
+                    if entry is not None:
+                        entry.outcomes[code] = (
+                            fingerprint,
+                            (score, json.loads(violation) if violation else None),
+                        )
+        return stored
+
+    def save(
+        self,
+        entries: list[tuple[int, str, str, dict[str, tuple[str, RuleOutcome]]]],
+    ) -> None:
+        """Sla (definitie_id, text_hash, engine, {code: (fingerprint, outcome)}) op.
+
+        Alleen de meegegeven regeluitkomsten worden vervangen; ontbrekende
+        regels van een definitie met gewijzigde tekst/engine worden eerst gewist.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for def_id, text_hash, engine, outcomes in entries:
+                    row = conn.execute(
+                        "SELECT text_hash, engine FROM definition_state "
+                        "WHERE definitie_id = ?",
+                        (def_id,),
+                    ).fetchone()
+                    if row is not None and tuple(row) != (text_hash, engine):
+                        conn.execute(
+                            "DELETE FROM rule_results WHERE definitie_id = ?",
+                            (def_id,),
+                        )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO definition_state "
+                        "VALUES (?, ?, ?, ?)",
+                        (def_id, text_hash, engine, now),
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO rule_results VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (
+                                def_id,
+                                code,
+                                fingerprint,
+                                float(score),
+                                (
+                                    json.dumps(violation, ensure_ascii=False)
+                                    if violation is not None
+                                    else None
+                                ),
+                            )
+                            for code, (fingerprint, (score, violation)) in (
+                                outcomes.items()
+                            )
+                        ],
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def prune(self, keep_ids: Iterable[int]) -> int:
+        """Verwijder state van definities die niet meer bestaan."""
+        keep = set(keep_ids)
+        with closing(self._connect()) as conn:
+            stale = [
+                (def_id,)
+                for (def_id,) in conn.execute(
+                    "SELECT definitie_id FROM definition_state"
+                )
+                if def_id not in keep
+            ]
+            if stale:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "DELETE FROM rule_results WHERE definitie_id = ?", stale
+                )
+                conn.executemany(
+                    "DELETE FROM definition_state WHERE definitie_id = ?", stale
+                )
+                conn.execute("COMMIT")
+        return len(stale)
+
+
+@dataclass
+class RevalidationProgress:
+    """Voortgang tijdens een revalidatierun."""
+
+    processed: int
+    total: int
+    rules_evaluated: int
+    elapsed_seconds: float
+
+    @property
+    def definitions_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+@dataclass
+class RevalidationReport:
+    """Samenvatting van een revalidatierun."""
+
+    definitions: int = 0
+    updated: int = 0
+    rules_evaluated: int = 0
+    rules_reused: int = 0
+    full_revalidations: int = 0
+    changed_rules: list[str] = field(default_factory=list)
+    pruned: int = 0
+    elapsed_seconds: float = 0.0
+    dry_run: bool = False
+
+    @property
+    def definitions_per_second(self) -> float:
+        return self.definitions / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def rules_per_second(self) -> float:
+        return (
+            self.rules_evaluated / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "definitions": self.definitions,
+            "updated": self.updated,
+            "rules_evaluated": self.rules_evaluated,
+            "rules_reused": self.rules_reused,
+            "full_revalidations": self.full_revalidations,
+            "changed_rules": list(self.changed_rules),
+            "pruned": self.pruned,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "definitions_per_second": round(self.definitions_per_second, 1),
+            "rules_per_second": round(self.rules_per_second, 1),
+            "dry_run": self.dry_run,
+        }
+
+
+class IncrementalRevalidationService:
+    """Revalideer het corpus, met hergebruik van ongewijzigde regeluitkomsten.
+
+    Args:
+        repository: DefinitieRepository (get_all/update_validation_results)
+        validation_service: ModularValidationService met de actuele regelset
+        store: RuleResultStore voor uitkomsten per definitie per regel
+        regels_dir: Directory met de regelbestanden (JSON + Python validators)
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        validation_service: Any,
+        store: RuleResultStore | None = None,
+        regels_dir: Path = DEFAULT_REGELS_DIR,
+    ):
+        self.repository = repository
+        self.validation_service = validation_service
+        self.store = store or RuleResultStore()
+        self.regels_dir = Path(regels_dir)
+
+    def current_fingerprints(self) -> dict[str, str]:
+        service = self.validation_service
+        codes = [step.code for step in service._get_rule_plan().steps]
+        return rule_fingerprints(codes, service._json_rules, self.regels_dir)
+
+    def run(
+        self,
+        *,
+        full: bool = False,
+        dry_run: bool = False,
+        batch_size: int = 200,
+        progress: Callable[[RevalidationProgress], None] | None = None,
+    ) -> RevalidationReport:
+        """Revalideer alle definities in de repository.
+
+        Args:
+            full: Negeer opgeslagen uitkomsten en voer alle regels opnieuw uit
+            dry_run: Bereken alles, maar schrijf niets weg (repository en store)
+            batch_size: Definities per schrijfbatch (en per progress callback)
+            progress: Optionele callback na iedere batch
+        """
+        start = time.perf_counter()
+        fingerprints = self.current_fingerprints()
+        engine = engine_fingerprint()
+        records = [r for r in self.repository.get_all() if r.id is not None]
+        report = RevalidationReport(definitions=len(records), dry_run=dry_run)
+        changed: set[str] = set()
+
+        batch_size = max(1, int(batch_size))
+        for offset in range(0, len(records), batch_size):
+            batch = records[offset : offset + batch_size]
+            stored = {} if full else self.store.load(r.id for r in batch)
+            scores: list[tuple[int, float, list[dict[str, Any]]]] = []
+            entries: list[tuple[int, str, str, dict[str, tuple[str, RuleOutcome]]]] = []
+
+            for record in batch:
+                context = record_context(record)
+                text_hash = text_fingerprint(record.begrip, record.definitie, context)
+                previous = stored.get(record.id)
+                cached: dict[str, RuleOutcome] = {}
+                if previous is None or (previous.text_hash, previous.engine) != (
+                    text_hash,
+                    engine,
+                ):
+                    report.full_revalidations += 1
+                else:
+                    for code, (fingerprint, outcome) in previous.outcomes.items():
+                        if fingerprints.get(code) == fingerprint:
+                            cached[code] = outcome
+                        elif code in fingerprints:
+                            changed.add(code)
+                    changed.update(set(fingerprints) - set(previous.outcomes))
+
+                result, evaluated = (
+                    self.validation_service.validate_with_cached_outcomes(
+                        record.begrip,
+                        record.definitie,
+                        cached,
+                        ontologische_categorie=record.categorie or None,
+                        context=context,
+                    )
+                )
+                report.rules_evaluated += len(evaluated)
+                report.rules_reused += len(fingerprints) - len(evaluated)
+                scores.append(
+                    (record.id, result["overall_score"], result["violations"])
+                )
+                entries.append(
+                    (
+                        record.id,
+                        text_hash,
+                        engine,
+                        {
+                            code: (fingerprints[code], outcome)
+                            for code, outcome in evaluated.items()
+                            if code in fingerprints
+                        },
+                    )
+                )
+
+            if not dry_run:
+                self.store.save(entries)
+                report.updated += self.repository.update_validation_results(scores)
+            if progress is not None:
+                progress(
+                    RevalidationProgress(
+                        processed=offset + len(batch),
+                        total=len(records),
+                        rules_evaluated=report.rules_evaluated,
+                        elapsed_seconds=time.perf_counter() - start,
+                    )
+                )
+
+        if not dry_run:
+            report.pruned = self.store.prune(r.id for r in records)
+        report.changed_rules = sorted(changed)
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "Corpus revalidatie: %d definities, %d regels uitgevoerd, %d hergebruikt "
+            "(%.1f def/s)",
+            report.definitions,
+            report.rules_evaluated,
+            report.rules_reused,
+            report.definitions_per_second,
+            extra={"component": "incremental_revalidation", **report.to_dict()},
+        )
+        return report
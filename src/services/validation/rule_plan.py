@@ -0,0 +1,308 @@
+"""Gecompileerd uitvoeringsplan voor ModularValidationService.
+
+De geladen toetsregels worden éénmalig vertaald naar een plat, gesorteerd
+plan van callables. Alles wat niet van de definitietekst afhangt (regex
+compilatie, severity, categorie, gewichten na ARAI/baseline filtering) wordt
+hier vooraf bepaald, zodat een validatie alleen nog de stappen hoeft af te
+lopen. Tekstkenmerken (strip, lowercase, woorden) worden per definitie één
+keer berekend in ``EvaluationContext``.
+
+Alle patronen (herkenbaar, required, redundancy) krijgen een literal-prefilter:
+uit de regex wordt afgeleid welke letterlijke tekst een match minimaal moet
+bevatten (bijv. ``zou`` voor ``\\bzou\\b``). Het plan bundelt die literals
+van alle regels in één index; per definitie wordt die index één keer tegen de
+(lowercase) tekst gescand en het resultaat voedt iedere regel. Alleen regexen
+waarvan een literal aanwezig is worden daarna nog echt uitgevoerd.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from validation.additional_patterns import get_additional_patterns
+
+from .types_internal import EvaluationContext
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - oudere Python versies
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+RuleOutcome = tuple[float, dict[str, Any] | None]
+
+# Regels waarbij herkenbaar_patronen een POSITIEF signaal zijn (presence is goed)
+POSITIVE_PATTERN_RULES = frozenset({"CON-02", "ESS-03", "ESS-04", "ESS-05"})
+# Regels met een extra ingebouwde check naast de generieke JSON velden
+RULES_WITH_EXTRA_CHECKS = frozenset({"STR-01", "VER-01"} | POSITIVE_PATTERN_RULES)
+
+
+def _int_or_none(value: Any) -> int | None:
+    return value if isinstance(value, int) else None
+
+
+def _compile_all(patterns: list[str]) -> tuple[re.Pattern[str], ...]:
+    """Compileer alle patronen; één ongeldig patroon maakt de set leeg (legacy)."""
+    try:
+        return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+    except re.error:
+        return ()
+
+
+def _literal_requirement(items: Any) -> frozenset[str] | None:
+    """Lowercase literals waarvan elke match er minstens één moet bevatten.
+
+    Werkt op de sre parse tree; alleen ASCII literals tellen mee. Geeft None
+    als geen (veilige) eis af te leiden is, dan wordt de regex altijd gedraaid.
+    """
+    best: frozenset[str] | None = None
+
+    def consider(req: frozenset[str] | None) -> None:
+        nonlocal best
+        if not req or not all(req):
+            return
+        if best is None or min(map(len, req)) > min(map(len, best)):
+            best = req
+
+    run: list[str] = []
+    for op, av in items:
+        name = str(op)
+        if name == "LITERAL" and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if run:
+            consider(frozenset({"".join(run)}))
+            run = []
+        if name == "SUBPATTERN":
+            consider(_literal_requirement(av[-1]))
+        elif name == "ATOMIC_GROUP":
+            consider(_literal_requirement(av))
+        elif name == "BRANCH":
+            alternatives = [_literal_requirement(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(frozenset().union(*alternatives))  # type: ignore[arg-type]
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") and av[0] >= 1:
+            consider(_literal_requirement(av[2]))
+    if run:
+        consider(frozenset({"".join(run)}))
+    return best
+
+
+@dataclass(frozen=True)
+class ScanPattern:
+    """Gecompileerde regex met optionele literal-prefilter."""
+
+    regex: re.Pattern[str]
+    literals: frozenset[str] | None = None
+
+    @classmethod
+    def from_regex(cls, regex: re.Pattern[str]) -> ScanPattern:
+        try:
+            literals = _literal_requirement(
+                _sre_parse.parse(regex.pattern, regex.flags)
+            )
+        except Exception:  # pragma: no cover - analyse is best-effort
+            literals = None
+        return cls(regex=regex, literals=literals)
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+
+@dataclass(frozen=True)
+class PatternGroup:
+    """Geordende set ScanPatterns van één regel (herkenbaar/required/redundancy)."""
+
+    scans: tuple[ScanPattern, ...] = ()
+    literals: frozenset[str] = frozenset()
+    # Minstens één patroon zonder afleidbare literal: altijd uitvoeren
+    unfiltered: bool = False
+
+    @classmethod
+    def from_regexes(cls, regexes: Iterable[re.Pattern[str]]) -> PatternGroup:
+        scans = tuple(ScanPattern.from_regex(r) for r in regexes)
+        return cls(
+            scans=scans,
+            literals=frozenset().union(*(s.literals or () for s in scans)),
+            unfiltered=any(s.literals is None for s in scans),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.scans)
+
+    def matchable(self, present: frozenset[str] | None) -> tuple[ScanPattern, ...]:
+        """Patronen die kunnen matchen gegeven de aanwezige literals (volgorde behouden).
+
+        ``present`` None betekent: geen prefilter mogelijk, alle patronen draaien.
+        """
+        if present is None:
+            return self.scans
+        if not self.unfiltered and self.literals.isdisjoint(present):
+            return ()
+        return tuple(
+            scan
+            for scan in self.scans
+            if scan.literals is None or not scan.literals.isdisjoint(present)
+        )
+
+
+@dataclass(frozen=True)
+class CompiledJsonRule:
+    """JSON toetsregel met vooraf gecompileerde patronen en drempels."""
+
+    code: str
+    code_up: str
+    rule: dict[str, Any]
+    severity: str
+    severity_level: str
+    category: str
+    patterns: PatternGroup = PatternGroup()
+    positive_patterns: bool = False
+    required_sources: tuple[str, ...] = ()
+    required: PatternGroup = PatternGroup()
+    forbidden_phrases: tuple[str, ...] = ()
+    min_words: int | None = None
+    max_words: int | None = None
+    min_chars: int | None = None
+    max_chars: int | None = None
+    min_commas: int | None = None
+    circular: bool = False
+    redundancy: PatternGroup = PatternGroup()
+    # Prefilter literals van alle patronen van deze regel
+    literals: frozenset[str] = frozenset()
+    # True als de regel alleen uit herkenbare patronen bestaat
+    patterns_only: bool = False
+
+    @classmethod
+    def from_rule(
+        cls,
+        code: str,
+        rule: dict[str, Any],
+        *,
+        severity: str,
+        severity_level: str,
+        category: str,
+    ) -> CompiledJsonRule:
+        code_up = code.upper()
+        patterns = list(rule.get("herkenbaar_patronen", []) or [])
+        extra = get_additional_patterns(code_up)
+        if extra:
+            # Volgorde behouden en ontdubbelen
+            patterns = list(dict.fromkeys([*patterns, *extra]))
+        required_sources = tuple(rule.get("required_patterns", []) or [])
+
+        redundancy: list[re.Pattern[str]] = []
+        for rpat in rule.get("redundancy_patterns", []) or []:
+            try:
+                redundancy.append(re.compile(rpat, re.IGNORECASE))
+            except re.error:
+                continue
+
+        scans = PatternGroup.from_regexes(_compile_all(patterns))
+        required = PatternGroup.from_regexes(_compile_all(list(required_sources)))
+        redundant = PatternGroup.from_regexes(redundancy)
+        limits = {
+            key: _int_or_none(rule.get(key))
+            for key in (
+                "min_words",
+                "max_words",
+                "min_chars",
+                "max_chars",
+                "min_commas",
+            )
+        }
+        forbidden_phrases = tuple(rule.get("forbidden_phrases", []) or [])
+        circular = bool(rule.get("circular_definition"))
+        patterns_only = not (
+            required_sources
+            or forbidden_phrases
+            or circular
+            or redundancy
+            or any(v is not None for v in limits.values())
+            or code_up in RULES_WITH_EXTRA_CHECKS
+        )
+        return cls(
+            code=code,
+            code_up=code_up,
+            rule=rule,
+            severity=severity,
+            severity_level=severity_level,
+            category=category,
+            patterns=scans,
+            positive_patterns=code_up in POSITIVE_PATTERN_RULES,
+            required_sources=required_sources,
+            required=required,
+            forbidden_phrases=forbidden_phrases,
+            circular=circular,
+            redundancy=redundant,
+            literals=scans.literals | required.literals | redundant.literals,
+            patterns_only=patterns_only,
+            **limits,
+        )
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """Eén regel in het uitvoeringsplan."""
+
+    code: str
+    evaluate: Callable[[EvaluationContext], RuleOutcome]
+
+
+def _sizes(sources: tuple[Any, ...]) -> tuple[int, ...]:
+    return tuple(len(src) if hasattr(src, "__len__") else 0 for src in sources)
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """Plat, deterministisch geordend uitvoeringsplan plus scoringsgewichten.
+
+    ``sources`` zijn de objecten (regellijst, JSON regels, gewichten) waaruit
+    het plan is gebouwd; wijzigt één daarvan (ander object of andere lengte),
+    dan wordt het plan opnieuw gecompileerd.
+    """
+
+    steps: tuple[PlanStep, ...]
+    weights: dict[str, float]
+    categories: dict[str, str] = field(default_factory=dict)
+    # Literal-index over alle regels: één scan per tekst voedt elke regel
+    literals: frozenset[str] = frozenset()
+    sources: tuple[Any, ...] = ()
+    sizes: tuple[int, ...] = ()
+    # Volgorde voor gate-only validatie: blokkerende regels eerst, dan gewicht
+    gate_steps: tuple[PlanStep, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        steps: tuple[PlanStep, ...],
+        weights: dict[str, float],
+        categories: dict[str, str],
+        literals: frozenset[str],
+        sources: tuple[Any, ...],
+        gate_steps: tuple[PlanStep, ...] = (),
+    ) -> RulePlan:
+        return cls(
+            steps=steps,
+            weights=weights,
+            categories=categories,
+            literals=literals,
+            sources=sources,
+            sizes=_sizes(sources),
+            gate_steps=gate_steps or steps,
+        )
+
+    def matches(self, sources: tuple[Any, ...]) -> bool:
+        """True als het plan nog overeenkomt met de huidige regelset."""
+        return (
+            len(sources) == len(self.sources)
+            and all(a is b for a, b in zip(sources, self.sources, strict=True))
+            and _sizes(sources) == self.sizes
+        )
+
+    def __len__(self) -> int:
+        return len(self.steps)
@@ -0,0 +1,150 @@
+"""Opt-in tijdmeting per toetsregel (histogrammen met p50/p95/totaal).
+
+Per regel wordt de duur van ``evaluate(ctx)`` gemeten met een monotone klok
+(``time.perf_counter_ns``) en opgeteld in een log-schaal histogram. Dat houdt
+het geheugengebruik constant, ongeacht het aantal metingen; percentielen zijn
+schattingen op bucket-niveau (relatieve fout < ~10%), totaal/min/max exact.
+
+Uitgeschakeld kost dit niets: de service controleert ``enabled`` één keer per
+validatie. Metingen uit procespool-workers (``process_pool``) en gecachte
+resultaten (``result_cache``) komen niet in de histogrammen terecht.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Bucketgrenzen in ns: 1µs .. ~17s, factor 2^(1/4) per bucket
+_BUCKET_FACTOR = 2**0.25
+_BUCKET_BOUNDS: tuple[int, ...] = tuple(
+    int(1_000 * _BUCKET_FACTOR**i) for i in range(97)
+)
+
+
+@dataclass
+class RuleHistogram:
+    """Histogram van meetwaarden (ns) voor één regel."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(_BUCKET_BOUNDS) + 1))
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    def add(self, duration_ns: int) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, duration_ns)] += 1
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def percentile(self, q: float) -> float:
+        """Geschatte q-de percentiel (0..100) in ns, begrensd door min/max."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(q / 100 * self.count))
+        if rank >= self.count:
+            return float(self.max_ns)
+        seen = 0
+        index = 0
+        while seen + self.counts[index] < rank:
+            seen += self.counts[index]
+            index += 1
+        # Geometrisch midden van de bucket als schatting
+        upper = _BUCKET_BOUNDS[min(index, len(_BUCKET_BOUNDS) - 1)]
+        lower = _BUCKET_BOUNDS[index - 1] if index > 0 else 0
+        estimate = (lower * upper) ** 0.5 if lower else upper
+        return float(min(max(estimate, self.min_ns), self.max_ns))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_ms": round(self.total_ns / self.count / 1e6, 4) if self.count else 0,
+            "p50_ms": round(self.percentile(50) / 1e6, 4),
+            "p95_ms": round(self.percentile(95) / 1e6, 4),
+            "max_ms": round(self.max_ns / 1e6, 4),
+        }
+
+
+class RuleTimingCollector:
+    """Verzamelt per-regel histogrammen over meerdere validaties.
+
+    Thread-safe: metingen van één validatie worden lokaal verzameld en onder
+    één lock samengevoegd.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: dict[str, RuleHistogram] = {}
+        self._runs = 0
+
+    @classmethod
+    def from_config(cls, config: Any | None) -> RuleTimingCollector:
+        """Bouw uit ``config.params['rule_timing']`` (standaard uit)."""
+        params = getattr(config, "params", None) or {}
+        settings = params.get("rule_timing") if isinstance(params, dict) else None
+        if not isinstance(settings, dict):
+            return cls()
+        return cls(enabled=bool(settings.get("enabled", False)))
+
+    def run_timed(
+        self,
+        calls: Iterable[tuple[str, Callable[[Any], Any]]],
+        ctx: Any,
+    ) -> list[tuple[str, Any]]:
+        """Voer ``evaluate(ctx)`` per regel uit en registreer de duur."""
+        clock = time.perf_counter_ns
+        outcomes: list[tuple[str, Any]] = []
+        samples: list[tuple[str, int]] = []
+        for code, evaluate in calls:
+            start = clock()
+            out = evaluate(ctx)
+            samples.append((code, clock() - start))
+            outcomes.append((code, out))
+        self.record_run(samples)
+        return outcomes
+
+    def record_run(self, samples: Iterable[tuple[str, int]]) -> None:
+        """Voeg de metingen (regelcode, ns) van één validatie toe."""
+        with self._lock:
+            for code, duration_ns in samples:
+                histogram = self._histograms.get(code)
+                if histogram is None:
+                    histogram = self._histograms[code] = RuleHistogram()
+                histogram.add(duration_ns)
+            self._runs += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._runs = 0
+
+    def report(self, top: int | None = None) -> list[dict[str, Any]]:
+        """Regels gesorteerd op totale tijd (duurste eerst)."""
+        with self._lock:
+            rows = [
+                {"rule": code, **histogram.to_dict()}
+                for code, histogram in self._histograms.items()
+            ]
+        total = sum(row["total_ms"] for row in rows) or 1.0
+        for row in rows:
+            row["share_pct"] = round(row["total_ms"] / total * 100, 1)
+        rows.sort(key=lambda row: (-row["total_ms"], row["rule"]))
+        return rows[:top] if top else rows
+
+    def get_stats(self) -> dict[str, Any]:
+        rows = self.report()
+        return {
+            "enabled": self.enabled,
+            "runs": self._runs,
+            "total_ms": round(sum(row["total_ms"] for row in rows), 3),
+            "rules": {row.pop("rule"): row for row in rows},
+        }
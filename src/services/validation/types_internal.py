@@ -6,10 +6,15 @@ rule evaluation and context sharing between modules.
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
+# Tekens die onder re.IGNORECASE ASCII letters matchen (zie re documentatie)
+_CASE_EXCEPTIONS = ("\u0130", "\u0131", "\u017f", "\u212a")
+
 
 class ReadOnlySequence:
     """Minimal read-only sequence with list-like equality, no append method.
@@ -59,6 +64,11 @@ class EvaluationContext:
     - correlation_id: tracing identifier
     - tokens: optional tokenization output (immutable tuple to prevent mutation)
     - metadata: free-form readonly metadata
+    - gate_only: alleen acceptatie bepalen (geen suggesties/duplicate-signaal)
+
+    Gedeelde tekstkenmerken (text_norm, text_lower, words, sentences, lemma,
+    ...) worden lui berekend en per context gecachet, zodat regels ze niet
+    ieder afzonderlijk opnieuw afleiden.
     """
 
     raw_text: str
@@ -71,6 +81,7 @@ class EvaluationContext:
     correlation_id: str | None = None
     tokens: Any = field(default_factory=lambda: ReadOnlySequence(()))
     metadata: dict[str, Any] = field(default_factory=dict)
+    gate_only: bool = False
 
     def __post_init__(self):  # type: ignore[override]
         # Wrap tokens in a read-only sequence (compare equal to lists, no append)
@@ -92,6 +103,7 @@ class EvaluationContext:
         correlation_id: str | None = None,
         tokens: Iterable[str] | None = None,
         metadata: dict[str, Any] | None = None,
+        gate_only: bool = False,
     ) -> EvaluationContext:
         return cls(
             raw_text=text,
@@ -104,8 +116,86 @@ class EvaluationContext:
                 ReadOnlySequence(tokens) if tokens is not None else ReadOnlySequence(())
             ),
             metadata=dict(metadata or {}),
+            gate_only=gate_only,
         )
 
+    # ===== Gedeelde tekstkenmerken (éénmaal per definitie) =====
+    @cached_property
+    def text_norm(self) -> str:
+        """Gestripte cleaned_text (basis voor lengte- en woordchecks)."""
+        return (self.cleaned_text or "").strip()
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text_norm.lower()
+
+    @cached_property
+    def prefilter_text(self) -> str | None:
+        """Lowercase cleaned_text voor literal-prefilters van regexen.
+
+        None als de tekst tekens bevat die onder re.IGNORECASE een ASCII letter
+        matchen zonder dat str.lower() dat weerspiegelt (İ, ı, ſ, K); dan
+        draaien alle regexen zonder prefilter.
+        """
+        text = self.cleaned_text or ""
+        if any(ch in text for ch in _CASE_EXCEPTIONS):
+            return None
+        return text.lower()
+
+    def present_literals(self, literals: frozenset[str]) -> frozenset[str] | None:
+        """Deel van ``literals`` dat in de tekst voorkomt (één scan per literal-set).
+
+        Het resultaat wordt per context gecachet zodat alle regels van een
+        uitvoeringsplan dezelfde scan delen. None betekent: geen prefilter.
+        """
+        text = self.prefilter_text
+        if text is None:
+            return None
+        cache = self.__dict__.setdefault("_present_literals", {})
+        present = cache.get(literals)
+        if present is None:
+            present = frozenset(lit for lit in literals if lit in text)
+            cache[literals] = present
+        return present
+
+    @cached_property
+    def words(self) -> tuple[str, ...]:
+        return tuple(self.text_norm.split())
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @cached_property
+    def char_count(self) -> int:
+        return len(self.text_norm)
+
+    @cached_property
+    def comma_count(self) -> int:
+        return self.text_norm.count(",")
+
+    @cached_property
+    def sentences(self) -> tuple[str, ...]:
+        parts = re.split(r"(?<=[.!?])\s+", self.text_norm)
+        return tuple(p for p in parts if p)
+
+    @cached_property
+    def effective_text(self) -> str:
+        """Gestripte cleaned_text met fallback naar raw_text (scoring heuristieken)."""
+        return (self.cleaned_text or self.raw_text or "").strip()
+
+    @cached_property
+    def lemma(self) -> str:
+        """Genormaliseerd begrip (gestript, lowercase)."""
+        return str(self.begrip or "").strip().lower()
+
+    @cached_property
+    def begrip_pattern(self) -> re.Pattern[str] | None:
+        """Woordgrens-regex voor het begrip (circulariteitschecks)."""
+        if not self.begrip:
+            return None
+        return re.compile(rf"\b{re.escape(str(self.begrip))}\b", re.IGNORECASE)
+
 
 @dataclass
 class RuleResult:
@@ -36,6 +36,17 @@ _CATEGORY_PREFIXES: dict[str, str] = {
     "LANG-": "taal",
 }
 
+# Interne baseline regels (zonder JSON-definitie); tellen niet mee in categorie-scores
+BASELINE_INTERNAL_RULES: tuple[str, ...] = (
+    "VAL-EMP-001",
+    "VAL-LEN-001",
+    "VAL-LEN-002",
+    "ESS-CONT-001",
+    "CON-CIRC-001",
+    "STR-TERM-001",
+    "STR-ORG-001",
+)
+
 # Severity mapping voor aanbeveling/prioriteit combinaties
 _SEVERITY_LEVEL_MAP: dict[tuple[str, str], str] = {
     ("verplicht", "hoog"): "critical",
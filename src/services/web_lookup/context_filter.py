@@ -26,6 +26,214 @@ class ContextMatch:
     match_count: int = 0
 
 
+# Keywords waarmee een jur-token aan elk juridisch domein gerelateerd raakt
+_JUR_DOMAIN_KEYWORDS = ("straf", "civiel", "bestuurs")
+
+
+def _resolve_org_tokens(
+    patterns: dict[str, str], tokens: list[str]
+) -> list[tuple[str, list[str]]]:
+    """Koppel org-tokens aan hun patroon (token.upper() moet een bekende key zijn)."""
+    return [
+        (token, [patterns[token.upper()]])
+        for token in tokens
+        if token.upper() in patterns
+    ]
+
+
+def _resolve_jur_tokens(
+    patterns: dict[str, str], tokens: list[str]
+) -> list[tuple[str, list[str]]]:
+    """Koppel jur-tokens aan de patronen van alle gerelateerde domeinen."""
+    resolved = []
+    for token in tokens:
+        token_lower = token.lower()
+        related = [
+            pattern
+            for domain, pattern in patterns.items()
+            if domain.lower() in token_lower
+            or token_lower in domain.lower()
+            or any(keyword in token_lower for keyword in _JUR_DOMAIN_KEYWORDS)
+        ]
+        resolved.append((token, related))
+    return resolved
+
+
+def _resolve_wet_tokens(
+    patterns: dict[str, str], tokens: list[str]
+) -> list[tuple[str, list[str]]]:
+    """Koppel wet-tokens aan de patronen van de wetten waarnaar ze verwijzen."""
+    resolved = []
+    for token in tokens:
+        token_norm = token.lower().strip()
+        related = [
+            pattern
+            for law_code, pattern in patterns.items()
+            if law_code.lower() in token_norm or token_norm in law_code.lower()
+        ]
+        resolved.append((token, related))
+    return resolved
+
+
+def _top_level_alternatives(pattern: str) -> list[str]:
+    """Splits een regex op '|' buiten groepen en character classes."""
+    parts, depth, in_class, start, i = [], 0, False, 0, 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def _starts_with_word_boundary(pattern: str) -> bool:
+    """True als elke match van het patroon op een woordgrens begint."""
+    return all(alt.startswith(r"\b") for alt in _top_level_alternatives(pattern))
+
+
+class CompiledContextMatcher:
+    """
+    Voorgecompileerde matcher voor één set context tokens.
+
+    Alle relevante patronen worden eenmalig samengevoegd tot één regex waarin
+    elk patroon een eigen named group heeft; tokens die naar hetzelfde patroon
+    verwijzen delen die group. Per text wordt de gecombineerde regex gescand
+    in plaats van elk patroon per token afzonderlijk. Het resultaat is
+    identiek aan het afzonderlijk zoeken met elk patroon.
+    """
+
+    def __init__(
+        self,
+        org_tokens: list[tuple[str, list[str]]],
+        jur_tokens: list[tuple[str, list[str]]],
+        wet_tokens: list[tuple[str, list[str]]],
+    ):
+        group_by_pattern: dict[str, str] = {}
+
+        def _groups(
+            resolved: list[tuple[str, list[str]]],
+        ) -> list[tuple[str, set[str]]]:
+            out = []
+            for token, token_patterns in resolved:
+                names = set()
+                for pattern in token_patterns:
+                    if pattern not in group_by_pattern:
+                        group_by_pattern[pattern] = f"p{len(group_by_pattern)}"
+                    names.add(group_by_pattern[pattern])
+                out.append((token, names))
+            return out
+
+        self._org = _groups(org_tokens)
+        self._jur = _groups(jur_tokens)
+        self._wet = _groups(wet_tokens)
+
+        # Volgorde van de group names bepaalt de volgorde in de gecombineerde regex
+        self._sources = {name: pattern for pattern, name in group_by_pattern.items()}
+        self._all_names = frozenset(self._sources)
+        self._combined: dict[frozenset[str], re.Pattern[str]] = {}
+        self._word_anchored = all(
+            _starts_with_word_boundary(pattern) for pattern in self._sources.values()
+        )
+
+    def _combined_for(self, names: frozenset[str]) -> re.Pattern[str]:
+        """Gecombineerde regex voor een subset patronen (gecached)."""
+        compiled = self._combined.get(names)
+        if compiled is None:
+            alternatives = "|".join(
+                f"(?P<{name}>{pattern})"
+                for name, pattern in self._sources.items()
+                if name in names
+            )
+            if self._word_anchored:
+                # Alternatieven alleen proberen op woordgrenzen
+                alternatives = rf"\b(?:{alternatives})"
+            compiled = re.compile(alternatives, re.IGNORECASE)
+            self._combined[names] = compiled
+        return compiled
+
+    def _hits(self, text_lower: str) -> set[str]:
+        """Bepaal welke patronen (group names) in de text matchen.
+
+        Na elke hit wordt verder gezocht vanaf dezelfde startpositie met een
+        regex zonder de reeds gevonden patronen, zodat overlappende matches van
+        verschillende patronen elkaar niet verbergen. Het aantal searches is daardoor
+        begrensd door het aantal patronen, ongeacht hoe vaak termen voorkomen.
+        """
+        remaining = self._all_names
+        pos = 0
+        while remaining:
+            m = self._combined_for(remaining).search(text_lower, pos)
+            if m is None:
+                break
+            remaining = remaining - {m.lastgroup}
+            pos = m.start()
+        return set(self._all_names - remaining)
+
+    def match(self, text: str) -> ContextMatch:
+        """
+        Analyseer text voor context matches.
+
+        Args:
+            text: Text to analyze (title + snippet + definition)
+
+        Returns:
+            ContextMatch with match details and relevance score
+        """
+        match = ContextMatch()
+        if not text:
+            return match
+
+        hits = self._hits(text.lower())
+
+        for token, names in self._org:
+            if names & hits:
+                match.has_org_match = True
+                match.org_matches.append(token)
+                match.match_count += 1
+
+        for token, names in self._jur:
+            if names & hits:
+                match.has_jur_match = True
+                match.jur_matches.append(token)
+                match.match_count += 1
+
+        for token, names in self._wet:
+            if names & hits:
+                match.has_wet_match = True
+                match.wet_matches.append(token)
+                match.match_count += 1
+
+        # Calculate relevance score (0.0 - 1.0)
+        # Weights: wet > jur > org (legal basis is most important)
+        score = 0.0
+        if match.has_wet_match:
+            score += 0.5  # Legal basis match is highly relevant
+        if match.has_jur_match:
+            score += 0.3  # Juridical domain match is moderately relevant
+        if match.has_org_match:
+            score += 0.2  # Organizational match is less relevant
+
+        # Bonus for multiple matches (up to 1.0 max)
+        if match.match_count > 1:
+            score = min(1.0, score + 0.1 * (match.match_count - 1))
+
+        match.relevance_score = score
+        return match
+
+
 class ContextFilter:
     """Filter en score results op basis van context relevantie."""
 
@@ -55,6 +263,33 @@ class ContextFilter:
             "Rv": r"\b(rv|wetboek\s+van\s+burgerlijke\s+rechtsvordering)\b",
         }
 
+    def compile(
+        self,
+        org_context: list[str] | None = None,
+        jur_context: list[str] | None = None,
+        wet_context: list[str] | None = None,
+    ) -> CompiledContextMatcher:
+        """
+        Compileer één matcher voor de volledige set context tokens.
+
+        Bepaalt eenmalig welke patronen relevant zijn voor de tokens en voegt
+        ze samen tot één gecombineerde regex. De matcher kan daarna voor elk
+        result (filter_results) en elke score-boost hergebruikt worden.
+
+        Args:
+            org_context: Organizational context tokens (e.g., ["OM", "ZM"])
+            jur_context: Juridical domain tokens (e.g., ["Strafrecht"])
+            wet_context: Legal basis tokens (e.g., ["Sv", "Wetboek van Strafvordering"])
+
+        Returns:
+            CompiledContextMatcher voor deze context
+        """
+        return CompiledContextMatcher(
+            _resolve_org_tokens(self.org_patterns, org_context or []),
+            _resolve_jur_tokens(self.jur_patterns, jur_context or []),
+            _resolve_wet_tokens(self.wet_patterns, wet_context or []),
+        )
+
     def match_context(
         self,
         text: str,
@@ -76,78 +311,7 @@ class ContextFilter:
         """
         if not text:
             return ContextMatch()
-
-        text_lower = text.lower()
-        match = ContextMatch()
-
-        # Match organizational context
-        if org_context:
-            for token in org_context:
-                token_upper = token.upper()
-                if token_upper in self.org_patterns:
-                    pattern = self.org_patterns[token_upper]
-                    if re.search(pattern, text_lower, re.IGNORECASE):
-                        match.has_org_match = True
-                        match.org_matches.append(token)
-                        match.match_count += 1
-
-        # Match juridical domain
-        if jur_context:
-            for token in jur_context:
-                token_lower = token.lower()
-                # Check if any jur_pattern matches in text
-                for domain, pattern in self.jur_patterns.items():
-                    domain_lower = domain.lower()
-                    # Check if token relates to this domain
-                    # E.g., "Strafrecht" relates to "Strafrecht" pattern
-                    if (
-                        domain_lower in token_lower
-                        or token_lower in domain_lower
-                        or any(
-                            keyword in token_lower
-                            for keyword in ["straf", "civiel", "bestuurs"]
-                        )
-                    ):
-                        # Now check if pattern actually matches in text
-                        if re.search(pattern, text_lower, re.IGNORECASE):
-                            match.has_jur_match = True
-                            match.jur_matches.append(token)
-                            match.match_count += 1
-                            break
-
-        # Match legal basis
-        if wet_context:
-            for token in wet_context:
-                # Normalize token for matching
-                token_norm = token.lower().strip()
-                for law_code, pattern in self.wet_patterns.items():
-                    if re.search(pattern, text_lower, re.IGNORECASE):
-                        # Check if token references this law
-                        if (
-                            law_code.lower() in token_norm
-                            or token_norm in law_code.lower()
-                        ):
-                            match.has_wet_match = True
-                            match.wet_matches.append(token)
-                            match.match_count += 1
-                            break
-
-        # Calculate relevance score (0.0 - 1.0)
-        # Weights: wet > jur > org (legal basis is most important)
-        score = 0.0
-        if match.has_wet_match:
-            score += 0.5  # Legal basis match is highly relevant
-        if match.has_jur_match:
-            score += 0.3  # Juridical domain match is moderately relevant
-        if match.has_org_match:
-            score += 0.2  # Organizational match is less relevant
-
-        # Bonus for multiple matches (up to 1.0 max)
-        if match.match_count > 1:
-            score = min(1.0, score + 0.1 * (match.match_count - 1))
-
-        match.relevance_score = score
-        return match
+        return self.compile(org_context, jur_context, wet_context).match(text)
 
     def filter_results(
         self,
@@ -177,6 +341,9 @@ class ContextFilter:
         if not any([org_context, jur_context, wet_context]):
             return results
 
+        # Eenmalig compileren voor alle results van deze request
+        matcher = self.compile(org_context, jur_context, wet_context)
+
         scored_results = []
         for result in results:
             # Build text to analyze from all available fields
@@ -189,7 +356,7 @@ class ContextFilter:
             text = " ".join([str(p) for p in text_parts if p])
 
             # Match context
-            match = self.match_context(text, org_context, jur_context, wet_context)
+            match = matcher.match(text)
 
             # Only keep results above min_score
             if match.relevance_score >= min_score:
@@ -223,6 +390,9 @@ class ContextFilter:
         """
         Boost original score op basis van context relevance.
 
+        Voor meerdere results: compileer eenmalig via compile() en geef
+        matcher.match(text) door als context_match.
+
         Args:
             original_score: Original provider-weighted score
             context_match: Context match analysis result
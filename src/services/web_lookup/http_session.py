@@ -0,0 +1,52 @@
+"""
+Aanmaak van HTTP sessies voor de web lookup providers.
+
+Alle providers maken hun ``aiohttp.ClientSession`` via ``create_session``.
+Binnen ``use_session_factory`` wordt in plaats daarvan een eigen factory
+gebruikt (bijv. een sessie die requests naar een lokale stand-in server
+stuurt voor offline benchmarks). De factory leeft in een ``ContextVar`` en
+geldt dus alleen voor code in die context (en daaruit gestarte tasks); andere
+sessies in het proces blijven ongemoeid.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+SessionFactory = Callable[..., Any]
+
+_session_factory: ContextVar[SessionFactory | None] = ContextVar(
+    "web_lookup_session_factory", default=None
+)
+
+
+def create_session(**kwargs: Any) -> Any:
+    """
+    Maak een HTTP sessie voor een provider.
+
+    Args:
+        **kwargs: Argumenten voor ``aiohttp.ClientSession``
+
+    Returns:
+        ``aiohttp.ClientSession`` of de sessie van de actieve factory
+    """
+    factory = _session_factory.get()
+    if factory is not None:
+        return factory(**kwargs)
+
+    import aiohttp
+
+    return aiohttp.ClientSession(**kwargs)
+
+
+@contextmanager
+def use_session_factory(factory: SessionFactory) -> Iterator[None]:
+    """Gebruik ``factory`` voor alle provider sessies binnen deze context."""
+    token = _session_factory.set(factory)
+    try:
+        yield
+    finally:
+        _session_factory.reset(token)
@@ -20,6 +20,8 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
+from utils.warm_start import get_warm_start
+
 if TYPE_CHECKING:
     from services.web_lookup.modern_web_lookup import LookupResult
 
@@ -128,38 +130,50 @@ class JuridischRankerConfig:
             return
 
         try:
-            with open(self.keywords_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                logger.warning("Lege keywords config - gebruik fallback")
-                self._load_fallback_keywords()
-                return
-
-            # Extract keywords uit alle categorieën
-            for _category, keywords_list in data.items():
-                # Skip comments/metadata
-                if not isinstance(keywords_list, list):
-                    continue
-
-                # Normaliseer en voeg toe
-                for keyword in keywords_list:
-                    if isinstance(keyword, str):
-                        normalized = self._normalize_term(keyword)
-                        if normalized:
-                            self.keywords.add(normalized)
-
-            logger.info(
-                f"Geladen: {len(self.keywords)} juridische keywords "
-                f"uit {self.keywords_path}"
+            keywords = get_warm_start().get_or_build(
+                f"juridische_keywords:{self.keywords_path.resolve()}",
+                # Deze module (_read_keywords/_normalize_term) hoort bij de bronnen
+                [self.keywords_path, __file__],
+                self._read_keywords,
             )
-
         except yaml.YAMLError as e:
             logger.error(f"YAML parse error in {self.keywords_path}: {e}")
             self._load_fallback_keywords()
+            return
         except Exception as e:
             logger.error(f"Fout bij laden keywords uit {self.keywords_path}: {e}")
             self._load_fallback_keywords()
+            return
+
+        if not keywords:
+            logger.warning("Lege keywords config - gebruik fallback")
+            self._load_fallback_keywords()
+            return
+
+        self.keywords = set(keywords)
+        logger.info(
+            f"Geladen: {len(self.keywords)} juridische keywords "
+            f"uit {self.keywords_path}"
+        )
+
+    def _read_keywords(self) -> set[str]:
+        """Parse de keywords YAML naar een set genormaliseerde termen."""
+        with open(self.keywords_path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+        keywords: set[str] = set()
+        for _category, keywords_list in (data or {}).items():
+            # Skip comments/metadata
+            if not isinstance(keywords_list, list):
+                continue
+
+            # Normaliseer en voeg toe
+            for keyword in keywords_list:
+                if isinstance(keyword, str):
+                    normalized = self._normalize_term(keyword)
+                    if normalized:
+                        keywords.add(normalized)
+        return keywords
 
     def _load_fallback_keywords(self) -> None:
         """
@@ -236,14 +250,17 @@ class JuridischRankerConfig:
             return
 
         try:
-            with open(self.defaults_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # Alleen de web_lookup sectie gaat het snapshot in
+            web_lookup = get_warm_start().get_or_build(
+                f"web_lookup_defaults:{self.defaults_path.resolve()}",
+                [self.defaults_path, __file__],
+                self._read_web_lookup_defaults,
+            )
 
-            if not data or "web_lookup" not in data:
+            if web_lookup is None:
                 logger.warning("web_lookup sectie niet gevonden in defaults")
                 return
 
-            web_lookup = data["web_lookup"]
             if "juridical_boost" not in web_lookup:
                 logger.warning("juridical_boost sectie niet gevonden")
                 return
@@ -268,6 +285,15 @@ class JuridischRankerConfig:
         except Exception as e:
             logger.error(f"Fout bij laden boost factors uit {self.defaults_path}: {e}")
 
+    def _read_web_lookup_defaults(self) -> dict[str, Any] | None:
+        """Parse web_lookup_defaults.yaml en geef de web_lookup sectie."""
+        with open(self.defaults_path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+        if not data or "web_lookup" not in data:
+            return None
+        return cast(dict[str, Any], data["web_lookup"])
+
 
 # Module-level singleton
 _config_singleton: JuridischRankerConfig | None = None
@@ -0,0 +1,185 @@
+"""
+Adaptieve per-provider timeouts op basis van geobserveerde latency.
+
+Per (provider, endpoint) wordt een compacte streaming latency sketch
+bijgehouden (logaritmische buckets met begrensde relatieve fout, vergelijkbaar
+met DDSketch). Uit de P95 wordt de timeout voor de volgende call afgeleid,
+binnen de geconfigureerde grenzen:
+
+    timeout = clamp(P95 * p95_multiplier, min_seconds, max_seconds)
+
+Zolang er minder dan ``min_samples`` observaties zijn wordt de request-timeout
+gebruikt (ongewijzigd gedrag bij cold start). Een call die op de timeout
+strandt wordt als observatie van die timeout geregistreerd, zodat de timeout
+voor een trage maar waardevolle provider stapsgewijs groeit tot het maximum.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any
+
+DEFAULT_QUANTILES = (0.5, 0.95)
+
+
+class LatencySketch:
+    """Streaming quantile sketch met relatieve nauwkeurigheid ``alpha``.
+
+    Elke waarde ``x`` valt in bucket ``ceil(log_gamma(x))`` met
+    ``gamma = (1 + alpha) / (1 - alpha)``; een quantile wordt teruggegeven als
+    het (relatieve) midden van de bucket. Geheugen is logaritmisch in het
+    bereik van de waarden (enkele tientallen buckets voor 1ms - 60s).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02):
+        self.alpha = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, value: float) -> None:
+        """Voeg een observatie (in seconden) toe."""
+        value = max(float(value), 1e-6)
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Geef de benaderde q-quantile (0..1), of None zonder observaties."""
+        if self.count == 0:
+            return None
+        rank = math.ceil(q * (self.count - 1))
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(value, self.min or value), self.max or value)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Samenvatting voor monitoring (seconden)."""
+        return {
+            "count": self.count,
+            "mean": (self.total / self.count) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            **{f"p{int(q * 100)}": self.quantile(q) for q in DEFAULT_QUANTILES},
+            "buckets": len(self._buckets),
+        }
+
+
+class LatencyTracker:
+    """Latency sketches per (provider, endpoint) en de afgeleide timeouts."""
+
+    def __init__(
+        self,
+        min_seconds: float = 2.0,
+        max_seconds: float = 30.0,
+        p95_multiplier: float = 1.5,
+        min_samples: int = 20,
+        relative_accuracy: float = 0.02,
+    ):
+        """Initialize latency tracker.
+
+        Args:
+            min_seconds: Ondergrens voor een afgeleide timeout
+            max_seconds: Bovengrens voor een afgeleide timeout
+            p95_multiplier: Marge bovenop de geobserveerde P95
+            min_samples: Observaties nodig voordat de sketch de timeout bepaalt
+            relative_accuracy: Relatieve fout van de quantile sketch
+        """
+        self.min_seconds = float(min_seconds)
+        self.max_seconds = max(float(max_seconds), self.min_seconds)
+        self.p95_multiplier = float(p95_multiplier)
+        self.min_samples = max(1, int(min_samples))
+        self.relative_accuracy = float(relative_accuracy)
+        self._sketches: dict[tuple[str, str], LatencySketch] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, endpoint: str, seconds: float) -> None:
+        """Registreer de duur van één call."""
+        key = (provider, endpoint)
+        with self._lock:
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = LatencySketch(self.relative_accuracy)
+            sketch.add(seconds)
+
+    def timeout_for(self, provider: str, endpoint: str, default: float) -> float:
+        """Bepaal de timeout voor een call.
+
+        Args:
+            provider: Provider key (bijv. "wikipedia")
+            endpoint: Endpoint binnen de provider (bijv. SRU endpoint)
+            default: Timeout bij onvoldoende observaties (request-timeout); geldt
+                ook als harde bovengrens zodat het request budget gerespecteerd
+                blijft
+
+        Returns:
+            Timeout in seconden
+        """
+        with self._lock:
+            derived = self._derive(self._sketches.get((provider, endpoint)))
+        return default if derived is None else min(derived, default)
+
+    def _derive(self, sketch: LatencySketch | None) -> float | None:
+        """Afgeleide timeout uit een sketch, of None bij te weinig observaties."""
+        if sketch is None or sketch.count < self.min_samples:
+            return None
+        p95 = sketch.quantile(0.95) or 0.0
+        return min(max(p95 * self.p95_multiplier, self.min_seconds), self.max_seconds)
+
+    def get_status(self) -> dict[str, dict[str, Any]]:
+        """Histogram samenvattingen per provider en endpoint."""
+        with self._lock:
+            status: dict[str, dict[str, Any]] = {}
+            for (provider, endpoint), sketch in self._sketches.items():
+                status.setdefault(provider, {})[endpoint] = {
+                    **sketch.to_dict(),
+                    "adaptive_timeout": self._derive(sketch),
+                }
+            return status
+
+    def reset(self) -> None:
+        """Verwijder alle observaties."""
+        with self._lock:
+            self._sketches.clear()
+
+
+_tracker: LatencyTracker | None = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker(config: dict[str, Any] | None = None) -> LatencyTracker | None:
+    """
+    Haal de gedeelde latency tracker op (één instance per proces).
+
+    Args:
+        config: ``web_lookup.adaptive_timeouts`` sectie uit de web lookup config
+
+    Returns:
+        LatencyTracker, of None als adaptieve timeouts uitgeschakeld zijn
+    """
+    global _tracker
+    cfg = config or {}
+    if not cfg.get("enabled", True):
+        return None
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = LatencyTracker(
+                min_seconds=float(cfg.get("min_seconds", 2.0)),
+                max_seconds=float(cfg.get("max_seconds", 30.0)),
+                p95_multiplier=float(cfg.get("p95_multiplier", 1.5)),
+                min_samples=int(cfg.get("min_samples", 20)),
+                relative_accuracy=float(cfg.get("relative_accuracy", 0.02)),
+            )
+        return _tracker
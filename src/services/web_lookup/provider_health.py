@@ -0,0 +1,326 @@
+"""
+Gedeelde, persistente provider health store voor web lookup (circuit breaker).
+
+Provider health leefde tot nu toe per instance in het geheugen: elke Streamlit
+sessie of herstart ontdekte opnieuw (via meerdere timeouts) dat een provider
+onbereikbaar was. Deze store bewaart de circuit breaker state in SQLite zodat
+alle processen dezelfde kennis delen.
+
+State machine per provider:
+    closed     → requests toegestaan; na ``failure_threshold`` opeenvolgende
+                 failures → open
+    open       → provider wordt overgeslagen tot ``cooldown_seconds`` verstreken
+    half_open  → precies één request (over alle processen) mag als probe door;
+                 succes → closed, failure → opnieuw open
+
+Alle state-overgangen gebeuren in één SQLite transactie (``BEGIN IMMEDIATE``),
+zodat meerdere processen veilig dezelfde database kunnen gebruiken.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Verankerd aan de project root: processen met een andere cwd delen dezelfde state
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_DB_PATH = str(PROJECT_ROOT / "cache" / "provider_health.db")
+
+
+def resolve_db_path(db_path: str | Path) -> str:
+    """Maak een relatief database pad absoluut t.o.v. de project root."""
+    path = Path(db_path)
+    return str(path if path.is_absolute() else PROJECT_ROOT / path)
+
+
+class ProviderHealthStore:
+    """SQLite-backed circuit breaker state, gedeeld tussen processen."""
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300.0,
+        probe_timeout_seconds: float = 60.0,
+    ):
+        """Initialize provider health store.
+
+        Args:
+            db_path: Pad naar SQLite database
+            failure_threshold: Opeenvolgende failures voordat het circuit opent
+            cooldown_seconds: Wachttijd voordat een open circuit een probe toestaat
+            probe_timeout_seconds: Na deze tijd mag een nieuwe probe geclaimd
+                worden als de vorige nooit is afgerond (bijv. gecrasht proces)
+        """
+        self.db_path = resolve_db_path(db_path)
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown_seconds = float(cooldown_seconds)
+        self.probe_timeout_seconds = float(probe_timeout_seconds)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit; transacties worden expliciet gestart met BEGIN IMMEDIATE
+        return sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+
+    def _ensure_schema(self) -> None:
+        """Create provider_health table als deze niet bestaat."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS provider_health (
+                    provider TEXT PRIMARY KEY,
+                    state TEXT NOT NULL DEFAULT 'closed',
+                    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                    total_failures INTEGER NOT NULL DEFAULT 0,
+                    total_successes INTEGER NOT NULL DEFAULT 0,
+                    opened_at REAL,
+                    probe_started_at REAL,
+                    last_failure_at REAL,
+                    last_success_at REAL,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL
+                )
+            """
+            )
+
+    def allow_request(self, provider: str) -> bool:
+        """Bepaal of een request naar deze provider mag.
+
+        Bij een open circuit waarvan de cooldown verstreken is wordt de
+        half-open probe atomisch geclaimd: alleen de eerste aanvrager (over
+        alle processen) krijgt True.
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT state FROM provider_health WHERE provider = ?",
+                    (provider,),
+                ).fetchone()
+                if row is None or row[0] == STATE_CLOSED:
+                    return True
+
+                # Claim probe: open + cooldown verstreken, of verlopen half-open probe
+                cursor = conn.execute(
+                    """
+                    UPDATE provider_health
+                       SET state = ?, probe_started_at = ?, updated_at = ?
+                     WHERE provider = ?
+                       AND ((state = ? AND opened_at <= ?)
+                            OR (state = ? AND probe_started_at <= ?))
+                """,
+                    (
+                        STATE_HALF_OPEN,
+                        now,
+                        now,
+                        provider,
+                        STATE_OPEN,
+                        now - self.cooldown_seconds,
+                        STATE_HALF_OPEN,
+                        now - self.probe_timeout_seconds,
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    logger.info(f"Provider health: half-open probe voor {provider}")
+                    return True
+                return False
+        except sqlite3.Error as e:
+            # Health store mag lookups nooit blokkeren
+            logger.debug(f"Provider health store niet leesbaar: {e}")
+            return True
+
+    def record_success(self, provider: str) -> None:
+        """Registreer een geslaagde request; sluit het circuit."""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT state FROM provider_health WHERE provider = ?",
+                    (provider,),
+                ).fetchone()
+                conn.execute(
+                    """
+                    INSERT INTO provider_health
+                        (provider, state, total_successes, last_success_at, updated_at)
+                    VALUES (?, ?, 1, ?, ?)
+                    ON CONFLICT(provider) DO UPDATE SET
+                        state = excluded.state,
+                        consecutive_failures = 0,
+                        total_successes = total_successes + 1,
+                        opened_at = NULL,
+                        probe_started_at = NULL,
+                        last_success_at = excluded.last_success_at,
+                        updated_at = excluded.updated_at
+                """,
+                    (provider, STATE_CLOSED, now, now),
+                )
+                conn.execute("COMMIT")
+            if row is not None and row[0] != STATE_CLOSED:
+                logger.info(f"Provider health: circuit voor {provider} gesloten")
+        except sqlite3.Error as e:
+            logger.debug(f"Provider health success niet opgeslagen: {e}")
+
+    def record_failure(self, provider: str, error: str | None = None) -> None:
+        """Registreer een mislukte request; opent het circuit bij de drempel."""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    """SELECT state, consecutive_failures
+                       FROM provider_health WHERE provider = ?""",
+                    (provider,),
+                ).fetchone()
+                state, failures = row if row else (STATE_CLOSED, 0)
+                failures += 1
+                # Mislukte probe of drempel bereikt → (opnieuw) open
+                opens = state == STATE_HALF_OPEN or (
+                    state == STATE_CLOSED and failures >= self.failure_threshold
+                )
+                new_state = STATE_OPEN if opens else state
+                conn.execute(
+                    """
+                    INSERT INTO provider_health
+                        (provider, state, consecutive_failures, total_failures,
+                         opened_at, last_failure_at, last_error, updated_at)
+                    VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                    ON CONFLICT(provider) DO UPDATE SET
+                        state = excluded.state,
+                        consecutive_failures = excluded.consecutive_failures,
+                        total_failures = total_failures + 1,
+                        opened_at = COALESCE(excluded.opened_at, opened_at),
+                        probe_started_at = NULL,
+                        last_failure_at = excluded.last_failure_at,
+                        last_error = excluded.last_error,
+                        updated_at = excluded.updated_at
+                """,
+                    (
+                        provider,
+                        new_state,
+                        failures,
+                        now if opens else None,
+                        now,
+                        (error or "")[:500] or None,
+                        now,
+                    ),
+                )
+                conn.execute("COMMIT")
+            if opens:
+                logger.warning(
+                    f"Provider health: circuit voor {provider} geopend "
+                    f"na {failures} opeenvolgende failures",
+                    extra={"provider": provider, "last_error": error},
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Provider health failure niet opgeslagen: {e}")
+
+    def release_probe(self, provider: str) -> None:
+        """Geef een geclaimde probe zonder uitkomst vrij.
+
+        Zonder bewijs van herstel of falen (bijv. een geannuleerde lookup)
+        blijft het circuit open, maar mag de volgende aanvrager direct een
+        nieuwe probe claimen in plaats van ``probe_timeout_seconds`` te wachten.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    UPDATE provider_health
+                       SET state = ?, probe_started_at = NULL, updated_at = ?
+                     WHERE provider = ? AND state = ?
+                """,
+                    (STATE_OPEN, time.time(), provider, STATE_HALF_OPEN),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Provider health probe niet vrijgegeven: {e}")
+
+    def get_status(self, provider: str | None = None) -> dict[str, Any]:
+        """Geef health state per provider (of voor één provider)."""
+        try:
+            with closing(self._connect()) as conn:
+                conn.row_factory = sqlite3.Row
+                if provider:
+                    rows = conn.execute(
+                        "SELECT * FROM provider_health WHERE provider = ?",
+                        (provider,),
+                    ).fetchall()
+                else:
+                    rows = conn.execute("SELECT * FROM provider_health").fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Provider health status niet leesbaar: {e}")
+            return {}
+
+        status = {row["provider"]: dict(row) for row in rows}
+        if provider:
+            return status.get(provider, {"provider": provider, "state": STATE_CLOSED})
+        return status
+
+    def reset(self, provider: str | None = None) -> None:
+        """Verwijder opgeslagen health state (alle providers of één)."""
+        try:
+            with closing(self._connect()) as conn:
+                if provider:
+                    conn.execute(
+                        "DELETE FROM provider_health WHERE provider = ?", (provider,)
+                    )
+                else:
+                    conn.execute("DELETE FROM provider_health")
+        except sqlite3.Error as e:
+            logger.warning(f"Provider health reset gefaald: {e}")
+
+
+_stores: dict[str, ProviderHealthStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_provider_health_store(
+    config: dict[str, Any] | None = None,
+) -> ProviderHealthStore | None:
+    """
+    Haal de gedeelde provider health store op (één instance per database pad).
+
+    Args:
+        config: ``web_lookup.provider_health`` sectie uit de web lookup config.
+            Het pad kan overschreven worden met env var PROVIDER_HEALTH_DB;
+            relatieve paden worden t.o.v. de project root opgelost.
+
+    Returns:
+        ProviderHealthStore, of None als uitgeschakeld of niet te initialiseren
+    """
+    cfg = config or {}
+    if not cfg.get("enabled", True):
+        return None
+
+    db_path = resolve_db_path(
+        os.getenv("PROVIDER_HEALTH_DB") or cfg.get("db_path") or DEFAULT_DB_PATH
+    )
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            try:
+                store = ProviderHealthStore(
+                    db_path=db_path,
+                    failure_threshold=int(cfg.get("failure_threshold", 3)),
+                    cooldown_seconds=float(cfg.get("cooldown_seconds", 300)),
+                    probe_timeout_seconds=float(cfg.get("probe_timeout_seconds", 60)),
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Provider health store niet beschikbaar: {e}")
+                return None
+            _stores[db_path] = store
+        return store
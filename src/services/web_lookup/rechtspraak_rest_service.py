@@ -21,6 +21,7 @@ except Exception:  # pragma: no cover
 from datetime import UTC, datetime
 
 from ..interfaces import LookupResult, WebSource
+from .http_session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class RechtspraakRESTService:
         if not AIOHTTP_AVAILABLE:  # pragma: no cover
             msg = "aiohttp vereist voor Rechtspraak REST service"
             raise RuntimeError(msg)
-        self.session = aiohttp.ClientSession(
+        self.session = create_session(
             headers=self.headers,
             timeout=aiohttp.ClientTimeout(total=20),
             trust_env=True,
@@ -30,6 +30,8 @@ UTC = UTC  # Python 3.10 compatibility
 from typing import cast
 
 from ..interfaces import LookupResult, WebSource
+from .http_session import create_session
+from .sru_stream_parser import SRUStreamParser
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,9 @@ class SRUService:
     - zoekoperatie.overheid.nl (zoekservice)
     """
 
+    # Chunkgrootte (bytes) voor het streamend parsen van SRU responses
+    STREAM_CHUNK_SIZE = 16 * 1024
+
     def __init__(
         self, circuit_breaker_config: dict | None = None, enable_synonyms: bool = True
     ):
@@ -178,7 +183,7 @@ class SRUService:
         )
         # SRU-servers verwachten XML responses
         self.headers.setdefault("Accept", "application/xml, text/xml;q=0.9, */*;q=0.8")
-        self.session = aiohttp.ClientSession(
+        self.session = create_session(
             headers=self.headers,
             timeout=aiohttp.ClientTimeout(total=30),
             connector=connector,
@@ -265,45 +270,6 @@ class SRUService:
                 last_status: int | None = None
                 last_text: str | None = None
 
-                # Parse subset van SRU diagnostics voor betere logging
-                def _extract_diag(xml_text: str) -> dict:
-                    try:
-                        r = ET.fromstring(xml_text)
-                        ns = {
-                            "srw": "http://docs.oasis-open.org/ns/search-ws/sruResponse"
-                        }
-                        d = r.find(".//srw:diagnostics", ns)
-                        if d is None:
-                            return {}
-                        first = None
-                        for n in d:
-                            first = n
-                            break
-                        if first is None:
-                            return {}
-
-                        # Probeer message/details/uri te lezen (namespaces tolerant)
-                        def _txt(tag: str) -> str | None:
-                            el = first.find(f"srw:{tag}", ns)
-                            if el is not None and el.text:
-                                return el.text.strip()
-                            for e in first:
-                                t = e.tag
-                                if "}" in t:
-                                    t = t.split("}", 1)[1]
-                                if t.lower() == tag and e.text:
-                                    return e.text.strip()
-                            return None
-
-                        return {
-                            "diag_uri": _txt("uri"),
-                            "diag_message": _txt("message"),
-                            "diag_details": _txt("details"),
-                        }
-                    except Exception as e:
-                        logger.warning(f"SRU diagnostics parsing gefaald: {e}")
-                        return {}
-
                 # Doorloop schemas (indien van toepassing) en probeer primary + alternatieve URLs
                 for schema in schemas_to_try:
                     params = dict(base_params)
@@ -336,9 +302,8 @@ class SRUService:
                                         "recordSchema": schema,
                                     }
                                     if response.status == 200:
-                                        xml_content = await response.text()
-                                        parsed = self._parse_sru_response(
-                                            xml_content, term, config
+                                        parsed = await self._parse_sru_stream(
+                                            response, term, config, max_records
                                         )
                                         attempt_rec["records"] = len(parsed or [])
                                         self._attempts.append(attempt_rec)
@@ -352,7 +317,7 @@ class SRUService:
                                             attempt_rec["body_preview"] = last_text
 
                                             # Extract and log diagnostics
-                                            diag = _extract_diag(txt)
+                                            diag = self._extract_diag_from_response(txt)
                                             if diag:
                                                 logger.warning(
                                                     f"SRU diagnostic from {config.name}: {diag.get('diag_message', 'Unknown error')}",
@@ -776,53 +741,10 @@ class SRUService:
         Ondersteunt beide SRU 1.2 en 2.0 namespaces.
         """
         try:
-            r = ET.fromstring(xml_text)
-            # Probeer beide namespace varianten (SRU 1.2 en 2.0)
-            namespace_variants = [
-                {
-                    "srw": "http://docs.oasis-open.org/ns/search-ws/sruResponse"
-                },  # SRU 2.0
-                {"srw": "http://www.loc.gov/zing/srw/"},  # SRU 1.2
-            ]
-
-            d = None
-            for ns in namespace_variants:
-                d = r.find(".//srw:diagnostics", ns)
-                if d is not None:
-                    break
-
-            if d is None:
-                return {}
-
-            first = None
-            for n in d:
-                first = n
-                break
-            if first is None:
-                return {}
-
-            # Probeer message/details/uri te lezen (namespaces tolerant)
-            def _txt(tag: str) -> str | None:
-                # Probeer met namespace
-                for ns in namespace_variants:
-                    el = first.find(f"srw:{tag}", ns)
-                    if el is not None and el.text:
-                        return el.text.strip()
-
-                # Fallback: zonder namespace
-                for e in first:
-                    t = e.tag
-                    if "}" in t:
-                        t = t.split("}", 1)[1]
-                    if t.lower() == tag and e.text:
-                        return e.text.strip()
-                return None
-
-            return {
-                "diag_uri": _txt("uri"),
-                "diag_message": _txt("message"),
-                "diag_details": _txt("details"),
-            }
+            parser = SRUStreamParser(lambda record, namespaces: None)
+            parser.feed(xml_text)
+            parser.close()
+            return parser.diagnostics
         except Exception as e:
             logger.warning(f"SRU diagnostics extractie gefaald: {e}")
             return {}
@@ -915,91 +837,112 @@ class SRUService:
             return out
         return None
 
+    def _new_stream_parser(
+        self, term: str, config: SRUConfig, max_records: int | None
+    ) -> SRUStreamParser:
+        """Maak een streaming parser die records direct naar LookupResults omzet."""
+        return SRUStreamParser(
+            lambda record, namespaces: self._parse_record(
+                record, term, config, namespaces
+            ),
+            max_records=max_records,
+        )
+
     def _parse_sru_response(
-        self, xml_content: str, term: str, config: SRUConfig
+        self,
+        xml_content: str,
+        term: str,
+        config: SRUConfig,
+        max_records: int | None = None,
     ) -> list[LookupResult]:
         """Parse SRU XML response naar LookupResult objecten."""
+        parser = self._new_stream_parser(term, config, max_records)
         try:
-            root = ET.fromstring(xml_content)
-
-            # SRU namespace variants (support voor SRU 1.2 en 2.0)
-            namespace_variants = [
-                {
-                    "srw": "http://www.loc.gov/zing/srw/",  # SRU 1.2
-                    "dc": "http://purl.org/dc/elements/1.1/",
-                    "dcterms": "http://purl.org/dc/terms/",
-                    "gzd": "http://overheid.nl/gzd",
-                },
-                {
-                    "srw": "http://docs.oasis-open.org/ns/search-ws/sruResponse",  # SRU 2.0
-                    "dc": "http://purl.org/dc/elements/1.1/",
-                    "dcterms": "http://purl.org/dc/terms/",
-                    "gzd": "http://overheid.nl/gzd",
-                },
-            ]
+            parser.feed(xml_content)
+            parser.close()
+        except ET.ParseError as e:
+            logger.error(f"XML parse error voor {config.name}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {config.name} response: {e}")
+            return []
+        return self._finish_parse(parser, term, config)
+
+    async def _parse_sru_stream(
+        self,
+        response,
+        term: str,
+        config: SRUConfig,
+        max_records: int | None = None,
+    ) -> list[LookupResult]:
+        """Parse een SRU response incrementeel terwijl de body binnenkomt.
 
-            # Probeer beide namespaces (SRU 1.2 en 2.0 auto-detect)
-            records = []
-            namespaces = None
-            for ns_variant in namespace_variants:
-                records = root.findall(".//srw:record", ns_variant)
-                if records:
-                    namespaces = ns_variant
+        Records en diagnostics worden in één pass geëxtraheerd; lezen stopt
+        zodra ``max_records`` bruikbare records verzameld zijn. Responses
+        zonder aiohttp stream (bijv. mocks) vallen terug op ``response.text()``.
+        """
+        content = getattr(response, "content", None)
+        if not (AIOHTTP_AVAILABLE and isinstance(content, aiohttp.StreamReader)):
+            return self._parse_sru_response(
+                await response.text(), term, config, max_records
+            )
+
+        parser = self._new_stream_parser(term, config, max_records)
+        try:
+            async for chunk in content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                if parser.done:
                     logger.debug(
-                        f"Found {len(records)} records using namespace: {ns_variant['srw']}"
+                        f"SRU stream van {config.name} vroegtijdig gestopt na "
+                        f"{len(parser.results)} records ({parser.bytes_read} bytes)"
                     )
                     break
+            parser.close()
+        except ET.ParseError as e:
+            logger.error(f"XML parse error voor {config.name}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {config.name} response: {e}")
+            return []
+        return self._finish_parse(parser, term, config)
+
+    def _finish_parse(
+        self, parser: SRUStreamParser, term: str, config: SRUConfig
+    ) -> list[LookupResult]:
+        """Log diagnostics bij lege responses en sorteer de geparste records."""
+        if not parser.records_seen:
+            logger.warning(
+                f"No records found in SRU response from {config.name}",
+                extra={
+                    "xml_length": parser.bytes_read,
+                    "xml_preview": parser.preview,
+                    "endpoint": config.name,
+                    "term": term,
+                },
+            )
 
-            if not records:
-                logger.warning(
-                    f"No records found in SRU response from {config.name}",
+            # Diagnostics zijn in dezelfde pass meegenomen
+            diag = parser.diagnostics
+            if diag:
+                logger.error(
+                    f"SRU diagnostic found: {diag.get('diag_message', 'Unknown')}",
                     extra={
-                        "xml_length": len(xml_content),
-                        "xml_preview": (
-                            xml_content[:500] if len(xml_content) > 500 else xml_content
-                        ),
                         "endpoint": config.name,
                         "term": term,
+                        "diagnostic_uri": diag.get("diag_uri"),
+                        "diagnostic_message": diag.get("diag_message"),
+                        "diagnostic_details": diag.get("diag_details"),
                     },
                 )
+            return []
 
-                # Check for diagnostics in XML
-                diag = self._extract_diag_from_response(xml_content)
-                if diag:
-                    logger.error(
-                        f"SRU diagnostic found: {diag.get('diag_message', 'Unknown')}",
-                        extra={
-                            "endpoint": config.name,
-                            "term": term,
-                            "diagnostic_uri": diag.get("diag_uri"),
-                            "diagnostic_message": diag.get("diag_message"),
-                            "diagnostic_details": diag.get("diag_details"),
-                        },
-                    )
-
-                return []
-
-            results = []
-
-            # At this point, namespaces is guaranteed to be set (records is non-empty)
-            assert namespaces is not None
-            for record in records:
-                result = self._parse_record(record, term, config, namespaces)
-                if result:
-                    results.append(result)
-
-            # Sorteer op relevantie (title match eerst)
-            results.sort(key=lambda r: r.source.confidence, reverse=True)
+        results: list[LookupResult] = list(parser.results)
 
-            logger.info(f"Parsed {len(results)} results from {config.name}")
-            return results
+        # Sorteer op relevantie (title match eerst)
+        results.sort(key=lambda r: r.source.confidence, reverse=True)
 
-        except ET.ParseError as e:
-            logger.error(f"XML parse error voor {config.name}: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error parsing {config.name} response: {e}")
-            return []
+        logger.info(f"Parsed {len(results)} results from {config.name}")
+        return results
 
     def _parse_record(
         self,
@@ -0,0 +1,152 @@
+"""
+Incrementele (streaming) parser voor SRU searchRetrieve responses.
+
+Vervangt het volledig inlezen + ``ET.fromstring`` van SRU responses. De
+response wordt in chunks aan een ``XMLPullParser`` gevoed; records en
+diagnostics worden in één pass geëxtraheerd en verwerkte elementen worden
+direct vrijgegeven. Zodra ``max_records`` bruikbare records verzameld zijn
+stopt de parser met verwerken.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from typing import Any
+
+SRU_12_NS = "http://www.loc.gov/zing/srw/"
+SRU_20_NS = "http://docs.oasis-open.org/ns/search-ws/sruResponse"
+SRU_NAMESPACES = (SRU_12_NS, SRU_20_NS)
+
+# Namespaces die _parse_record verwacht naast de SRW namespace
+RECORD_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "gzd": "http://overheid.nl/gzd",
+}
+
+# Aantal bytes/karakters van de response dat bewaard blijft voor logging
+PREVIEW_SIZE = 500
+
+
+def _split_tag(tag: str) -> tuple[str, str]:
+    """Splits '{namespace}local' in (namespace, local)."""
+    if tag.startswith("{"):
+        ns, _, local = tag[1:].partition("}")
+        return ns, local
+    return "", tag
+
+
+def extract_diagnostic(diagnostics: ET.Element) -> dict[str, Any]:
+    """Lees uri/message/details uit de eerste diagnostic (namespace tolerant)."""
+    first = next(iter(diagnostics), None)
+    if first is None:
+        return {}
+
+    def _txt(tag: str) -> str | None:
+        # Eerst SRW-namespaced kinderen, daarna op lokale tagnaam
+        for srw_only in (True, False):
+            for el in first:
+                ns, local = _split_tag(el.tag)
+                if srw_only and ns not in SRU_NAMESPACES:
+                    continue
+                if local.lower() == tag and el.text:
+                    return el.text.strip()
+        return None
+
+    return {
+        "diag_uri": _txt("uri"),
+        "diag_message": _txt("message"),
+        "diag_details": _txt("details"),
+    }
+
+
+class SRUStreamParser:
+    """
+    Streaming SRU parser op basis van ``xml.etree.ElementTree.XMLPullParser``.
+
+    Gebruik ``feed()`` per ontvangen chunk en ``close()`` aan het einde. Elk
+    afgerond ``srw:record`` element wordt meteen via ``parse_record`` omgezet
+    en daarna uit de boom verwijderd. ``done`` wordt True zodra ``max_records``
+    bruikbare records verzameld zijn; verdere input wordt dan genegeerd.
+
+    Net als de eerdere ``findall``-implementatie worden alleen records uit één
+    SRW namespace gebruikt (SRU 1.2 heeft voorrang boven SRU 2.0).
+    """
+
+    def __init__(
+        self,
+        parse_record: Callable[[ET.Element, dict[str, str]], Any | None],
+        max_records: int | None = None,
+    ):
+        self._parse_record = parse_record
+        self.max_records = max_records
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+        self._results: dict[str, list[Any]] = {ns: [] for ns in SRU_NAMESPACES}
+        self.records_seen = 0
+        self.diagnostics: dict[str, Any] = {}
+        self.bytes_read = 0
+        self.preview = ""
+        self.done = False
+
+    @property
+    def results(self) -> list[Any]:
+        """Bruikbare records (SRU 1.2 records hebben voorrang)."""
+        return self._results[SRU_12_NS] or self._results[SRU_20_NS]
+
+    def feed(self, data: bytes | str) -> None:
+        """Verwerk een chunk van de response."""
+        if self.done or not data:
+            return
+        if len(self.preview) < PREVIEW_SIZE:
+            chunk = (
+                data.decode("utf-8", errors="replace")
+                if isinstance(data, bytes)
+                else data
+            )
+            self.preview += chunk[: PREVIEW_SIZE - len(self.preview)]
+        self.bytes_read += len(data)
+        self._parser.feed(data)
+        self._process_events()
+
+    def close(self) -> None:
+        """Sluit de parser af; raises ET.ParseError bij onvolledige XML."""
+        if self.done:
+            return
+        self._parser.close()
+        self._process_events()
+
+    def _process_events(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if self.done:
+                continue
+            ns, local = _split_tag(elem.tag)
+            if ns not in SRU_NAMESPACES:
+                continue
+
+            if local == "record":
+                self.records_seen += 1
+                result = self._parse_record(elem, {"srw": ns, **RECORD_NAMESPACES})
+                if result is not None:
+                    self._results[ns].append(result)
+                self._release(elem)
+                if (
+                    self.max_records is not None
+                    and len(self.results) >= self.max_records
+                ):
+                    self.done = True
+            elif local == "diagnostics" and not self.diagnostics:
+                self.diagnostics = extract_diagnostic(elem)
+                self._release(elem)
+
+    def _release(self, elem: ET.Element) -> None:
+        """Geef een verwerkt element (en zijn subtree) vrij."""
+        elem.clear()
+        if self._stack:
+            self._stack[-1].remove(elem)
@@ -21,6 +21,7 @@ except ImportError:
 from datetime import UTC, datetime
 
 from ..interfaces import LookupResult, WebSource
+from .http_session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +61,7 @@ class WikipediaService:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
+        self.session = create_session(
             headers=self.headers, timeout=aiohttp.ClientTimeout(total=30)
         )
         return self
@@ -24,6 +24,8 @@ except ImportError:
     AIOHTTP_AVAILABLE = False
     print("Warning: aiohttp niet beschikbaar - Wikipedia synonym extractor werkt niet")
 
+from .http_session import create_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,7 +111,7 @@ class WikipediaSynonymExtractor:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
+        self.session = create_session(
             headers=self.headers, timeout=aiohttp.ClientTimeout(total=30)
         )
         return self
@@ -22,6 +22,7 @@ except ImportError:  # pragma: no cover - fallback voor omgevingen zonder aiohtt
 from datetime import UTC, datetime
 
 from ..interfaces import LookupResult, WebSource
+from .http_session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ class WiktionaryService:
         if not AIOHTTP_AVAILABLE:
             msg = "aiohttp vereist voor WiktionaryService"
             raise RuntimeError(msg)
-        self.session = aiohttp.ClientSession(
+        self.session = create_session(
             headers=self.headers, timeout=aiohttp.ClientTimeout(total=30)
         )
         return self
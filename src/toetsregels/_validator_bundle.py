@@ -0,0 +1,98 @@
+"""Gegenereerde bundle met alle validator classes (niet handmatig wijzigen).
+
+Opnieuw genereren: python -m toetsregels.rule_registry --write-bundle
+"""
+
+from toetsregels.validators.ARAI01 import ARAI01Validator
+from toetsregels.validators.ARAI02 import ARAI02Validator
+from toetsregels.validators.ARAI02SUB1 import ARAI02SUB1Validator
+from toetsregels.validators.ARAI02SUB2 import ARAI02SUB2Validator
+from toetsregels.validators.ARAI03 import ARAI03Validator
+from toetsregels.validators.ARAI04 import ARAI04Validator
+from toetsregels.validators.ARAI04SUB1 import ARAI04SUB1Validator
+from toetsregels.validators.ARAI05 import ARAI05Validator
+from toetsregels.validators.ARAI06 import ARAI06Validator
+from toetsregels.validators.CON_01 import CON01Validator
+from toetsregels.validators.CON_02 import CON02Validator
+from toetsregels.validators.ESS_01 import ESS01Validator
+from toetsregels.validators.ESS_02 import ESS02Validator
+from toetsregels.validators.ESS_03 import ESS03Validator
+from toetsregels.validators.ESS_04 import ESS04Validator
+from toetsregels.validators.ESS_05 import ESS05Validator
+from toetsregels.validators.INT_01 import INT01Validator
+from toetsregels.validators.INT_02 import INT02Validator
+from toetsregels.validators.INT_03 import INT03Validator
+from toetsregels.validators.INT_04 import INT04Validator
+from toetsregels.validators.INT_06 import INT06Validator
+from toetsregels.validators.INT_07 import INT07Validator
+from toetsregels.validators.INT_08 import INT08Validator
+from toetsregels.validators.INT_09 import INT09Validator
+from toetsregels.validators.INT_10 import INT10Validator
+from toetsregels.validators.SAM_01 import SAM01Validator
+from toetsregels.validators.SAM_02 import SAM02Validator
+from toetsregels.validators.SAM_03 import SAM03Validator
+from toetsregels.validators.SAM_04 import SAM04Validator
+from toetsregels.validators.SAM_05 import SAM05Validator
+from toetsregels.validators.SAM_06 import SAM06Validator
+from toetsregels.validators.SAM_07 import SAM07Validator
+from toetsregels.validators.SAM_08 import SAM08Validator
+from toetsregels.validators.STR_01 import STR01Validator
+from toetsregels.validators.STR_02 import STR02Validator
+from toetsregels.validators.STR_03 import STR03Validator
+from toetsregels.validators.STR_04 import STR04Validator
+from toetsregels.validators.STR_05 import STR05Validator
+from toetsregels.validators.STR_06 import STR06Validator
+from toetsregels.validators.STR_07 import STR07Validator
+from toetsregels.validators.STR_08 import STR08Validator
+from toetsregels.validators.STR_09 import STR09Validator
+from toetsregels.validators.VER_01 import VER01Validator
+from toetsregels.validators.VER_02 import VER02Validator
+from toetsregels.validators.VER_03 import VER03Validator
+
+VALIDATOR_CLASSES = {
+    "ARAI-01": ARAI01Validator,
+    "ARAI-02": ARAI02Validator,
+    "ARAI-02SUB1": ARAI02SUB1Validator,
+    "ARAI-02SUB2": ARAI02SUB2Validator,
+    "ARAI-03": ARAI03Validator,
+    "ARAI-04": ARAI04Validator,
+    "ARAI-04SUB1": ARAI04SUB1Validator,
+    "ARAI-05": ARAI05Validator,
+    "ARAI-06": ARAI06Validator,
+    "CON-01": CON01Validator,
+    "CON-02": CON02Validator,
+    "ESS-01": ESS01Validator,
+    "ESS-02": ESS02Validator,
+    "ESS-03": ESS03Validator,
+    "ESS-04": ESS04Validator,
+    "ESS-05": ESS05Validator,
+    "INT-01": INT01Validator,
+    "INT-02": INT02Validator,
+    "INT-03": INT03Validator,
+    "INT-04": INT04Validator,
+    "INT-06": INT06Validator,
+    "INT-07": INT07Validator,
+    "INT-08": INT08Validator,
+    "INT-09": INT09Validator,
+    "INT-10": INT10Validator,
+    "SAM-01": SAM01Validator,
+    "SAM-02": SAM02Validator,
+    "SAM-03": SAM03Validator,
+    "SAM-04": SAM04Validator,
+    "SAM-05": SAM05Validator,
+    "SAM-06": SAM06Validator,
+    "SAM-07": SAM07Validator,
+    "SAM-08": SAM08Validator,
+    "STR-01": STR01Validator,
+    "STR-02": STR02Validator,
+    "STR-03": STR03Validator,
+    "STR-04": STR04Validator,
+    "STR-05": STR05Validator,
+    "STR-06": STR06Validator,
+    "STR-07": STR07Validator,
+    "STR-08": STR08Validator,
+    "STR-09": STR09Validator,
+    "VER-01": VER01Validator,
+    "VER-02": VER02Validator,
+    "VER-03": VER03Validator,
+}
@@ -64,6 +64,10 @@ class CachedToetsregelManager:
         self.stats["cache_hits"] += 1
         return self.cache.get_all_rules()
 
+    def get_ruleset_version(self) -> str:
+        """Fingerprint van de geladen regelset (zie RuleCache.get_ruleset_version)."""
+        return self.cache.get_ruleset_version()
+
     def get_verplichte_regels(self) -> list[dict[str, Any]]:
         """Haal alle verplichte regels op."""
         all_rules = self.get_all_regels()
@@ -5,7 +5,6 @@ Laadt toetsregels uit zowel JSON configuratie als Python validatie modules.
 Elke toetsregel kan zijn eigen Python module hebben voor complexe validatie logica.
 """
 
-import importlib.util
 import json
 import logging
 from collections.abc import Callable
@@ -13,6 +12,12 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any, cast
 
+from .rule_registry import (
+    DEFAULT_REGELS_DIR,
+    get_rule_registry,
+    import_validator_module,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +40,8 @@ class ModularToetsregelLoader:
 
         self.loaded_modules: dict[str, ModuleType] = {}
         self.loaded_configs: dict[str, dict[str, Any]] = {}
+        # Standaard regels: validators uit de (éénmalig geladen) registry
+        self._use_registry = self.regels_dir.resolve() == DEFAULT_REGELS_DIR.resolve()
 
     def load_regel(self, regel_id: str) -> dict[str, Any] | None:
         """
@@ -46,6 +53,10 @@ class ModularToetsregelLoader:
         Returns:
             Dictionary met regel configuratie en validator
         """
+        # Eenmaal geladen regels liggen vast (geen herhaalde imports/JSON reads)
+        if regel_id in self.loaded_configs:
+            return self.loaded_configs[regel_id]
+
         # Normaliseer regel ID (ESS-03 -> ESS_03 voor Python module)
         module_name = regel_id.replace("-", "_")
 
@@ -75,42 +86,41 @@ class ModularToetsregelLoader:
             # Backward compatibility: probeer regels_dir als fallback
             py_path = self.regels_dir / f"{module_name}.py"
 
-        if py_path.exists():
+        registry_validator = (
+            get_rule_registry().get_validator(regel_id) if self._use_registry else None
+        )
+        if registry_validator is not None:
+            # Vooraf geladen validator (geïnstantieerd met de JSON config)
+            regel_data["validator"] = registry_validator
+            regel_data["validate_func"] = registry_validator.validate
+        elif py_path.exists():
             try:
-                # Dynamisch laden van Python module
-                spec = importlib.util.spec_from_file_location(module_name, py_path)
-                if spec is None or spec.loader is None:
-                    logger.warning(f"Kon spec niet laden voor {regel_id}")
-                else:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    # Zoek validator class of functie
-                    if hasattr(module, "create_validator"):
-                        # Module heeft factory functie
-                        validator = module.create_validator()
-                        regel_data["validator"] = validator
-                        regel_data["validate_func"] = validator.validate
-                        logger.info(f"Geladen validator class voor {regel_id}")
-
-                    elif hasattr(module, f"validate_{module_name.lower()}"):
-                        # Module heeft directe validatie functie
-                        validate_func = getattr(
-                            module, f"validate_{module_name.lower()}"
-                        )
-                        regel_data["validate_func"] = validate_func
-                        logger.info(f"Geladen validatie functie voor {regel_id}")
-
-                    elif hasattr(module, f"{module_name}Validator"):
-                        # Module heeft validator class
-                        validator_class = getattr(module, f"{module_name}Validator")
-                        validator = validator_class(config)
-                        regel_data["validator"] = validator
-                        regel_data["validate_func"] = validator.validate
-                        logger.info(f"Geladen {module_name}Validator voor {regel_id}")
-
-                    # Cache de module
-                    self.loaded_modules[regel_id] = module
+                # Python module éénmaal per proces importeren (zie rule_registry)
+                module = import_validator_module(py_path, module_name)
+                # Zoek validator class of functie
+                if hasattr(module, "create_validator"):
+                    # Module heeft factory functie
+                    validator = module.create_validator()
+                    regel_data["validator"] = validator
+                    regel_data["validate_func"] = validator.validate
+                    logger.info(f"Geladen validator class voor {regel_id}")
+
+                elif hasattr(module, f"validate_{module_name.lower()}"):
+                    # Module heeft directe validatie functie
+                    validate_func = getattr(module, f"validate_{module_name.lower()}")
+                    regel_data["validate_func"] = validate_func
+                    logger.info(f"Geladen validatie functie voor {regel_id}")
+
+                elif hasattr(module, f"{module_name}Validator"):
+                    # Module heeft validator class
+                    validator_class = getattr(module, f"{module_name}Validator")
+                    validator = validator_class(config)
+                    regel_data["validator"] = validator
+                    regel_data["validate_func"] = validator.validate
+                    logger.info(f"Geladen {module_name}Validator voor {regel_id}")
+
+                # Cache de module
+                self.loaded_modules[regel_id] = module
 
             except Exception as e:
                 logger.warning(f"Kon Python module niet laden voor {regel_id}: {e}")
@@ -7,6 +7,7 @@ behoudt een kleine memory footprint en is direct integreerbaar met
 ModularValidationService — zonder UI/Streamlit-afhankelijkheid.
 """
 
+import hashlib
 import json
 import logging
 import threading
@@ -14,6 +15,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from utils.cache import cached, clear_cache as _global_cache_clear
+from utils.warm_start import get_warm_start
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,8 @@ def _load_all_rules_cached(regels_dir: str) -> dict[str, dict[str, Any]]:
 
     Deze functie wordt SLECHTS EENMAAL uitgevoerd per uur (ttl=3600).
     Alle volgende calls returnen de gecachte data direct uit memory.
+    Een nieuw proces leest de regels uit het warm-start snapshot, zolang
+    geen van de JSON bestanden gewijzigd is.
 
     Args:
         regels_dir: Path naar de regels directory
@@ -42,14 +46,26 @@ def _load_all_rules_cached(regels_dir: str) -> dict[str, dict[str, Any]]:
         Dictionary met regel_id als key en regel data als value
     """
     rules_path = Path(regels_dir)
-    all_rules: dict[str, dict[str, Any]] = {}
 
     if not rules_path.exists():
         logger.warning(f"Regels directory bestaat niet: {regels_dir}")
-        return all_rules
+        return {}
 
-    # Load alle JSON files in één keer
     json_files = sorted(rules_path.glob("*.json"))
+    # Deze module (_read_rules) hoort bij de bronnen: wijzigt de normalisatie,
+    # dan wordt het snapshot herbouwd
+    return get_warm_start().get_or_build(
+        f"toetsregels:{rules_path.resolve()}",
+        [*json_files, __file__],
+        lambda: _read_rules(json_files, regels_dir),
+    )
+
+
+def _read_rules(json_files: list[Path], regels_dir: str) -> dict[str, dict[str, Any]]:
+    """Lees en normaliseer alle regel JSON bestanden."""
+    all_rules: dict[str, dict[str, Any]] = {}
+
+    # Load alle JSON files in één keer
     logger.info(f"Loading {len(json_files)} regel files van {regels_dir}")
 
     for json_file in json_files:
@@ -276,6 +292,23 @@ class RuleCache:
 
         return weights
 
+    def get_ruleset_version(self) -> str:
+        """
+        Fingerprint van de inhoud van de geladen regelset.
+
+        Wijzigt zodra de cache andere regeldata serveert (na TTL of clear),
+        zodat afgeleide caches (bv. prompt module output) mee kunnen keyen.
+
+        Returns:
+            Korte hex-hash van alle regeldata
+        """
+        payload = json.dumps(
+            self.get_all_rules(), sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()[
+            :12
+        ]
+
     def clear_cache(self):
         """
         Clear de cache voor regels.
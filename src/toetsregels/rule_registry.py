@@ -0,0 +1,289 @@
+"""
+Rule registry - Python validators éénmalig importeren en instantiëren.
+
+De registry ontdekt alle toetsregels (``regels/<ID>.json``), importeert de
+bijbehorende validator class uit ``toetsregels.validators`` via het normale
+importsysteem (dus één keer per proces, met bytecode cache) en instantieert
+die met de JSON configuratie. Daarna levert de registry gebonden
+``validate`` callables zonder verdere bestandssysteem-toegang.
+
+Optioneel versnelt een gegenereerde bundle (``_validator_bundle.py``) de
+start: die importeert alle validator classes expliciet, zodat er geen
+directory scans of kandidaat-bestandsnamen nodig zijn. Genereren:
+
+    python -m toetsregels.rule_registry --write-bundle
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+VALIDATORS_PACKAGE = "toetsregels.validators"
+BUNDLE_MODULE = "toetsregels._validator_bundle"
+
+_TOETSREGELS_DIR = Path(__file__).parent
+DEFAULT_REGELS_DIR = _TOETSREGELS_DIR / "regels"
+DEFAULT_VALIDATORS_DIR = _TOETSREGELS_DIR / "validators"
+BUNDLE_PATH = _TOETSREGELS_DIR / "_validator_bundle.py"
+
+# Modules die buiten het package (bijv. regels/<ID>.py) via spec geladen zijn
+_spec_modules: dict[Path, ModuleType] = {}
+_spec_lock = threading.Lock()
+
+
+def validator_module_candidates(regel_id: str) -> list[str]:
+    """Mogelijke modulenamen: CON-01 → CON_01, ARAI-02SUB1 → ARAI02SUB1."""
+    return [regel_id.replace("-", "_"), regel_id.replace("-", "")]
+
+
+def validator_class_name(regel_id: str) -> str:
+    """Conventie voor de validator class: CON-01 → CON01Validator."""
+    return f"{regel_id.replace('-', '')}Validator"
+
+
+def import_validator_module(py_path: Path, module_name: str) -> ModuleType:
+    """Importeer een validator module precies één keer per proces.
+
+    Modules in het ``toetsregels.validators`` package lopen via
+    ``importlib.import_module`` (sys.modules + bytecode cache); overige paden
+    (bijv. ``regels/ESS-03.py``) via een spec, gememoized per pad.
+    """
+    py_path = Path(py_path).resolve()
+    if (
+        py_path.parent == DEFAULT_VALIDATORS_DIR.resolve()
+        and py_path.stem.isidentifier()
+    ):
+        return importlib.import_module(f"{VALIDATORS_PACKAGE}.{py_path.stem}")
+
+    with _spec_lock:
+        module = _spec_modules.get(py_path)
+        if module is not None:
+            return module
+        spec = importlib.util.spec_from_file_location(module_name, py_path)
+        if spec is None or spec.loader is None:
+            msg = f"Kon geen module spec laden voor {py_path}"
+            raise ImportError(msg)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _spec_modules[py_path] = module
+        return module
+
+
+def load_rule_config(regels_dir: Path, regel_id: str) -> dict[str, Any] | None:
+    """Lees ``<regel_id>.json``; het ID wordt toegevoegd voor consistentie."""
+    json_path = Path(regels_dir) / f"{regel_id}.json"
+    if not json_path.exists():
+        return None
+    with open(json_path, encoding="utf-8") as f:
+        config = json.load(f)
+    config["id"] = regel_id
+    return config
+
+
+def discover_rule_ids(regels_dir: Path = DEFAULT_REGELS_DIR) -> list[str]:
+    """Alle regel IDs op basis van de JSON bestanden."""
+    return sorted(
+        p.stem for p in Path(regels_dir).glob("*.json") if not p.stem.startswith("_")
+    )
+
+
+def discover_validator_classes(
+    regel_ids: list[str], validators_dir: Path = DEFAULT_VALIDATORS_DIR
+) -> dict[str, type]:
+    """Zoek per regel de validator class via de bestandsnaam-conventies."""
+    classes: dict[str, type] = {}
+    for regel_id in regel_ids:
+        for name in validator_module_candidates(regel_id):
+            py_path = Path(validators_dir) / f"{name}.py"
+            if not py_path.exists():
+                continue
+            module = import_validator_module(py_path, f"toetsregel_{regel_id}")
+            validator_class = getattr(module, validator_class_name(regel_id), None)
+            if validator_class is not None:
+                classes[regel_id] = validator_class
+            break
+    return classes
+
+
+def load_bundle() -> dict[str, type] | None:
+    """Validator classes uit de gegenereerde bundle, of None als die ontbreekt."""
+    try:
+        bundle = importlib.import_module(BUNDLE_MODULE)
+    except ImportError:
+        return None
+    return dict(getattr(bundle, "VALIDATOR_CLASSES", {}) or {}) or None
+
+
+def generate_bundle_source(classes: dict[str, type]) -> str:
+    """Broncode voor ``_validator_bundle.py`` (expliciete imports, geen scan)."""
+    lines = [
+        '"""Gegenereerde bundle met alle validator classes (niet handmatig wijzigen).',
+        "",
+        "Opnieuw genereren: python -m toetsregels.rule_registry --write-bundle",
+        '"""',
+        "",
+    ]
+    for regel_id in sorted(classes):
+        cls = classes[regel_id]
+        lines.append(f"from {cls.__module__} import {cls.__name__}")
+    lines += ["", "VALIDATOR_CLASSES = {"]
+    lines += [
+        f'    "{regel_id}": {classes[regel_id].__name__},'
+        for regel_id in sorted(classes)
+    ]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def write_bundle(path: Path = BUNDLE_PATH) -> int:
+    """Genereer de bundle op basis van de huidige regels; geeft aantal regels."""
+    classes = discover_validator_classes(discover_rule_ids())
+    Path(path).write_text(generate_bundle_source(classes), encoding="utf-8")
+    logger.info(f"Validator bundle geschreven met {len(classes)} regels: {path}")
+    return len(classes)
+
+
+class RuleRegistry:
+    """Registry met vooraf geladen, geïnstantieerde validators per regel.
+
+    ``load()`` is idempotent en thread-safe; ``get_*`` laadt lui bij eerste
+    gebruik, daarna liggen de validators vast voor de rest van het proces.
+    """
+
+    def __init__(
+        self,
+        regels_dir: str | Path | None = None,
+        validators_dir: str | Path | None = None,
+        use_bundle: bool = True,
+    ):
+        self.regels_dir = Path(regels_dir) if regels_dir else DEFAULT_REGELS_DIR
+        self.validators_dir = (
+            Path(validators_dir) if validators_dir else DEFAULT_VALIDATORS_DIR
+        )
+        # De bundle beschrijft alleen de standaard validators
+        self.use_bundle = use_bundle and self.validators_dir == DEFAULT_VALIDATORS_DIR
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._configs: dict[str, dict[str, Any]] = {}
+        self._validators: dict[str, Any] = {}
+        self._errors: dict[str, str] = {}
+        self._source = "none"
+        self._load_seconds = 0.0
+
+    def load(self) -> "RuleRegistry":
+        """Ontdek, importeer en instantieer alle validators (één keer)."""
+        if self._loaded:
+            return self
+        with self._lock:
+            if self._loaded:
+                return self
+            start = time.perf_counter()
+            regel_ids = discover_rule_ids(self.regels_dir)
+            classes = load_bundle() if self.use_bundle else None
+            self._source = "bundle" if classes else "scan"
+            missing = [r for r in regel_ids if r not in (classes or {})]
+            if missing:
+                # Nieuwe regels die (nog) niet in de bundle staan
+                classes = {
+                    **(classes or {}),
+                    **discover_validator_classes(missing, self.validators_dir),
+                }
+
+            for regel_id in regel_ids:
+                validator_class = classes.get(regel_id)
+                if validator_class is None:
+                    continue
+                try:
+                    config = load_rule_config(self.regels_dir, regel_id)
+                    if config is None:
+                        continue
+                    self._configs[regel_id] = config
+                    self._validators[regel_id] = validator_class(config)
+                except Exception as e:
+                    self._errors[regel_id] = f"{type(e).__name__}: {e}"
+                    logger.error(f"Fout bij laden validator {regel_id}: {e}")
+
+            self._load_seconds = time.perf_counter() - start
+            self._loaded = True
+            logger.info(
+                f"RuleRegistry: {len(self._validators)} validators geladen via "
+                f"{self._source} in {self._load_seconds * 1000:.1f}ms"
+            )
+        return self
+
+    def rule_ids(self) -> list[str]:
+        return sorted(self.load()._validators)
+
+    def get_validator(self, regel_id: str) -> Any | None:
+        return self.load()._validators.get(regel_id)
+
+    def get_config(self, regel_id: str) -> dict[str, Any] | None:
+        return self.load()._configs.get(regel_id)
+
+    def get_validate(
+        self, regel_id: str
+    ) -> Callable[[str, str, dict | None], tuple[bool, str, float]] | None:
+        """Gebonden ``validate(definitie, begrip, context)`` voor een regel."""
+        validator = self.get_validator(regel_id)
+        return validator.validate if validator is not None else None
+
+    def validators(self) -> dict[str, Any]:
+        return dict(self.load()._validators)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "source": self._source,
+            "validators": len(self._validators),
+            "errors": dict(self._errors),
+            "load_ms": round(self._load_seconds * 1000, 2),
+        }
+
+
+_registry: RuleRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_rule_registry() -> RuleRegistry:
+    """Globale registry (lui geladen bij eerste gebruik)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RuleRegistry()
+    return _registry
+
+
+def preload_rule_registry() -> RuleRegistry:
+    """Laad alle validators nu (bijv. bij applicatiestart)."""
+    return get_rule_registry().load()
+
+
+def _main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Toetsregel validator registry")
+    parser.add_argument(
+        "--write-bundle", action="store_true", help="Genereer _validator_bundle.py"
+    )
+    args = parser.parse_args(argv)
+    if args.write_bundle:
+        count = write_bundle()
+        print(f"Bundle geschreven: {BUNDLE_PATH} ({count} regels)")
+        return 0
+    stats = preload_rule_registry().get_stats()
+    print(json.dumps(stats, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
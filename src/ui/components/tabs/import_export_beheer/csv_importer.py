@@ -1,7 +1,8 @@
 """
 CSV Import component - Verplaatst van import_export_beheer_tab.py.
 
-Bevat alle CSV import functionaliteit, exact zoals het al werkte.
+De import zelf draait als achtergrondjob (``services.jobs``); de voortgang
+blijft na een rerun zichtbaar.
 """
 
 from __future__ import (
@@ -11,14 +12,17 @@ from __future__ import (
 import logging
 from typing import TYPE_CHECKING
 
-import pandas as pd
 import streamlit as st
 
+from ui.session_state import SessionStateManager
+
 if TYPE_CHECKING:
+    import pandas as pd
+
     from database.definitie_repository import DefinitieRepository
 
-# Status values as string literals (avoids runtime import of DefinitieStatus enum)
-_STATUS_DRAFT = "draft"
+# Session key met het id van de lopende import job (overleeft reruns)
+_IMPORT_JOB_KEY = "csv_import_job_id"
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,11 @@ class CSVImporter:
         st.markdown("### CSV Import")
         st.info("Upload een CSV bestand met definities om te importeren.")
 
+        # Een import uit een eerdere run loopt als job door: toon de voortgang
+        job_id = SessionStateManager.get_value(_IMPORT_JOB_KEY)
+        if job_id:
+            self._render_import_job(job_id)
+
         # File upload
         uploaded_file = st.file_uploader(
             "Selecteer CSV bestand",
@@ -44,7 +53,9 @@ class CSVImporter:
 
         if uploaded_file is not None:
             try:
-                # Lees CSV
+                # Lees CSV (pandas pas laden als er echt een bestand is)
+                import pandas as pd
+
                 df = pd.read_csv(uploaded_file)
 
                 # Toon preview
@@ -85,62 +96,68 @@ class CSVImporter:
     def _process_import(
         self, df: pd.DataFrame, skip_duplicates: bool, auto_validate: bool
     ):
-        """Verwerk CSV import - exact verplaatst van origineel."""
-        # Local import for record construction (avoids top-level database import)
-        from database.definitie_repository import DefinitieRecord
-
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        """Dien de CSV import in als achtergrondjob en volg de voortgang."""
+        from services.jobs import JOB_IMPORT
+        from utils.container_manager import get_cached_container
+
+        rows = [
+            {
+                "begrip": row.get("begrip", ""),
+                "definitie": row.get("definitie", ""),
+                "categorie": row.get("categorie") or "Type",
+                "organisatorische_context": row.get("context") or "Algemeen",
+            }
+            for _, row in df.fillna("").iterrows()
+        ]
+        queue = get_cached_container().job_queue()
+        job_id = queue.enqueue(
+            JOB_IMPORT,
+            {
+                "rows": rows,
+                "skip_duplicates": skip_duplicates,
+                "created_by": "csv_import",
+            },
+        )
+        SessionStateManager.set_value(_IMPORT_JOB_KEY, job_id)
+        # Auto-validatie wordt in een aparte story geïmplementeerd; rijen
+        # worden als draft opgeslagen
 
-        imported = 0
-        skipped = 0
-        errors = []
+        self._render_import_job(job_id)
 
-        total = len(df)
+    def _render_import_job(self, job_id: str):
+        """Poll de import job en toon het resultaat zodra hij klaar is."""
+        from ui.helpers.async_bridge import wait_for_job
+        from utils.container_manager import get_cached_container
 
-        for idx, row in df.iterrows():
-            progress = (idx + 1) / total
-            progress_bar.progress(progress)
-            status_text.text(f"Verwerken: {idx + 1}/{total}")
+        progress_bar = st.progress(0.0)
+        status_text = st.empty()
 
-            try:
-                # Check duplicaat
-                if skip_duplicates:
-                    existing = self.repository.find_by_begrip(
-                        row.get("begrip", ""), row.get("context", "")
-                    )
-                    if existing:
-                        skipped += 1
-                        continue
-
-                # Maak record
-                record = DefinitieRecord(
-                    begrip=row.get("begrip", ""),
-                    definitie=row.get("definitie", ""),
-                    categorie=row.get("categorie", "Type"),
-                    organisatorische_context=row.get("context", "Algemeen"),
-                    status=_STATUS_DRAFT,
-                    validation_score=0.0,
-                )
-
-                # Save
-                self.repository.save(record)
-                imported += 1
-
-                # Auto validatie indien gewenst
-                if auto_validate:
-                    # Auto-validatie wordt in een aparte story geïmplementeerd
-                    pass
+        def _on_progress(done: float, message: str | None) -> None:
+            progress_bar.progress(min(1.0, done))
+            status_text.text(f"Verwerken: {message or '...'}")
 
-            except Exception as e:
-                errors.append(f"Rij {idx + 1}: {e!s}")
+        job = wait_for_job(
+            get_cached_container().job_queue(), job_id, on_progress=_on_progress
+        )
+        SessionStateManager.clear_value(_IMPORT_JOB_KEY)
 
         # Resultaten
         progress_bar.empty()
         status_text.empty()
 
+        if job.status != "succeeded":
+            st.error(f"❌ Import mislukt: {job.error or job.status}")
+            return
+
+        result = job.result
+        errors = [
+            f"Rij {r['row'] + 1} ({r['begrip']}): {r['error']}"
+            for r in result["rows"]
+            if r["error"]
+        ]
         st.success(
-            f"✅ Import voltooid: {imported} geïmporteerd, {skipped} overgeslagen"
+            f"✅ Import voltooid: {result['succeeded']} geïmporteerd, "
+            f"{result['skipped']} overgeslagen"
         )
         if errors:
             with st.expander(f"⚠️ {len(errors)} fouten opgetreden"):
@@ -49,6 +49,9 @@ class DatabaseManager:
             with col4:
                 st.metric("Database Size", stats["size"])
 
+        with st.expander("🧪 Kwaliteit per toetsregel", expanded=False):
+            self._render_rule_statistics()
+
         # Reset functionaliteit
         st.markdown("### ⚠️ Database Reset")
         st.warning(
@@ -94,6 +97,74 @@ class DatabaseManager:
             logger.error(f"Error getting stats: {e}")
             return {"total": 0, "established": 0, "draft": 0, "size": "Error"}
 
+    def _render_rule_statistics(self):
+        """Corpusstatistieken per toetsregel uit de revalidatie-store."""
+        summary = self._get_corpus_summary()
+        if not summary:
+            st.info(
+                "Nog geen uitkomsten per regel. Vul de store met "
+                "`python -m src.cli.revalidation_cli run`."
+            )
+            return
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Gevalideerde definities", summary["definitions"])
+        with col2:
+            st.metric("Toetsregels", summary["rules"])
+        with col3:
+            mean = summary["mean_score"]
+            st.metric("Gem. score", f"{mean:.2f}" if mean is not None else "N/A")
+
+        histogram = summary["score_histogram"]
+        st.bar_chart(
+            {
+                "definities": dict(
+                    zip(
+                        [f"{low:.1f}" for low in histogram["edges"]],
+                        histogram["counts"],
+                        strict=False,
+                    )
+                )
+            }
+        )
+        st.markdown("**Categoriegemiddelden**")
+        st.table(
+            [
+                {"categorie": category, "gemiddelde": mean}
+                for category, mean in summary["category_means"].items()
+            ]
+        )
+        st.markdown("**Meest falende regels**")
+        st.table(summary["top_failing_rules"])
+        st.markdown("**Definities met de meeste overtredingen**")
+        st.table(
+            [
+                {
+                    "id": row["definitie_id"],
+                    "falende regels": row["failed_rules"],
+                    "score": row["score"],
+                    "regels": ", ".join(row["rules"]),
+                }
+                for row in summary["top_offenders"]
+            ]
+        )
+
+    def _get_corpus_summary(self, top: int = 10) -> dict[str, Any] | None:
+        """Summary van de (gecachte) corpusmatrix, of None als de store leeg is."""
+        try:
+            from services.validation.corpus_stats import get_corpus_matrix
+
+            matrix = get_corpus_matrix()
+            if not matrix.shape[0]:
+                return None
+            return matrix.with_overall(self.repository.get_validation_scores()).summary(
+                top=top
+            )
+        except Exception as e:
+            logger.error(f"Error getting rule statistics: {e}")
+            return None
+
     def _execute_database_reset(self):
         """Reset de database - exact verplaatst van origineel."""
         with st.spinner("Database resetten..."):
@@ -13,8 +13,7 @@ from typing import TYPE_CHECKING
 
 import streamlit as st
 
-from services.data_aggregation_service import DataAggregationService
-from services.export_service import ExportFormat, ExportLevel, ExportService
+from services.export_service import ExportFormat, ExportLevel
 from ui.session_state import SessionStateManager
 
 if TYPE_CHECKING:
@@ -32,11 +31,6 @@ class FormatExporter:
     def __init__(self, repository: DefinitieRepository):
         """Initialize met repository dependency."""
         self.repository = repository
-        # Initialize export service
-        data_agg = DataAggregationService(repository)
-        self.export_service = ExportService(
-            repository=repository, data_aggregation_service=data_agg
-        )
 
     def render(self):
         """Render export sectie - verplaatst van _render_export_section."""
@@ -296,10 +290,26 @@ class FormatExporter:
         }
         export_level = level_map.get(level, ExportLevel.BASIS)
 
-        # Gebruik ExportService voor export met geselecteerd niveau
-        file_path = self.export_service.export_multiple_definitions(
-            definitions=definitions, format=export_format, level=export_level
+        # Export draait als achtergrondjob (ExportService via de container)
+        from services.jobs import JOB_EXPORT
+        from ui.helpers.async_bridge import wait_for_job
+        from utils.container_manager import get_cached_container
+
+        queue = get_cached_container().job_queue()
+        job_id = queue.enqueue(
+            JOB_EXPORT,
+            {
+                "definition_ids": [d.id for d in definitions],
+                "format": export_format.value,
+                "level": export_level.value,
+            },
         )
+        with st.spinner("Export wordt gegenereerd..."):
+            job = wait_for_job(queue, job_id, timeout=300)
+        if job.status != "succeeded":
+            st.error(f"Export mislukt: {job.error or job.status}")
+            return
+        file_path = job.result["path"]
 
         # Lees bestand en toon download button
         with open(file_path, "rb") as f:
@@ -4,17 +4,141 @@ This module provides a central place for handling async/sync conversions
 in the UI layer. Services should remain async, UI handles the bridging.
 
 Per US-043: All async-to-sync conversions should go through this module.
+
+All coroutines run on one persistent background event loop per process
+(``utils.background_loop``) instead of a fresh ``asyncio.run`` per action.
+In-flight work is tracked per Streamlit session and cancelled on reruns.
 """
 
 import asyncio
+import functools
 import logging
-from collections.abc import Coroutine
-from typing import Any, TypeVar
+import re
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import CancelledError, Future, wait
+from importlib import metadata
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from utils.background_loop import get_background_loop, run_sync
+
+if TYPE_CHECKING:
+    from services.jobs import JobQueue, JobRecord
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Interval waarmee een wachtende run_async controleert op een Streamlit rerun
+_POLL_INTERVAL = 0.1
+
+# Streamlit versies [min, max) waarvoor de rerun-detectie is geverifieerd
+_RERUN_PROBE_VERSIONS = ((1, 38), (1, 52))
+# ScriptRequestType namen die het einde van de huidige script run betekenen
+_RERUN_STATES = frozenset({"RERUN", "STOP"})
+
+# In-flight futures per Streamlit sessie (None = buiten Streamlit)
+_pending: dict[str | None, set[Future[Any]]] = {}
+_pending_lock = threading.Lock()
+
+
+def _script_run_ctx() -> Any:
+    """Huidige Streamlit ScriptRunContext, of None buiten een script run."""
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import (
+            get_script_run_ctx,
+        )
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+@functools.cache
+def _rerun_probe_supported() -> bool:
+    """True als ``ScriptRequests._state`` gelezen mag worden (zie _rerun_requested).
+
+    Streamlit heeft geen publiek signaal voor een openstaande rerun/stop; de
+    status staat alleen in het private ``_state``. Buiten het geverifieerde
+    versiebereik valt run_async terug op wachten zonder afbreken bij een rerun.
+    """
+    try:
+        installed = metadata.version("streamlit")
+    except metadata.PackageNotFoundError:
+        return False
+    version = tuple(int(part) for part in re.findall(r"\d+", installed)[:2])
+    low, high = _RERUN_PROBE_VERSIONS
+    if not low <= version < high:
+        logger.warning(
+            f"Rerun-detectie niet geverifieerd voor Streamlit {installed}; "
+            "run_async breekt niet af bij een rerun"
+        )
+        return False
+    return True
+
+
+def _rerun_requested(ctx: Any) -> bool:
+    """True als Streamlit om een rerun/stop van deze script run heeft gevraagd."""
+    if not _rerun_probe_supported():
+        return False
+    requests = getattr(ctx, "script_requests", None)
+    state = getattr(requests, "_state", None)
+    # Onbekende vorm (bv. gewijzigde enum): niet afbreken
+    return getattr(state, "name", None) in _RERUN_STATES
+
+
+def _track(session_id: str | None, future: Future[Any]) -> None:
+    with _pending_lock:
+        _pending.setdefault(session_id, set()).add(future)
+
+    def _untrack(done: Future[Any]) -> None:
+        with _pending_lock:
+            futures = _pending.get(session_id)
+            if futures is not None:
+                futures.discard(done)
+                if not futures:
+                    _pending.pop(session_id, None)
+
+    future.add_done_callback(_untrack)
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """Dien een coroutine in op de persistente background loop (non-blocking).
+
+    De future wordt aan de huidige Streamlit sessie gekoppeld, zodat
+    ``cancel_session_tasks`` / ``begin_script_run`` hem kunnen annuleren.
+    Coroutines draaien op de loop-thread: gebruik daarin geen ``st.*``.
+    """
+    ctx = _script_run_ctx()
+    future = get_background_loop().submit(coro)
+    _track(getattr(ctx, "session_id", None), future)
+    return future
+
+
+def cancel_session_tasks(session_id: str | None = None) -> int:
+    """Annuleer openstaand async werk van een sessie (default: huidige sessie).
+
+    Returns:
+        Aantal geannuleerde futures
+    """
+    if session_id is None:
+        session_id = getattr(_script_run_ctx(), "session_id", None)
+    with _pending_lock:
+        futures = list(_pending.get(session_id, ()))
+    return sum(1 for future in futures if future.cancel())
+
+
+def begin_script_run() -> int:
+    """Aanroepen bovenaan iedere Streamlit script run.
+
+    Werk dat een vorige run van deze sessie nog had lopen (bv. via ``submit``)
+    wordt geannuleerd; de rerun vervangt die resultaten toch.
+    """
+    cancelled = cancel_session_tasks()
+    if cancelled:
+        logger.debug(f"{cancelled} async taak/taken van vorige run geannuleerd")
+    return cancelled
+
 
 def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
     """Run an async coroutine from sync context (UI).
@@ -22,6 +146,11 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
     This is the centralized bridge for UI components that need to call
     async services. Services should NOT use this - they should remain async.
 
+    The coroutine runs on the process-wide background event loop, so
+    loop-bound resources (HTTP sessions, async clients, locks) survive
+    across interactions. When Streamlit requests a rerun while we wait, the
+    work is cancelled and ``CancelledError`` is raised.
+
     Args:
         coro: The coroutine to run
         timeout: Optional timeout in seconds
@@ -32,28 +161,97 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
     Example:
         result = run_async(service.async_method(args))
     """
-    from concurrent.futures import ThreadPoolExecutor
+    if get_background_loop().in_loop_thread():
+        # Aangeroepen vanuit een coroutine op de loop zelf: niet blokkeren
+        return run_sync(coro, timeout=timeout)
+
+    ctx = _script_run_ctx()
+    future = submit(coro)
+    try:
+        return _wait(future, timeout, ctx)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def _wait(future: Future[T], timeout: float | None, ctx: Any) -> T:
+    """Wacht op ``future``; breek af bij timeout of Streamlit rerun."""
+    if ctx is None:
+        return future.result(timeout=timeout)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            msg = f"Async operation timed out after {timeout}s"
+            raise TimeoutError(msg)
+        slice_ = _POLL_INTERVAL if remaining is None else min(remaining, _POLL_INTERVAL)
+        # Eerst wachten, dan pas het resultaat lezen: een TimeoutError van de
+        # coroutine zelf is geen verlopen poll-slice
+        done, _ = wait([future], timeout=slice_)
+        if done:
+            return future.result()
+        if _rerun_requested(ctx):
+            msg = "Async operation cancelled by Streamlit rerun"
+            raise CancelledError(msg)
+
+
+def wait_for_job(
+    queue: "JobQueue",
+    job_id: str,
+    *,
+    timeout: float | None = None,
+    on_progress: Callable[[float, str | None], None] | None = None,
+    cancel_on_abort: bool = False,
+) -> "JobRecord":
+    """Poll een achtergrondjob (``services.jobs``) tot hij klaar is.
+
+    De job draait op de background loop, los van deze script run. Vraagt
+    Streamlit om een rerun, dan stopt het wachten met ``CancelledError``; de
+    job loopt door en is bij een volgende run via ``queue.get`` op te vragen,
+    tenzij ``cancel_on_abort``. Bij een timeout wordt de job altijd geannuleerd.
 
-    # Check if we're in the main thread with a running event loop (Streamlit)
+    Args:
+        queue: JobQueue waarin de job is ingediend
+        job_id: Id uit ``queue.enqueue``
+        timeout: Maximale wachttijd in seconden
+        on_progress: ``callback(progress, message)`` bij elke voortgangswijziging
+        cancel_on_abort: Annuleer de job als het wachten voortijdig stopt
+
+    Returns:
+        Het JobRecord in eindstatus (succeeded, failed of cancelled)
+    """
+    ctx = _script_run_ctx()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    reported: tuple[float, str | None] | None = None
     try:
-        asyncio.get_running_loop()
-        # We're in an async context with a running loop
-        # Use a thread pool to run the coroutine in isolation
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result(timeout=timeout) if timeout else future.result()
-    except RuntimeError:
-        # No running loop, we can safely use asyncio.run
-        pass
-
-    # No running loop - create new one
-    if timeout:
-
-        async def with_timeout() -> T:
-            return await asyncio.wait_for(coro, timeout)
-
-        return asyncio.run(with_timeout())
-    return asyncio.run(coro)
+        while True:
+            job = queue.get(job_id)
+            if job is None:
+                msg = f"Job {job_id} niet gevonden"
+                raise LookupError(msg)
+            if job.is_finished:
+                return job
+            if on_progress is not None and reported != (
+                job.progress,
+                job.progress_message,
+            ):
+                reported = (job.progress, job.progress_message)
+                on_progress(*reported)
+            if deadline is not None and time.monotonic() >= deadline:
+                msg = f"Job {job_id} timed out after {timeout}s"
+                raise TimeoutError(msg)
+            if ctx is not None and _rerun_requested(ctx):
+                msg = f"Wachten op job {job_id} afgebroken door Streamlit rerun"
+                raise CancelledError(msg)
+            time.sleep(_POLL_INTERVAL)
+    except TimeoutError:
+        queue.cancel(job_id)
+        raise
+    except BaseException:
+        if cancel_on_abort:
+            queue.cancel(job_id)
+        raise
 
 
 def run_async_safe(
@@ -8,23 +8,19 @@ met ondersteuning voor meerdere tabs en complete workflow beheer.
 """
 
 import asyncio  # Asynchrone programmering voor ontologische analyse
+import importlib
 import logging  # Logging faciliteiten voor debug en monitoring
 import os
 from datetime import (
     UTC,
     datetime,  # Datum en tijd functionaliteit
 )
+from functools import cached_property
 from typing import Any, cast  # Type hints voor betere code documentatie
 
 import streamlit as st  # Streamlit web interface framework
 
 # DEF-175: Moved to lazy import where used (line ~100)
-from document_processing.document_extractor import (
-    supported_file_types,  # Ondersteunde bestandstypen
-)
-from document_processing.document_processor import (
-    get_document_processor,  # Document processor factory
-)
 from domain.ontological_categories import (
     OntologischeCategorie,  # Ontologische categorieën
 )
@@ -35,26 +31,12 @@ from integration.definitie_checker import (  # Definitie integratie controle
 
 # Nieuwe services imports
 from services import get_definition_service
-from ui.components.definition_edit_tab import (
-    DefinitionEditTab,  # Edit interface voor definities
-)
-from ui.components.definition_generator_tab import (
-    DefinitionGeneratorTab,  # Hoofdtab voor definitie generatie
-)
 
-# Importeer alle UI tab componenten voor de verschillende functionaliteiten
+# Context selectie component via ContextManager
 from ui.components.enhanced_context_manager_selector import (
     EnhancedContextManagerSelector as ContextSelector,
 )
 
-# Context selectie component via ContextManager
-from ui.components.expert_review_tab import (
-    ExpertReviewTab,  # Expert review en validatie tab
-)
-
-# Geconsolideerde import/export/beheer tab (vervangt Export en Management tabs)
-from ui.components.tabs.import_export_beheer import ImportExportBeheerTab
-
 # Quality Control tab verwijderd - functionaliteit gedocumenteerd in EPIC-023
 # Orchestration tab verwijderd - functionaliteit gedocumenteerd in EPIC-028
 # Web Lookup tab verwijderd - functionaliteit is automatic via ModernWebLookupService
@@ -81,6 +63,36 @@ UTC = UTC  # Voor Python 3.10 compatibility
 
 logger = logging.getLogger(__name__)  # Logger instantie voor deze module
 
+# Tab componenten worden pas geïmporteerd bij de eerste render van hun tab:
+# ze trekken zware dependencies mee (bv. pandas via de CSV importer) die de
+# cold start van de app anders vertragen.
+_LAZY_TAB_CLASSES = {
+    # Hoofdtab voor definitie generatie
+    "DefinitionGeneratorTab": "ui.components.definition_generator_tab",
+    # Edit interface voor definities
+    "DefinitionEditTab": "ui.components.definition_edit_tab",
+    # Expert review en validatie tab
+    "ExpertReviewTab": "ui.components.expert_review_tab",
+    # Geconsolideerde import/export/beheer tab (vervangt Export en Management tabs)
+    "ImportExportBeheerTab": "ui.components.tabs.import_export_beheer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Laad tab classes lazy als module attribuut (PEP 562)."""
+    module_path = _LAZY_TAB_CLASSES.get(name)
+    if module_path is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def _tab_class(name: str) -> type:
+    """Tab class via de module namespace (respecteert patches in tests)."""
+    return globals().get(name) or __getattr__(name)
+
 
 class TabbedInterface:
     """Main tabbed interface controller voor DefinitieAgent."""
@@ -139,6 +151,12 @@ class TabbedInterface:
                         "error_message": "Definition service unavailable",
                     }
 
+                def submit_generation(
+                    self, begrip: str, context_dict: dict, **kwargs
+                ) -> str:
+                    msg = "Definition service unavailable"
+                    raise RuntimeError(msg)
+
             self.definition_service = _DummyService()
 
         # Maak DefinitieChecker met de service
@@ -152,27 +170,7 @@ class TabbedInterface:
             ContextSelector()
         )  # Initialiseer context selector component
 
-        # Initialiseer alle tab componenten met repository referentie
-        self.definition_tab = DefinitionGeneratorTab(self.checker)
-
-        # Koppel validatie service aan Edit-tab (ModularValidation via Orchestrator V2)
-        try:
-            # Use cached container instead of creating new one
-            validation_service = (
-                self.container.orchestrator()
-            )  # ValidationOrchestratorV2
-        except Exception as e:
-            logger.warning(
-                f"Validatie service niet beschikbaar ({type(e).__name__}: {e!s}); Edit-tab zonder validator"
-            )
-            validation_service = None
-
-        self.edit_tab = DefinitionEditTab(
-            validation_service=validation_service
-        )  # Edit tab with validator
-        self.expert_tab = ExpertReviewTab(self.repository)
-        # Nieuwe geconsolideerde tab vervangt Export en Management tabs
-        self.import_export_beheer_tab = ImportExportBeheerTab(self.repository)
+        # Tab componenten worden aangemaakt bij hun eerste render (zie properties)
         # Quality Control tab verwijderd - zie EPIC-023 voor toekomstige implementatie
         # External Sources tab verwijderd - 95% overlap met Export tab
         # Web Lookup tab verwijderd - zie EPIC-028, automatic via ModernWebLookupService
@@ -216,6 +214,38 @@ class TabbedInterface:
             # Management tab geconsolideerd in import_export_beheer
         }
 
+    @cached_property
+    def definition_tab(self):
+        """Generator tab (aangemaakt bij eerste gebruik)."""
+        return _tab_class("DefinitionGeneratorTab")(self.checker)
+
+    @cached_property
+    def edit_tab(self):
+        """Edit tab met validator (aangemaakt bij eerste gebruik)."""
+        # Koppel validatie service aan Edit-tab (ModularValidation via Orchestrator V2)
+        try:
+            # Use cached container instead of creating new one
+            validation_service = (
+                self.container.orchestrator()
+            )  # ValidationOrchestratorV2
+        except Exception as e:
+            logger.warning(
+                f"Validatie service niet beschikbaar ({type(e).__name__}: {e!s}); Edit-tab zonder validator"
+            )
+            validation_service = None
+
+        return _tab_class("DefinitionEditTab")(validation_service=validation_service)
+
+    @cached_property
+    def expert_tab(self):
+        """Expert review tab (aangemaakt bij eerste gebruik)."""
+        return _tab_class("ExpertReviewTab")(self.repository)
+
+    @cached_property
+    def import_export_beheer_tab(self):
+        """Import/export/beheer tab (aangemaakt bij eerste gebruik)."""
+        return _tab_class("ImportExportBeheerTab")(self.repository)
+
     def render(self):
         """Render de volledige tabbed interface."""
         # App header
@@ -792,7 +822,8 @@ class TabbedInterface:
                     )
 
                 # Altijd V2-servicepad gebruiken (geen legacy fallback)
-                from ui.helpers.async_bridge import run_async
+                from ui.helpers.async_bridge import wait_for_job
+                from utils.progress_callback import operation_progress
 
                 # Haal actuele generation options op (kan force flags bevatten)
                 options = ensure_dict(
@@ -832,31 +863,46 @@ class TabbedInterface:
                         snippet_window=window_chars,
                     )
 
-                service_result = run_async(
-                    self.definition_service.generate_definition(
-                        begrip=begrip,
-                        context_dict={
-                            "organisatorisch": org_context,
-                            "juridisch": jur_context,
-                            "wettelijk": wet_context,  # EPIC-010: Gebruik consistente variabele
-                        },
-                        organisatie=primary_org,
-                        categorie=auto_categorie,
-                        ufo_categorie=(
-                            SessionStateManager.get_value("ufo_categorie") or None
-                        ),
-                        # Geef opties door zodat validator duplicate kan escaleren
-                        options={
-                            k: v
-                            for k, v in options.items()
-                            if k in ("force_generate", "force_duplicate")
-                        },
-                        # EPIC-018: doorgeven aan service
-                        document_context=doc_summary,
-                        document_snippets=doc_snippets,
+                # Generatie draait als achtergrondjob; de script run pollt de status
+                job_id = self.definition_service.submit_generation(
+                    begrip=begrip,
+                    context_dict={
+                        "organisatorisch": org_context,
+                        "juridisch": jur_context,
+                        "wettelijk": wet_context,  # EPIC-010: Gebruik consistente variabele
+                    },
+                    organisatie=primary_org,
+                    categorie=auto_categorie,
+                    ufo_categorie=(
+                        SessionStateManager.get_value("ufo_categorie") or None
                     ),
-                    timeout=120,
+                    # Geef opties door zodat validator duplicate kan escaleren
+                    options={
+                        k: v
+                        for k, v in options.items()
+                        if k in ("force_generate", "force_duplicate")
+                    },
+                    # EPIC-018: doorgeven aan service
+                    document_context=doc_summary,
+                    document_snippets=doc_snippets,
                 )
+                progress_bar = st.progress(0.0)
+                with operation_progress("generating_definition"):
+                    job = wait_for_job(
+                        self.container.job_queue(),
+                        job_id,
+                        timeout=120,
+                        on_progress=lambda done, _message: progress_bar.progress(
+                            min(1.0, done)
+                        ),
+                        # Een rerun vervangt het resultaat toch (zoals bij run_async)
+                        cancel_on_abort=True,
+                    )
+                progress_bar.empty()
+                if job.status != "succeeded":
+                    msg = job.error or f"Generatie-job {job.status}"
+                    raise RuntimeError(msg)
+                service_result = job.result
 
                 # Converteer naar checker formaat voor UI compatibility variabelen
                 check_result = None
@@ -1040,6 +1086,8 @@ class TabbedInterface:
             if not selected_docs:
                 return None
 
+            from document_processing.document_processor import get_document_processor
+
             processor = get_document_processor()
             aggregated_context = processor.get_aggregated_context(selected_docs)
 
@@ -1106,6 +1154,8 @@ class TabbedInterface:
             if not begrip or not selected_doc_ids:
                 return []
 
+            from document_processing.document_processor import get_document_processor
+
             processor = get_document_processor()
             begrip_lower = str(begrip).strip().lower()
 
@@ -1278,6 +1328,8 @@ class TabbedInterface:
 
             # Toon ondersteunde bestandstypen in sidebar of als tekst
             if st.checkbox("i️ Toon ondersteunde bestandstypen", value=False):
+                from document_processing.document_extractor import supported_file_types
+
                 supported_types = supported_file_types()
                 st.markdown("**Ondersteunde bestandstypen:**")
                 for _mime_type, description in supported_types.items():
@@ -1292,6 +1344,8 @@ class TabbedInterface:
 
     def _process_uploaded_files(self, uploaded_files):
         """Verwerk geüploade bestanden."""
+        from document_processing.document_processor import get_document_processor
+
         processor = get_document_processor()
 
         progress_bar = st.progress(0)
@@ -1337,6 +1391,8 @@ class TabbedInterface:
 
     def _render_uploaded_documents_list(self):
         """Render lijst van geüploade documenten."""
+        from document_processing.document_processor import get_document_processor
+
         processor = get_document_processor()
         documents = processor.get_processed_documents()
 
@@ -0,0 +1,157 @@
+"""
+Persistent background event loop voor sync → async bridging.
+
+Eén event loop per proces, in een daemon-thread die blijft draaien zolang het
+proces leeft. Sync code (Streamlit UI, legacy wrappers) dient coroutines in via
+``submit(coro) -> concurrent.futures.Future`` in plaats van voor iedere actie
+``asyncio.run`` (nieuwe loop) te starten. Loop-gebonden resources zoals de
+``AsyncOpenAI`` client, aiohttp sessies en asyncio locks blijven daardoor
+herbruikbaar tussen interacties.
+
+Bij procesafsluiting (``atexit``) worden openstaande taken geannuleerd, async
+generators en de default executor netjes afgesloten en de loop gesloten.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """Langlevende asyncio event loop in een eigen daemon-thread."""
+
+    def __init__(self, name: str = "background-event-loop"):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._thread is not None
+            and self._thread.is_alive()
+            and self._pid == os.getpid()
+        )
+
+    def in_loop_thread(self) -> bool:
+        """True als de aanroeper zelf op de loop-thread draait."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start de loop-thread (idempotent) en geef de loop terug.
+
+        Na een fork (bv. process pool workers) hoort de loop bij het
+        ouderproces; er wordt dan een nieuwe loop gestart.
+        """
+        with self._lock:
+            if self.is_running:
+                return self._loop  # type: ignore[return-value]
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run, name=self._name, daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            logger.debug(f"Background event loop gestart ({self._name})")
+            return loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Dien een coroutine in op de loop; geeft een thread-safe Future.
+
+        ``future.cancel()`` annuleert ook de onderliggende asyncio taak.
+        """
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Annuleer openstaande taken en stop de loop-thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None or self._pid != os.getpid():
+                self._loop = self._thread = self._pid = None
+                return
+            self._loop = self._thread = self._pid = None
+
+        if loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(_drain(loop), loop).result(timeout)
+            except Exception as e:  # pragma: no cover - best effort
+                logger.warning(f"Background loop shutdown niet volledig: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        logger.debug(f"Background event loop gestopt ({self._name})")
+
+
+async def _drain(loop: asyncio.AbstractEventLoop) -> None:
+    """Annuleer alle taken behalve de huidige en ruim loop-resources op."""
+    current = asyncio.current_task()
+    tasks = [t for t in asyncio.all_tasks(loop) if t is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await loop.shutdown_asyncgens()
+    await loop.shutdown_default_executor()
+
+
+_background_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Proces-brede background loop (lazy gestart bij eerste submit)."""
+    return _background_loop
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """Dien een coroutine in op de proces-brede background loop."""
+    return _background_loop.submit(coro)
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """Blokkerend: voer ``coro`` uit op de background loop en wacht op het resultaat.
+
+    Vanaf de loop-thread zelf (sync code aangeroepen vanuit een coroutine)
+    zou wachten deadlocken; de coroutine draait dan geïsoleerd in een eigen
+    thread met ``asyncio.run``.
+    """
+    if _background_loop.in_loop_thread():
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result(timeout=timeout)
+    future = _background_loop.submit(coro)
+    try:
+        return future.result(timeout=timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def shutdown_background_loop(timeout: float = 5.0) -> None:
+    """Stop de proces-brede background loop (ook via atexit)."""
+    _background_loop.shutdown(timeout)
+
+
+atexit.register(shutdown_background_loop)
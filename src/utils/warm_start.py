@@ -0,0 +1,237 @@
+"""
+Warm-start snapshot voor afgeleide startup data.
+
+Bij elke proces start werden dezelfde bronnen opnieuw ingelezen en
+opgebouwd: de toetsregel JSON bestanden, de juridische keywords YAML en de
+UFO patroontabellen. Deze module bewaart de opgebouwde structuren in één
+gepickled bestand (``cache/warm_start.pkl``) dat bij de eerste opvraag in
+één keer wordt ingelezen. Elke entry is gekoppeld aan de bronbestanden
+waaruit hij is gebouwd; wijzigt een bron, dan wordt alleen die entry
+opnieuw gebouwd en het snapshot atomair herschreven.
+
+Bronnen worden eerst op (size, mtime) gecontroleerd; alleen bij een
+afwijking wordt de inhoud gehasht, zodat een checkout die alleen mtimes
+wijzigt geen rebuild veroorzaakt.
+
+Gebruik:
+    rules = get_warm_start().get_or_build("toetsregels", json_files, load_rules)
+
+Het pad kan overschreven worden met env var WARM_START_SNAPSHOT; de waarde
+``off`` schakelt het snapshot uit (altijd direct bouwen).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Verankerd aan de project root, niet de working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SNAPSHOT_PATH = str(PROJECT_ROOT / "cache" / "warm_start.pkl")
+FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+# (size, mtime_ns, sha1) per bronbestand; None voor een ontbrekend bestand
+SourceState = tuple[int, int, str] | None
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes(), usedforsecurity=False).hexdigest()
+
+
+def _source_state(path: Path) -> SourceState:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, _hash_file(path))
+
+
+class WarmStartSnapshot:
+    """Versioned on-disk snapshot van opgebouwde structuren, per naam."""
+
+    def __init__(self, path: str | Path = DEFAULT_SNAPSHOT_PATH, enabled: bool = True):
+        path = Path(path)
+        # Relatieve paden t.o.v. project root, niet de working directory
+        self.path = path if path.is_absolute() else PROJECT_ROOT / path
+        self.enabled = enabled
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "rebuilds": 0, "writes": 0}
+
+    # ---- laden / opslaan -------------------------------------------------
+
+    def _header(self) -> dict[str, Any]:
+        return {"format": FORMAT_VERSION, "python": sys.version_info[:2]}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Lees het snapshot (één keer per proces)."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except Exception as e:
+            logger.warning(f"Warm-start snapshot onleesbaar, wordt herbouwd: {e}")
+            return self._entries
+
+        if isinstance(data, dict) and data.get("header") == self._header():
+            self._entries = data.get("entries", {})
+        else:
+            logger.info("Warm-start snapshot van andere versie, wordt herbouwd")
+        return self._entries
+
+    def _save(self) -> None:
+        """Schrijf het snapshot atomair weg; fouten zijn niet fataal."""
+        tmp_name = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"header": self._header(), "entries": self._entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_name, self.path)
+            self.stats["writes"] += 1
+        except Exception as e:
+            logger.warning(f"Warm-start snapshot niet opgeslagen: {e}")
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    # ---- validatie -------------------------------------------------------
+
+    def _is_fresh(self, recorded: dict[str, SourceState], sources: list[Path]) -> bool:
+        """Controleer of de bronnen sinds het bouwen ongewijzigd zijn.
+
+        Ververst de opgeslagen (size, mtime) als alleen de mtime wijzigde.
+        """
+        if set(recorded) != {str(p) for p in sources}:
+            return False
+
+        touched = False
+        for source in sources:
+            state = recorded[str(source)]
+            try:
+                stat = source.stat()
+            except OSError:
+                if state is not None:
+                    return False
+                continue
+            if state is None:
+                return False
+            size, mtime_ns, digest = state
+            if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+                continue
+            if stat.st_size != size or _hash_file(source) != digest:
+                return False
+            recorded[str(source)] = (stat.st_size, stat.st_mtime_ns, digest)
+            touched = True
+
+        if touched:
+            self._save()
+        return True
+
+    # ---- publieke API ----------------------------------------------------
+
+    def get_or_build(
+        self, name: str, sources: Iterable[str | Path], builder: Callable[[], T]
+    ) -> T:
+        """
+        Haal een entry uit het snapshot of bouw hem opnieuw.
+
+        Args:
+            name: Unieke naam van de entry
+            sources: Bestanden waaruit de entry wordt opgebouwd; neem ook de
+                module van ``builder`` op, zodat een codewijziging de entry
+                ongeldig maakt
+            builder: Bouwt de waarde; moet picklebaar zijn
+
+        Returns:
+            De (eventueel opnieuw gebouwde) waarde
+        """
+        if not self.enabled:
+            return builder()
+
+        source_paths = sorted(Path(s).resolve() for s in sources)
+        with self._lock:
+            entry = self._load().get(name)
+            if entry is not None and self._is_fresh(entry["sources"], source_paths):
+                self.stats["hits"] += 1
+                return entry["value"]
+
+            value = builder()
+            self.stats["rebuilds"] += 1
+            self._entries[name] = {
+                "sources": {str(p): _source_state(p) for p in source_paths},
+                "value": value,
+            }
+            self._save()
+            logger.info(f"Warm-start entry '{name}' opgebouwd")
+            return value
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Verwijder één entry (of alles) uit het snapshot."""
+        with self._lock:
+            entries = self._load()
+            if name is None:
+                entries.clear()
+            else:
+                entries.pop(name, None)
+            self._save()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Statistieken voor monitoring."""
+        with self._lock:
+            entries = self._entries or {}
+            return {
+                **self.stats,
+                "enabled": self.enabled,
+                "path": str(self.path),
+                "entries": sorted(entries),
+            }
+
+
+_snapshot: WarmStartSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_warm_start() -> WarmStartSnapshot:
+    """
+    Haal het gedeelde warm-start snapshot op.
+
+    Het pad kan overschreven worden met env var WARM_START_SNAPSHOT
+    (``off`` schakelt het snapshot uit).
+    """
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                path = os.getenv("WARM_START_SNAPSHOT") or DEFAULT_SNAPSHOT_PATH
+                _snapshot = WarmStartSnapshot(path, enabled=path.lower() != "off")
+    return _snapshot
+
+
+def reset_warm_start() -> None:
+    """Vergeet de gedeelde instance (voor tests)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
@@ -289,7 +289,23 @@ def _disable_network(monkeypatch):
         msg = "Network access is disabled in tests. Set ALLOW_NETWORK=1 to override."
         raise RuntimeError(msg)
 
+    _real_connect = socket.socket.connect
+    _real_connect_ex = socket.socket.connect_ex
+
+    def _is_loopback(address) -> bool:
+        # Lokale stand-in servers (bijv. de web lookup replay harness) zijn toegestaan
+        host = address[0] if isinstance(address, tuple) and address else None
+        return host in ("127.0.0.1", "::1", "localhost")
+
     def _blocked_connect(self, *args, **kwargs):  # pragma: no cover - guard
+        if args and _is_loopback(args[0]):
+            return _real_connect(self, *args, **kwargs)
+        msg = "Network access is disabled in tests. Set ALLOW_NETWORK=1 to override."
+        raise RuntimeError(msg)
+
+    def _blocked_connect_ex(self, *args, **kwargs):  # pragma: no cover - guard
+        if args and _is_loopback(args[0]):
+            return _real_connect_ex(self, *args, **kwargs)
         msg = "Network access is disabled in tests. Set ALLOW_NETWORK=1 to override."
         raise RuntimeError(msg)
 
@@ -298,7 +314,46 @@ def _disable_network(monkeypatch):
         socket, "create_connection", _blocked_create_connection, raising=True
     )
     monkeypatch.setattr(socket.socket, "connect", _blocked_connect, raising=True)
-    monkeypatch.setattr(socket.socket, "connect_ex", _blocked_connect, raising=True)
+    monkeypatch.setattr(socket.socket, "connect_ex", _blocked_connect_ex, raising=True)
+
+
+# Isoleer de persistente provider health store (circuit breaker) per test,
+# zodat gesimuleerde provider failures niet doorlekken naar andere tests of
+# naar de lokale cache/provider_health.db van de app.
+@pytest.fixture(autouse=True)
+def _isolated_provider_health_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROVIDER_HEALTH_DB", str(tmp_path / "provider_health.db"))
+
+
+# Job queue per test in een eigen database (niet cache/jobs.db van de app).
+@pytest.fixture(autouse=True)
+def _isolated_job_queue_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_QUEUE_DB", str(tmp_path / "jobs.db"))
+
+
+# Warm-start snapshot per test in een eigen bestand (niet cache/warm_start.pkl
+# van de app); de gedeelde instance wordt daarvoor vergeten.
+@pytest.fixture(autouse=True)
+def _isolated_warm_start_snapshot(tmp_path, monkeypatch):
+    from utils import warm_start
+
+    monkeypatch.setenv("WARM_START_SNAPSHOT", str(tmp_path / "warm_start.pkl"))
+    warm_start.reset_warm_start()
+    yield
+    warm_start.reset_warm_start()
+
+
+# Verse latency tracker per test: geobserveerde (gemockte) latencies mogen de
+# adaptieve timeouts van andere tests niet beïnvloeden.
+@pytest.fixture(autouse=True)
+def _isolated_latency_tracker(monkeypatch):
+    for mod_name in (
+        "services.web_lookup.latency_tracker",
+        "src.services.web_lookup.latency_tracker",
+    ):
+        mod = sys.modules.get(mod_name)
+        if mod is not None:
+            monkeypatch.setattr(mod, "_tracker", None)
 
 
 # Opt-in versnellen van asyncio.sleep om lokale testruns te versnellen.
@@ -39,6 +39,8 @@ class MockValidationOrchestrator(ValidationOrchestratorInterface):
         text: str,
         ontologische_categorie: str | None = None,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         correlation_id = (
             str(context.correlation_id)
@@ -128,6 +130,8 @@ class MockValidationOrchestrator(ValidationOrchestratorInterface):
         self,
         definition: Definition,
         context: ValidationContext | None = None,
+        *,
+        gate_only: bool = False,
     ) -> ValidationResult:
         # Delegate to validate_text with definition content
         return await self.validate_text(
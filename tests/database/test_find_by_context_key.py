@@ -0,0 +1,167 @@
+"""Tests voor de geïndexeerde duplicate-context lookup (CON-01)."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from database.definitie_repository import DefinitieRecord, DefinitieRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = DefinitieRepository(str(tmp_path / "definities.db"))
+    repository.create_definitie(
+        DefinitieRecord(
+            begrip="Registratie",
+            definitie="formeel vastleggen van gegevens in een systeem",
+            categorie="proces",
+            organisatorische_context=json.dumps(["DJI", "OM"]),
+            juridische_context=json.dumps(["Strafrecht"]),
+            wettelijke_basis=json.dumps(["Art. 27 Sv"]),
+        )
+    )
+    return repository
+
+
+@pytest.mark.unit
+def test_match_is_order_and_case_insensitive(repo):
+    record = repo.find_by_context_key(
+        " registratie ", ["om", "dji"], ["strafrecht"], ["art. 27 sv"]
+    )
+    assert record is not None
+    assert record.begrip == "Registratie"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("begrip", "org", "jur", "wet", "categorie"),
+    [
+        ("registratie", ["DJI"], ["Strafrecht"], ["Art. 27 Sv"], None),
+        ("registratie", ["DJI", "OM"], [], ["Art. 27 Sv"], None),
+        ("registratie", ["DJI", "OM"], ["Strafrecht"], ["Art. 27 Sv"], "type"),
+        ("vastlegging", ["DJI", "OM"], ["Strafrecht"], ["Art. 27 Sv"], None),
+    ],
+)
+def test_different_context_does_not_match(repo, begrip, org, jur, wet, categorie):
+    assert repo.find_by_context_key(begrip, org, jur, wet, categorie) is None
+
+
+@pytest.mark.unit
+def test_exclude_id_skips_the_definition_itself(repo):
+    own = repo.find_by_context_key(
+        "registratie", ["DJI", "OM"], ["Strafrecht"], ["Art. 27 Sv"]
+    )
+
+    assert (
+        repo.find_by_context_key(
+            "registratie",
+            ["DJI", "OM"],
+            ["Strafrecht"],
+            ["Art. 27 Sv"],
+            exclude_id=own.id,
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_non_ascii_begrip_matches_case_insensitively(repo):
+    new_id = repo.create_definitie(
+        DefinitieRecord(
+            begrip="Één-persoonszaak",
+            definitie="zaak met één betrokkene",
+            categorie="type",
+            organisatorische_context=json.dumps(["OM"]),
+        )
+    )
+    repo.update_definitie(new_id, {"begrip": "ÉÉN-PERSOONSZAAK"})
+
+    record = repo.find_by_context_key("één-persoonszaak", ["om"], [], [])
+
+    assert record is not None
+    assert record.id == new_id
+
+
+@pytest.mark.unit
+def test_lookup_uses_begrip_norm_index(repo):
+    with sqlite3.connect(repo.db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM definities "
+            "WHERE (begrip_norm = ? OR begrip_norm IS NULL) AND id != ?",
+            ("registratie", -1),
+        ).fetchall()
+    assert any("idx_definities_begrip_norm" in str(row) for row in plan)
+
+
+@pytest.mark.unit
+def test_existing_database_is_backfilled_once(tmp_path):
+    db_path = tmp_path / "oud.db"
+    repository = DefinitieRepository(str(db_path))
+    definitie_id = repository.create_definitie(
+        DefinitieRecord(
+            begrip="Één",
+            definitie="het getal 1",
+            categorie="type",
+            organisatorische_context=json.dumps(["OM"]),
+        )
+    )
+
+    def snapshot():
+        with sqlite3.connect(db_path) as conn:
+            return (
+                conn.execute(
+                    "SELECT begrip_norm FROM definities WHERE id = ?", (definitie_id,)
+                ).fetchone()[0],
+                conn.execute(
+                    "SELECT sql FROM sqlite_master "
+                    "WHERE name = 'idx_definities_begrip_norm'"
+                ).fetchone()[0],
+                conn.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+                    "AND tbl_name = 'definities' ORDER BY name"
+                ).fetchall(),
+                conn.execute("SELECT COUNT(*) FROM definitie_geschiedenis").fetchone()[
+                    0
+                ],
+            )
+
+    triggers = snapshot()[2]
+    with sqlite3.connect(db_path) as conn:
+        # Oude situatie: expressie-index op LOWER(TRIM(begrip)), geen waarden
+        conn.execute("DROP INDEX idx_definities_begrip_norm")
+        conn.execute(
+            "CREATE INDEX idx_definities_begrip_norm "
+            "ON definities(LOWER(TRIM(begrip)))"
+        )
+        conn.execute("UPDATE definities SET begrip_norm = NULL")
+
+    reopened = DefinitieRepository(str(db_path))
+    norm, index_sql, triggers_after, history = snapshot()
+    DefinitieRepository(str(db_path))
+
+    assert norm == "één"
+    assert "LOWER" not in index_sql
+    assert triggers_after == triggers
+    # Tweede start vindt niets meer om aan te vullen
+    assert snapshot() == (norm, index_sql, triggers, history)
+    assert reopened.find_by_context_key("ÉÉN", ["OM"]).id == definitie_id
+
+
+@pytest.mark.unit
+def test_migration_script_is_repeatable_after_repository_init(tmp_path):
+    db_path = tmp_path / "definities.db"
+    DefinitieRepository(str(db_path))
+    script = (
+        Path(__file__).parents[2]
+        / "src/database/migrations/20261018_add_begrip_norm_column.sql"
+    ).read_text(encoding="utf-8")
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(script)
+        conn.executescript(script)
+        index_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'idx_definities_begrip_norm'"
+        ).fetchone()[0]
+    assert "begrip_norm" in index_sql
@@ -0,0 +1,115 @@
+"""Tests voor het startup import-profiel en het import budget."""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.monitoring.import_profile import (
+    SRC_DIR,
+    ImportBudget,
+    ImportProfile,
+    parse_importtime,
+    profile_imports,
+    record_import_profile,
+)
+from src.monitoring.performance_tracker import PerformanceTracker
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2000 |       pandas._libs
+import time:     30000 |      32000 |     pandas
+import time:       500 |      32500 |   ui.components.csv_importer
+import time:      1500 |      34000 | ui.tabbed_interface
+some unrelated warning
+"""
+
+
+def _profile(output: str = IMPORTTIME_OUTPUT) -> ImportProfile:
+    return ImportProfile(timings=parse_importtime(output), wall_ms=80.0)
+
+
+def test_parse_importtime():
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [t.module for t in timings] == [
+        "_io",
+        "pandas._libs",
+        "pandas",
+        "ui.components.csv_importer",
+        "ui.tabbed_interface",
+    ]
+    assert [t.depth for t in timings] == [1, 3, 2, 1, 0]
+    assert timings[2].self_us == 30000
+    assert timings[2].cumulative_us == 32000
+
+
+def test_profile_summaries():
+    profile = _profile()
+
+    assert profile.total_ms == pytest.approx(34.12)
+    assert list(profile.by_package()) == ["pandas", "ui", "_io"]
+    assert profile.by_package()["pandas"] == pytest.approx(32.0)
+    assert profile.slowest(1)[0].module == "ui.tabbed_interface"
+    assert profile.imported("pandas")
+    assert profile.imported("ui.components")
+    assert not profile.imported("ui.comp")
+
+
+def test_budget_flags_slow_startup_and_eager_heavy_imports():
+    profile = _profile()
+
+    assert ImportBudget(total_ms=100, deferred_modules=()).check(profile) == []
+    violations = ImportBudget(total_ms=10).check(profile)
+    assert len(violations) == 2
+    assert "budget" in violations[0]
+    assert "'pandas'" in violations[1]
+
+
+def test_record_import_profile_detects_regression(tmp_path):
+    tracker = PerformanceTracker(str(tmp_path / "perf.db"))
+    fast = _profile()
+
+    for _ in range(10):  # baseline met voldoende confidence
+        statuses = record_import_profile(fast, tracker)
+    assert statuses["startup_import_total_ms"] is None
+    assert "startup_import.pandas_ms" in statuses
+
+    slow = _profile(IMPORTTIME_OUTPUT.replace("30000 |", "60000 |"))
+    statuses = record_import_profile(slow, tracker)
+    assert statuses["startup_import_total_ms"] == "CRITICAL"
+    assert statuses["startup_import._io_ms"] is None
+
+
+def test_tabbed_interface_defers_tabs_and_heavy_dependencies():
+    """Importeren van de UI shell laadt geen tabs of zware dependencies."""
+    code = (
+        "import sys, ui.tabbed_interface as t\n"
+        "heavy = ('pandas', 'openpyxl', 'PyPDF2', 'docx', 'aiohttp',\n"
+        "         'ui.components.definition_edit_tab',\n"
+        "         'ui.components.expert_review_tab',\n"
+        "         'ui.components.tabs.import_export_beheer')\n"
+        "print('EAGER=' + ','.join(m for m in heavy if m in sys.modules))\n"
+        "t.ExpertReviewTab\n"
+        "print('LAZY=%s' % ('ui.components.expert_review_tab' in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    lines = completed.stdout.splitlines()
+    assert "EAGER=" in lines
+    assert "LAZY=True" in lines
+
+
+def test_profile_imports_runs_in_fresh_process():
+    profile = profile_imports(("json",))
+
+    assert profile.imported("json")
+    assert profile.total_ms > 0
+    assert profile.wall_ms >= profile.total_ms
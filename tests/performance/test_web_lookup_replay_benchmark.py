@@ -0,0 +1,49 @@
+"""
+Offline performance regressietests voor de web lookup pipeline.
+
+Draaien de volledige ModernWebLookupService.lookup tegen de replay harness
+(geen internet) en bewaken latency, ranking/dedup CPU tijd en geheugen.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.monitoring.web_lookup_benchmark import generate_terms, run_lookup_benchmark
+
+CASSETTE = (
+    Path(__file__).parents[1] / "fixtures" / "cassettes" / "web_lookup_basic.json"
+)
+
+
+def test_generate_terms_unique_and_mixed():
+    terms = generate_terms(50)
+    assert len({t for t, _ in terms}) == 50
+    assert sum(t.startswith("ECLI:") for t, _ in terms) == 5
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_lookup_benchmark_offline():
+    result = await run_lookup_benchmark(
+        20, cassette=CASSETTE, concurrency=4, latency_ms=5, seed=1
+    )
+
+    assert result["http_requests"] > 0
+    assert result["misses"] == 0
+    assert result["cassette_hits"] > 0
+    assert result["avg_results"] > 0
+    assert result["ranking_calls"] == 20
+    # Ruime budgetten: bewaken regressies, geen micro-benchmark
+    assert result["latency_p95_ms"] < 5000
+    assert result["ranking_cpu_ms"] / result["ranking_calls"] < 50
+    assert result["peak_memory_mb"] < 100
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_lookup_benchmark_survives_injected_failures():
+    result = await run_lookup_benchmark(10, failure_rate=0.5, latency_ms=1, seed=7)
+
+    assert result["injected_failures"] > 0
+    assert result["ranking_calls"] == 10
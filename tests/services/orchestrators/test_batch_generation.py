@@ -0,0 +1,258 @@
+"""
+Tests for DefinitionOrchestratorV2.create_definitions_batch.
+
+Covers deduplication, sharing of web lookups and synonym enrichment across
+the batch, the shared rate limiter and resuming from a checkpoint.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.interfaces import AIGenerationResult, CleaningResult, GenerationRequest
+from services.orchestrators.batch_generation import BatchCheckpoint, batch_key
+from services.orchestrators.definition_orchestrator_v2 import (
+    DefinitionOrchestratorV2,
+)
+
+
+def _orchestrator(web_lookup_service=None, synonym_orchestrator=None):
+    prompt_service = AsyncMock()
+    prompt_service.build_generation_prompt.return_value = MagicMock(
+        text="PROMPT", token_count=10, components_used=[], metadata={}
+    )
+    ai_service = AsyncMock()
+    ai_service.generate_definition.return_value = AIGenerationResult(
+        text="Een gegenereerde definitie.",
+        model="gpt-4",
+        tokens_used=10,
+        generation_time=0.01,
+    )
+    cleaning_service = AsyncMock()
+    cleaning_service.clean_text.return_value = CleaningResult(
+        original_text="Een gegenereerde definitie.",
+        cleaned_text="Een gegenereerde definitie.",
+        was_cleaned=False,
+    )
+    validation_service = AsyncMock()
+    validation_service.validate_definition.return_value = {
+        "version": "1.0.0",
+        "overall_score": 0.85,
+        "is_acceptable": True,
+        "violations": [],
+        "passed_rules": [],
+        "detailed_scores": {},
+        "system": {"correlation_id": "00000000-0000-0000-0000-000000000000"},
+    }
+    repository = MagicMock()
+    ids = iter(range(1, 1000))
+    repository.save.side_effect = lambda *_a, **_k: next(ids)
+
+    return DefinitionOrchestratorV2(
+        prompt_service=prompt_service,
+        ai_service=ai_service,
+        validation_service=validation_service,
+        cleaning_service=cleaning_service,
+        repository=repository,
+        web_lookup_service=web_lookup_service,
+        synonym_orchestrator=synonym_orchestrator,
+    )
+
+
+def _request(rid, begrip, categorie=None):
+    return GenerationRequest(
+        id=rid,
+        begrip=begrip,
+        ontologische_categorie=categorie,
+        organisatorische_context=["DJI"],
+        actor="tester",
+    )
+
+
+async def _no_examples(**_kwargs):
+    return {}
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def test_batch_key_ignores_case_whitespace_and_list_order():
+    a = GenerationRequest(
+        id="1", begrip="Toezicht ", juridische_context=["Strafrecht", "Bestuursrecht"]
+    )
+    b = GenerationRequest(
+        id="2", begrip="toezicht", juridische_context=["bestuursrecht", "strafrecht"]
+    )
+    assert batch_key(a) == batch_key(b)
+    assert batch_key(a) != batch_key(_request("3", "toezicht", "proces"))
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_and_shares_lookups():
+    lookups = []
+
+    async def slow_lookup(request):
+        lookups.append(request.term)
+        await asyncio.sleep(0.05)
+        return []
+
+    web_lookup_service = MagicMock()
+    web_lookup_service.lookup = AsyncMock(side_effect=slow_lookup)
+    synonym_orchestrator = MagicMock()
+    synonym_orchestrator.ensure_synonyms = AsyncMock(return_value=([], 0))
+    orch = _orchestrator(web_lookup_service, synonym_orchestrator)
+
+    requests = [
+        _request("r1", "toezicht", "proces"),
+        _request("r2", "Toezicht", "proces"),  # exact duplicate
+        _request("r3", "toezicht", "resultaat"),  # same term, other category
+        _request("r4", "verificatie", "proces"),
+    ]
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=_no_examples,
+    ):
+        results = await _collect(
+            orch.create_definitions_batch(
+                requests, concurrency=4, rate_limit_endpoint=None
+            )
+        )
+
+    assert sorted(r.index for r in results) == [0, 1, 2, 3]
+    assert all(r.success for r in results)
+    by_index = {r.index: r for r in results}
+    assert by_index[1].duplicate_of == 0
+    assert by_index[1].definition_id == by_index[0].definition_id
+    assert orch.ai_service.generate_definition.await_count == 3
+    # Web lookup and synonyms once per term, not per request
+    assert sorted(lookups) == ["toezicht", "verificatie"]
+    assert synonym_orchestrator.ensure_synonyms.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_synonyms_per_term_and_context():
+    synonym_orchestrator = MagicMock()
+    synonym_orchestrator.ensure_synonyms = AsyncMock(return_value=([], 0))
+    orch = _orchestrator(synonym_orchestrator=synonym_orchestrator)
+
+    other_context = _request("r3", "toezicht", "resultaat")
+    other_context.organisatorische_context = ["OM"]
+    requests = [
+        _request("r1", "toezicht", "proces"),
+        _request("r2", "Toezicht ", "resultaat"),  # same term and context
+        other_context,
+    ]
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=_no_examples,
+    ):
+        await _collect(
+            orch.create_definitions_batch(
+                requests, concurrency=3, rate_limit_endpoint=None
+            )
+        )
+
+    contexts = [
+        call.kwargs["context"]["organisatorisch"]
+        for call in synonym_orchestrator.ensure_synonyms.await_args_list
+    ]
+    assert sorted(contexts) == [["DJI"], ["OM"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_items_get_their_own_context_copy():
+    web_lookup_service = MagicMock()
+    web_lookup_service.lookup = AsyncMock(return_value=[])
+    orch = _orchestrator(web_lookup_service)
+    seen = []
+
+    async def build_prompt(request, feedback_history=None, context=None):
+        seen.append(context)
+        return MagicMock(text="PROMPT", token_count=10, components_used=[])
+
+    orch.prompt_service.build_generation_prompt.side_effect = build_prompt
+    snippets = [{"title": "Beleid", "snippet": "toezicht door de inspectie"}]
+    shared_context = {"documents": {"snippets": snippets}}
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=_no_examples,
+    ):
+        await _collect(
+            orch.create_definitions_batch(
+                [_request("r1", "toezicht"), _request("r2", "verificatie")],
+                concurrency=2,
+                context=shared_context,
+                rate_limit_endpoint=None,
+            )
+        )
+
+    # The prompt stage replaces the snippets with provenance records
+    assert shared_context == {"documents": {"snippets": snippets}}
+    assert len(seen) == 2
+    assert seen[0] is not seen[1]
+    assert all(c["documents"]["snippets"][0]["provider"] == "documents" for c in seen)
+
+
+@pytest.mark.asyncio
+async def test_batch_feeds_shared_rate_limiter_at_low_priority():
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock(return_value=True)
+    limiter.record_response = AsyncMock()
+    orch = _orchestrator()
+
+    with (
+        patch(
+            "services.orchestrators.definition_orchestrator_v2.get_smart_limiter",
+            new=AsyncMock(return_value=limiter),
+        ) as get_limiter,
+        patch(
+            "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+            new=_no_examples,
+        ),
+    ):
+        results = await _collect(
+            orch.create_definitions_batch(
+                [_request("r1", "toezicht"), _request("r2", "verificatie")]
+            )
+        )
+
+    assert len(results) == 2
+    get_limiter.assert_awaited_once_with("definition_generation")
+    assert limiter.acquire.await_count == 2
+    assert limiter.acquire.await_args.args[0].name == "LOW"
+    assert limiter.record_response.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / "run.jsonl"
+    requests = [_request("r1", "toezicht"), _request("r2", "verificatie")]
+
+    orch = _orchestrator()
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=_no_examples,
+    ):
+        stream = orch.create_definitions_batch(
+            requests, concurrency=1, checkpoint=checkpoint, rate_limit_endpoint=None
+        )
+        first = await stream.__anext__()
+        await stream.aclose()  # simulated crash after one term
+
+        assert len(BatchCheckpoint(checkpoint)) == 1
+
+        resumed_orch = _orchestrator()
+        results = await _collect(
+            resumed_orch.create_definitions_batch(
+                requests, checkpoint=checkpoint, rate_limit_endpoint=None
+            )
+        )
+
+    assert {r.index for r in results} == {0, 1}
+    resumed = [r for r in results if r.resumed]
+    assert [r.index for r in resumed] == [first.index]
+    assert resumed[0].definition_id == first.definition_id
+    assert resumed_orch.ai_service.generate_definition.await_count == 1
+    assert len(BatchCheckpoint(checkpoint)) == 2
@@ -0,0 +1,175 @@
+"""
+Tests for the stage graph that drives DefinitionOrchestratorV2 phases 1-7.
+
+Covers dependency ordering, overlap of independent stages, per-stage deadlines
+and the stage timings exposed in the orchestrator response metadata.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.orchestrators.stage_graph import Stage, StageGraph
+
+
+async def _after(delay, value):
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap_and_receive_dependency_results():
+    graph = StageGraph(
+        [
+            Stage("root", lambda d: _after(0, 1)),
+            Stage("left", lambda d: _after(0.1, d["root"] + 1), after=("root",)),
+            Stage("right", lambda d: _after(0.1, d["root"] + 2), after=("root",)),
+            Stage(
+                "join",
+                lambda d: _after(0, d["left"] * d["right"]),
+                after=("left", "right"),
+            ),
+        ]
+    )
+
+    results = await graph.run()
+
+    assert results == {"root": 1, "left": 2, "right": 3, "join": 6}
+    left, right = graph.timings["left"], graph.timings["right"]
+    assert right.start < left.start + left.duration  # ran concurrently
+    assert graph.timings["join"].start >= left.start + left.duration
+    meta = graph.timing_metadata()
+    assert set(meta["stage_timings"]) == {"root", "left", "right", "join"}
+    assert meta["critical_path"][0] == "root"
+    assert meta["critical_path"][-1] == "join"
+
+
+@pytest.mark.asyncio
+async def test_deadline_uses_fallback_or_raises():
+    graph = StageGraph(
+        [
+            Stage(
+                "slow",
+                lambda d: _after(1, "late"),
+                deadline=0.01,
+                on_timeout=lambda: "fallback",
+            ),
+            Stage("next", lambda d: _after(0, d["slow"]), after=("slow",)),
+        ]
+    )
+    results = await graph.run()
+    assert results["next"] == "fallback"
+    assert graph.timings["slow"].status == "timeout"
+
+    strict = StageGraph([Stage("slow", lambda d: _after(1, "late"), deadline=0.01)])
+    with pytest.raises(TimeoutError):
+        await strict.run()
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_stages():
+    async def boom(_deps):
+        raise RuntimeError("stage failed")
+
+    graph = StageGraph(
+        [
+            Stage("fails", boom),
+            Stage("sibling", lambda d: _after(1, None)),
+            Stage("dependent", lambda d: _after(0, None), after=("fails",)),
+        ]
+    )
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        await graph.run()
+    assert graph.timings["fails"].status == "error"
+    assert graph.timings["sibling"].status == "cancelled"
+    assert graph.timings["dependent"].status == "pending"
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError, match="unknown"):
+        StageGraph([Stage("a", AsyncMock(), after=("missing",))])
+    with pytest.raises(ValueError, match="Cycle"):
+        StageGraph(
+            [
+                Stage("a", AsyncMock(), after=("b",)),
+                Stage("b", AsyncMock(), after=("a",)),
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_overlaps_voorbeelden_with_validation():
+    from services.interfaces import (
+        AIGenerationResult,
+        CleaningResult,
+        GenerationRequest,
+    )
+    from services.orchestrators.definition_orchestrator_v2 import (
+        DefinitionOrchestratorV2,
+    )
+
+    prompt_service = AsyncMock()
+    prompt_service.build_generation_prompt.return_value = MagicMock(
+        text="PROMPT", token_count=10, components_used=[], metadata={}
+    )
+    ai_service = AsyncMock()
+    ai_service.generate_definition.return_value = AIGenerationResult(
+        text="Een gegenereerde definitie.",
+        model="gpt-4",
+        tokens_used=10,
+        generation_time=0.01,
+    )
+    cleaning_service = AsyncMock()
+    cleaning_service.clean_text.return_value = CleaningResult(
+        original_text="Een gegenereerde definitie.",
+        cleaned_text="Een gegenereerde definitie.",
+        was_cleaned=False,
+    )
+
+    async def slow_validation(**_kwargs):
+        await asyncio.sleep(0.1)
+        return {
+            "version": "1.0.0",
+            "overall_score": 0.85,
+            "is_acceptable": True,
+            "violations": [],
+            "passed_rules": [],
+            "detailed_scores": {},
+            "system": {"correlation_id": "00000000-0000-0000-0000-000000000000"},
+        }
+
+    validation_service = AsyncMock()
+    validation_service.validate_definition.side_effect = slow_validation
+    repository = MagicMock()
+    repository.save.return_value = 1
+
+    orch = DefinitionOrchestratorV2(
+        prompt_service=prompt_service,
+        ai_service=ai_service,
+        validation_service=validation_service,
+        cleaning_service=cleaning_service,
+        repository=repository,
+    )
+    request = GenerationRequest(id="it-002", begrip="verificatie", actor="tester")
+
+    async def slow_examples(**_kwargs):
+        await asyncio.sleep(0.1)
+        return {"voorbeeldzinnen": ["Voorbeeld 1"]}
+
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=slow_examples,
+    ):
+        response = await orch.create_definition(request)
+
+    assert response.success is True
+    assert response.definition.metadata["voorbeelden"] == {
+        "voorbeeldzinnen": ["Voorbeeld 1"]
+    }
+    timings = response.metadata["stage_timings"]
+    assert set(timings) >= {"security", "prompt", "voorbeelden", "validation"}
+    voorbeelden, validation = timings["voorbeelden"], timings["validation"]
+    assert validation["start"] < voorbeelden["start"] + voorbeelden["duration"]
+    assert response.metadata["critical_path"][0] == "security"
@@ -214,3 +214,180 @@ class TestDEF123ContextAwareModuleLoading:
         assert (
             "context_awareness" in metadata["skipped_modules"]
         ), "context_awareness should be in skipped list"
+
+
+class _StaticModule(_OkModule):
+    """Cachebare module: output hangt alleen af van config en shared 'mode'."""
+
+    def __init__(self, module_id: str):
+        super().__init__(module_id)
+        self.calls = 0
+
+    def initialize(self, config: dict):
+        self._config = config
+        self._initialized = True
+
+    def execute(self, context: ModuleContext):
+        self.calls += 1
+        context.set_shared("static_seen", True)
+        mode = context.get_shared("mode", "default")
+        return ModuleOutput(content=f"[{self.module_id}:{mode}]", metadata={})
+
+    def cache_key_inputs(self, context: ModuleContext):
+        return {"config": self._config, "mode": context.get_shared("mode", "default")}
+
+    def restore_from_cache(self, context: ModuleContext, output: ModuleOutput):
+        context.set_shared("static_seen", True)
+
+
+class _ReaderModule(_OkModule):
+    """Niet-cachebare module die shared state van _StaticModule leest."""
+
+    def __init__(self):
+        super().__init__("reader", deps=["static"])
+        self.calls = 0
+
+    def execute(self, context: ModuleContext):
+        self.calls += 1
+        return ModuleOutput(
+            content=f"[reader:{context.get_shared('static_seen', False)}]",
+            metadata={},
+        )
+
+
+class TestModuleOutputMemoization:
+    def _orchestrator(self, **kwargs):
+        orch = PromptOrchestrator(**kwargs)
+        static, reader = _StaticModule("static"), _ReaderModule()
+        orch.register_module(static)
+        orch.register_module(reader)
+        orch.initialize_modules({"static": {"include_examples": True}})
+        orch.set_module_order(["static", "reader"])
+        return orch, static, reader
+
+    def test_cacheable_module_executes_once_per_key(self):
+        orch, static, reader = self._orchestrator()
+        enriched, cfg = _ctx()
+
+        first = orch.build_prompt("a", enriched, cfg)
+        second = orch.build_prompt("b", enriched, cfg)
+
+        assert first == second == "[static:default]\n\n[reader:True]"
+        assert static.calls == 1
+        assert reader.calls == 2  # geen cache_key_inputs -> altijd uitvoeren
+        assert orch.get_execution_metadata()["cached_modules"] == ["static"]
+        stats = orch.get_module_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    def test_changed_inputs_miss_the_cache(self):
+        orch, static, _ = self._orchestrator()
+        enriched, cfg = _ctx()
+
+        orch.build_prompt("a", enriched, cfg)
+        orch.initialize_modules({"static": {"include_examples": False}})
+        orch.build_prompt("a", enriched, cfg)
+        assert static.calls == 2
+
+        orch.clear_module_cache()
+        orch.build_prompt("a", enriched, cfg)
+        assert static.calls == 3
+
+    def test_cache_is_bounded(self):
+        orch, static, _ = self._orchestrator(module_cache_size=1)
+        enriched, cfg = _ctx()
+
+        for include in (True, False, True):
+            orch.initialize_modules({"static": {"include_examples": include}})
+            orch.build_prompt("a", enriched, cfg)
+
+        assert static.calls == 3
+        assert orch.get_module_cache_stats()["evictions"] == 2
+
+    def test_cache_disabled(self):
+        orch, static, _ = self._orchestrator(module_cache_size=0)
+        enriched, cfg = _ctx()
+
+        orch.build_prompt("a", enriched, cfg)
+        orch.build_prompt("a", enriched, cfg)
+        assert static.calls == 2
+
+
+def test_static_rule_modules_declare_cache_inputs():
+    from services.prompts.modules.json_based_rules_module import (
+        JSONBasedRulesModule,
+    )
+    from services.prompts.modules.structure_rules_module import (
+        StructureRulesModule,
+    )
+
+    enriched, cfg = _ctx()
+    context = ModuleContext(begrip="x", enriched_context=enriched, config=cfg)
+    rules = JSONBasedRulesModule("ARAI", "arai_rules", "ARAI", "✳️", "ARAI", 75)
+    rules.initialize({})
+    structure = StructureRulesModule()
+    structure.initialize({"include_examples": False})
+
+    inputs = rules.cache_key_inputs(context)
+    assert inputs["rule_prefix"] == "ARAI"
+    assert inputs["ruleset_version"] == context.get_shared("ruleset_version")
+    assert structure.cache_key_inputs(context) == {
+        "config": {"include_examples": False}
+    }
+
+
+class _SlowModule(_OkModule):
+    def execute(self, context: ModuleContext):
+        import threading
+        import time
+
+        time.sleep(0.01)
+        return ModuleOutput(
+            content=f"[{self.module_id}]",
+            metadata={"thread": threading.current_thread().name},
+        )
+
+
+class TestBatchExecutionMode:
+    def _orchestrator(self, module_cls=_OkModule, **kwargs):
+        orch = PromptOrchestrator(**kwargs)
+        for module_id in ("A", "B", "C"):
+            orch.register_module(module_cls(module_id))
+        orch.initialize_modules({})
+        return orch
+
+    def test_cheap_batch_runs_inline_after_first_measurement(self):
+        orch = self._orchestrator()
+        enriched, cfg = _ctx()
+
+        orch.build_prompt("a", enriched, cfg)
+        assert orch.get_execution_metadata()["batch_modes"] == ["pooled"]
+        orch.build_prompt("a", enriched, cfg)
+        metadata = orch.get_execution_metadata()
+        assert metadata["batch_modes"] == ["inline"]
+        assert set(metadata["module_costs_ms"]) == {"A", "B", "C"}
+        orch.shutdown()
+
+    def test_expensive_batch_stays_pooled_on_persistent_executor(self):
+        orch = self._orchestrator(_SlowModule, inline_threshold_ms=1.0)
+        enriched, cfg = _ctx()
+
+        threads = set()
+        for _ in range(3):
+            orch.build_prompt("a", enriched, cfg)
+            metadata = orch.get_execution_metadata()
+            assert metadata["batch_modes"] == ["pooled"]
+            threads.update(md["thread"] for md in metadata["module_metadata"].values())
+
+        assert all(name.startswith("prompt-module") for name in threads)
+        assert len(threads) <= orch.max_workers
+        orch.shutdown()
+
+    def test_forced_modes(self):
+        enriched, cfg = _ctx()
+        inline = self._orchestrator(_SlowModule, execution_mode="inline")
+        inline.build_prompt("a", enriched, cfg)
+        assert inline.get_execution_metadata()["batch_modes"] == ["inline"]
+        assert inline._executor is None
+
+        with pytest.raises(ValueError, match="execution_mode"):
+            PromptOrchestrator(execution_mode="turbo")
@@ -0,0 +1,179 @@
+"""Tests voor de prompt result cache van PromptServiceV2."""
+
+import itertools
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.interfaces import (
+    AIGenerationResult,
+    CleaningResult,
+    GenerationRequest,
+    LookupResult,
+    WebSource,
+)
+from services.orchestrators.definition_orchestrator_v2 import (
+    DefinitionOrchestratorV2,
+)
+from services.prompts.prompt_service_v2 import PromptServiceConfig, PromptServiceV2
+
+
+def _request(rid, begrip="toezicht", **kwargs):
+    return GenerationRequest(
+        id=rid,
+        begrip=begrip,
+        organisatorische_context=["DJI"],
+        actor=f"user-{rid}",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def build_prompt():
+    with patch(
+        "services.definition_generator_prompts.UnifiedPromptBuilder.build_prompt",
+        side_effect=lambda begrip, context: f"PROMPT {begrip}",
+    ) as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_reuse_prompt(build_prompt):
+    svc = PromptServiceV2()
+
+    first = await svc.build_generation_prompt(_request("1"))
+    # Ander id/actor, zelfde inhoud -> zelfde prompt uit cache
+    second = await svc.build_generation_prompt(_request("2"))
+
+    assert build_prompt.call_count == 1
+    assert second.text == first.text
+    assert second.metadata["cache_hit"] is True
+    assert "cache_hit" not in first.metadata
+    stats = svc.get_prompt_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prompt_inputs_are_part_of_the_key(build_prompt):
+    svc = PromptServiceV2()
+
+    await svc.build_generation_prompt(_request("1"))
+    await svc.build_generation_prompt(_request("2", ontologische_categorie="proces"))
+    await svc.build_generation_prompt(_request("3"), context={"web_lookup": ["x"]})
+    await svc.build_generation_prompt(_request("4", begrip="verificatie"))
+
+    assert build_prompt.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled_and_expires(build_prompt):
+    disabled = PromptServiceV2(PromptServiceConfig(cache_enabled=False))
+    await disabled.build_generation_prompt(_request("1"))
+    await disabled.build_generation_prompt(_request("1"))
+    assert build_prompt.call_count == 2
+
+    expiring = PromptServiceV2(PromptServiceConfig(cache_ttl_seconds=0))
+    await expiring.build_generation_prompt(_request("1"))
+    await expiring.build_generation_prompt(_request("1"))
+    assert build_prompt.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_prompt_gets_a_fresh_timestamp():
+    stamped = "PROMPT\n- Begrip: toezicht\n- Timestamp: 2020-01-01 00:00:00\n- Einde"
+    with patch(
+        "services.definition_generator_prompts.UnifiedPromptBuilder.build_prompt",
+        return_value=stamped,
+    ):
+        svc = PromptServiceV2()
+        first = await svc.build_generation_prompt(_request("1"))
+        second = await svc.build_generation_prompt(_request("2"))
+
+    assert first.text == stamped
+    ((_, cached),) = svc._prompt_cache.values()
+    assert "- Timestamp: {timestamp}\n" in cached.text
+    assert re.search(r"- Timestamp: \d{4}-\d\d-\d\d \d\d:\d\d:\d\d\n", second.text)
+    assert "2020-01-01" not in second.text
+    assert second.text.endswith("- Einde")
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_do_not_share_mutable_state(build_prompt):
+    svc = PromptServiceV2()
+
+    first = await svc.build_generation_prompt(_request("1"))
+    first.metadata["template_selected"] = "gewijzigd"
+    second = await svc.build_generation_prompt(_request("2"))
+    second.metadata["feedback_entries"] = 99
+    third = await svc.build_generation_prompt(_request("3"))
+
+    assert third.metadata["template_selected"] != "gewijzigd"
+    assert third.metadata["feedback_entries"] == 0
+    assert third.metadata is not second.metadata
+
+
+@pytest.mark.asyncio
+async def test_web_lookup_debug_and_timestamps_do_not_bust_the_cache(build_prompt):
+    calls = itertools.count(1)
+
+    async def lookup(request):
+        n = next(calls)
+        web_lookup_service._last_debug = {
+            "term": request.term,
+            "attempts": [{"provider": "wikipedia", "duration_ms": 100 + n}],
+        }
+        return [
+            LookupResult(
+                term=request.term,
+                source=WebSource(name="Wikipedia", url="https://nl.wikipedia.org/x"),
+                definition="toezicht is het controleren van naleving",
+                metadata={"retrieved_at": f"2026-10-19T10:00:0{n}"},
+            )
+        ]
+
+    web_lookup_service = MagicMock()
+    web_lookup_service.lookup = AsyncMock(side_effect=lookup)
+    ai_service = AsyncMock()
+    ai_service.generate_definition.return_value = AIGenerationResult(
+        text="Een definitie.", model="gpt-4", tokens_used=10, generation_time=0.01
+    )
+    cleaning_service = AsyncMock()
+    cleaning_service.clean_text.return_value = CleaningResult(
+        original_text="Een definitie.",
+        cleaned_text="Een definitie.",
+        was_cleaned=False,
+    )
+    validation_service = AsyncMock()
+    validation_service.validate_definition.return_value = {
+        "version": "1.0.0",
+        "overall_score": 0.85,
+        "is_acceptable": True,
+        "violations": [],
+        "passed_rules": [],
+        "detailed_scores": {},
+        "system": {"correlation_id": "00000000-0000-0000-0000-000000000000"},
+    }
+    prompt_service = PromptServiceV2()
+    orch = DefinitionOrchestratorV2(
+        prompt_service=prompt_service,
+        ai_service=ai_service,
+        validation_service=validation_service,
+        cleaning_service=cleaning_service,
+        repository=MagicMock(),
+        web_lookup_service=web_lookup_service,
+    )
+
+    async def no_examples(**_kwargs):
+        return {}
+
+    with patch(
+        "voorbeelden.unified_voorbeelden.genereer_alle_voorbeelden_async",
+        new=no_examples,
+    ):
+        await orch.create_definition(_request("1"))
+        await orch.create_definition(_request("2"))
+
+    assert web_lookup_service.lookup.await_count == 2
+    assert build_prompt.call_count == 1
+    assert prompt_service.get_prompt_cache_stats()["hits"] == 1
@@ -0,0 +1,107 @@
+"""Tests voor batchvalidatie in een procespool (ModularValidationService/V2)."""
+
+import pytest
+
+from services.orchestrators.validation_orchestrator_v2 import ValidationOrchestratorV2
+from services.validation.interfaces import ValidationContext, ValidationRequest
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.process_pool import chunked, resolve_workers
+
+TEXTS = [
+    ("vonnis", "Een vonnis is een schriftelijke uitspraak van de rechter."),
+    ("verdachte", "persoon die volgens artikel 27 Sv wordt verdacht van een feit"),
+    ("leeg", ""),
+    ("procesmodel", "procesmodel: is een model dat processtappen beschrijft"),
+    ("gegevens", "Gegevens zijn simpel maar ook complex, a, b, c, d, e, f, g."),
+]
+
+
+@pytest.fixture
+def json_service():
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(get_cached_toetsregel_manager(), None, None)
+
+
+def _items():
+    return [
+        {"begrip": b, "text": t, "context": {"correlation_id": f"cid-{i}"}}
+        for i, (b, t) in enumerate(TEXTS)
+    ]
+
+
+@pytest.mark.unit
+def test_chunked_preserves_order():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunked([1, 2], 0) == [[1], [2]]
+
+
+@pytest.mark.unit
+def test_resolve_workers_bounded_by_chunks(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    assert resolve_workers(0, 3) == 3
+    assert resolve_workers(2, 10) == 2
+    assert resolve_workers(-1, 20) == 8
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip_compiles_same_plan(json_service):
+    clone = ModularValidationService.from_rule_set_snapshot(
+        json_service.rule_set_snapshot()
+    )
+
+    plan = json_service._get_rule_plan()
+    clone_plan = clone._get_rule_plan()
+    assert [s.code for s in clone_plan.steps] == [s.code for s in plan.steps]
+    assert clone_plan.weights == plan.weights
+    assert clone_plan.literals == plan.literals
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_process_pool_matches_sequential(json_service):
+    sequential = await json_service.batch_validate(_items())
+    pooled = await json_service.batch_validate(_items(), workers=2, chunk_size=2)
+
+    assert pooled == sequential
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_default_rule_set_uses_process_pool(monkeypatch):
+    service = ModularValidationService()
+    calls = []
+
+    async def fake_pool(snapshot, prepared, *, workers, chunk_size):
+        calls.append((workers, len(prepared)))
+        return [{"begrip": item[0]} for item in prepared]
+
+    monkeypatch.setattr(
+        "services.validation.modular_validation_service.validate_in_process_pool",
+        fake_pool,
+    )
+    results = await service.batch_validate([("a", "tekst"), ("b", "tekst")], workers=2)
+
+    assert calls == [(2, 2)]
+    assert [r["begrip"] for r in results] == ["a", "b"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_orchestrator_process_pool_matches_sequential(json_service):
+    orchestrator = ValidationOrchestratorV2(validation_service=json_service)
+    requests = [
+        ValidationRequest(
+            begrip=b,
+            text=t,
+            context=ValidationContext(
+                correlation_id=f"00000000-0000-0000-0000-00000000000{i}"
+            ),
+        )
+        for i, (b, t) in enumerate(TEXTS)
+    ]
+
+    sequential = await orchestrator.batch_validate(requests)
+    pooled = await orchestrator.batch_validate(requests, workers=2, chunk_size=3)
+
+    assert pooled == sequential
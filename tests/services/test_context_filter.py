@@ -201,3 +201,35 @@ class TestContextFilter:
         # Should not crash, but no matches expected
         assert len(filtered) == 1
         assert filtered[0]["context_match"]["relevance_score"] == 0.0
+
+    def test_compiled_matcher_matches_match_context(self):
+        """Test dat een eenmalig gecompileerde matcher dezelfde resultaten geeft."""
+        context = {
+            "org_context": ["OM", "NP"],
+            "jur_context": ["Strafrecht"],
+            "wet_context": ["Sv", "Sr"],
+        }
+        matcher = self.filter.compile(**context)
+        texts = [
+            "Het Openbaar Ministerie vordert op grond van het Wetboek van Strafvordering",
+            "De politie in een strafzaak",
+            "Nothing related here",
+            "",
+        ]
+        for text in texts:
+            assert matcher.match(text) == self.filter.match_context(text, **context)
+
+    def test_compiled_matcher_overlapping_patterns(self):
+        """Test dat overlappende matches van verschillende patronen beide tellen."""
+        # "strafrecht" (jur) valt binnen "wetboek van strafrecht" (Sr)
+        matcher = self.filter.compile(jur_context=["Strafrecht"], wet_context=["Sr"])
+        match = matcher.match("Wetboek van Strafrecht")
+        assert match.has_jur_match
+        assert match.has_wet_match
+        assert match.match_count == 2
+
+    def test_compiled_matcher_feeds_boost_score(self):
+        """Test dat de gecompileerde matcher bruikbaar is voor boost_score."""
+        matcher = self.filter.compile(wet_context=["Awb"])
+        match = matcher.match("Artikel 3:2 Awb")
+        assert self.filter.boost_score(0.5, match) == pytest.approx(0.65)
@@ -359,6 +359,23 @@ class TestDefinitionRepository:
             mock_cursor.execute.assert_called_once()
             assert "SELECT * FROM definities" in mock_cursor.execute.call_args[0][0]
 
+    def test_find_by_begrip_ignores_derived_columns(self, tmp_path):
+        """Test dat kolommen zonder record veld (begrip_norm) genegeerd worden."""
+        repository = DefinitionRepository(db_path=str(tmp_path / "definities.db"))
+        repository.save(
+            Definition(
+                begrip="Toezicht",
+                definitie="Het controleren van naleving.",
+                organisatorische_context=["OM"],
+                categorie="proces",
+            )
+        )
+
+        result = repository.find_by_begrip("Toezicht")
+
+        assert result is not None
+        assert result.organisatorische_context == ["OM"]
+
     def test_find_by_begrip_not_found(self, repository):
         """Test find_by_begrip wanneer begrip niet gevonden wordt."""
         with patch.object(repository, "_get_connection") as mock_get_conn:
@@ -1,5 +1,6 @@
 """Tests for EvaluationContext sharing between validators."""
 
+from functools import partial
 from unittest.mock import Mock, call, patch
 
 import pytest
@@ -144,16 +145,20 @@ async def test_context_includes_correlation_id_for_tracing():
 
     correlation_id = "trace-abc-123"
 
-    # Mock internal method to inspect context
-    original_evaluate = getattr(service, "_evaluate_rule", None)
+    # Vervang de plan-stappen om de context per regel te inspecteren
+    compile_step = getattr(service, "_compile_rule_step", None)
     contexts_seen = []
 
     def capture_context(rule, context):
         contexts_seen.append(context)
-        return {"score": 0.8, "violations": []}
-
-    if original_evaluate:
-        with patch.object(service, "_evaluate_rule", side_effect=capture_context):
+        return 0.8, None
+
+    if compile_step:
+        with patch.object(
+            service,
+            "_compile_rule_step",
+            side_effect=lambda code, literals: partial(capture_context, code),
+        ):
             await service.validate_definition(
                 begrip="test",
                 text="test text",
@@ -162,6 +167,7 @@ async def test_context_includes_correlation_id_for_tracing():
             )
 
         # All contexts should have the same correlation_id
+        assert contexts_seen
         for ctx in contexts_seen:
             assert ctx.correlation_id == correlation_id
     else:
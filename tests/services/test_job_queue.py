@@ -0,0 +1,289 @@
+"""Tests voor de SQLite job store en de achtergrond worker pool."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.interfaces import GenerationRequest
+from services.jobs import (
+    JOB_GENERATION,
+    JOB_IMPORT,
+    JobQueue,
+    JobStore,
+    generation_payload,
+    job_operation_name,
+    job_store,
+    register_default_handlers,
+)
+from services.jobs.job_store import (
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    STATUS_SUCCEEDED,
+)
+from utils.progress_callback import (
+    register_progress_callback,
+    unregister_progress_callback,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+@pytest.fixture
+def queue(store):
+    q = JobQueue(store, max_workers=2, poll_interval=0.05)
+    yield q
+    q.stop()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _finished(queue, job_id):
+    return lambda: queue.get(job_id).is_finished
+
+
+def test_store_claims_by_priority_and_kind(store):
+    low = store.enqueue("export", {"n": 1}, priority=3)
+    high = store.enqueue("export", {"n": 2}, priority=0)
+    other = store.enqueue("import", {"n": 3}, priority=0)
+
+    claimed = store.claim_next(["export"])
+    assert claimed.id == high
+    assert claimed.status == STATUS_RUNNING
+    assert claimed.attempts == 1
+    assert store.claim_next(["export"]).id == low
+    assert store.claim_next([]) is None
+    assert store.claim_next().id == other
+    assert store.claim_next() is None
+
+
+def test_job_result_progress_and_timing_are_persisted(queue, store):
+    events = []
+    register_progress_callback(lambda name, active: events.append((name, active)))
+
+    async def handler(payload, ctx):
+        ctx.report(0.5, "halverwege")
+        await asyncio.sleep(0.05)
+        return {"dubbel": payload["n"] * 2}
+
+    queue.register("double", handler)
+    try:
+        job_id = queue.enqueue("double", {"n": 21}, owner="sessie-1")
+        assert _wait_for(_finished(queue, job_id))
+    finally:
+        unregister_progress_callback()
+
+    # Nieuwe store-instance: resultaat overleeft de worker (gebruiker kan weg)
+    job = JobStore(store.db_path).get(job_id)
+    assert job.status == STATUS_SUCCEEDED
+    assert job.result == {"dubbel": 42}
+    assert job.progress == 1.0
+    assert job.timing()["run_seconds"] >= 0.05
+    assert job.timing()["total_seconds"] >= job.timing()["run_seconds"]
+    assert [j.id for j in store.list_jobs(owner="sessie-1")] == [job_id]
+    assert events == [
+        (job_operation_name(job_id), True),
+        (job_operation_name(job_id), False),
+    ]
+
+
+def test_concurrency_limit_per_kind(queue):
+    active, peak = [0], [0]
+
+    async def handler(payload, ctx):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.05)
+        active[0] -= 1
+
+    queue.register("generation", handler, concurrency=1)
+    job_ids = [queue.enqueue("generation", {}) for _ in range(3)]
+
+    assert _wait_for(lambda: all(queue.get(j).is_finished for j in job_ids))
+    assert peak[0] == 1
+
+
+def test_failed_job_is_retried_via_dead_letter_queue(queue):
+    calls = []
+
+    async def flaky(payload, ctx):
+        calls.append(ctx.attempt)
+        if len(calls) == 1:
+            raise RuntimeError("tijdelijk")
+        return "ok"
+
+    queue.register("flaky", flaky)
+    job_id = queue.enqueue("flaky", {}, max_attempts=2)
+
+    assert _wait_for(_finished(queue, job_id))
+    job = queue.get(job_id)
+    assert job.status == STATUS_SUCCEEDED
+    assert calls == [1, 2]
+    assert queue.dead_letter_queue.get_stats()["stats"]["total_added"] == 1
+
+
+def test_job_fails_after_max_attempts(queue):
+    async def broken(payload, ctx):
+        raise ValueError("kapot")
+
+    queue.register("broken", broken)
+    job_id = queue.enqueue("broken", {}, max_attempts=1)
+
+    assert _wait_for(_finished(queue, job_id))
+    job = queue.get(job_id)
+    assert job.status == STATUS_FAILED
+    assert job.error == "ValueError: kapot"
+    assert queue.dead_letter_queue.get_stats()["queue_size"] == 0
+
+
+def test_cancel_running_job(queue):
+    started, cancelled = threading.Event(), threading.Event()
+
+    async def slow(payload, ctx):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    queue.register("slow", slow)
+    job_id = queue.enqueue("slow", {})
+    assert started.wait(2.0)
+
+    assert queue.cancel(job_id) is True
+    assert cancelled.wait(2.0)
+    assert queue.get(job_id).status == STATUS_CANCELLED
+    assert queue.cancel(job_id) is False
+
+
+def test_stop_returns_running_job_to_queue(queue, store):
+    started = threading.Event()
+
+    async def slow(payload, ctx):
+        started.set()
+        await asyncio.sleep(5)
+
+    queue.register("slow", slow)
+    job_id = queue.enqueue("slow", {})
+    assert started.wait(2.0)
+
+    queue.stop()
+
+    job = store.get(job_id)
+    assert job.status == STATUS_QUEUED
+    assert job.attempts == 0
+
+
+def test_enqueue_unknown_kind_is_rejected(queue):
+    with pytest.raises(ValueError, match="Geen handler"):
+        queue.enqueue("onbekend", {})
+
+
+def test_import_handler_reports_progress_per_row(queue):
+    import_service = MagicMock()
+    import_service.import_single = AsyncMock(
+        side_effect=[
+            SimpleNamespace(success=True, definition_id=7, error=None),
+            RuntimeError("database op slot"),
+        ]
+    )
+    container = MagicMock()
+    container.import_service.return_value = import_service
+    register_default_handlers(queue, container)
+
+    rows = [{"begrip": "toezicht"}, {"begrip": "verificatie"}]
+    job_id = queue.enqueue(
+        JOB_IMPORT, {"rows": rows, "created_by": "tester", "validated": True}
+    )
+
+    assert _wait_for(_finished(queue, job_id))
+    job = queue.get(job_id)
+    assert job.status == STATUS_SUCCEEDED
+    assert job.result["succeeded"] == 1
+    assert job.result["rows"][1]["error"] == "database op slot"
+    assert import_service.import_single.await_args.kwargs["gate_only"] is True
+
+
+def test_import_handler_saves_drafts_and_skips_duplicates(queue, tmp_path):
+    from services.definition_repository import DefinitionRepository
+
+    repository = DefinitionRepository(str(tmp_path / "definities.db"))
+    container = MagicMock()
+    container.repository.return_value = repository
+    register_default_handlers(queue, container)
+    rows = [
+        {
+            "begrip": "toezicht",
+            "definitie": "het controleren van naleving",
+            "categorie": "proces",
+            "organisatorische_context": "OM",
+        }
+    ]
+
+    def run(skip_duplicates):
+        job_id = queue.enqueue(
+            JOB_IMPORT, {"rows": rows, "skip_duplicates": skip_duplicates}
+        )
+        assert _wait_for(_finished(queue, job_id))
+        return queue.get(job_id).result
+
+    first = run(skip_duplicates=True)
+    skipped = run(skip_duplicates=True)
+    added = run(skip_duplicates=False)
+
+    assert (first["succeeded"], first["skipped"]) == (1, 0)
+    assert (skipped["succeeded"], skipped["skipped"]) == (0, 1)
+    assert (added["succeeded"], added["skipped"]) == (1, 0)
+    saved = repository.get(added["rows"][0]["definition_id"])
+    assert saved.metadata["status"] == "draft"
+    assert added["rows"][0]["definition_id"] != first["rows"][0]["definition_id"]
+    container.import_service.assert_not_called()
+
+
+def test_relative_db_path_is_anchored_to_project_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_store, "PROJECT_ROOT", tmp_path)
+    elsewhere = tmp_path / "elders"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    store = JobStore("cache/jobs.db")
+
+    assert store.db_path == str(tmp_path / "cache" / "jobs.db")
+    assert (tmp_path / "cache" / "jobs.db").exists()
+
+
+def test_generation_job_can_return_the_ui_response(queue):
+    orchestrator = MagicMock()
+    orchestrator.create_definition = AsyncMock(
+        return_value=SimpleNamespace(success=False, definition=None, message="quota")
+    )
+    container = MagicMock()
+    container.orchestrator.return_value = orchestrator
+    register_default_handlers(queue, container)
+
+    request = GenerationRequest(id="r1", begrip="toezicht")
+    job_id = queue.enqueue(
+        JOB_GENERATION, generation_payload(request, None, ui_response=True)
+    )
+
+    assert _wait_for(_finished(queue, job_id))
+    job = queue.get(job_id)
+    assert job.status == STATUS_SUCCEEDED
+    assert job.result["success"] is False
+    assert job.result["error_message"] == "quota"
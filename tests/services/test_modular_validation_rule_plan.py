@@ -0,0 +1,211 @@
+"""Tests voor het gecompileerde uitvoeringsplan van ModularValidationService."""
+
+import re
+from functools import partial
+
+import pytest
+
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.result_cache import ValidationResultCache
+from services.validation.rule_plan import CompiledJsonRule, ScanPattern
+from services.validation.types_internal import EvaluationContext
+
+TEXTS = [
+    ("vonnis", "Een vonnis is een schriftelijke uitspraak van de rechter."),
+    ("verdachte", "persoon die volgens artikel 27 Sv wordt verdacht van een feit"),
+    ("procesmodel", "procesmodel: is een model dat processtappen beschrijft"),
+    ("gegevens", "Gegevens zijn simpel maar ook complex, a, b, c, d, e, f, g."),
+    ("x", ""),
+]
+
+
+def _strip_correlation(result):
+    result["system"].pop("correlation_id", None)
+    return result
+
+
+@pytest.fixture
+def json_service():
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(get_cached_toetsregel_manager(), None, None)
+
+
+@pytest.mark.unit
+def test_plan_compiled_once_in_sorted_order(json_service):
+    plan = json_service._get_rule_plan()
+
+    assert [s.code for s in plan.steps] == sorted(json_service._internal_rules)
+    assert json_service._get_rule_plan() is plan
+    # Baseline regels tellen niet mee naast JSON regels; ARAI nooit
+    assert plan.weights["VAL-EMP-001"] == 0.0
+    assert all(w == 0.0 for c, w in plan.weights.items() if c.startswith("ARAI"))
+
+
+@pytest.mark.unit
+def test_plan_recompiled_when_rules_change():
+    service = ModularValidationService()
+    plan = service._get_rule_plan()
+    assert len(plan) == 7
+
+    service._internal_rules.append("ZZZ-99")
+    new_plan = service._get_rule_plan()
+    assert new_plan is not plan
+    assert new_plan.steps[-1].code == "ZZZ-99"
+    assert new_plan.steps[-1].evaluate(EvaluationContext.from_params("x")) == (
+        1.0,
+        None,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("begrip", "text"), TEXTS)
+async def test_plan_matches_per_rule_dispatch(json_service, monkeypatch, begrip, text):
+    ctx = {"correlation_id": "plan-equivalence"}
+    via_plan = await json_service.validate_definition(begrip, text, context=ctx)
+
+    # Zelfde regelset, maar elke stap via de losse _evaluate_rule dispatch
+    dispatch = ModularValidationService(
+        json_service.toetsregel_manager,
+        None,
+        None,
+        result_cache=ValidationResultCache(max_entries=0),
+    )
+    monkeypatch.setattr(
+        dispatch,
+        "_compile_rule_step",
+        lambda code, literals: partial(dispatch._evaluate_rule, code),
+    )
+    via_dispatch = await dispatch.validate_definition(begrip, text, context=ctx)
+
+    assert _strip_correlation(via_plan) == _strip_correlation(via_dispatch)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_plan_steps_are_the_evaluation_seam(monkeypatch):
+    service = ModularValidationService()
+    seen = []
+
+    def fake(code, ctx):
+        seen.append(code)
+        return 1.0, None
+
+    monkeypatch.setattr(
+        service, "_compile_rule_step", lambda code, literals: partial(fake, code)
+    )
+    await service.validate_definition("test", "test tekst")
+
+    assert seen == sorted(service._internal_rules)
+
+
+class TestLiteralPrefilter:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"\bzou\b", {"zou"}),
+            (r"\b(om te|met als doel)\b", {"om te", "met als doel"}),
+            (r"\bsynoniem\s+van\b", {"synoniem"}),
+            (r"\bding(en)?\b", {"ding"}),
+            (r"\b[A-Z]{2,6}\b", None),
+            (r"^\s*\w+\s*$", None),
+            (r"\b(a|)\b", None),
+        ],
+    )
+    def test_required_literals(self, pattern, expected):
+        scan = ScanPattern.from_regex(re.compile(pattern, re.IGNORECASE))
+        assert scan.literals == (None if expected is None else frozenset(expected))
+
+    def test_candidate_patterns_skip_only_impossible_matches(self):
+        rule = CompiledJsonRule.from_rule(
+            "TST-01",
+            {"herkenbaar_patronen": [r"\bzou\b", r"\bmogen\b", r"\b[A-Z]{3}\b"]},
+            severity="warning",
+            severity_level="low",
+            category="taal",
+        )
+        ctx = EvaluationContext.from_params("Dit ZOU kunnen")
+
+        present = ctx.present_literals(rule.literals)
+        candidates = [scan.pattern for scan in rule.patterns.matchable(present)]
+        assert candidates == [r"\bzou\b", r"\b[A-Z]{3}\b"]
+        assert rule.patterns_only is True
+
+    def test_unicode_case_exceptions_disable_prefilter(self):
+        # 'ſ' matcht 's' onder IGNORECASE, maar 'ſ'.lower() blijft 'ſ'
+        ctx = EvaluationContext.from_params("een ſysteem")
+        assert ctx.prefilter_text is None
+        rule = CompiledJsonRule.from_rule(
+            "TST-02",
+            {"herkenbaar_patronen": [r"\bsysteem\b"]},
+            severity="warning",
+            severity_level="low",
+            category="taal",
+        )
+        present = ctx.present_literals(rule.literals)
+        assert present is None
+        assert len(rule.patterns.matchable(present)) == 1
+
+
+class TestSharedLiteralScan:
+    def test_plan_literals_scanned_once_per_context(self, json_service):
+        plan = json_service._get_rule_plan()
+        ctx = EvaluationContext.from_params(
+            "Een vonnis is een uitspraak die zou gelden"
+        )
+
+        present = ctx.present_literals(plan.literals)
+        assert plan.literals
+        assert present <= plan.literals
+        assert "zou" in present
+        assert ctx.present_literals(plan.literals) is present
+
+    def test_required_and_redundancy_prefiltered(self):
+        rule = CompiledJsonRule.from_rule(
+            "TST-03",
+            {
+                "required_patterns": [r"\bdie\b", r"\bwaarbij\b"],
+                "redundancy_patterns": [r"\bnoodzakelijk\b"],
+            },
+            severity="warning",
+            severity_level="low",
+            category="structuur",
+        )
+        ctx = EvaluationContext.from_params("iets die bestaat")
+        present = ctx.present_literals(rule.literals)
+
+        assert [s.pattern for s in rule.required.matchable(present)] == [r"\bdie\b"]
+        assert rule.redundancy.matchable(present) == ()
+
+    @pytest.mark.unit
+    def test_first_hit_position_unchanged(self):
+        service = ModularValidationService()
+        rule = {
+            "herkenbaar_patronen": [r"\bmogelijk\b", r"\bzou\b"],
+            "prioriteit": "midden",
+        }
+        ctx = EvaluationContext.from_params("het zou mogelijk zijn")
+
+        score, violation = service._evaluate_json_rule("TST-04", rule, ctx)
+
+        # Eerste hit in de tekst telt, niet het eerste patroon in de lijst
+        assert score == pytest.approx(0.4)
+        assert violation["metadata"] == {"detected_pattern": r"\bzou\b", "position": 4}
+
+
+@pytest.mark.unit
+def test_evaluation_context_shared_features():
+    ctx = EvaluationContext.from_params(
+        "  Een Vonnis, kort. Tweede zin!  ", begrip=" Vonnis "
+    )
+
+    assert ctx.text_norm == "Een Vonnis, kort. Tweede zin!"
+    assert ctx.text_lower == "een vonnis, kort. tweede zin!"
+    assert ctx.words == ("Een", "Vonnis,", "kort.", "Tweede", "zin!")
+    assert ctx.word_count == 5
+    assert ctx.comma_count == 1
+    assert ctx.sentences == ("Een Vonnis, kort.", "Tweede zin!")
+    assert ctx.lemma == "vonnis"
+    # Features worden éénmaal berekend (cached)
+    assert ctx.words is ctx.words
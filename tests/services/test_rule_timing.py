@@ -0,0 +1,74 @@
+"""Tests voor de opt-in tijdmeting per toetsregel."""
+
+import pytest
+
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.result_cache import ValidationResultCache
+from services.validation.rule_timing import RuleHistogram, RuleTimingCollector
+
+BEGRIP = "vonnis"
+TEXT = "Een vonnis is een schriftelijke uitspraak van de rechter in een strafzaak."
+
+
+def _service(timing=None):
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(
+        get_cached_toetsregel_manager(),
+        None,
+        None,
+        result_cache=ValidationResultCache(max_entries=0),
+        rule_timing=timing,
+    )
+
+
+@pytest.mark.unit
+def test_histogram_percentiles_within_bucket_error():
+    histogram = RuleHistogram()
+    for micros in range(1, 101):
+        histogram.add(micros * 1_000)
+
+    assert histogram.count == 100
+    assert histogram.total_ns == 5_050_000
+    assert histogram.percentile(50) == pytest.approx(50_000, rel=0.1)
+    assert histogram.percentile(95) == pytest.approx(95_000, rel=0.1)
+    assert histogram.percentile(100) == 100_000
+
+
+@pytest.mark.unit
+def test_report_sorted_by_total_time():
+    timing = RuleTimingCollector(enabled=True)
+    timing.record_run([("SNEL", 1_000), ("TRAAG", 9_000)])
+    timing.record_run([("SNEL", 1_000), ("TRAAG", 9_000)])
+
+    rows = timing.report()
+    assert [row["rule"] for row in rows] == ["TRAAG", "SNEL"]
+    assert rows[0]["share_pct"] == 90.0
+    assert timing.get_stats()["runs"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_service_times_every_rule_when_enabled():
+    timing = RuleTimingCollector(enabled=True)
+    service = _service(timing)
+    baseline = await _service().validate_definition(BEGRIP, TEXT)
+
+    result = await service.validate_definition(BEGRIP, TEXT)
+    await service.validate_definition(BEGRIP, TEXT)
+
+    stats = service.get_health_status()["rule_timing"]
+    assert stats["runs"] == 2
+    assert set(stats["rules"]) == {s.code for s in service._get_rule_plan().steps}
+    assert all(row["count"] == 2 for row in stats["rules"].values())
+    assert result["violations"] == baseline["violations"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_timing_disabled_by_default():
+    service = _service()
+    await service.validate_definition(BEGRIP, TEXT)
+
+    stats = service.get_health_status()["rule_timing"]
+    assert (stats["enabled"], stats["runs"], stats["rules"]) == (False, 0, {})
@@ -413,6 +413,35 @@ class TestServiceAdapter:
         # domein field removed per US-043
         assert call_args.organisatie == ""
 
+    def test_submit_generation_enqueues_ui_job(
+        self, service_adapter, mock_container, mock_orchestrator
+    ):
+        """Generatie vanuit de UI gaat als job zonder retries de wachtrij in."""
+        queue = Mock()
+        queue.enqueue.return_value = "job-1"
+        mock_container.job_queue = Mock(return_value=queue)
+
+        job_id = service_adapter.submit_generation(
+            begrip="Test",
+            context_dict={"organisatorisch": ["OM"], "juridisch": ["Strafrecht"]},
+            organisatie="OM",
+            document_snippets=[{"text": "fragment"}],
+            owner="sessie-1",
+        )
+
+        assert job_id == "job-1"
+        kind, payload = queue.enqueue.call_args.args
+        assert kind == "generation"
+        assert payload["ui_response"] is True
+        assert payload["request"]["begrip"] == "Test"
+        assert payload["request"]["juridische_context"] == ["Strafrecht"]
+        assert payload["context"] == {"documents": {"snippets": [{"text": "fragment"}]}}
+        assert queue.enqueue.call_args.kwargs == {
+            "owner": "sessie-1",
+            "max_attempts": 1,
+        }
+        mock_orchestrator.create_definition.assert_not_called()
+
     def test_get_stats(self, service_adapter, mock_container, mock_orchestrator):
         """Test get_stats methode."""
         # Setup mocks for each service
@@ -0,0 +1,128 @@
+"""Tests voor de gevectoriseerde bulk UFO classificatie."""
+
+import random
+
+import pytest
+
+from database.definitie_repository import DefinitieRecord, DefinitieRepository
+from services.ufo_bulk_classifier import BulkUFOClassifier, UFOFeatureIndex
+from services.ufo_classifier_service import UFOCategory, UFOClassifierService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return UFOClassifierService()
+
+
+def _corpus(service, size=1500, seed=7):
+    """Willekeurige definities uit patroonwoorden, ruis en randgevallen."""
+    words = sorted(
+        {
+            word
+            for patterns in service.PATTERNS.values()
+            for pattern in patterns
+            for word in pattern.strip("\\b()").split("|")
+        }
+    )
+    words += ["de", "een", "van", "42", "Proces-Verbaal", "zaak-", "Één"]
+    terms = [*service.DISAMBIGUATION_RULES, "Persoon", "begrip", "  "]
+    rng = random.Random(seed)
+    items = [
+        (rng.choice(terms), " ".join(rng.sample(words, rng.randint(0, 10))))
+        for _ in range(size)
+    ]
+    return [*items, ("", "leeg"), (None, None), ("zaak", "")]
+
+
+@pytest.mark.unit
+def test_bulk_matches_single_classification(service):
+    items = _corpus(service)
+    bulk = BulkUFOClassifier(service)
+
+    results = bulk.results(bulk.classify(items))
+
+    assert len(results) == len(items)
+    for (term, definition), result in zip(items, results, strict=True):
+        expected = service.classify(term, definition)
+        assert result.primary_category == expected.primary_category
+        assert result.confidence == pytest.approx(expected.confidence)
+        assert result.secondary_categories == expected.secondary_categories
+        assert result.explanation == expected.explanation
+
+
+@pytest.mark.unit
+def test_only_ambiguous_terms_are_disambiguated(service):
+    outcome = BulkUFOClassifier(service).classify(
+        [
+            ("zaak", "een strafzaak bij de rechter"),
+            ("persoon", "een natuurlijk persoon"),
+            ("", ""),
+        ]
+    )
+
+    assert outcome.disambiguated.tolist() == [True, False, False]
+    assert outcome.invalid.tolist() == [False, False, True]
+    assert outcome.categories[1] is UFOCategory.KIND
+
+
+@pytest.mark.unit
+def test_feature_index_keeps_multiword_alternatives_as_regex():
+    index = UFOFeatureIndex(
+        {
+            UFOCategory.EVENT: [r"\b(proces|strafbaar feit)\b"],
+            UFOCategory.QUANTITY: [r"\b\d+\b"],
+        }
+    )
+
+    assert "proces" in index.word_ids
+    assert len(index.regex_checks) == 2
+    matched = index.pattern_matrix(
+        ["een strafbaar feit", "processen", "artikel 12", "een proces"]
+    )
+    assert matched.tolist() == [
+        [True, False],
+        [False, False],
+        [False, True],
+        [True, False],
+    ]
+
+
+@pytest.mark.unit
+def test_reclassify_repository_writes_changed_categories(tmp_path, service):
+    repository = DefinitieRepository(str(tmp_path / "definities.db"))
+    ids = [
+        repository.create_definitie(
+            DefinitieRecord(
+                begrip=begrip,
+                definitie=definitie,
+                categorie="type",
+                organisatorische_context="[]",
+                ufo_categorie=ufo,
+            )
+        )
+        for begrip, definitie, ufo in [
+            ("persoon", "een natuurlijk persoon", None),
+            ("verdachte", "iemand die verdacht wordt", "Kind"),
+            ("proces", "een procedure", "Event"),
+            ("xyz", "iets zonder patroon", None),
+        ]
+    ]
+    bulk = BulkUFOClassifier(service)
+
+    dry = bulk.reclassify_repository(repository, dry_run=True)
+    assert dry.updated >= 2
+    assert repository.get_definitie(ids[0]).ufo_categorie is None
+
+    report = bulk.reclassify_repository(repository)
+
+    assert report.updated == dry.updated
+    assert report.skipped_unknown >= 1
+    assert [repository.get_definitie(i).ufo_categorie for i in ids] == [
+        "Kind",
+        "Role",
+        "Event",
+        None,
+    ]
+    assert bulk.reclassify_repository(repository).updated == 0
+    missing = bulk.reclassify_repository(repository, only_missing=True)
+    assert missing.definitions == missing.skipped_unknown
@@ -7,8 +7,10 @@ import pytest
 
 from src.services.ufo_pattern_matcher import (
     PatternMatcher,
+    TermAutomaton,
     UFOCategory,
     get_pattern_matcher,
+    required_literals,
 )
 
 
@@ -47,3 +49,88 @@ def test_get_singleton_matcher():
     m1 = get_pattern_matcher()
     m2 = get_pattern_matcher()
     assert m1 is m2, "Singleton instance verwacht voor pattern matcher"
+
+
+def _brute_force_keys(pm, text):
+    """Referentie: elk patroon en elke vocabulaire term los controleren."""
+    text_lower = text.lower()
+    keys = set()
+    for category, patterns in pm.compiled_patterns.items():
+        for pattern_id, pattern in patterns.items():
+            for found in pattern.findall(text_lower):
+                keys.add((category, str(found), pattern_id))
+    for domain, terms in pm.legal_vocabulary.items():
+        for term in terms:
+            if term in text_lower:
+                keys.add(
+                    (
+                        pm._determine_category_for_term(term, domain),
+                        term,
+                        f"domain_{domain}",
+                    )
+                )
+    return keys
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Een persoon die door de officier van justitie als verdachte wordt aangemerkt.",
+        "Overeenkomst tussen partijen waarbij 12 exemplaren voor 5 euro worden geleverd.",
+        "De rechtszaak vindt plaats tijdens de beginfase van het onderzoek.",
+        "Huwelijk tussen twee personen; gehuwd zijn is een huwelijkse staat.",
+        "",
+    ],
+)
+def test_indexed_matching_equals_running_every_pattern(text):
+    pm = get_pattern_matcher()
+    matches = pm.find_all_matches(text, use_cache=False)
+
+    keys = {
+        (m.category, str(m.matched_text), m.pattern_id)
+        for m in matches
+        if m.context["source"] != "disambiguation"
+    }
+    assert keys == _brute_force_keys(pm, text)
+
+
+@pytest.mark.unit
+def test_term_automaton_finds_overlapping_terms():
+    automaton = TermAutomaton(["recht", "strafrecht", "straf", "echt", ""])
+
+    found = {automaton.terms[i] for i in automaton.find("het strafrecht")}
+
+    assert found == {"recht", "strafrecht", "straf", "echt"}
+    assert automaton.find("geen treffers") == set()
+
+
+@pytest.mark.unit
+def test_required_literals():
+    assert required_literals(r"(?:fase|stadium)\b") == {"fase", "stadium"}
+    assert required_literals(r"\b(\w+)\s+die\s+(?:zelfstandig|onafhankelijk)") == {
+        "zelfstandig",
+        "onafhankelijk",
+    }
+    # Geen bruikbaar anker: patroon draait altijd
+    assert required_literals(r"\d+\s*%") is None
+
+
+@pytest.mark.unit
+def test_result_cache_is_bounded_and_per_instance():
+    pm = PatternMatcher(cache_size=2)
+
+    first = pm.find_all_matches("De verdachte")
+    assert pm.find_all_matches("de VERDACHTE") == first
+    pm.find_all_matches("een rechter")
+    pm.find_all_matches("een advocaat")
+
+    stats = pm.get_cache_stats()
+    assert (stats["size"], stats["max_size"]) == (2, 2)
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+
+    pm.find_all_matches("een notaris", use_cache=False)
+    assert pm.get_cache_stats()["misses"] == 3
+    pm.clear_cache()
+    assert pm.get_cache_stats()["size"] == 0
+    assert PatternMatcher().get_cache_stats()["size"] == 0
@@ -0,0 +1,120 @@
+"""Tests voor gate-only validatie (alleen acceptatie, met short-circuit)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.orchestrators.validation_orchestrator_v2 import ValidationOrchestratorV2
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.result_cache import ValidationResultCache
+
+CASES = [
+    ("vonnis", ""),
+    ("vonnis", "Een vonnis is een vonnis."),
+    ("vonnis", "uitspraak van de rechter"),
+    ("gegevens", "de developers gebruiken best practices en zo voor de data"),
+    (
+        "vonnis",
+        "uitspraak van een rechter die een geschil tussen partijen beslecht en die "
+        "volgens het procesrecht na een behandeling ter zitting schriftelijk wordt "
+        "vastgelegd",
+    ),
+    (
+        "verdachte",
+        "persoon ten aanzien van wie uit feiten of omstandigheden een redelijk "
+        "vermoeden van schuld aan een strafbaar feit voortvloeit",
+    ),
+]
+
+
+def _service(config=None, repository=None):
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(
+        get_cached_toetsregel_manager(),
+        None,
+        config,
+        repository=repository,
+        result_cache=ValidationResultCache(max_entries=0),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("begrip", "text"), CASES)
+async def test_gate_matches_full_validation(begrip, text):
+    service = _service()
+    full = await service.validate_definition(begrip, text)
+    gate = await service.validate_definition(begrip, text, gate_only=True)
+
+    assert gate["is_acceptable"] == full["is_acceptable"]
+    assert gate["gate"]["mode"] == "gate_only"
+    low, high = gate["gate"]["score_bounds"]
+    if gate["gate"]["decided_by"] == "score_bound":
+        assert low <= full["overall_score"] <= high
+
+
+@pytest.mark.asyncio
+async def test_blocking_heuristic_stops_before_rules():
+    gate = await _service().validate_definition(
+        "vonnis", "Een vonnis is een vonnis.", gate_only=True
+    )
+
+    assert gate["is_acceptable"] is False
+    assert gate["gate"]["decided_by"] == "blocking_violation"
+    assert gate["gate"]["rules_evaluated"] == 0
+    assert {v["code"] for v in gate["violations"]} >= {"CON-CIRC-001"}
+
+
+@pytest.mark.asyncio
+async def test_gate_skips_duplicate_context_lookup():
+    class Repository:
+        calls = 0
+
+        def find_by_context_key(self, *args, **kwargs):
+            Repository.calls += 1
+
+    service = _service(repository=Repository())
+    context = {"organisatorische_context": ["OM"]}
+
+    await service.validate_definition(*CASES[-1], context=context)
+    assert Repository.calls > 0
+
+    Repository.calls = 0
+    gate = await service.validate_definition(*CASES[2], context=context, gate_only=True)
+    assert Repository.calls == 0
+    assert gate["is_acceptable"] is False
+
+
+@pytest.mark.asyncio
+async def test_low_overall_threshold_falls_back_to_full_validation():
+    config = SimpleNamespace(thresholds={"overall_accept": 0.5}, weights=None)
+    service = _service(config)
+    full = await service.validate_definition(*CASES[2])
+    gate = await service.validate_definition(*CASES[2], gate_only=True)
+
+    assert gate["gate"]["decided_by"] == "full_validation"
+    assert gate["is_acceptable"] == full["is_acceptable"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_forwards_gate_only():
+    orchestrator = ValidationOrchestratorV2(_service())
+    result = await orchestrator.validate_text(
+        begrip="vonnis", text=CASES[-2][1], gate_only=True
+    )
+
+    assert result["gate"]["mode"] == "gate_only"
+    assert result["is_acceptable"] is True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_ignores_gate_only_for_services_without_mode():
+    class LegacyService:
+        async def validate_definition(
+            self, begrip, text, ontologische_categorie=None, context=None
+        ):
+            return {"version": "1.0.0", "is_acceptable": True, "system": {}}
+
+    orchestrator = ValidationOrchestratorV2(LegacyService())
+    result = await orchestrator.validate_text("x", "tekst", gate_only=True)
+    assert result["is_acceptable"] is True
@@ -0,0 +1,185 @@
+"""Tests voor de content-addressed resultaatcache van ModularValidationService."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.result_cache import ValidationResultCache
+
+BEGRIP = "vonnis"
+TEXT = "Een vonnis is een schriftelijke uitspraak van de rechter in een strafzaak."
+
+
+def _service(cache=None, repository=None):
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(
+        get_cached_toetsregel_manager(),
+        None,
+        None,
+        repository=repository,
+        result_cache=cache,
+    )
+
+
+def _without_correlation(result):
+    result = dict(result)
+    result["system"] = {
+        k: v for k, v in result["system"].items() if k != "correlation_id"
+    }
+    return result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repeat_validation_hits_cache():
+    service = _service()
+    first = await service.validate_definition(
+        BEGRIP, TEXT, context={"correlation_id": "a"}
+    )
+    second = await service.validate_definition(
+        BEGRIP, TEXT, context={"correlation_id": "b"}
+    )
+
+    assert second["system"]["correlation_id"] == "b"
+    assert _without_correlation(second) == _without_correlation(first)
+    stats = service.get_health_status()["result_cache"]
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cached_result_is_isolated_from_callers():
+    service = _service()
+    first = await service.validate_definition(BEGRIP, TEXT)
+    first["violations"].append({"code": "X"})
+    first["system"]["degraded_mode"] = "mutated"
+
+    second = await service.validate_definition(BEGRIP, TEXT)
+    assert {"code": "X"} not in second["violations"]
+    assert second["system"]["degraded_mode"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_context_and_categorie_are_part_of_key():
+    service = _service()
+    await service.validate_definition(BEGRIP, TEXT)
+    await service.validate_definition(BEGRIP, TEXT, ontologische_categorie="proces")
+    await service.validate_definition(BEGRIP, TEXT, context={"marker": "soort"})
+
+    assert service.get_health_status()["result_cache"]["hits"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rule_set_change_invalidates():
+    service = _service()
+    await service.validate_definition(BEGRIP, TEXT)
+    rules = service._json_rules
+    # Nieuw dict-object: plan én regelset-versie worden opnieuw bepaald
+    service._json_rules = {
+        **rules,
+        "STR-02": {**rules["STR-02"], "herkenbaar_patronen": [r"\brechter\b"]},
+    }
+
+    changed = await service.validate_definition(BEGRIP, TEXT)
+    stats = service.get_health_status()["result_cache"]
+    assert stats["hits"] == 0
+    assert stats["invalidations"] == 1
+    assert any(v["code"] == "STR-02" for v in changed["violations"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_disk_cache_survives_new_instance(tmp_path):
+    first = await _service(
+        ValidationResultCache(cache_dir=str(tmp_path))
+    ).validate_definition(BEGRIP, TEXT)
+
+    service = _service(ValidationResultCache(cache_dir=str(tmp_path)))
+    second = await service.validate_definition(BEGRIP, TEXT)
+
+    assert _without_correlation(second) == _without_correlation(first)
+    assert service.get_health_status()["result_cache"]["disk_hits"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_without_duplicate_lookup_is_cacheable():
+    service = _service(repository=object())
+    context = {"organisatorische_context": ["OM"]}
+    await service.validate_definition(BEGRIP, TEXT, context=context)
+    await service.validate_definition(BEGRIP, TEXT, context=context)
+
+    stats = service.get_health_status()["result_cache"]
+    assert (stats["hits"], stats["bypassed"]) == (1, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_other_versions_on_disk_are_kept(tmp_path):
+    strict = _service(ValidationResultCache(cache_dir=str(tmp_path)))
+    strict._overall_threshold = 0.9
+    lenient = _service(ValidationResultCache(cache_dir=str(tmp_path)))
+    lenient._overall_threshold = 0.5
+
+    await strict.validate_definition(BEGRIP, TEXT)
+    await lenient.validate_definition(BEGRIP, TEXT)
+
+    again = _service(ValidationResultCache(cache_dir=str(tmp_path)))
+    again._overall_threshold = 0.9
+    await again.validate_definition(BEGRIP, TEXT)
+    assert again.get_health_status()["result_cache"]["disk_hits"] == 1
+
+
+@pytest.mark.unit
+def test_disk_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    from services.validation import result_cache
+
+    monkeypatch.setattr(result_cache, "_PRUNE_EVERY", 1)
+    clock = iter(range(1, 100))
+    monkeypatch.setattr(
+        result_cache, "time", SimpleNamespace(time=lambda: float(next(clock)))
+    )
+    writer = ValidationResultCache(cache_dir=str(tmp_path), max_disk_entries=2)
+    writer.set_version("v1")
+    writer.put("a", {"n": 1})
+    writer.put("b", {"n": 2})
+
+    reader = ValidationResultCache(cache_dir=str(tmp_path), max_disk_entries=2)
+    reader.set_version("v1")
+    assert reader.get("a") == {"n": 1}  # a is nu recenter gebruikt dan b
+    writer.put("c", {"n": 3})
+
+    fresh = ValidationResultCache(cache_dir=str(tmp_path))
+    fresh.set_version("v1")
+    assert [fresh.get(key) for key in "abc"] == [{"n": 1}, None, {"n": 3}]
+
+
+@pytest.mark.unit
+def test_disk_cache_evicts_entries_past_max_age(tmp_path, monkeypatch):
+    from services.validation import result_cache
+
+    monkeypatch.setattr(result_cache, "_PRUNE_EVERY", 1)
+    now = [0.0]
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    cache = ValidationResultCache(cache_dir=str(tmp_path), max_disk_age_days=1)
+    cache.set_version("v1")
+    cache.put("old", {"n": 1})
+    now[0] = 2 * 86400
+    cache.put("new", {"n": 2})
+
+    fresh = ValidationResultCache(cache_dir=str(tmp_path))
+    fresh.set_version("v1")
+    assert (fresh.get("old"), fresh.get("new")) == (None, {"n": 2})
+
+
+@pytest.mark.unit
+def test_relative_cache_dir_is_anchored_to_project_root():
+    from services.validation.result_cache import PROJECT_ROOT
+
+    cache = ValidationResultCache(max_entries=0, cache_dir="cache")
+
+    assert cache.db_path == str(PROJECT_ROOT / "cache" / "validation_results.db")
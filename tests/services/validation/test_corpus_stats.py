@@ -0,0 +1,133 @@
+"""Tests voor de kolomgebaseerde corpusstatistieken (CorpusScoreMatrix)."""
+
+import random
+
+import numpy as np
+import pytest
+
+from database.definitie_repository import DefinitieRecord, DefinitieRepository
+from services.validation.corpus_stats import (
+    CorpusScoreMatrix,
+    _counts_in_category_scores,
+    get_corpus_matrix,
+)
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.revalidation import (
+    IncrementalRevalidationService,
+    RuleResultStore,
+)
+from services.validation.violation_builder import category_for_rule
+
+RULES = ["ARAI-01", "CON-01", "ESS-01", "ESS-02", "STR-01", "VAL-EMP-001", "VER-01"]
+
+
+def _random_outcomes(n=200, seed=7):
+    rng = random.Random(seed)
+    outcomes = {}
+    for def_id in range(1, n + 1):
+        per_rule = {}
+        for code in RULES:
+            if rng.random() < 0.1:
+                continue  # regel niet uitgevoerd
+            score = rng.choice([0.0, 0.5, 1.0])
+            per_rule[code] = (score, {"code": code} if score < 1.0 else None)
+        outcomes[def_id] = per_rule
+    return outcomes
+
+
+@pytest.mark.unit
+def test_aggregations_match_python_reference():
+    outcomes = _random_outcomes()
+    matrix = CorpusScoreMatrix.from_outcomes(outcomes)
+
+    assert matrix.shape == (200, len(RULES))
+    for code in RULES:
+        ran = [o[code] for o in outcomes.values() if code in o]
+        failed = sum(1 for _, v in ran if v is not None)
+        assert matrix.fail_rates()[code] == round(failed / len(ran), 4)
+        assert matrix.rule_means()[code] == pytest.approx(
+            sum(s for s, _ in ran) / len(ran), abs=1e-4
+        )
+
+    for category, mean in matrix.category_means().items():
+        per_definition = [
+            np.mean(values)
+            for values in (
+                [
+                    s
+                    for code, (s, _) in o.items()
+                    if _counts_in_category_scores(code)
+                    and category_for_rule(code) == category
+                ]
+                for o in outcomes.values()
+            )
+            if values
+        ]
+        expected = float(np.mean(per_definition)) if per_definition else None
+        assert mean == pytest.approx(expected, abs=1e-4)
+
+
+@pytest.mark.unit
+def test_top_offenders_and_histogram():
+    outcomes = {
+        1: {"ESS-01": (1.0, None), "STR-01": (1.0, None)},
+        2: {"ESS-01": (0.0, {"code": "ESS-01"}), "STR-01": (0.0, {"code": "STR"})},
+        3: {"ESS-01": (0.0, {"code": "ESS-01"}), "STR-01": (1.0, None)},
+    }
+    matrix = CorpusScoreMatrix.from_outcomes(outcomes, overall={1: 0.95, 2: 0.1})
+
+    offenders = matrix.top_offenders(2)
+    assert [o["definitie_id"] for o in offenders] == [2, 3]
+    assert offenders[0]["rules"] == ["ESS-01", "STR-01"]
+    assert offenders[1]["score"] is None  # geen totaalscore bekend
+
+    histogram = matrix.score_histogram(bins=2)
+    assert histogram == {"counts": [1, 1], "edges": [0.0, 0.5, 1.0]}
+    assert matrix.score_histogram(bins=2, rule_code="ESS-01")["counts"] == [2, 1]
+    assert matrix.top_failing_rules(1) == [
+        {"rule": "ESS-01", "failed": 2, "fail_rate": 0.6667}
+    ]
+
+
+@pytest.mark.unit
+def test_empty_corpus():
+    summary = CorpusScoreMatrix.from_outcomes({}).summary()
+    assert summary["definitions"] == 0
+    assert summary["mean_score"] is None
+    assert summary["top_offenders"] == []
+
+
+@pytest.mark.integration
+def test_matrix_from_revalidation_store(tmp_path):
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    repo = DefinitieRepository(str(tmp_path / "definities.db"))
+    repo.create_definitie(
+        DefinitieRecord(
+            begrip="vonnis",
+            definitie="Een vonnis is een schriftelijke uitspraak van de rechter.",
+            categorie="proces",
+            organisatorische_context="[]",
+            juridische_context="[]",
+            wettelijke_basis="[]",
+        )
+    )
+    store = RuleResultStore(str(tmp_path / "rule_results.db"))
+    service = ModularValidationService(get_cached_toetsregel_manager(), None, None)
+    IncrementalRevalidationService(repo, service, store).run()
+
+    matrix = get_corpus_matrix(store)
+    assert get_corpus_matrix(store) is matrix  # store ongewijzigd → hergebruik
+    assert matrix.shape == (
+        len(repo.get_all()),
+        len(service._get_rule_plan().steps),
+    )
+
+    scores = repo.get_validation_scores()
+    with_overall = matrix.with_overall(scores)
+    assert with_overall.definition_scores().tolist() == pytest.approx(
+        [scores[i] for i in matrix.definitie_ids.tolist()]
+    )
+
+    IncrementalRevalidationService(repo, service, store).run(full=True)
+    assert get_corpus_matrix(store) is not matrix
@@ -0,0 +1,182 @@
+"""Tests voor incrementele corpus-revalidatie (fingerprints + regeluitkomsten)."""
+
+import json
+
+import pytest
+
+from database.definitie_repository import DefinitieRecord, DefinitieRepository
+from services.validation.modular_validation_service import ModularValidationService
+from services.validation.revalidation import (
+    IncrementalRevalidationService,
+    RuleResultStore,
+    record_context,
+    rule_fingerprints,
+)
+
+DEFINITIES = [
+    ("vonnis", "Een vonnis is een schriftelijke uitspraak van de rechter.", "OM"),
+    (
+        "verdachte",
+        "persoon die volgens artikel 27 Sv wordt verdacht van een feit",
+        None,
+    ),
+    ("procesmodel", "procesmodel: is een model dat processtappen beschrijft", None),
+]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = DefinitieRepository(str(tmp_path / "definities.db"))
+    for begrip, tekst, organisatie in DEFINITIES:
+        repository.create_definitie(
+            DefinitieRecord(
+                begrip=begrip,
+                definitie=tekst,
+                categorie="proces",
+                organisatorische_context=json.dumps(
+                    [organisatie] if organisatie else []
+                ),
+                juridische_context=json.dumps(["Strafrecht"] if organisatie else []),
+                wettelijke_basis=json.dumps(["Sv"] if organisatie else []),
+            )
+        )
+    return repository
+
+
+@pytest.fixture
+def validation_service():
+    from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+    return ModularValidationService(get_cached_toetsregel_manager(), None, None)
+
+
+@pytest.fixture
+def revalidation(repo, validation_service, tmp_path):
+    return IncrementalRevalidationService(
+        repository=repo,
+        validation_service=validation_service,
+        store=RuleResultStore(str(tmp_path / "rule_results.db")),
+    )
+
+
+async def _expected_scores(service, repo):
+    scores = {}
+    for record in repo.get_all():
+        result = await service.validate_definition(
+            record.begrip,
+            record.definitie,
+            ontologische_categorie=record.categorie,
+            context=record_context(record),
+        )
+        scores[record.begrip] = result["overall_score"]
+    return scores
+
+
+def _stored_scores(repo):
+    return {r.begrip: r.validation_score for r in repo.get_all()}
+
+
+@pytest.mark.unit
+def test_fingerprint_covers_json_and_python_validator(tmp_path):
+    rules = {"TST-01": {"herkenbaar_patronen": [r"\bzou\b"]}}
+    before = rule_fingerprints(["TST-01"], rules, tmp_path)
+
+    (tmp_path / "TST-01.py").write_text("# validator\n", encoding="utf-8")
+    with_source = rule_fingerprints(["TST-01"], rules, tmp_path)
+    rules["TST-01"]["herkenbaar_patronen"].append(r"\bmogen\b")
+    with_pattern = rule_fingerprints(["TST-01"], rules, tmp_path)
+
+    assert len({before["TST-01"], with_source["TST-01"], with_pattern["TST-01"]}) == 3
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_second_run_reuses_all_rule_outcomes(revalidation, repo):
+    first = revalidation.run()
+    rules = len(revalidation.current_fingerprints())
+    # Schema bevat ook voorbeelddefinities
+    n = len(repo.get_all())
+
+    assert first.full_revalidations == n
+    assert first.rules_evaluated == rules * n
+    assert first.updated == n
+    assert _stored_scores(repo) == await _expected_scores(
+        revalidation.validation_service, repo
+    )
+
+    second = revalidation.run()
+    assert second.full_revalidations == 0
+    assert second.changed_rules == []
+    # Alleen CON-01 (context-bijwerking) draait altijd opnieuw
+    assert second.rules_evaluated == n
+    assert second.rules_reused == (rules - 1) * n
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_changed_rule_only_reruns_that_rule(revalidation, repo):
+    revalidation.run()
+    service = revalidation.validation_service
+    rules = service._json_rules
+    # Nieuw dict-object: het uitvoeringsplan wordt opnieuw gecompileerd
+    service._json_rules = {
+        **rules,
+        "VER-03": {**rules["VER-03"], "herkenbaar_patronen": [r"\buitspraak\b"]},
+        "STR-02": {**rules["STR-02"], "herkenbaar_patronen": [r"\brechter\b"]},
+    }
+
+    report = revalidation.run()
+
+    assert report.changed_rules == ["STR-02", "VER-03"]
+    assert report.rules_evaluated == 3 * len(repo.get_all())  # + CON-01
+    assert _stored_scores(repo) == await _expected_scores(service, repo)
+
+
+@pytest.mark.integration
+def test_changed_text_and_dry_run(revalidation, repo):
+    revalidation.run()
+    record = repo.get_all()[0]
+    repo.update_definitie(record.id, {"definitie": "Te kort."})
+
+    dry = revalidation.run(dry_run=True)
+    assert dry.full_revalidations == 1
+    assert dry.updated == 0
+    assert repo.get_definitie(record.id).validation_score == record.validation_score
+
+    report = revalidation.run()
+    assert report.full_revalidations == 1
+    assert repo.get_definitie(record.id).validation_score != record.validation_score
+
+
+@pytest.mark.unit
+def test_record_context_matches_orchestrator_keys(repo):
+    record = next(r for r in repo.get_all() if r.begrip == "vonnis")
+
+    assert record_context(record) == {
+        "organisatorische_context": ["OM"],
+        "juridische_context": ["Strafrecht"],
+        "wettelijke_basis": ["Sv"],
+        "categorie": "proces",
+        "definition_id": record.id,
+    }
+
+
+@pytest.mark.integration
+def test_changed_context_revalidates_definition(revalidation, repo):
+    revalidation.run()
+    record = next(r for r in repo.get_all() if r.begrip == "vonnis")
+    repo.update_definitie(record.id, {"organisatorische_context": '["DJI"]'})
+
+    report = revalidation.run()
+
+    assert report.full_revalidations == 1
+
+
+@pytest.mark.unit
+def test_relative_store_path_is_anchored_to_project_root(monkeypatch):
+    from services.validation.revalidation import PROJECT_ROOT
+
+    monkeypatch.setattr(RuleResultStore, "_ensure_schema", lambda self: None)
+    store = RuleResultStore("cache/rule_results.db")
+
+    assert store.db_path == str(PROJECT_ROOT / "cache" / "rule_results.db")
@@ -0,0 +1,127 @@
+"""
+Tests voor adaptieve per-provider timeouts op basis van latency sketches.
+
+Verificatie van:
+- Quantiles van de sketch binnen de relatieve nauwkeurigheid
+- Afgeleide timeout: cold start, begrenzing en groei na timeouts
+- ModernWebLookupService meet latency per provider/endpoint en exposeert
+  de histogrammen via get_source_status
+"""
+
+import asyncio
+import math
+import random
+
+import pytest
+
+from services.interfaces import LookupRequest
+from services.modern_web_lookup_service import ModernWebLookupService
+from services.web_lookup.latency_tracker import LatencySketch, LatencyTracker
+
+
+class TestLatencySketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-1.0, 0.8) for _ in range(5000)]
+        sketch = LatencySketch(relative_accuracy=0.02)
+        for v in values:
+            sketch.add(v)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95):
+            exact = ordered[math.ceil(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.03)
+        assert sketch.count == 5000
+        # Compact: aantal buckets is logaritmisch in het waardenbereik
+        assert sketch.to_dict()["buckets"] < 400
+
+    def test_empty_sketch(self):
+        assert LatencySketch().quantile(0.95) is None
+
+
+class TestLatencyTracker:
+    def test_cold_start_uses_default(self):
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record("wikipedia", "lookup", 0.2)
+        assert tracker.timeout_for("wikipedia", "lookup", 30.0) == 30.0
+
+    def test_timeout_derived_from_p95_within_bounds(self):
+        tracker = LatencyTracker(
+            min_seconds=1.0, max_seconds=20.0, p95_multiplier=2.0, min_samples=5
+        )
+        for _ in range(20):
+            tracker.record("wikipedia", "lookup", 0.1)
+            tracker.record("overheid", "overheid", 6.0)
+
+        # Snelle provider: P95 * 2 = 0.2s → ondergrens
+        assert tracker.timeout_for("wikipedia", "lookup", 30.0) == 1.0
+        # Trage provider: P95 * 2 ≈ 12s, nooit boven request budget
+        assert tracker.timeout_for("overheid", "overheid", 30.0) == pytest.approx(
+            12.0, rel=0.03
+        )
+        assert tracker.timeout_for("overheid", "overheid", 10.0) == 10.0
+        # Endpoints worden los bijgehouden
+        assert tracker.timeout_for("overheid", "overheid_zoek", 30.0) == 30.0
+
+    def test_timeouts_grow_timeout_until_max(self):
+        tracker = LatencyTracker(
+            min_seconds=1.0, max_seconds=8.0, p95_multiplier=1.5, min_samples=1
+        )
+        tracker.record("overheid", "overheid", 2.0)
+        timeouts = []
+        for _ in range(6):
+            timeout = tracker.timeout_for("overheid", "overheid", 30.0)
+            timeouts.append(timeout)
+            tracker.record("overheid", "overheid", timeout)
+
+        assert timeouts == sorted(timeouts)
+        assert timeouts[-1] == 8.0
+
+    def test_status_exposes_histogram(self):
+        tracker = LatencyTracker(min_samples=2)
+        for seconds in (0.5, 0.5, 1.5):
+            tracker.record("rechtspraak", "rest", seconds)
+
+        status = tracker.get_status()["rechtspraak"]["rest"]
+        assert status["count"] == 3
+        assert status["p50"] == pytest.approx(0.5, rel=0.03)
+        assert status["p95"] == pytest.approx(1.5, rel=0.03)
+        assert status["adaptive_timeout"] is not None
+
+
+class TestLookupServiceAdaptiveTimeouts:
+    @pytest.mark.asyncio
+    async def test_lookup_records_latency_and_exposes_status(self, monkeypatch):
+        async def fast_wiki(*a, **k):
+            return None
+
+        monkeypatch.setattr(
+            "services.web_lookup.wikipedia_service.wikipedia_lookup", fast_wiki
+        )
+        svc = ModernWebLookupService()
+        await svc.lookup(LookupRequest(term="x", sources=["wikipedia"]))
+
+        latency = svc.get_source_status()["wikipedia"]["latency"]
+        assert latency["lookup"]["count"] >= 1
+        assert "p95" in latency["lookup"]
+
+    @pytest.mark.asyncio
+    async def test_call_uses_adaptive_timeout(self, monkeypatch):
+        svc = ModernWebLookupService()
+        tracker = svc._latency_tracker
+        assert tracker is not None
+        for _ in range(tracker.min_samples):
+            tracker.record("wikipedia", "lookup", 0.01)
+
+        req = LookupRequest(term="x", timeout=30)
+        timeout = svc._call_timeout("wikipedia", "lookup", req)
+        assert timeout == tracker.min_seconds
+
+        monkeypatch.setattr(tracker, "min_seconds", 0.05)
+        with pytest.raises(TimeoutError):
+            await svc._timed_call("wikipedia", "lookup", asyncio.sleep(1), req)
+        # Timeout telt mee als observatie zodat de timeout kan groeien
+        assert tracker.get_status()["wikipedia"]["lookup"]["max"] == pytest.approx(
+            0.05, rel=0.05
+        )
@@ -0,0 +1,243 @@
+"""
+Tests voor de persistente, cross-process provider health store.
+
+Verificatie van:
+- Circuit opent na N opeenvolgende failures en sluit bij succes
+- Half-open probe wordt precies één keer geclaimd (ook over instances heen)
+- State is gedeeld tussen instances op dezelfde database (cross-process)
+- ModernWebLookupService slaat providers met open circuit vooraf over
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.interfaces import LookupRequest
+from services.modern_web_lookup_service import ModernWebLookupService
+from services.web_lookup.provider_health import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    ProviderHealthStore,
+    get_provider_health_store,
+    resolve_db_path,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProviderHealthStore(
+        db_path=str(tmp_path / "health.db"),
+        failure_threshold=2,
+        cooldown_seconds=60,
+        probe_timeout_seconds=30,
+    )
+
+
+class TestProviderHealthStore:
+    def test_unknown_provider_is_allowed(self, store):
+        assert store.allow_request("rechtspraak") is True
+        assert store.get_status("rechtspraak")["state"] == STATE_CLOSED
+
+    def test_circuit_opens_after_threshold(self, store):
+        store.record_failure("rechtspraak", "timeout")
+        assert store.allow_request("rechtspraak") is True
+
+        store.record_failure("rechtspraak", "timeout")
+        status = store.get_status("rechtspraak")
+        assert status["state"] == STATE_OPEN
+        assert status["consecutive_failures"] == 2
+        assert status["last_error"] == "timeout"
+        assert store.allow_request("rechtspraak") is False
+
+    def test_success_resets_failures(self, store):
+        store.record_failure("wikipedia")
+        store.record_success("wikipedia")
+        store.record_failure("wikipedia")
+
+        status = store.get_status("wikipedia")
+        assert status["state"] == STATE_CLOSED
+        assert status["consecutive_failures"] == 1
+        assert status["total_successes"] == 1
+
+    def test_half_open_probe_claimed_once_across_instances(self, store, monkeypatch):
+        other = ProviderHealthStore(db_path=store.db_path, cooldown_seconds=60)
+        store.record_failure("rechtspraak")
+        store.record_failure("rechtspraak")
+        # Andere instance (proces) ziet direct het open circuit
+        assert other.allow_request("rechtspraak") is False
+
+        later = time.time() + 61
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert store.allow_request("rechtspraak") is True
+        assert other.allow_request("rechtspraak") is False
+        assert store.get_status("rechtspraak")["state"] == STATE_HALF_OPEN
+
+    def test_probe_result_closes_or_reopens(self, store, monkeypatch):
+        store.record_failure("overheid")
+        store.record_failure("overheid")
+        later = time.time() + 61
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert store.allow_request("overheid") is True
+        store.record_failure("overheid", "still down")
+        assert store.get_status("overheid")["state"] == STATE_OPEN
+        assert store.allow_request("overheid") is False
+
+        monkeypatch.setattr(time, "time", lambda: later + 61)
+        assert store.allow_request("overheid") is True
+        store.record_success("overheid")
+        assert store.get_status("overheid")["state"] == STATE_CLOSED
+
+    def test_released_probe_can_be_claimed_again(self, store, monkeypatch):
+        store.record_failure("overheid")
+        store.record_failure("overheid")
+        later = time.time() + 61
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert store.allow_request("overheid") is True
+
+        store.release_probe("overheid")
+
+        assert store.get_status("overheid")["state"] == STATE_OPEN
+        assert store.allow_request("overheid") is True
+
+    def test_relative_db_path_is_anchored_to_project_root(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        resolved = resolve_db_path("cache/provider_health.db")
+
+        assert resolved.endswith("cache/provider_health.db")
+        assert not resolved.startswith(str(tmp_path))
+        assert resolve_db_path(str(tmp_path / "h.db")) == str(tmp_path / "h.db")
+
+    def test_reset(self, store):
+        store.record_failure("overheid")
+        store.record_failure("overheid")
+        store.reset("overheid")
+        assert store.allow_request("overheid") is True
+
+    def test_getter_respects_disabled_config(self):
+        assert get_provider_health_store({"enabled": False}) is None
+        assert get_provider_health_store({}) is get_provider_health_store({})
+
+
+class TestLookupServiceHealthIntegration:
+    def test_determine_sources_skips_open_circuit(self):
+        svc = ModernWebLookupService()
+        store = svc._health_store
+        assert store is not None
+        for _ in range(store.failure_threshold):
+            store.record_failure("rechtspraak", "timeout")
+
+        sources = svc._determine_sources(LookupRequest(term="vonnis"))
+
+        assert "rechtspraak" not in sources
+        assert "wikipedia" in sources
+        assert svc.get_source_status()["rechtspraak"]["health"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_open_circuit(self, monkeypatch):
+        async def broken_wiki(*a, **k):
+            msg = "connection refused"
+            raise ConnectionError(msg)
+
+        monkeypatch.setattr(
+            "services.web_lookup.wikipedia_service.wikipedia_lookup", broken_wiki
+        )
+        svc = ModernWebLookupService()
+        store = svc._health_store
+        req = LookupRequest(term="x", sources=["wikipedia"], max_results=1)
+
+        for _ in range(store.failure_threshold):
+            await svc.lookup(req)
+
+        assert store.get_status("wikipedia")["state"] == STATE_OPEN
+        assert svc._determine_sources(req) == []
+
+    @pytest.mark.asyncio
+    async def test_empty_but_reachable_provider_stays_closed(self, monkeypatch):
+        async def empty_wiki(*a, **k):
+            return None
+
+        monkeypatch.setattr(
+            "services.web_lookup.wikipedia_service.wikipedia_lookup", empty_wiki
+        )
+        svc = ModernWebLookupService()
+        store = svc._health_store
+        req = LookupRequest(term="x", sources=["wikipedia"], max_results=1)
+
+        for _ in range(store.failure_threshold + 1):
+            await svc.lookup(req)
+
+        assert store.get_status("wikipedia")["state"] == STATE_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_inconclusive_probe_is_released(self, monkeypatch):
+        async def cancelled_wiki(*a, **k):
+            raise asyncio.CancelledError
+
+        monkeypatch.setattr(
+            "services.web_lookup.wikipedia_service.wikipedia_lookup", cancelled_wiki
+        )
+        svc = ModernWebLookupService()
+        store = svc._health_store
+        for _ in range(store.failure_threshold):
+            store.record_failure("wikipedia", "timeout")
+        later = time.time() + store.cooldown_seconds + 1
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert store.allow_request("wikipedia") is True
+
+        with pytest.raises(asyncio.CancelledError):
+            await svc._lookup_source(
+                "x", "wikipedia", LookupRequest(term="x", sources=["wikipedia"])
+            )
+
+        assert store.get_status("wikipedia")["state"] == STATE_OPEN
+        assert store.allow_request("wikipedia") is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_keep_health_attribution_apart(self, monkeypatch):
+        started = asyncio.Event()
+
+        async def wiki(term, *a, **k):
+            if term.startswith("kapot"):
+                started.set()
+                await asyncio.sleep(0.05)
+                msg = "connection refused"
+                raise ConnectionError(msg)
+            # anders: leeg maar bereikbaar (None)
+
+        monkeypatch.setattr(
+            "services.web_lookup.wikipedia_service.wikipedia_lookup", wiki
+        )
+        svc = ModernWebLookupService()
+        store = svc._health_store
+        calls: list[tuple[str, bool]] = []
+        monkeypatch.setattr(
+            store,
+            "record_success",
+            lambda name: calls.append(
+                ("success", threading.current_thread() is threading.main_thread())
+            ),
+        )
+        monkeypatch.setattr(
+            store,
+            "record_failure",
+            lambda name, error=None: calls.append(
+                ("failure", threading.current_thread() is threading.main_thread())
+            ),
+        )
+
+        failing = asyncio.create_task(
+            svc.lookup(LookupRequest(term="kapot", sources=["wikipedia"]))
+        )
+        await started.wait()
+        # Reset en vult de gedeelde debug lijst terwijl ``failing`` nog loopt
+        await svc.lookup(LookupRequest(term="leeg", sources=["wikipedia"]))
+        await failing
+
+        assert [kind for kind, _ in calls] == ["success", "failure"]
+        # Sync SQLite calls draaien niet op de event loop
+        assert not any(on_loop for _, on_loop in calls)
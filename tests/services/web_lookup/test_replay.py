@@ -0,0 +1,118 @@
+"""
+Tests voor de offline record/replay harness van de web lookup pipeline.
+
+Verificatie van:
+- Canonieke request sleutels (volgorde van query parameters)
+- Replay van MediaWiki/SRU/Rechtspraak responses uit een cassette
+- Synthetische responses, latency en failure injectie
+- Cassette persistentie
+"""
+
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from services.interfaces import LookupRequest
+from services.modern_web_lookup_service import ModernWebLookupService
+from services.web_lookup.http_session import create_session
+from services.web_lookup.rechtspraak_rest_service import rechtspraak_lookup
+from services.web_lookup.wikipedia_service import wikipedia_lookup
+from src.monitoring.web_lookup_replay import (
+    Cassette,
+    Interaction,
+    StandInSession,
+    replay_http,
+    request_key,
+)
+
+CASSETTE = (
+    Path(__file__).parents[2] / "fixtures" / "cassettes" / "web_lookup_basic.json"
+)
+
+
+def test_request_key_is_order_independent():
+    a = request_key("get", "https://nl.wikipedia.org/w/api.php?b=2&a=1")
+    b = request_key("GET", "https://nl.wikipedia.org/w/api.php?a=1&b=2")
+    assert a == b
+
+
+def test_cassette_roundtrip(tmp_path):
+    cassette = Cassette()
+    cassette.add(
+        Interaction("GET", "https://example.org/x?q=1", 200, "text/plain", "ok")
+    )
+    cassette.save(tmp_path / "c.json")
+
+    loaded = Cassette.load(tmp_path / "c.json")
+    assert len(loaded) == 1
+    assert loaded.get("GET", "https://example.org/x?q=1").body == "ok"
+
+
+@pytest.mark.asyncio
+async def test_replays_mediawiki_from_cassette():
+    async with replay_http(CASSETTE) as server:
+        result = await wikipedia_lookup("vonnis")
+
+    assert result is not None and result.success
+    assert result.definition.startswith("Een vonnis is")
+    assert server.stats.hits >= 2
+    assert server.stats.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_replays_rechtspraak_from_cassette():
+    async with replay_http(CASSETTE) as server:
+        result = await rechtspraak_lookup("ECLI:NL:HR:2023:1234")
+
+    assert result is not None
+    assert result.metadata["dc_identifier"] == "ECLI:NL:HR:2023:1234"
+    assert server.stats.per_host == {"data.rechtspraak.nl": 1}
+
+
+@pytest.mark.asyncio
+async def test_full_lookup_offline_with_cassette():
+    async with replay_http(CASSETTE) as server:
+        results = await ModernWebLookupService().lookup(
+            LookupRequest(term="vonnis", max_results=5)
+        )
+
+    providers = {r.source.name for r in results}
+    assert {"Wikipedia", "Overheid.nl"} <= providers
+    assert server.stats.hits > 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_request_is_miss_unless_synthetic():
+    async with replay_http(Cassette()) as server:
+        assert await wikipedia_lookup("dagvaarding") is None
+    assert server.stats.misses == 1
+
+    async with replay_http(Cassette(), synthetic=True) as server:
+        result = await wikipedia_lookup("dagvaarding")
+    assert result is not None and result.success
+    assert server.stats.synthetic == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_and_latency_injection():
+    async with replay_http(CASSETTE, failure_rate=1.0, latency_ms=30) as server:
+        result = await wikipedia_lookup("vonnis")
+
+    assert result is None
+    assert server.stats.injected_failures == server.stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_redirect_is_scoped_to_injected_sessions():
+    original_request = aiohttp.ClientSession._request
+
+    async with replay_http(Cassette()):
+        session = create_session()
+        assert isinstance(session, StandInSession)
+        await session.close()
+        assert aiohttp.ClientSession._request is original_request
+
+    session = create_session()
+    assert isinstance(session, aiohttp.ClientSession)
+    await session.close()
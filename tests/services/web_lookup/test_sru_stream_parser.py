@@ -0,0 +1,149 @@
+"""
+Unit tests voor incrementele (streaming) SRU response parsing.
+
+Valideert dat:
+1. Records uit in chunks aangeleverde XML correct geparsed worden
+2. Parsing stopt zodra max_records bruikbare records verzameld zijn
+3. Diagnostics in dezelfde pass worden meegenomen
+4. SRUService de aiohttp stream gebruikt i.p.v. response.text()
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from src.services.web_lookup.sru_service import SRUConfig, SRUService
+from src.services.web_lookup.sru_stream_parser import SRUStreamParser
+
+
+def _sru_xml(n_records: int) -> str:
+    records = "".join(
+        f"""
+            <srw:record>
+              <srw:recordData>
+                <dc:dc xmlns:dc="http://purl.org/dc/elements/1.1/">
+                  <dc:title>Record {i}</dc:title>
+                  <dc:description>Beschrijving {i}</dc:description>
+                  <dc:identifier>https://example.com/{i}</dc:identifier>
+                </dc:dc>
+              </srw:recordData>
+            </srw:record>"""
+        for i in range(n_records)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+        <srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/">
+          <srw:records>{records}
+          </srw:records>
+        </srw:searchRetrieveResponse>"""
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def cfg():
+    return SRUConfig(
+        name="Test Stream",
+        base_url="https://example.com/sru",
+        default_collection="",
+        record_schema="dc",
+    )
+
+
+class TestSRUStreamParser:
+    """Test de streaming parser los van de service."""
+
+    def test_chunked_feed_parses_all_records(self):
+        parser = SRUStreamParser(lambda record, ns: ns["srw"])
+        for chunk in _chunks(_sru_xml(5).encode("utf-8"), 37):
+            parser.feed(chunk)
+        parser.close()
+
+        assert parser.records_seen == 5
+        assert len(parser.results) == 5
+        assert parser.diagnostics == {}
+
+    def test_stops_after_max_records(self):
+        seen: list[int] = []
+
+        def _parse(record, ns):
+            seen.append(1)
+            return record
+
+        parser = SRUStreamParser(_parse, max_records=2)
+        for chunk in _chunks(_sru_xml(10).encode("utf-8"), 64):
+            parser.feed(chunk)
+            if parser.done:
+                break
+
+        assert parser.done
+        assert len(parser.results) == 2
+        assert len(seen) == 2
+
+    def test_unusable_records_do_not_count(self):
+        parser = SRUStreamParser(lambda record, ns: None, max_records=1)
+        parser.feed(_sru_xml(3))
+        parser.close()
+
+        assert not parser.done
+        assert parser.records_seen == 3
+        assert parser.results == []
+
+    def test_diagnostics_extracted_in_same_pass(self):
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <srw:searchRetrieveResponse xmlns:srw="http://docs.oasis-open.org/ns/search-ws/sruResponse">
+          <srw:diagnostics>
+            <diag:diagnostic xmlns:diag="http://www.loc.gov/zing/srw/diagnostic/">
+              <diag:uri>info:srw/diagnostic/1/6</diag:uri>
+              <diag:message>record schema not supported</diag:message>
+            </diag:diagnostic>
+          </srw:diagnostics>
+        </srw:searchRetrieveResponse>"""
+        parser = SRUStreamParser(lambda record, ns: record)
+        parser.feed(xml)
+        parser.close()
+
+        assert parser.records_seen == 0
+        assert parser.diagnostics["diag_uri"] == "info:srw/diagnostic/1/6"
+        assert parser.diagnostics["diag_message"] == "record schema not supported"
+        assert parser.diagnostics["diag_details"] is None
+
+
+class TestSRUServiceStreaming:
+    """Test dat SRUService de response body streamend verwerkt."""
+
+    @pytest.mark.asyncio
+    async def test_parse_sru_stream_uses_stream_reader(self, cfg):
+        svc = SRUService(enable_synonyms=False)
+        body = _sru_xml(8).encode("utf-8")
+
+        async def _iter_chunked(size):
+            for chunk in _chunks(body, 100):
+                yield chunk
+
+        response = MagicMock()
+        response.content = MagicMock(spec=aiohttp.StreamReader)
+        response.content.iter_chunked = _iter_chunked
+        response.text = AsyncMock(side_effect=AssertionError("body niet streamend"))
+
+        results = await svc._parse_sru_stream(response, "record", cfg, max_records=3)
+
+        assert len(results) == 3
+        assert {r.metadata["dc_title"] for r in results} == {
+            "Record 0",
+            "Record 1",
+            "Record 2",
+        }
+
+    @pytest.mark.asyncio
+    async def test_parse_sru_stream_falls_back_to_text(self, cfg):
+        svc = SRUService(enable_synonyms=False)
+        response = MagicMock()
+        response.text = AsyncMock(return_value=_sru_xml(2))
+
+        results = await svc._parse_sru_stream(response, "record", cfg)
+
+        assert len(results) == 2
+        response.text.assert_awaited_once()
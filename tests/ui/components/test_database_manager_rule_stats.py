@@ -0,0 +1,38 @@
+"""Tests voor de corpusstatistieken per toetsregel in Database Beheer."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.validation import corpus_stats
+from services.validation.corpus_stats import CorpusScoreMatrix
+from ui.components.tabs.import_export_beheer.database_manager import DatabaseManager
+
+
+@pytest.mark.unit
+def test_corpus_summary_uses_matrix_and_overall_scores(monkeypatch):
+    matrix = CorpusScoreMatrix.from_outcomes(
+        {
+            1: {"ESS-01": (1.0, None), "STR-01": (0.0, {"code": "STR-01"})},
+            2: {"ESS-01": (0.0, {"code": "ESS-01"}), "STR-01": (0.0, {})},
+        }
+    )
+    monkeypatch.setattr(corpus_stats, "get_corpus_matrix", lambda: matrix)
+    repository = SimpleNamespace(get_validation_scores=lambda: {1: 0.9, 2: 0.4})
+
+    summary = DatabaseManager(repository)._get_corpus_summary(top=1)
+
+    assert (summary["definitions"], summary["rules"]) == (2, 2)
+    assert summary["mean_score"] == pytest.approx(0.65)
+    assert summary["top_offenders"][0]["definitie_id"] == 2
+
+
+@pytest.mark.unit
+def test_empty_store_has_no_summary(monkeypatch):
+    monkeypatch.setattr(
+        corpus_stats,
+        "get_corpus_matrix",
+        lambda: CorpusScoreMatrix.from_outcomes({}),
+    )
+
+    assert DatabaseManager(SimpleNamespace())._get_corpus_summary() is None
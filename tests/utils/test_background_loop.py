@@ -0,0 +1,249 @@
+"""Tests voor de persistente background event loop en de UI async bridge."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from services.jobs import JobQueue, JobStore
+from ui.helpers import async_bridge
+from utils.background_loop import BackgroundLoop, get_background_loop, run_sync
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_loop_is_reused_across_calls():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = run_sync(current_loop())
+    second = async_bridge.run_async(current_loop())
+
+    assert first is second
+    assert first is get_background_loop().start()
+
+
+def test_loop_bound_resources_survive_between_calls():
+    lock_holder = {}
+
+    async def create_lock():
+        lock_holder["lock"] = asyncio.Lock()
+
+    async def use_lock():
+        async with lock_holder["lock"]:
+            return True
+
+    async_bridge.run_async(create_lock())
+    # Met asyncio.run per aanroep zou de lock aan een gesloten loop hangen
+    assert async_bridge.run_async(use_lock()) is True
+
+
+def test_timeout_cancels_the_coroutine():
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        async_bridge.run_async(slow(), timeout=0.05)
+    assert cancelled.wait(1.0)
+
+
+def test_run_sync_from_loop_thread_does_not_deadlock():
+    async def inner():
+        return "inner"
+
+    async def outer():
+        # Sync legacy code die vanuit een coroutine op de loop wordt aangeroepen
+        return run_sync(inner(), timeout=1.0)
+
+    assert async_bridge.run_async(outer(), timeout=2.0) == "inner"
+
+
+def test_rerun_request_cancels_waiting_call(monkeypatch):
+    ctx = SimpleNamespace(
+        session_id="sessie-1",
+        script_requests=SimpleNamespace(_state=SimpleNamespace(name="CONTINUE")),
+    )
+    monkeypatch.setattr(async_bridge, "_script_run_ctx", lambda: ctx)
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    timer = threading.Timer(
+        0.05,
+        lambda: setattr(ctx.script_requests, "_state", SimpleNamespace(name="RERUN")),
+    )
+    timer.start()
+    with pytest.raises(CancelledError):
+        async_bridge.run_async(slow(), timeout=2.0)
+    assert cancelled.wait(1.0)
+
+
+@pytest.mark.parametrize("timeout", [2.0, None])
+def test_timeout_raised_by_coroutine_is_not_a_poll_timeout(monkeypatch, timeout):
+    ctx = SimpleNamespace(
+        session_id="sessie-1",
+        script_requests=SimpleNamespace(_state=SimpleNamespace(name="CONTINUE")),
+    )
+    monkeypatch.setattr(async_bridge, "_script_run_ctx", lambda: ctx)
+
+    async def inner_timeout():
+        await asyncio.wait_for(asyncio.sleep(1), timeout=0.01)
+
+    outcome = {}
+
+    def call():
+        try:
+            async_bridge.run_async(inner_timeout(), timeout=timeout)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=call, daemon=True)
+    started = time.monotonic()
+    thread.start()
+    thread.join(1.0)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 1.0
+    assert isinstance(outcome["error"], TimeoutError)
+    assert "timed out after" not in str(outcome["error"])
+
+
+def test_rerun_probe_matches_installed_streamlit():
+    """Het private ScriptRequests._state van de echte Streamlit (niet de mock)."""
+    code = (
+        "from streamlit.runtime.scriptrunner_utils.script_requests import (\n"
+        "    RerunData, ScriptRequests)\n"
+        "from types import SimpleNamespace\n"
+        "from ui.helpers.async_bridge import _rerun_requested\n"
+        "ctxs = [SimpleNamespace(script_requests=ScriptRequests()) for _ in 'abc']\n"
+        "ctxs[1].script_requests.request_rerun(RerunData())\n"
+        "ctxs[2].script_requests.request_stop()\n"
+        "print([_rerun_requested(ctx) for ctx in ctxs])\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.splitlines()[-1] == "[False, True, True]"
+
+
+def test_rerun_probe_disabled_for_unverified_streamlit(monkeypatch):
+    monkeypatch.setattr(async_bridge.metadata, "version", lambda name: "2.0.0")
+    async_bridge._rerun_probe_supported.cache_clear()
+    try:
+        ctx = SimpleNamespace(
+            script_requests=SimpleNamespace(_state=SimpleNamespace(name="RERUN"))
+        )
+        assert not async_bridge._rerun_requested(ctx)
+    finally:
+        monkeypatch.undo()
+        async_bridge._rerun_probe_supported.cache_clear()
+
+
+def test_begin_script_run_cancels_previous_session_work(monkeypatch):
+    ctx = SimpleNamespace(session_id="sessie-2", script_requests=None)
+    monkeypatch.setattr(async_bridge, "_script_run_ctx", lambda: ctx)
+
+    future = async_bridge.submit(asyncio.sleep(5))
+    other = get_background_loop().submit(asyncio.sleep(0, result="klaar"))
+
+    assert async_bridge.begin_script_run() == 1
+    assert future.cancelled()
+    assert other.result(timeout=1.0) == "klaar"
+
+
+def test_shutdown_cancels_pending_tasks_and_restarts_lazily():
+    background = BackgroundLoop(name="test-loop")
+    pending = background.submit(asyncio.sleep(5))
+
+    background.shutdown(timeout=1.0)
+
+    assert pending.cancelled()
+    assert not background.is_running
+    assert background.submit(asyncio.sleep(0, result=1)).result(timeout=1.0) == 1
+    background.shutdown(timeout=1.0)
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    queue = JobQueue(JobStore(str(tmp_path / "jobs.db")), poll_interval=0.05)
+    release = threading.Event()
+
+    async def handler(payload, ctx):
+        ctx.report(0.5, "halverwege")
+        while not release.is_set():
+            await asyncio.sleep(0.02)
+        return {"n": payload["n"]}
+
+    queue.register("demo", handler)
+    queue.release = release
+    yield queue
+    release.set()
+    queue.stop()
+
+
+def test_wait_for_job_reports_progress_and_returns_final_record(job_queue):
+    seen = []
+
+    def on_progress(progress, message):
+        seen.append((progress, message))
+        if message == "halverwege":
+            job_queue.release.set()
+
+    job = async_bridge.wait_for_job(
+        job_queue,
+        job_queue.enqueue("demo", {"n": 3}),
+        timeout=5.0,
+        on_progress=on_progress,
+    )
+
+    assert job.status == "succeeded"
+    assert job.result == {"n": 3}
+    assert seen[-1] == (0.5, "halverwege")
+
+
+def test_wait_for_job_timeout_cancels_the_job(job_queue):
+    job_id = job_queue.enqueue("demo", {"n": 1})
+
+    with pytest.raises(TimeoutError):
+        async_bridge.wait_for_job(job_queue, job_id, timeout=0.2)
+
+    assert job_queue.get(job_id).status == "cancelled"
+
+
+def test_rerun_stops_waiting_but_keeps_the_job(monkeypatch, job_queue):
+    ctx = SimpleNamespace(
+        session_id="sessie-1",
+        script_requests=SimpleNamespace(_state=SimpleNamespace(name="RERUN")),
+    )
+    monkeypatch.setattr(async_bridge, "_script_run_ctx", lambda: ctx)
+    job_id = job_queue.enqueue("demo", {"n": 1})
+
+    with pytest.raises(CancelledError):
+        async_bridge.wait_for_job(job_queue, job_id)
+    assert not job_queue.get(job_id).is_finished
+
+    with pytest.raises(CancelledError):
+        async_bridge.wait_for_job(job_queue, job_id, cancel_on_abort=True)
+    assert job_queue.get(job_id).status == "cancelled"
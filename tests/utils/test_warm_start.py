@@ -0,0 +1,146 @@
+"""Tests voor het warm-start snapshot."""
+
+import os
+from pathlib import Path
+
+from utils.warm_start import WarmStartSnapshot
+
+
+def _counting_builder(path):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"content": path.read_text(encoding="utf-8")}
+
+    return build, calls
+
+
+def test_snapshot_survives_process_restart(tmp_path):
+    source = tmp_path / "rules.json"
+    source.write_text('{"a": 1}', encoding="utf-8")
+    snapshot_path = tmp_path / "warm.pkl"
+    build, calls = _counting_builder(source)
+
+    first = WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+    # Nieuwe instance = nieuw proces: leest uit het snapshot
+    restarted = WarmStartSnapshot(snapshot_path)
+    second = restarted.get_or_build("rules", [source], build)
+
+    assert first == second == {"content": '{"a": 1}'}
+    assert len(calls) == 1
+    assert restarted.get_stats()["hits"] == 1
+
+
+def test_changed_source_triggers_rebuild(tmp_path):
+    source = tmp_path / "rules.json"
+    source.write_text('{"a": 1}', encoding="utf-8")
+    snapshot_path = tmp_path / "warm.pkl"
+    build, calls = _counting_builder(source)
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+
+    source.write_text('{"a": 22}', encoding="utf-8")
+    value = WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+
+    assert value == {"content": '{"a": 22}'}
+    assert len(calls) == 2
+
+
+def test_touched_source_with_same_content_is_not_rebuilt(tmp_path):
+    source = tmp_path / "rules.json"
+    source.write_text('{"a": 1}', encoding="utf-8")
+    snapshot_path = tmp_path / "warm.pkl"
+    build, calls = _counting_builder(source)
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+
+    assert len(calls) == 1
+
+
+def test_added_source_and_corrupt_snapshot_rebuild(tmp_path):
+    source = tmp_path / "a.json"
+    source.write_text("a", encoding="utf-8")
+    extra = tmp_path / "b.json"
+    extra.write_text("b", encoding="utf-8")
+    snapshot_path = tmp_path / "warm.pkl"
+    build, calls = _counting_builder(source)
+
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source, extra], build)
+    assert len(calls) == 2
+
+    snapshot_path.write_bytes(b"not a pickle")
+    WarmStartSnapshot(snapshot_path).get_or_build("rules", [source], build)
+    assert len(calls) == 3
+
+
+def test_disabled_snapshot_always_builds(tmp_path):
+    source = tmp_path / "rules.json"
+    source.write_text("x", encoding="utf-8")
+    build, calls = _counting_builder(source)
+    snapshot = WarmStartSnapshot(tmp_path / "warm.pkl", enabled=False)
+
+    snapshot.get_or_build("rules", [source], build)
+    snapshot.get_or_build("rules", [source], build)
+
+    assert len(calls) == 2
+    assert not (tmp_path / "warm.pkl").exists()
+
+
+def test_pattern_matcher_tables_come_from_snapshot(tmp_path, monkeypatch):
+    from services import ufo_pattern_matcher
+    from utils import warm_start
+
+    monkeypatch.setenv("WARM_START_SNAPSHOT", str(tmp_path / "warm.pkl"))
+    warm_start.reset_warm_start()
+    try:
+        built = ufo_pattern_matcher.PatternMatcher()
+        warm_start.reset_warm_start()
+        loaded = ufo_pattern_matcher.PatternMatcher()
+    finally:
+        warm_start.reset_warm_start()
+
+    assert loaded.legal_vocabulary == built.legal_vocabulary
+    assert {
+        category: {pid: p.pattern for pid, p in patterns.items()}
+        for category, patterns in loaded.compiled_patterns.items()
+    } == {
+        category: {pid: p.pattern for pid, p in patterns.items()}
+        for category, patterns in built.compiled_patterns.items()
+    }
+    assert loaded.find_all_matches("de verdachte in een strafzaak")
+
+
+def test_relative_snapshot_path_is_anchored_to_project_root(tmp_path, monkeypatch):
+    from utils import warm_start
+
+    monkeypatch.chdir(tmp_path)
+
+    snapshot = WarmStartSnapshot("cache/warm.pkl")
+
+    assert snapshot.path == warm_start.PROJECT_ROOT / "cache" / "warm.pkl"
+    assert Path(warm_start.DEFAULT_SNAPSHOT_PATH).is_absolute()
+
+
+def test_builder_modules_are_snapshot_sources(tmp_path):
+    from services.web_lookup import juridisch_ranker
+    from toetsregels import rule_cache
+    from utils.warm_start import get_warm_start
+
+    regels = tmp_path / "regels"
+    regels.mkdir()
+    (regels / "CON-01.json").write_text('{"id": "CON-01"}', encoding="utf-8")
+    rule_cache._load_all_rules_cached(str(regels))
+    juridisch_ranker.JuridischRankerConfig()
+
+    entries = get_warm_start()._load()
+    sources = {
+        name.split(":")[0]: set(entry["sources"]) for name, entry in entries.items()
+    }
+    assert str(Path(rule_cache.__file__).resolve()) in sources["toetsregels"]
+    ranker_module = str(Path(juridisch_ranker.__file__).resolve())
+    assert ranker_module in sources["juridische_keywords"]
+    assert ranker_module in sources["web_lookup_defaults"]
@@ -0,0 +1,129 @@
+"""CON-01 duplicate-context signaal via de geïndexeerde repository lookup."""
+
+import pytest
+
+from services.definition_repository import DefinitionRepository
+from services.interfaces import Definition
+from services.validation.modular_validation_service import ModularValidationService
+from toetsregels.cached_manager import get_cached_toetsregel_manager
+
+TEXT = "Registratie is het formeel vastleggen van gegevens in een geautoriseerd systeem"
+CONTEXT = {
+    "organisatorische_context": ["dji"],
+    "juridische_context": ["Strafrecht"],
+    "categorie": "proces",
+}
+
+
+def _dup_warnings(result):
+    return [
+        v
+        for v in result["violations"]
+        if v.get("code") == "CON-01" and v.get("metadata", {}).get("status")
+    ]
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return DefinitionRepository(str(tmp_path / "definities.db"))
+
+
+@pytest.fixture
+def service(repository):
+    return ModularValidationService(
+        get_cached_toetsregel_manager(), None, None, repository=repository
+    )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_signal_restored_for_definition_repository(repository, service):
+    existing_id = repository.save(
+        Definition(
+            begrip="registratie",
+            definitie=TEXT,
+            categorie="proces",
+            organisatorische_context=["DJI"],
+            juridische_context=["strafrecht"],
+        )
+    )
+
+    result = await service.validate_definition("registratie", TEXT, context=CONTEXT)
+
+    warnings = _dup_warnings(result)
+    assert len(warnings) == 1
+    assert warnings[0]["severity"] == "warning"
+    assert warnings[0]["metadata"]["existing_definition_id"] == existing_id
+
+
+@pytest.mark.asyncio
+async def test_cached_result_follows_repository_writes(repository, service):
+    first = await service.validate_definition("registratie", TEXT, context=CONTEXT)
+    assert _dup_warnings(first) == []
+
+    repository.save(
+        Definition(
+            begrip="Registratie",
+            definitie=TEXT,
+            categorie="proces",
+            organisatorische_context=["DJI"],
+            juridische_context=["Strafrecht"],
+        )
+    )
+    second = await service.validate_definition("registratie", TEXT, context=CONTEXT)
+    third = await service.validate_definition("registratie", TEXT, context=CONTEXT)
+
+    assert len(_dup_warnings(second)) == 1
+    assert third == {**second, "system": third["system"]}
+    assert service.get_health_status()["result_cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_definition_is_not_its_own_duplicate(repository, service):
+    existing_id = repository.save(
+        Definition(
+            begrip="registratie",
+            definitie=TEXT,
+            categorie="proces",
+            organisatorische_context=["DJI"],
+            juridische_context=["strafrecht"],
+        )
+    )
+
+    own = await service.validate_definition(
+        "registratie", TEXT, context={**CONTEXT, "definition_id": existing_id}
+    )
+    other = await service.validate_definition(
+        "registratie", TEXT, context={**CONTEXT, "definition_id": existing_id + 1}
+    )
+
+    assert _dup_warnings(own) == []
+    assert len(_dup_warnings(other)) == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_lookup_runs_once_per_validation(
+    repository, service, monkeypatch
+):
+    repository.save(
+        Definition(
+            begrip="registratie",
+            definitie=TEXT,
+            categorie="proces",
+            organisatorische_context=["DJI"],
+            juridische_context=["strafrecht"],
+        )
+    )
+    lookups = []
+    find = repository.find_by_context_key
+
+    def counting_find(*args, **kwargs):
+        lookups.append(args[0])
+        return find(*args, **kwargs)
+
+    monkeypatch.setattr(repository, "find_by_context_key", counting_find)
+
+    result = await service.validate_definition("registratie", TEXT, context=CONTEXT)
+
+    # Cachesleutel en CON-01 delen dezelfde lookup
+    assert lookups == ["registratie"]
+    assert len(_dup_warnings(result)) == 1
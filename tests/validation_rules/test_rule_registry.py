@@ -0,0 +1,59 @@
+"""Tests voor de RuleRegistry (import-once validators + gegenereerde bundle)."""
+
+import pytest
+
+from ai_toetser.json_validator_loader import JSONValidatorLoader
+from toetsregels.rule_registry import (
+    BUNDLE_PATH,
+    DEFAULT_REGELS_DIR,
+    RuleRegistry,
+    discover_rule_ids,
+    discover_validator_classes,
+    generate_bundle_source,
+    get_rule_registry,
+    import_validator_module,
+)
+
+DEFINITIE = "Een vonnis is een schriftelijke uitspraak van de rechter."
+
+
+def test_bundle_is_up_to_date():
+    """Faalt na toevoegen/hernoemen van een regel: genereer de bundle opnieuw."""
+    classes = discover_validator_classes(discover_rule_ids())
+    assert BUNDLE_PATH.read_text(encoding="utf-8") == generate_bundle_source(classes)
+
+
+@pytest.mark.parametrize("use_bundle", [True, False])
+def test_registry_loads_all_validators_once(use_bundle):
+    registry = RuleRegistry(use_bundle=use_bundle).load()
+    stats = registry.get_stats()
+
+    assert stats["source"] == ("bundle" if use_bundle else "scan")
+    assert stats["validators"] >= 45
+    assert stats["errors"] == {}
+    assert registry.get_validator("CON-01") is registry.get_validator("CON-01")
+    assert registry.get_config("CON-01")["id"] == "CON-01"
+
+
+def test_registry_matches_dynamic_loader():
+    registry = RuleRegistry().load()
+    legacy = JSONValidatorLoader(str(DEFAULT_REGELS_DIR) + "/")
+    legacy._use_registry = False
+
+    for regel_id in registry.rule_ids():
+        validate = registry.get_validate(regel_id)
+        expected = legacy.load_validator(regel_id).validate(DEFINITIE, "vonnis", {})
+        assert validate(DEFINITIE, "vonnis", {}) == expected, regel_id
+
+
+def test_default_loader_uses_shared_registry_instances():
+    loader = JSONValidatorLoader()
+    assert loader.load_validator("ESS-01") is get_rule_registry().get_validator(
+        "ESS-01"
+    )
+
+
+def test_modules_outside_package_are_imported_once():
+    path = DEFAULT_REGELS_DIR / "ESS-03.py"
+    first = import_validator_module(path, "ESS_03")
+    assert import_validator_module(path, "ESS_03") is first